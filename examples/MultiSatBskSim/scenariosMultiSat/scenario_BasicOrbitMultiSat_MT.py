@@ -33,14 +33,22 @@ Inside the ``run()`` command the number of threads is specified using::
 
     TheScenario.TotalSim.resetThreads(numThreads)
 
+By default the processes are placed on the threads in a round-robin fashion.  The script instead asks the
+simulation to measure how long each process takes to execute over the first frames, and to then redistribute
+the processes such that every thread carries a similar load::
+
+    TheScenario.TotalSim.enableProcessBalancing(10)
+
 With this basic setup it is assumed that each BSK process can run independently in a thread.  Note that this script
 does not use any spacecraft flight software which is running in a separate process.  The Basilisk v2.1
 multi-threading only functions for simulations where each Basilisk process can be evaluated independently.
 
 .. warning::
 
-    The Basilisk v2.1 multi-threading does not have a thread-safe messaging system.  This will be
-    added in a later release.
+    Regular messages are not thread-safe.  A message that is read by a process on another thread must be
+    double buffered with ``msg.enableDoubleBuffer(TheScenario.TotalSim)``.  The writes to such a message are
+    only published to its readers at the barrier after every frame, so the readers always see the message
+    written during the previous frame, independent of how the processes are spread across the threads.
 
 Illustration of Simulation Results
 ----------------------------------
@@ -252,6 +260,9 @@ def run(show_plots, numberSpacecraft, environment, numThreads):
     # which processes execute on a given thread, then the addProcessToThread in
     # the SimModel (TotalSim in SimulationBaseClass) should be used.
     TheScenario.TotalSim.resetThreads(numThreads)
+    # Measure the process costs over the first 10 frames and then rebalance the
+    # processes that were not explicitly placed across the threads
+    TheScenario.TotalSim.enableProcessBalancing(10)
     runScenario(TheScenario)
     figureList = TheScenario.pull_outputs(show_plots)
 
@@ -24,7 +24,7 @@ Overview
 This scenario demonstrates how to set up a spacecraft orbiting Earth subject to atmospheric drag, causing it to
 deorbit. This is achieved using the :ref:`exponentialAtmosphere` or :ref:`msisAtmosphere` environment module and the
 :ref:`dragDynamicEffector` dynamics module. The simulation is executed until the altitude falls below some threshold,
-using a terminal event handler.
+using a terminal event handler whose condition is checked natively by the simulation.
 
 The script is found in the folder ``basilisk/examples`` and executed by using::
 
@@ -257,9 +257,11 @@ def run(show_plots, initialAlt=250, deorbitAlt=100, model="exponential"):
     scSim.AddModelToTask(simTaskName, forceLog)
 
     # Event to terminate the simulation
+    # the condition is compiled and checked by the simulation itself, without calling into python every step
     scSim.createNewEvent("Deorbited", simulationTimeStep, True,
-                         [f"np.linalg.norm(self.spacecraft.scStateOutMsg.read().r_BN_N) < {planet.radEquator + 1000 * deorbitAlt}"],
-                         [], terminal=True)
+                         actionList=[], terminal=True,
+                         conditionExpression=f"norm(scState.r_BN_N) < {planet.radEquator + 1000 * deorbitAlt}",
+                         conditionMessages={"scState": scObject.scStateOutMsg})
 
     # Vizard Visualization Option
     # ---------------------------
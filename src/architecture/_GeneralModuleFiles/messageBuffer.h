@@ -0,0 +1,44 @@
+/*
+ ISC License
+
+ Copyright (c) 2024, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#ifndef MESSAGE_BUFFER_H
+#define MESSAGE_BUFFER_H
+
+class SimModel;
+
+/*! @brief Back buffer of a double buffered message.  The writes to the message go into the back buffer that only
+ becomes visible to the readers once the simulation publishes it at a frame barrier.  The registration with the
+ simulation is kept out of the message template, such that the messages don't depend on the simulation model. */
+class MessageBuffer
+{
+public:
+    virtual ~MessageBuffer() {this->detachFromOwner();};
+    virtual void publishBuffer() = 0;  //!< copy the back buffer written since the last barrier into the read payload
+    virtual void detachBuffer() = 0;   //!< stop double buffering, called when the publishing simulation goes away
+
+    void attachTo(SimModel *simModel);  //!< publish this buffer at the barriers of simModel instead of its current owner
+    void detachFromOwner();             //!< stop being published by the owning simulation, if any
+    void forgetOwner() {this->owner = nullptr;}  //!< drop the owner without unregistering, when it goes away
+    bool isAttached() const {return this->owner != nullptr;}  //!< check if a simulation publishes this buffer
+
+private:
+    SimModel *owner = nullptr;  //!< simulation publishing this buffer, null if not attached
+};
+
+#endif /* MESSAGE_BUFFER_H */
@@ -14,14 +14,15 @@ from Basilisk.architecture.swig_common_model import *
 %include "sys_model.h"
 
 %pythonbegin %{
-from typing import Union, Iterable
+from typing import Union, Iterable, Optional
 from Basilisk.utilities import pythonVariableLogger
 %}
 
 %extend SysModel
 {
     %pythoncode %{
-        def logger(self, variableNames: Union[str, Iterable[str]], recordingTime: int = 0):
+        def logger(self, variableNames: Union[str, Iterable[str]], recordingTime: int = 0,
+                   capacity: Optional[int] = None):
             if isinstance(variableNames, str):
                 variableNames = [variableNames]
 
@@ -37,6 +38,6 @@ from Basilisk.utilities import pythonVariableLogger
                     raise ValueError(f"Cannot log {variable_name} as it is not a "
                                     f"variable of {type(self).__name__}")
 
-            return pythonVariableLogger.PythonVariableLogger(logging_functions, recordingTime)
+            return pythonVariableLogger.PythonVariableLogger(logging_functions, recordingTime, capacity)
     %}
 }
@@ -0,0 +1,135 @@
+#
+#  Copyright (c) 2024, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+#
+# Purpose:  Test that double buffered messages are read deterministically by processes on other threads
+#
+
+import numpy as np
+import pytest
+from Basilisk.architecture import bskLogging
+from Basilisk.architecture import messaging
+from Basilisk.moduleTemplates import cppModuleTemplate
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+
+
+def runCoupledProcesses(numThreads, doubleBuffered):
+    """run a writer and a reader module in separate processes and return what the reader output"""
+    scSim = SimulationBaseClass.SimBaseClass()
+    scSim.TotalSim.resetThreads(numThreads)
+
+    writer = cppModuleTemplate.CppModuleTemplate()
+    writer.ModelTag = "writer"
+    writerProcess = scSim.CreateNewProcess("writerProcess")
+    writerProcess.addTask(scSim.CreateNewTask("writerTask", macros.sec2nano(1.)))
+    scSim.AddModelToTask("writerTask", writer)
+
+    reader = cppModuleTemplate.CppModuleTemplate()
+    reader.ModelTag = "reader"
+    reader.dataInMsg.subscribeTo(writer.dataOutMsg)
+    readerProcess = scSim.CreateNewProcess("readerProcess")
+    readerProcess.addTask(scSim.CreateNewTask("readerTask", macros.sec2nano(1.)))
+    scSim.AddModelToTask("readerTask", reader)
+
+    if doubleBuffered:
+        writer.dataOutMsg.enableDoubleBuffer(scSim.TotalSim)
+        assert writer.dataOutMsg.isDoubleBuffered()
+
+    readerRec = reader.dataOutMsg.recorder()
+    scSim.AddModelToTask("readerTask", readerRec)
+
+    scSim.InitializeSimulation()
+    scSim.ConfigureStopTime(macros.sec2nano(5.0))
+    scSim.ExecuteSimulation()
+
+    # the last written payload is published once the simulation stops
+    assert writer.dataOutMsg.read().dataVector[0] == 6.
+    assert reader.dataInMsg.timeWritten() == macros.sec2nano(5.0)
+
+    return readerRec.dataVector[:, 0]
+
+
+@pytest.mark.parametrize("numThreads", [1, 2])
+def test_MessageDoubleBuffer(numThreads):
+    """
+    testing that a double buffered message is read with a one frame delay, independent of the thread count
+    """
+
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    # each module adds its update counter to the first input vector component.  The reader sees the writer
+    # output of the previous frame, and nothing during the first frame.
+    np.testing.assert_array_equal(runCoupledProcesses(numThreads, True), [1., 3., 5., 7., 9., 11.])
+
+    # without double buffering a single thread reads the output written earlier in the same frame
+    if numThreads == 1:
+        np.testing.assert_array_equal(runCoupledProcesses(numThreads, False), [2., 4., 6., 8., 10., 12.])
+
+
+def test_MessageDoubleBufferWrite():
+    """
+    testing that a message written from python is published before the next frame
+    """
+    scSim = SimulationBaseClass.SimBaseClass()
+    msg = messaging.CModuleTemplateMsg()
+    msg.enableDoubleBuffer(scSim.TotalSim)
+
+    payload = messaging.CModuleTemplateMsgPayload()
+    payload.dataVector = [1., 2., 3.]
+    msg.write(payload, macros.sec2nano(1.))
+    assert msg.read().dataVector == [0., 0., 0.]
+
+    scSim.TotalSim.publishMessageBuffers()
+    assert msg.read().dataVector == [1., 2., 3.]
+
+    msg.disableDoubleBuffer()
+    assert not msg.isDoubleBuffered()
+    payload.dataVector = [4., 5., 6.]
+    msg.write(payload)
+    assert msg.read().dataVector == [4., 5., 6.]
+
+
+def test_MessageDoubleBufferAuthors():
+    """
+    testing that the write functors follow the double buffering of the message, whenever they were requested
+    """
+    scSim = SimulationBaseClass.SimBaseClass()
+    msg = messaging.CModuleTemplateMsg()
+    payload = messaging.CModuleTemplateMsgPayload()
+
+    # an author requested before the message is double buffered writes into the back buffer
+    authorBefore = msg.addAuthor()
+    msg.enableDoubleBuffer(scSim.TotalSim)
+    authorDuring = msg.addAuthor()
+    payload.dataVector = [1., 2., 3.]
+    authorBefore(payload, 0, macros.sec2nano(1.))
+    assert msg.read().dataVector == [0., 0., 0.]
+    scSim.TotalSim.publishMessageBuffers()
+    assert msg.read().dataVector == [1., 2., 3.]
+
+    # an author requested while the message is double buffered writes into the read payload afterwards
+    msg.disableDoubleBuffer()
+    payload.dataVector = [4., 5., 6.]
+    authorDuring(payload, 0, macros.sec2nano(2.))
+    assert msg.read().dataVector == [4., 5., 6.]
+    assert msg.addSubscriber().timeWritten() == macros.sec2nano(2.)
+
+
+if __name__ == "__main__":
+    test_MessageDoubleBuffer(2)
+    test_MessageDoubleBufferWrite()
+    test_MessageDoubleBufferAuthors()
@@ -0,0 +1,109 @@
+#
+#  Copyright (c) 2024, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+#
+# Purpose:  Test that the recorder history can be read as numpy arrays directly from the record buffer
+#
+
+import os
+import sys
+
+import numpy as np
+from Basilisk.architecture import bskLogging
+from Basilisk.architecture import messaging
+from Basilisk.moduleTemplates import cModuleTemplate
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "msgAutoSource"))
+import generateSWIGModules
+
+
+def test_RecorderRecordArray():
+    """
+    testing that the numpy record array of a recorder matches the recorded message payloads
+    """
+
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    scSim = SimulationBaseClass.SimBaseClass()
+    dynProcess = scSim.CreateNewProcess("dynamicsProcess")
+    dynProcess.addTask(scSim.CreateNewTask("dynamicsTask", macros.sec2nano(1.)))
+
+    mod1 = cModuleTemplate.cModuleTemplate()
+    mod1.ModelTag = "cModule1"
+    scSim.AddModelToTask("dynamicsTask", mod1)
+
+    inputData = messaging.CModuleTemplateMsgPayload()
+    inputData.dataVector = [1, 2, 3]
+    inputDataMsg = messaging.CModuleTemplateMsg().write(inputData)
+    mod1.dataInMsg.subscribeTo(inputDataMsg)
+
+    dataOutRec = mod1.dataOutMsg.recorder()
+    scSim.AddModelToTask("dynamicsTask", dataOutRec)
+
+    # a recorder without any history returns empty arrays
+    assert len(dataOutRec.recordArray()) == 0
+
+    scSim.InitializeSimulation()
+    scSim.ConfigureStopTime(macros.sec2nano(10.0))
+    scSim.ExecuteSimulation()
+
+    # the module adds its update counter to the first input vector component
+    truth = np.array([[1. + k, 2., 3.] for k in range(1, 12)])
+
+    records = dataOutRec.recordArray()
+    assert records.shape == (11,)
+    np.testing.assert_array_equal(records["dataVector"], truth)
+    np.testing.assert_array_equal(dataOutRec.dataVector, truth)
+
+    # the view reads the recorder memory directly and can't be written to
+    view = dataOutRec.recordArray(copy=False)
+    np.testing.assert_array_equal(view["dataVector"], truth)
+    assert not view.flags.writeable
+
+    # C++ message payloads don't provide a memory layout and use the regular record access
+    assert messaging.THROutputMsg().recorder().recordDtype() is None
+
+
+def test_RecorderRecordArrayFieldKinds(tmp_path):
+    """
+    testing that the fields read straight from the record buffer have the types of the SWIG payload accessors
+    """
+    # a signed char is a small integer and pointers are left to the SWIG accessors
+    header = tmp_path / "FieldKindsMsgPayload.h"
+    header.write_text("typedef struct {\n    signed char small;\n    unsigned char byte;\n    char name[8];\n"
+                      "    void* pointer;\n    double *values;\n}FieldKindsMsgPayload;\n")
+    fields = generateSWIGModules.parseStructFields(str(header), "FieldKindsMsgPayload", str(tmp_path))
+    assert fields == [("small", "i", 0), ("byte", "u", 0), ("name", "S", 1)]
+
+    msg = messaging.CameraImageMsg()
+    rec = msg.recorder()
+    payload = messaging.CameraImageMsgPayload()
+    for k, imageType in enumerate([-3, 4]):
+        payload.imageType = imageType
+        msg.write(payload, macros.sec2nano(k))
+        rec.UpdateState(macros.sec2nano(k))
+
+    assert rec.recordDtype()["imageType"] == np.dtype("i1")
+    np.testing.assert_array_equal(rec.imageType, [-3, 4])
+    assert "imagePointer" not in rec.recordDtype().names
+    swigPointers = [msg.read().imagePointer] * 2
+    assert list(rec.imagePointer) == swigPointers
+
+
+if __name__ == "__main__":
+    test_RecorderRecordArray()
@@ -0,0 +1,81 @@
+#
+#  Copyright (c) 2024, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+#
+# Purpose:  Test the on-change, deadband and window reduction sampling policies of the message recorder
+#
+
+import numpy as np
+import pytest
+from Basilisk.architecture import bskLogging
+from Basilisk.architecture import messaging
+from Basilisk.moduleTemplates import cModuleTemplate
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+
+
+@pytest.mark.parametrize("policy", ["onChange", "deadband", "mean", "max"])
+def test_RecorderSampling(policy):
+    """
+    testing that the recorder sampling policies store the expected messages
+    """
+
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    scSim = SimulationBaseClass.SimBaseClass()
+    dynProcess = scSim.CreateNewProcess("dynamicsProcess")
+    dynProcess.addTask(scSim.CreateNewTask("dynamicsTask", macros.sec2nano(1.)))
+
+    mod1 = cModuleTemplate.cModuleTemplate()
+    mod1.ModelTag = "cModule1"
+    scSim.AddModelToTask("dynamicsTask", mod1)
+
+    inputData = messaging.CModuleTemplateMsgPayload()
+    inputData.dataVector = [1, 2, 3]
+    inputDataMsg = messaging.CModuleTemplateMsg().write(inputData)
+    mod1.dataInMsg.subscribeTo(inputDataMsg)
+
+    # the module output dataVector[0] grows by 1 each second, starting at 2
+    if policy == "onChange":
+        # the stand-alone input message is only written once
+        rec = mod1.dataInMsg.recorder()
+        rec.setRecordOnChange(True)
+        truth = [[1., 2., 3.]]
+    elif policy == "deadband":
+        rec = mod1.dataOutMsg.recorder()
+        rec.setDeadband("dataVector", 2.5)
+        truth = [[x, 2., 3.] for x in [2., 5., 8., 11.]]
+    elif policy == "mean":
+        rec = mod1.dataOutMsg.recorder(macros.sec2nano(5.))
+        rec.setWindowReduction(messaging.RecordMean)
+        rec.reduceVariable("dataVector")
+        truth = [[2., 2., 3.], [5., 2., 3.], [10., 2., 3.]]
+    else:
+        rec = mod1.dataOutMsg.recorder(macros.sec2nano(5.))
+        rec.setWindowReduction(messaging.RecordMax)
+        rec.reduceVariable("dataVector")
+        truth = [[2., 2., 3.], [7., 2., 3.], [12., 2., 3.]]
+    scSim.AddModelToTask("dynamicsTask", rec)
+
+    scSim.InitializeSimulation()
+    scSim.ConfigureStopTime(macros.sec2nano(10.0))
+    scSim.ExecuteSimulation()
+
+    np.testing.assert_array_equal(rec.dataVector, np.array(truth))
+
+
+if __name__ == "__main__":
+    test_RecorderSampling("mean")
@@ -0,0 +1,165 @@
+#
+#  Copyright (c) 2024, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+#
+# Purpose:  Test the preallocated, chunked and ring buffer storage modes of the message recorder
+#
+
+import numpy as np
+import pytest
+from Basilisk.architecture import bskLogging
+from Basilisk.architecture import messaging
+from Basilisk.moduleTemplates import cModuleTemplate
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+
+
+@pytest.mark.parametrize("storageMode", ["default", "reserve", "chunk", "ring"])
+def test_RecorderStorage(storageMode):
+    """
+    testing that each recorder storage mode returns the expected message history
+    """
+
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    scSim = SimulationBaseClass.SimBaseClass()
+    dynProcess = scSim.CreateNewProcess("dynamicsProcess")
+    dynProcess.addTask(scSim.CreateNewTask("dynamicsTask", macros.sec2nano(1.)))
+
+    mod1 = cModuleTemplate.cModuleTemplate()
+    mod1.ModelTag = "cModule1"
+    scSim.AddModelToTask("dynamicsTask", mod1)
+
+    inputData = messaging.CModuleTemplateMsgPayload()
+    inputData.dataVector = [1, 2, 3]
+    inputDataMsg = messaging.CModuleTemplateMsg().write(inputData)
+    mod1.dataInMsg.subscribeTo(inputDataMsg)
+
+    dataOutRec = mod1.dataOutMsg.recorder()
+    if storageMode == "reserve":
+        dataOutRec.reserve(21)
+    elif storageMode == "chunk":
+        dataOutRec.setChunkSize(4)
+    elif storageMode == "ring":
+        dataOutRec.setRingBufferSize(5)
+    scSim.AddModelToTask("dynamicsTask", dataOutRec)
+
+    scSim.InitializeSimulation()
+
+    # the module adds its update counter to the first input vector component
+    truth = np.array([[1. + k, 2., 3.] for k in range(1, 22)])
+    truthTimes = np.array([macros.sec2nano(k) for k in range(21)])
+
+    # pull the history part way through the run, the recorder must keep recording afterwards
+    for stopTime, numRecords in [(10., 11), (20., 21)]:
+        scSim.ConfigureStopTime(macros.sec2nano(stopTime))
+        scSim.ExecuteSimulation()
+
+        if storageMode == "ring":
+            first = numRecords - 5
+        else:
+            first = 0
+        np.testing.assert_array_equal(dataOutRec.dataVector, truth[first:numRecords])
+        np.testing.assert_array_equal(dataOutRec.times(), truthTimes[first:numRecords])
+        assert dataOutRec.recordCount() == numRecords - first
+
+
+def test_RecorderStreamFile(tmp_path):
+    """
+    testing that a recorder streaming to a file returns the complete message history
+    """
+
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    scSim = SimulationBaseClass.SimBaseClass()
+    dynProcess = scSim.CreateNewProcess("dynamicsProcess")
+    dynProcess.addTask(scSim.CreateNewTask("dynamicsTask", macros.sec2nano(1.)))
+
+    mod1 = cModuleTemplate.cModuleTemplate()
+    mod1.ModelTag = "cModule1"
+    scSim.AddModelToTask("dynamicsTask", mod1)
+
+    inputData = messaging.CModuleTemplateMsgPayload()
+    inputData.dataVector = [1, 2, 3]
+    inputDataMsg = messaging.CModuleTemplateMsg().write(inputData)
+    mod1.dataInMsg.subscribeTo(inputDataMsg)
+
+    streamFile = str(tmp_path / "dataOut.bin")
+    dataOutRec = mod1.dataOutMsg.recorder()
+    dataOutRec.setStreamFile(streamFile, 4)
+    scSim.AddModelToTask("dynamicsTask", dataOutRec)
+
+    scSim.InitializeSimulation()
+    scSim.ConfigureStopTime(macros.sec2nano(20.0))
+    scSim.ExecuteSimulation()
+
+    # at most the last partial block of messages is held in memory
+    assert dataOutRec.recordCount() < 4
+
+    truth = np.array([[1. + k, 2., 3.] for k in range(1, 22)])
+    truthTimes = np.array([macros.sec2nano(k) for k in range(21)])
+    np.testing.assert_array_equal(dataOutRec.dataVector, truth)
+    np.testing.assert_array_equal(dataOutRec.times(), truthTimes)
+    np.testing.assert_array_equal(dataOutRec.streamRecords()["payload"]["dataVector"], truth)
+    assert dataOutRec.recordCount() == 0
+
+    # clearing the recorder also discards the stream file content
+    dataOutRec.clear()
+    assert len(dataOutRec.times()) == 0
+
+
+def test_RecorderRingToStreamFile(tmp_path):
+    """
+    testing that a recorder whose ring buffer wrapped keeps the history in order once it streams to a file
+    """
+
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    scSim = SimulationBaseClass.SimBaseClass()
+    dynProcess = scSim.CreateNewProcess("dynamicsProcess")
+    dynProcess.addTask(scSim.CreateNewTask("dynamicsTask", macros.sec2nano(1.)))
+
+    mod1 = cModuleTemplate.cModuleTemplate()
+    mod1.ModelTag = "cModule1"
+    scSim.AddModelToTask("dynamicsTask", mod1)
+
+    inputData = messaging.CModuleTemplateMsgPayload()
+    inputData.dataVector = [1, 2, 3]
+    inputDataMsg = messaging.CModuleTemplateMsg().write(inputData)
+    mod1.dataInMsg.subscribeTo(inputDataMsg)
+
+    dataOutRec = mod1.dataOutMsg.recorder()
+    dataOutRec.setRingBufferSize(5)
+    scSim.AddModelToTask("dynamicsTask", dataOutRec)
+
+    scSim.InitializeSimulation()
+
+    # 11 messages are recorded into the ring of 5, which thus wrapped
+    scSim.ConfigureStopTime(macros.sec2nano(10.0))
+    scSim.ExecuteSimulation()
+
+    dataOutRec.setStreamFile(str(tmp_path / "dataOut.bin"), 4)
+    scSim.ConfigureStopTime(macros.sec2nano(20.0))
+    scSim.ExecuteSimulation()
+
+    truth = np.array([[1. + k, 2., 3.] for k in range(7, 22)])
+    truthTimes = np.array([macros.sec2nano(k) for k in range(6, 21)])
+    np.testing.assert_array_equal(dataOutRec.dataVector, truth)
+    np.testing.assert_array_equal(dataOutRec.times(), truthTimes)
+
+
+if __name__ == "__main__":
+    test_RecorderStorage("ring")
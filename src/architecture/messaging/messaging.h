@@ -21,8 +21,14 @@ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
 #include "architecture/_GeneralModuleFiles/sys_model.h"
 #include <vector>
 #include "architecture/messaging/msgHeader.h"
+#include "architecture/_GeneralModuleFiles/messageBuffer.h"
 #include "architecture/utilities/bskLogging.h"
 #include <typeinfo>
+#include <algorithm>
+#include <cmath>
+#include <fstream>
+#include <string>
+#include <type_traits>
 #include <stdlib.h>
 
 /*! forward-declare sim message for use by read functor */
@@ -65,6 +71,16 @@ public:
     //! check if this msg has been connected to
     bool isLinked(){return this->initialized;};  // something that can be checked so that uninitialized messages aren't read.
 
+    //! return the memory address of the payload read by this functor, 0 if the functor is not connected
+    uint64_t getPayloadAddress(){
+        if (!this->initialized) {
+            messageType var;
+            bskLogger.bskLog(BSK_ERROR, "In C++ read functor, you are requesting the payload address of an unconnected msg of type %s.", typeid(var).name());
+            return 0;
+        }
+        return reinterpret_cast<uint64_t>(this->payloadPointer);
+    };
+
     //! check if the message has been ever written to
     bool isWritten(){
         if (this->initialized) {
@@ -153,19 +169,19 @@ public:
 template<typename messageType>
 class WriteFunctor{
 private:
-    messageType* payloadPointer;    //!< pointer to the message payload
-    MsgHeader* headerPointer;       //!< pointer to the message header
+    messageType** payloadPointer;   //!< pointer to the pointer to the payload written to
+    MsgHeader** headerPointer;      //!< pointer to the pointer to the header written to
 public:
     //! write functor constructor
     WriteFunctor(){};
-    //! write functor constructor
-    WriteFunctor(messageType* payloadPointer, MsgHeader *headerPointer) : payloadPointer(payloadPointer), headerPointer(headerPointer){};
+    //! write functor constructor, the written payload and header can be redirected through the given pointers
+    WriteFunctor(messageType** payloadPointer, MsgHeader **headerPointer) : payloadPointer(payloadPointer), headerPointer(headerPointer){};
     //! write functor constructor
     void operator()(messageType *payload, int64_t moduleID, uint64_t callTime){
-        *this->payloadPointer = *payload;
-        this->headerPointer->isWritten = 1;
-        this->headerPointer->timeWritten = callTime;
-        this->headerPointer->moduleID = moduleID;
+        **this->payloadPointer = *payload;
+        (*this->headerPointer)->isWritten = 1;
+        (*this->headerPointer)->timeWritten = callTime;
+        (*this->headerPointer)->moduleID = moduleID;
         return;
     }
 };
@@ -173,6 +189,20 @@ public:
 template<typename messageType>
 class Recorder;
 
+/*! back buffer of a double buffered message, only allocated once the message is double buffered */
+template<typename messageType>
+class MessageBackBuffer : public MessageBuffer{
+public:
+    //! back buffer constructor
+    MessageBackBuffer(Message<messageType> *message) : message(message){};
+    void publishBuffer() override {this->message->publishBuffer();};   //!< publish the back buffer of the message
+    void detachBuffer() override {this->message->detachBuffer();};     //!< stop double buffering the message
+    messageType payload = {};   //!< payload written to while the message is double buffered
+    MsgHeader header = {};      //!< header written to while the message is double buffered
+private:
+    Message<messageType> *message;  //!< message this is the back buffer of
+};
+
 /*!
  * base class template for bsk messages
  */
@@ -182,9 +212,25 @@ private:
     messageType payload = {};   //!< struct defining message payload, zero'd on creation
     MsgHeader header = {};      //!< struct defining the message header, zero'd on creation
     ReadFunctor<messageType> read = ReadFunctor<messageType>(&payload, &header);  //!< read functor instance
+    messageType *writtenPayload = &payload;     //!< payload written to by the write functors
+    MsgHeader *writtenHeader = &header;         //!< header written to by the write functors
+    std::unique_ptr<MessageBackBuffer<messageType>> backBuffer;  //!< back buffer, null until double buffered
 public:
-    //! write functor to this message
-    WriteFunctor<messageType> write = WriteFunctor<messageType>(&payload, &header);
+    Message() = default;
+    //! copy constructor, the copy is not double buffered
+    Message(const Message &other) : payload(other.payload), header(other.header), read(other.read),
+        write(other.write), zeroMsgPayload(other.zeroMsgPayload){};
+    //! copy assignment, the double buffering of this message is kept
+    Message &operator=(const Message &other){
+        this->payload = other.payload;
+        this->header = other.header;
+        this->read = other.read;
+        this->write = other.write;
+        this->zeroMsgPayload = other.zeroMsgPayload;
+        return *this;
+    };
+    //! write functor to this message, writes into the back buffer while the message is double buffered
+    WriteFunctor<messageType> write = WriteFunctor<messageType>(&writtenPayload, &writtenHeader);
     //! -- request read rights. returns reference to class ``read`` variable
     ReadFunctor<messageType> addSubscriber();
     //! -- request write rights.
@@ -205,6 +251,21 @@ public:
 
     //! Return the memory size of the payload, be careful about dynamically sized things
     uint64_t getPayloadSize() {return sizeof(messageType);};
+
+    //! Return the memory address of the payload read by the subscribers
+    uint64_t getPayloadAddress() {return reinterpret_cast<uint64_t>(&this->payload);};
+
+    /*! Double buffer the message.  Writes go into a back buffer that simModel publishes to the readers at the
+     barrier after every frame, such that a message can be read safely from a process on another thread. */
+    void enableDoubleBuffer(SimModel *simModel);
+    //! Write straight into the read payload again
+    void disableDoubleBuffer();
+    //! check if this msg is double buffered
+    bool isDoubleBuffered(){return this->backBuffer && this->backBuffer->isAttached();};
+    //! copy the back buffer into the read payload if it has been written since the last barrier
+    void publishBuffer();
+    //! stop double buffering without publishing, used when the publishing simulation is destroyed
+    void detachBuffer();
 };
 
 
@@ -232,6 +293,50 @@ messageType* Message<messageType>::getMsgPointers(MsgHeader **msgPtr){
     return &this->payload;
 }
 
+template<typename messageType>
+void Message<messageType>::enableDoubleBuffer(SimModel *simModel){
+    this->disableDoubleBuffer();
+    if (!this->backBuffer) {
+        this->backBuffer = std::make_unique<MessageBackBuffer<messageType>>(this);
+    }
+    this->backBuffer->header = {};
+    this->writtenPayload = &this->backBuffer->payload;
+    this->writtenHeader = &this->backBuffer->header;
+    this->backBuffer->attachTo(simModel);
+}
+
+template<typename messageType>
+void Message<messageType>::disableDoubleBuffer(){
+    if (this->isDoubleBuffered()) {
+        this->publishBuffer();
+        this->backBuffer->detachFromOwner();
+        this->detachBuffer();
+    }
+}
+
+template<typename messageType>
+void Message<messageType>::publishBuffer(){
+    if (this->backBuffer && this->backBuffer->header.isWritten) {
+        this->payload = this->backBuffer->payload;
+        this->header.isWritten = 1;
+        this->header.timeWritten = this->backBuffer->header.timeWritten;
+        this->header.moduleID = this->backBuffer->header.moduleID;
+        this->backBuffer->header.isWritten = 0;
+    }
+}
+
+template<typename messageType>
+void Message<messageType>::detachBuffer(){
+    if (this->backBuffer) {
+        this->backBuffer->forgetOwner();
+    }
+    this->writtenPayload = &this->payload;
+    this->writtenHeader = &this->header;
+}
+
+/*! reduction applied by a Recorder to the messages read within each recording interval */
+enum RecordReduction {RecordLatest, RecordMean, RecordMin, RecordMax};
+
 /*! Keep a time history of messages accessible to users from python */
 template<typename messageType>
 class Recorder : public SysModel{
@@ -276,26 +381,143 @@ public:
     void IntegratedInit(){};
     //! -- Read and record the message
     void UpdateState(uint64_t CurrentSimNanos){
+        if (this->windowReduction != RecordLatest) {
+            this->accumulateWindow(this->readMessage());
+        }
         if (CurrentSimNanos >= this->nextUpdateTime) {
-            this->msgRecordTimes.push_back(CurrentSimNanos);
-            this->msgWrittenTimes.push_back(this->readMessage.timeWritten());
-            this->msgRecord.push_back(this->readMessage());
+            const messageType* payload = &this->readMessage();
+            if (this->windowReduction != RecordLatest) {
+                payload = &this->reduceWindow();
+            }
+            uint64_t writtenTime = this->readMessage.timeWritten();
+            if (this->passesSamplingPolicy(*payload, writtenTime)) {
+                this->storeMessage(CurrentSimNanos, writtenTime, *payload);
+                this->lastPayload = *payload;
+                this->lastWrittenTime = writtenTime;
+                this->hasLastRecord = true;
+            }
             this->nextUpdateTime += this->timeInterval;
         }
     };
     //! Reset method
     void Reset(uint64_t CurrentSimNanos){
-        this->msgRecord.clear();    //!< -- Can only reset to 0 for now
-        this->msgRecordTimes.clear();
-        this->msgWrittenTimes.clear();
+        this->clear();    //!< -- Can only reset to 0 for now
+        this->windowCount = 0;
         this->nextUpdateTime = CurrentSimNanos;
     };
+
+    //! only record a message if it has been written again since the last recorded message
+    void setRecordOnChange(bool onChange){this->recordOnChange = onChange;};
+
+    /*! only record a message if an element of a deadband field changed by more than the deadband since the
+     last recorded message.  The field consists of numElements doubles starting offset bytes into the payload. */
+    void addDeadbandField(uint64_t offset, uint64_t numElements, double deadband){
+        this->deadbandFields.push_back({offset, numElements, deadband});
+    };
+
+    /*! reduce the messages read within each recording interval into the recorded message.  The reduction
+     is applied to the reduction fields, all other payload variables are taken from the latest message. */
+    void setWindowReduction(RecordReduction reduction){
+        this->windowReduction = reduction;
+        this->windowCount = 0;
+    };
+
+    //! add a field of numElements doubles, starting offset bytes into the payload, to the window reduction
+    void addReductionField(uint64_t offset, uint64_t numElements){
+        this->reductionFields.push_back({offset, numElements, 0.0});
+        this->windowValues.resize(this->windowValues.size() + numElements);
+        this->windowCount = 0;
+    };
+
+    //! remove all deadband and reduction fields
+    void clearSamplingFields(){
+        this->deadbandFields.clear();
+        this->reductionFields.clear();
+        this->windowValues.clear();
+        this->windowCount = 0;
+    };
     //! time recorded method
-    std::vector<uint64_t>& times(){return this->msgRecordTimes;}
+    std::vector<uint64_t>& times(){this->collectHistory(); return this->msgRecordTimes;}
     //! time written method
-    std::vector<uint64_t>& timesWritten(){return this->msgWrittenTimes;}
+    std::vector<uint64_t>& timesWritten(){this->collectHistory(); return this->msgWrittenTimes;}
     //! record method
-    std::vector<messageType>& record(){return this->msgRecord;};
+    std::vector<messageType>& record(){this->collectHistory(); return this->msgRecord;};
+    //! address of the contiguous record buffer, lets python map the recorded payloads without copying them
+    uint64_t recordAddress(){this->collectHistory(); return (uint64_t) this->msgRecord.data();};
+    //! number of recorded messages
+    uint64_t recordCount(){
+        uint64_t count = this->msgRecord.size();
+        for (auto const& chunk : this->msgChunks) {
+            count += chunk.size();
+        }
+        return count;
+    };
+
+    //! preallocate the record buffers for the given number of messages
+    void reserve(uint64_t numMessages){
+        this->msgRecord.reserve(numMessages);
+        this->msgRecordTimes.reserve(numMessages);
+        this->msgWrittenTimes.reserve(numMessages);
+    };
+
+    /*! only keep the most recent messages.  The record buffers are allocated once for this number of messages,
+     after which each new message overwrites the oldest one.  Setting the size to 0 keeps all messages again. */
+    void setRingBufferSize(uint64_t numMessages){
+        this->collectHistory();
+        if (numMessages > 0 && this->msgRecord.size() > numMessages) {
+            size_t numDropped = this->msgRecord.size() - numMessages;
+            this->msgRecord.erase(this->msgRecord.begin(), this->msgRecord.begin() + numDropped);
+            this->msgRecordTimes.erase(this->msgRecordTimes.begin(), this->msgRecordTimes.begin() + numDropped);
+            this->msgWrittenTimes.erase(this->msgWrittenTimes.begin(), this->msgWrittenTimes.begin() + numDropped);
+        }
+        this->ringBufferSize = numMessages;
+        this->reserve(numMessages);
+    };
+
+    /*! store the history in chunks of the given number of messages.  Growing the history then allocates a
+     new chunk instead of copying all prior messages into a larger buffer.  The chunks are joined into the
+     regular record buffers when the history is accessed.  Setting the size to 0 stores into one buffer again. */
+    void setChunkSize(uint64_t numMessages){
+        this->collectHistory();
+        this->chunkSize = numMessages;
+    };
+
+    /*! stream the recorded messages to a binary file while the simulation runs.  Once flushSize messages are
+     held in memory they are appended to the file and dropped from memory.  Each file entry stores the record
+     time, the written time and the raw payload, such that python can map the file onto a numpy memmap.
+     An empty file name stops the streaming. */
+    void setStreamFile(std::string fileName, uint64_t flushSize = 1000){
+        if (!std::is_trivially_copyable<messageType>::value) {
+            messageType var;
+            bskLogger.bskLog(BSK_ERROR, "Recorder: messages of type %s can't be streamed to a file as the payload isn't plain data.", typeid(var).name());
+            return;
+        }
+        this->collectHistory();
+        this->streamFileName = fileName;
+        this->streamFlushSize = flushSize > 0 ? flushSize : 1;
+        this->ringBufferSize = 0;
+        this->chunkSize = 0;
+        this->openStreamFile();
+    };
+    //! return the name of the stream file, empty if the recorder keeps the history in memory
+    std::string getStreamFileName(){return this->streamFileName;};
+
+    //! append the messages held in memory to the stream file and drop them from memory
+    void flush(){
+        if (!this->streamFile) {
+            return;
+        }
+        this->collectHistory();
+        for (size_t c = 0; c < this->msgRecord.size(); c++) {
+            this->streamFile->write((const char*) &this->msgRecordTimes[c], sizeof(uint64_t));
+            this->streamFile->write((const char*) &this->msgWrittenTimes[c], sizeof(uint64_t));
+            this->streamFile->write((const char*) &this->msgRecord[c], sizeof(messageType));
+        }
+        this->streamFile->flush();
+        this->msgRecord.clear();
+        this->msgRecordTimes.clear();
+        this->msgWrittenTimes.clear();
+    };
     
     //! determine message name
     std::string findMsgName(std::string msgName) {
@@ -321,6 +543,14 @@ public:
         this->msgRecord.clear();
         this->msgRecordTimes.clear();
         this->msgWrittenTimes.clear();
+        this->msgChunks.clear();
+        this->msgRecordTimeChunks.clear();
+        this->msgWrittenTimeChunks.clear();
+        this->ringBufferStart = 0;
+        this->hasLastRecord = false;
+        if (this->streamFile) {
+            this->openStreamFile();
+        }
     };
 
     BSKLogger bskLogger;                          //!< -- BSK Logging
@@ -331,9 +561,168 @@ public:
     };
 
 private:
+    /*! plain double field of the payload used by the sampling policies */
+    struct SamplingField {
+        uint64_t offset;                          //!< [bytes] offset of the first element within the payload
+        uint64_t numElements;                     //!< number of consecutive double elements
+        double deadband;                          //!< deadband applied to each element
+    };
+
+    //! return a pointer to the first double element of a sampling field
+    static const double* fieldValues(const messageType& payload, const SamplingField& field){
+        return (const double*) ((const char*) &payload + field.offset);
+    };
+
+    //! check the on-change and deadband policies against the last recorded message
+    bool passesSamplingPolicy(const messageType& payload, uint64_t writtenTime){
+        if (!this->hasLastRecord) {
+            return true;
+        }
+        if (this->recordOnChange && writtenTime == this->lastWrittenTime) {
+            return false;
+        }
+        if (this->deadbandFields.empty()) {
+            return true;
+        }
+        for (auto const& field : this->deadbandFields) {
+            const double* values = fieldValues(payload, field);
+            const double* lastValues = fieldValues(this->lastPayload, field);
+            for (uint64_t k = 0; k < field.numElements; k++) {
+                if (std::fabs(values[k] - lastValues[k]) > field.deadband) {
+                    return true;
+                }
+            }
+        }
+        return false;
+    };
+
+    //! add a message to the reduction of the current recording interval
+    void accumulateWindow(const messageType& payload){
+        this->windowPayload = payload;
+        size_t index = 0;
+        for (auto const& field : this->reductionFields) {
+            const double* values = fieldValues(payload, field);
+            for (uint64_t k = 0; k < field.numElements; k++, index++) {
+                if (this->windowCount == 0) {
+                    this->windowValues[index] = values[k];
+                } else if (this->windowReduction == RecordMean) {
+                    this->windowValues[index] += values[k];
+                } else if (this->windowReduction == RecordMin) {
+                    this->windowValues[index] = std::min(this->windowValues[index], values[k]);
+                } else {
+                    this->windowValues[index] = std::max(this->windowValues[index], values[k]);
+                }
+            }
+        }
+        this->windowCount++;
+    };
+
+    //! return the reduced message of the current recording interval and start a new interval
+    const messageType& reduceWindow(){
+        size_t index = 0;
+        for (auto const& field : this->reductionFields) {
+            double* values = (double*) ((char*) &this->windowPayload + field.offset);
+            for (uint64_t k = 0; k < field.numElements; k++, index++) {
+                values[k] = this->windowValues[index];
+                if (this->windowReduction == RecordMean) {
+                    values[k] /= this->windowCount;
+                }
+            }
+        }
+        this->windowCount = 0;
+        return this->windowPayload;
+    };
+
+    //! add a message to the history according to the storage mode of the recorder
+    void storeMessage(uint64_t recordTime, uint64_t writtenTime, const messageType& payload){
+        if (this->ringBufferSize > 0 && this->msgRecord.size() >= this->ringBufferSize) {
+            // the ring buffer is full, overwrite the oldest message
+            this->msgRecordTimes[this->ringBufferStart] = recordTime;
+            this->msgWrittenTimes[this->ringBufferStart] = writtenTime;
+            this->msgRecord[this->ringBufferStart] = payload;
+            this->ringBufferStart = (this->ringBufferStart + 1) % this->ringBufferSize;
+        } else if (this->ringBufferSize == 0 && this->chunkSize > 0) {
+            if (this->msgChunks.empty() || this->msgChunks.back().size() >= this->chunkSize) {
+                this->msgChunks.emplace_back();
+                this->msgChunks.back().reserve(this->chunkSize);
+                this->msgRecordTimeChunks.emplace_back();
+                this->msgRecordTimeChunks.back().reserve(this->chunkSize);
+                this->msgWrittenTimeChunks.emplace_back();
+                this->msgWrittenTimeChunks.back().reserve(this->chunkSize);
+            }
+            this->msgRecordTimeChunks.back().push_back(recordTime);
+            this->msgWrittenTimeChunks.back().push_back(writtenTime);
+            this->msgChunks.back().push_back(payload);
+        } else {
+            this->msgRecordTimes.push_back(recordTime);
+            this->msgWrittenTimes.push_back(writtenTime);
+            this->msgRecord.push_back(payload);
+        }
+        if (this->streamFile && this->recordCount() >= this->streamFlushSize) {
+            this->flush();
+        }
+    };
+
+    //! (re)create the stream file, any prior file content is discarded
+    void openStreamFile(){
+        this->streamFile.reset();
+        if (this->streamFileName.empty()) {
+            return;
+        }
+        this->streamFile = std::make_shared<std::ofstream>(this->streamFileName, std::ios::binary | std::ios::trunc);
+        if (!this->streamFile->is_open()) {
+            bskLogger.bskLog(BSK_ERROR, "Recorder: unable to open the stream file %s.", this->streamFileName.c_str());
+            this->streamFile.reset();
+        }
+    };
+
+    //! bring the history into chronological order inside the contiguous record buffers
+    void collectHistory(){
+        if (this->ringBufferStart > 0) {
+            std::rotate(this->msgRecord.begin(), this->msgRecord.begin() + this->ringBufferStart, this->msgRecord.end());
+            std::rotate(this->msgRecordTimes.begin(), this->msgRecordTimes.begin() + this->ringBufferStart, this->msgRecordTimes.end());
+            std::rotate(this->msgWrittenTimes.begin(), this->msgWrittenTimes.begin() + this->ringBufferStart, this->msgWrittenTimes.end());
+            this->ringBufferStart = 0;
+        }
+        if (!this->msgChunks.empty()) {
+            // grow geometrically, such that accessing a growing history repeatedly doesn't copy it every time
+            uint64_t numMessages = this->recordCount();
+            if (numMessages > this->msgRecord.capacity()) {
+                this->reserve(std::max<uint64_t>(numMessages, 2 * this->msgRecord.capacity()));
+            }
+            for (size_t c = 0; c < this->msgChunks.size(); c++) {
+                this->msgRecord.insert(this->msgRecord.end(), this->msgChunks[c].begin(), this->msgChunks[c].end());
+                this->msgRecordTimes.insert(this->msgRecordTimes.end(), this->msgRecordTimeChunks[c].begin(), this->msgRecordTimeChunks[c].end());
+                this->msgWrittenTimes.insert(this->msgWrittenTimes.end(), this->msgWrittenTimeChunks[c].begin(), this->msgWrittenTimeChunks[c].end());
+            }
+            this->msgChunks.clear();
+            this->msgRecordTimeChunks.clear();
+            this->msgWrittenTimeChunks.clear();
+        }
+    };
+
     std::vector<messageType> msgRecord;           //!< vector of recorded messages
     std::vector<uint64_t> msgRecordTimes;         //!< vector of times at which messages are recorded
     std::vector<uint64_t> msgWrittenTimes;        //!< vector of times at which messages are written
+    std::vector<std::vector<messageType>> msgChunks;          //!< recorded messages not yet joined into msgRecord
+    std::vector<std::vector<uint64_t>> msgRecordTimeChunks;   //!< record times not yet joined into msgRecordTimes
+    std::vector<std::vector<uint64_t>> msgWrittenTimeChunks;  //!< written times not yet joined into msgWrittenTimes
+    uint64_t ringBufferSize = 0;                  //!< maximum number of kept messages, 0 keeps all messages
+    uint64_t ringBufferStart = 0;                 //!< index of the oldest message in a wrapped around ring buffer
+    uint64_t chunkSize = 0;                       //!< number of messages per storage chunk, 0 disables chunking
+    std::string streamFileName;                   //!< file the history is streamed to, empty keeps it in memory
+    std::shared_ptr<std::ofstream> streamFile;    //!< output stream of the stream file
+    uint64_t streamFlushSize = 1000;              //!< number of messages held in memory before they are streamed
+    bool recordOnChange = false;                  //!< flag to only record messages that were written again
+    std::vector<SamplingField> deadbandFields;    //!< fields checked against their deadband before recording
+    RecordReduction windowReduction = RecordLatest;   //!< reduction of the messages read within a recording interval
+    std::vector<SamplingField> reductionFields;   //!< fields the window reduction is applied to
+    std::vector<double> windowValues;             //!< running reduction of the reduction field elements
+    uint64_t windowCount = 0;                     //!< number of messages read in the current recording interval
+    messageType windowPayload = {};               //!< latest message read in the current recording interval
+    messageType lastPayload = {};                 //!< last recorded message
+    uint64_t lastWrittenTime = 0;                 //!< [ns] written time of the last recorded message
+    bool hasLastRecord = false;                   //!< flag indicating if a message has been recorded since the last clear
     uint64_t nextUpdateTime = 0;                  //!< [ns] earliest time at which the msg is recorded again
     uint64_t timeInterval;                        //!< [ns] recording time intervale
 
@@ -1,5 +1,144 @@
+import os
+import re
 import sys
 
+# numpy kind of the plain C types that can be mapped directly onto a numpy structured dtype
+C_TYPE_KINDS = {
+     'double': 'f', 'float': 'f',
+     'char': 'S', 'bool': 'b',
+     'int': 'i', 'short': 'i', 'long': 'i', 'signed': 'i',
+     'int8_t': 'i', 'int16_t': 'i', 'int32_t': 'i', 'int64_t': 'i',
+     'unsigned': 'u', 'size_t': 'u',
+     'uint8_t': 'u', 'uint16_t': 'u', 'uint32_t': 'u', 'uint64_t': 'u',
+}
+
+FIELD_PATTERN = re.compile(r'^((?:\w+\s+)*?[\w:]+)\s*(\*?)\s*(\w+)\s*((?:\[[^\]]+\]\s*)*)(?:=.*)?$', re.DOTALL)
+
+RECORD_LAYOUT_TEMPLATE = '''
+%{{
+#include <cstddef>
+%}}
+%inline %{{
+    //! payload size followed by the offset and the nested array sizes of every field listed in _recordLayoutSpec
+    std::vector<uint64_t> {type}PayloadRecordLayout() {{
+        return {{{layout}}};
+    }}
+%}}
+%pythoncode %{{
+_recordLayoutSpec = {spec}
+%}}
+'''
+
+
+def stripComments(text):
+     """remove the C and C++ style comments from the header text"""
+     text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
+     return re.sub(r'//[^\n]*', '', text)
+
+
+def findEnumNames(text):
+     """return the names of the enum types declared in the header text"""
+     names = re.findall(r'\benum\s+(\w+)\s*\{', text)
+     names += re.findall(r'\btypedef\s+enum\s*\w*\s*\{[^}]*\}\s*(\w+)\s*;', text)
+     return set(names)
+
+
+def readHeader(headerPath, srcPath):
+     """read a header and return its text along with the enum names declared in it or in its includes"""
+     with open(headerPath, 'r') as headerFid:
+          text = stripComments(headerFid.read())
+     enumNames = findEnumNames(text)
+     for include in re.findall(r'#include\s+"([^"]+)"', text):
+          for includePath in [os.path.join(srcPath, include), os.path.join(os.path.dirname(headerPath), include)]:
+               if os.path.exists(includePath):
+                    with open(includePath, 'r') as includeFid:
+                         enumNames |= findEnumNames(stripComments(includeFid.read()))
+                    break
+     return text, enumNames
+
+
+def parseStructFields(headerPath, structName, srcPath, depth=0):
+     """
+     Parse the plain data fields of a C message payload structure.
+
+     Returns a list of ``(name, kind, dimensions)`` tuples.  ``kind`` is the numpy kind character of the
+     element type, or a ``(structName, fields)`` tuple for a nested payload structure.  ``dimensions`` is the
+     number of ``[]`` array dimensions of the field.  Fields whose type can't be mapped onto a numpy dtype,
+     as well as pointers that SWIG wraps as objects, are skipped and remain accessible through the regular
+     recorder ``__getattr__``.
+     """
+     if depth > 4 or not os.path.exists(headerPath):
+          return []
+     text, enumNames = readHeader(headerPath, srcPath)
+     match = re.search(r'typedef\s+struct\s*\w*\s*\{(.*?)\}\s*' + structName + r'\s*;', text, re.DOTALL)
+     if match is None:
+          return []
+
+     fields = []
+     for declaration in match.group(1).split(';'):
+          fieldMatch = FIELD_PATTERN.match(declaration.strip())
+          if fieldMatch is None:
+               continue
+          typeName, pointer, name, dims = fieldMatch.groups()
+          typeWords = typeName.split()
+          if pointer:
+               continue
+          elif typeWords[0] == 'enum' or typeWords[-1] in enumNames:
+               kind = 'i'
+          elif all(word in C_TYPE_KINDS for word in typeWords):
+               if 'unsigned' in typeWords:
+                    kind = 'u'
+               elif 'signed' in typeWords:
+                    # a signed char is a small integer, only a plain char is text
+                    kind = 'i'
+               else:
+                    kind = C_TYPE_KINDS[typeWords[-1]]
+          else:
+               nestedHeader = os.path.join(os.path.dirname(headerPath), typeWords[-1] + '.h')
+               nestedFields = parseStructFields(nestedHeader, typeWords[-1], srcPath, depth + 1)
+               if not nestedFields:
+                    continue
+               kind = (typeWords[-1], nestedFields)
+          fields.append((name, kind, dims.count('[')))
+     return fields
+
+
+def recordLayoutExpressions(structName, fields):
+     """
+     Return the ``offsetof``/``sizeof`` expressions describing the memory layout of the parsed fields,
+     in the order in which ``_recordDtypeFromLayout()`` in ``newMessaging.ih`` consumes them.
+     """
+     expressions = []
+     for name, kind, dims in fields:
+          expressions.append('offsetof({0}, {1})'.format(structName, name))
+          for k in range(dims + 1):
+               expressions.append('sizeof({0}::{1}{2})'.format(structName, name, '[0]' * k))
+          if isinstance(kind, tuple):
+               expressions += recordLayoutExpressions(*kind)
+     return expressions
+
+
+def recordLayoutSpec(fields):
+     """return the python literal of the parsed fields, with nested structures reduced to their field lists"""
+     return [(name, recordLayoutSpec(kind[1]) if isinstance(kind, tuple) else kind, dims)
+             for name, kind, dims in fields]
+
+
+def recordLayoutSource(structType, headerPath, srcPath):
+     """
+     Create the SWIG code exposing the memory layout of a C message payload to python.  This lets a message
+     recorder map its history directly onto a numpy structured array instead of converting every payload.
+     """
+     fields = parseStructFields(headerPath, structType + 'Payload', srcPath)
+     if not fields:
+          return ''
+     expressions = ['sizeof({0}Payload)'.format(structType)]
+     expressions += recordLayoutExpressions(structType + 'Payload', fields)
+     return RECORD_LAYOUT_TEMPLATE.format(type=structType,
+                                          layout=',\n                '.join(expressions),
+                                          spec=repr(recordLayoutSpec(fields)))
+
+
 if __name__ == "__main__":
      moduleOutputPath = sys.argv[1]
      headerinputPath = sys.argv[2]
@@ -8,7 +147,7 @@ if __name__ == "__main__":
      generateCInfo = sys.argv[5] == 'True'
 
      swigTemplateFile = 'msgInterfacePy.i.in'
-     swigCTemplateFile = 'cMsgCInterfacePy.i.in'     
+     swigCTemplateFile = 'cMsgCInterfacePy.i.in'
 
      swigFid = open(swigTemplateFile, 'r')
      swigTemplateData = swigFid.read()
@@ -21,7 +160,7 @@ if __name__ == "__main__":
      moduleFileOut = open(moduleOutputPath, 'w')
      moduleFileOut.write(swigTemplateData.format(type=structType, baseDir=baseDir))
      if(generateCInfo):
-         moduleFileOut.write(swigCTemplateData.format(type=structType))
+          # the header path is relative to the messaging folder, this script runs inside msgAutoSource
+          moduleFileOut.write(recordLayoutSource(structType, os.path.join('..', headerinputPath), '../../../'))
+          moduleFileOut.write(swigCTemplateData.format(type=structType))
      moduleFileOut.close()
-
-
@@ -0,0 +1,169 @@
+#
+#  ISC License
+#
+#  Copyright (c) 2024, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+#
+# Purpose:  Test that events with condition expressions checked by the simulation fire like python condition events
+#
+
+import pytest
+from Basilisk.architecture import bskLogging
+from Basilisk.architecture import messaging
+from Basilisk.moduleTemplates import cModuleTemplate
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import eventCondition
+from Basilisk.utilities import macros
+
+
+def runEvent(useExpression, threshold, eventRate, actionList, terminal=False, crossing=False, guardDirection=None,
+             guardExpression=None):
+    """run a module whose first output vector component is 2 + t with t the time in seconds, and return
+    the simulation along with the times at which the event fired"""
+    scSim = SimulationBaseClass.SimBaseClass()
+    dynProcess = scSim.CreateNewProcess("dynamicsProcess")
+    dynProcess.addTask(scSim.CreateNewTask("dynamicsTask", macros.sec2nano(1.)))
+
+    scSim.mod1 = cModuleTemplate.cModuleTemplate()
+    scSim.mod1.ModelTag = "cModule1"
+    scSim.AddModelToTask("dynamicsTask", scSim.mod1)
+
+    inputData = messaging.CModuleTemplateMsgPayload()
+    inputData.dataVector = [1, 2, 3]
+    inputDataMsg = messaging.CModuleTemplateMsg().write(inputData)
+    scSim.mod1.dataInMsg.subscribeTo(inputDataMsg)
+
+    scSim.firedTimes = []
+    actionList = ["self.firedTimes.append(self.TotalSim.CurrentNanos)"] + actionList
+    if guardDirection is not None:
+        scSim.createNewEvent("testEvent", eventRate, True, actionList=actionList, terminal=terminal,
+                             guardExpression=guardExpression or f"mod.dataVector[0] - {threshold}",
+                             guardDirection=guardDirection,
+                             conditionMessages={"mod": scSim.mod1.dataOutMsg})
+    elif useExpression:
+        expression = f"mod.dataVector[0] > {threshold}"
+        if crossing:
+            expression = f"crossesAbove(mod.dataVector[0], {threshold})"
+        scSim.createNewEvent("testEvent", eventRate, True, actionList=actionList, terminal=terminal,
+                             conditionExpression=expression,
+                             conditionMessages={"mod": scSim.mod1.dataOutMsg})
+    else:
+        scSim.createNewEvent("testEvent", eventRate, True,
+                             [f"self.mod1.dataOutMsg.read().dataVector[0] > {threshold}"],
+                             actionList, terminal=terminal)
+
+    scSim.InitializeSimulation()
+    scSim.ConfigureStopTime(macros.sec2nano(10.0))
+    scSim.ExecuteSimulation()
+
+    return scSim, scSim.firedTimes
+
+
+@pytest.mark.parametrize("useExpression", [False, True])
+def test_nativeEventThreshold(useExpression):
+    """
+    testing that a threshold event fires once, at the first check after the threshold is passed
+    """
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    scSim, firedTimes = runEvent(useExpression, 5.5, macros.sec2nano(2.), [])
+
+    assert firedTimes == [macros.sec2nano(4.)]
+    assert scSim.eventMap["testEvent"].occurCounter == 1
+    assert not scSim.eventMap["testEvent"].eventActive
+    assert scSim.TotalSim.CurrentNanos == macros.sec2nano(10.)
+
+
+@pytest.mark.parametrize("useExpression", [False, True])
+def test_nativeEventRepeated(useExpression):
+    """
+    testing that an event which is activated again by its action fires once per check period
+    """
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    scSim, firedTimes = runEvent(useExpression, 3., macros.sec2nano(2.),
+                                 ["self.setEventActivity('testEvent', True)"])
+
+    assert firedTimes == [macros.sec2nano(t) for t in [2., 4., 6., 8.]]
+    assert scSim.eventMap["testEvent"].occurCounter == 4
+    assert scSim.eventMap["testEvent"].eventActive
+
+
+def test_nativeEventTerminal():
+    """
+    testing that a terminal crossing event stops the simulation at the first check after the crossing
+    """
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    scSim, firedTimes = runEvent(True, 7.5, macros.sec2nano(1.), [], terminal=True, crossing=True)
+
+    assert firedTimes == [macros.sec2nano(6.)]
+    assert scSim.TotalSim.CurrentNanos == macros.sec2nano(6.)
+
+
+@pytest.mark.parametrize("guardDirection", [-1, 0, 1])
+def test_guardEvent(guardDirection):
+    """
+    testing that a guard event checked with a coarse rate stops the simulation at the first frame after the
+    zero crossing, and interpolates the crossing time
+    """
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    scSim, firedTimes = runEvent(True, 6.5, macros.sec2nano(10.), [], terminal=True, guardDirection=guardDirection)
+
+    if guardDirection < 0:
+        # the guard only rises
+        assert firedTimes == []
+        assert scSim.TotalSim.CurrentNanos == macros.sec2nano(10.)
+    else:
+        assert firedTimes == [macros.sec2nano(5.)]
+        assert scSim.eventMap["testEvent"].eventTime == macros.sec2nano(4.5)
+        assert scSim.TotalSim.CurrentNanos == macros.sec2nano(5.)
+
+
+def test_guardEventMissedPrediction():
+    """
+    testing that a guard event whose crossing is not predicted stops the simulation at the next regular check
+    """
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    # the step guard is constant between the checks, such that no crossing is predicted.  It first becomes positive
+    # at 6 s, after the check one frame past the regular check at 4 s, and is only seen by the regular check at 8 s.
+    scSim, firedTimes = runEvent(True, 7.5, macros.sec2nano(4.), [], terminal=True, guardDirection=1,
+                                 guardExpression="(mod.dataVector[0] > 7.5) - 0.5")
+
+    assert firedTimes == [macros.sec2nano(8.)]
+    assert scSim.eventMap["testEvent"].eventTime == macros.sec2nano(6.5)
+    assert scSim.TotalSim.CurrentNanos == macros.sec2nano(8.)
+
+
+def test_eventConditionErrors():
+    """
+    testing that condition expressions which can't be checked by the simulation are rejected
+    """
+    dataMsg = messaging.CModuleTemplateMsg()
+    messages = {"mod": dataMsg, "thr": messaging.THROutputMsg()}
+
+    assert eventCondition.compileCondition("norm(mod.dataVector) > 1 and time < 5", messages).size() > 0
+    for expression in ["mod.dataVector > 1", "mod.unknown > 1", "mod.dataVector[3] > 1",
+                       "other.dataVector[0] > 1", "mod.dataVector[0] ** 2 > 1", "thr.thrustForce > 1",
+                       "mod.dataVector[0] >"]:
+        with pytest.raises(ValueError):
+            eventCondition.compileCondition(expression, messages)
+
+
+if __name__ == "__main__":
+    test_nativeEventThreshold(True)
@@ -0,0 +1,83 @@
+#
+#  ISC License
+#
+#  Copyright (c) 2024, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+#
+# Purpose:  Test that the processes of a multi-threaded simulation are rebalanced using their measured cost
+#
+
+import numpy as np
+from Basilisk.architecture import bskLogging
+from Basilisk.moduleTemplates import cModuleTemplate
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+
+
+def test_processBalancing():
+    """
+    testing that expensive processes are spread across the threads after the first frames
+    """
+
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    scSim = SimulationBaseClass.SimBaseClass()
+    scSim.TotalSim.resetThreads(3)
+
+    # the expensive processes are created such that the round-robin assignment places them on the same thread
+    numModules = [200, 1, 1, 200, 1]
+    modules = []
+    recorders = []
+    for k, count in enumerate(numModules):
+        proc = scSim.CreateNewProcess("process" + str(k))
+        proc.addTask(scSim.CreateNewTask("task" + str(k), macros.sec2nano(1.)))
+        for j in range(count):
+            mod = cModuleTemplate.cModuleTemplate()
+            mod.ModelTag = "cModule" + str(k) + "_" + str(j)
+            scSim.AddModelToTask("task" + str(k), mod)
+            modules.append(mod)
+        recorders.append(modules[-1].dataOutMsg.recorder())
+        scSim.AddModelToTask("task" + str(k), recorders[-1])
+
+    # the last process is explicitly placed and must never be moved
+    scSim.TotalSim.addProcessToThread(scSim.procList[4].processData, 2)
+    scSim.TotalSim.enableProcessBalancing(5)
+
+    scSim.InitializeSimulation()
+    processNames = [proc.getProcessName() for proc in scSim.TotalSim.processList]
+    heavy = [processNames.index("process0"), processNames.index("process3")]
+    assignment = list(scSim.TotalSim.getProcessThreadAssignment())
+    assert assignment[heavy[0]] == assignment[heavy[1]]
+
+    scSim.ConfigureStopTime(macros.sec2nano(20.0))
+    scSim.ExecuteSimulation()
+
+    assignment = list(scSim.TotalSim.getProcessThreadAssignment())
+    assert assignment[heavy[0]] != assignment[heavy[1]]
+    assert assignment[processNames.index("process4")] == 2
+    assert -1 not in assignment
+
+    # the processes were measured during the first frames
+    assert scSim.procList[0].processData.getExecutionNanos() > scSim.procList[1].processData.getExecutionNanos()
+
+    # moving the processes doesn't skip or repeat any frame
+    for rec in recorders:
+        np.testing.assert_array_equal(rec.times(), [macros.sec2nano(t) for t in range(21)])
+        np.testing.assert_array_equal(rec.dataVector[:, 0], np.arange(1, 22))
+
+
+if __name__ == "__main__":
+    test_processBalancing()
@@ -0,0 +1,79 @@
+#
+#  ISC License
+#
+#  Copyright (c) 2024, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+#
+# Purpose:  Test that multi-threaded frame stepping gives the same results with a sleeping and a spinning barrier
+#
+
+import numpy as np
+import pytest
+from Basilisk.architecture import bskLogging
+from Basilisk.moduleTemplates import cppModuleTemplate
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+
+
+def runChain(numThreads, spinCount):
+    """run a chain of modules in separate processes, coupled through double buffered messages"""
+    scSim = SimulationBaseClass.SimBaseClass()
+    scSim.TotalSim.resetThreads(numThreads)
+    scSim.TotalSim.setBarrierSpinCount(spinCount)
+
+    modules = []
+    for k in range(4):
+        proc = scSim.CreateNewProcess("process" + str(k))
+        # the last process runs at a lower rate, such that its thread is idle during some frames
+        period = 2. if k == 3 else 1.
+        proc.addTask(scSim.CreateNewTask("task" + str(k), macros.sec2nano(period)))
+        mod = cppModuleTemplate.CppModuleTemplate()
+        mod.ModelTag = "module" + str(k)
+        if modules:
+            mod.dataInMsg.subscribeTo(modules[-1].dataOutMsg)
+        modules.append(mod)
+        scSim.AddModelToTask("task" + str(k), mod)
+    for mod in modules:
+        mod.dataOutMsg.enableDoubleBuffer(scSim.TotalSim)
+
+    rec = modules[-1].dataOutMsg.recorder()
+    scSim.AddModelToTask("task3", rec)
+
+    scSim.InitializeSimulation()
+    scSim.ConfigureStopTime(macros.sec2nano(10.0))
+    scSim.ExecuteSimulation()
+
+    return rec.times(), rec.dataVector
+
+
+@pytest.mark.parametrize("numThreads", [1, 3])
+@pytest.mark.parametrize("spinCount", [0, 10000])
+def test_threadBarrier(numThreads, spinCount):
+    """
+    testing that the frame barrier gives the single threaded results for every thread count and spin count
+    """
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    truthTimes, truthData = runChain(1, 0)
+    times, data = runChain(numThreads, spinCount)
+
+    np.testing.assert_array_equal(times, [macros.sec2nano(t) for t in range(0, 11, 2)])
+    np.testing.assert_array_equal(times, truthTimes)
+    np.testing.assert_array_equal(data, truthData)
+
+
+if __name__ == "__main__":
+    test_threadBarrier(3, 10000)
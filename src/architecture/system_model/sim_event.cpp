@@ -0,0 +1,363 @@
+/*
+ ISC License
+
+ Copyright (c) 2024, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#include "sim_event.h"
+#include <cmath>
+#include <cstring>
+#include <algorithm>
+
+/*! The default event constructor */
+SimEvent::SimEvent() : SimEvent("", 1000000000, std::vector<EventInstruction>(), false)
+{
+}
+
+/*! Make an event with the given condition program.
+    @param name Identifier of the event
+    @param rate [ns] Period with which the condition is checked
+    @param program Condition program in reverse polish notation
+    @param active Flag indicating whether the condition is checked
+ */
+SimEvent::SimEvent(std::string name, uint64_t rate, std::vector<EventInstruction> program, bool active)
+    : SimEvent(name, rate, program, 0, active)
+{
+    this->guardEvent = false;
+}
+
+/*! Make an event that fires when the given guard function crosses zero.
+    @param name Identifier of the event
+    @param rate [ns] Largest period with which the guard is checked
+    @param guard Guard function program in reverse polish notation
+    @param direction Guard crossings that fire the event, 1 rising, -1 falling, 0 both
+    @param active Flag indicating whether the guard is checked
+ */
+SimEvent::SimEvent(std::string name, uint64_t rate, std::vector<EventInstruction> guard, int32_t direction,
+                   bool active)
+{
+    this->eventName = name;
+    this->eventRate = rate > 0 ? rate : 1;
+    this->condition = guard;
+    this->guardEvent = true;
+    this->guardDirection = direction;
+    this->eventTime = 0;
+    this->eventActive = false;
+    this->nextCheckTime = 0;
+    this->prevCheckTime = -1;
+    this->guardSamples = 0;
+    this->guardProbed = false;
+    this->stack.reserve(this->condition.size());
+    this->setActive(active);
+}
+
+/*! The event destructor. */
+SimEvent::~SimEvent()
+{
+}
+
+/*! This method checks that the condition program leaves exactly one value on
+    the stack, and never pops a value that hasn't been pushed.
+    @return bool
+ */
+bool SimEvent::programValid()
+{
+    int64_t depth = 0;
+    std::vector<EventInstruction>::iterator it;
+    for(it = this->condition.begin(); it != this->condition.end(); it++)
+    {
+        switch(it->opCode)
+        {
+            case EventConst:
+            case EventTime:
+                depth++;
+                break;
+            case EventLoad:
+                if(it->address == 0 || it->dataType < EventDouble || it->dataType > EventUInt64) {
+                    return false;
+                }
+                depth++;
+                break;
+            case EventNeg:
+            case EventAbs:
+            case EventSqrt:
+            case EventNot:
+            case EventCrossAbove:
+            case EventCrossBelow:
+                if(depth < 1) {
+                    return false;
+                }
+                break;
+            case EventAdd: case EventSub: case EventMul: case EventDiv:
+            case EventLess: case EventLessEqual: case EventGreater: case EventGreaterEqual:
+            case EventEqual: case EventNotEqual: case EventAnd: case EventOr:
+                if(depth < 2) {
+                    return false;
+                }
+                depth--;
+                break;
+            default:
+                return false;
+        }
+    }
+    return depth == 1;
+}
+
+/*! This method activates or deactivates the event.  An event that is activated
+    is checked at the next opportunity, but never twice in the same check period,
+    and its crossing conditions and guard start over.
+    @param active Flag indicating whether the condition is checked
+ */
+void SimEvent::setActive(bool active)
+{
+    if(active && !this->eventActive)
+    {
+        this->nextCheckTime = 0;
+        if(this->prevCheckTime >= 0)
+        {
+            this->nextCheckTime = (uint64_t) this->prevCheckTime - this->prevCheckTime % this->eventRate
+                                  + this->eventRate;
+        }
+        this->previousValues.assign(this->condition.size(), 0.0);
+        this->hasPrevious.assign(this->condition.size(), false);
+        this->guardSamples = 0;
+    }
+    this->eventActive = active;
+}
+
+/*! This method checks the condition of the event and schedules the next check.
+    An event whose condition is met is deactivated.
+    @param checkNanos [ns] Time up to which the simulation has been stepped
+    @param currentNanos [ns] Time of the last executed frame, used as the condition time
+    @return bool
+ */
+bool SimEvent::checkCondition(uint64_t checkNanos, uint64_t currentNanos)
+{
+    bool regularCheck = this->nextCheckTime % this->eventRate == 0;
+    this->prevCheckTime = (int64_t) checkNanos;
+    this->nextCheckTime = checkNanos - checkNanos % this->eventRate + this->eventRate;
+    this->guardProbed = this->guardProbed && !regularCheck;
+    double value = this->evaluate(currentNanos);
+    if(this->guardEvent ? !this->checkGuard(value, checkNanos, currentNanos) : value == 0.0)
+    {
+        return false;
+    }
+    if(!this->guardEvent)
+    {
+        this->eventTime = currentNanos;
+    }
+    this->eventActive = false;
+    return true;
+}
+
+/*! This method compares the guard value with the one of the previous check.  If
+    the guard changed sign in a firing direction, the crossing time is interpolated
+    linearly between both checks.  Otherwise the guard is checked again one frame
+    after every regular check, and the quadratic through the last three guard values
+    predicts the next zero crossing.  If the prediction falls before the next regular
+    check, the guard is checked again at the predicted time.  The simulation is thus
+    stopped close after the crossing without checking often while the guard is far
+    from zero.
+    @param guardValue Value of the guard function
+    @param checkNanos [ns] Time up to which the simulation has been stepped
+    @param currentNanos [ns] Time of the last executed frame, the time of the guard value
+    @return bool True if the guard crossed zero in a firing direction
+ */
+bool SimEvent::checkGuard(double guardValue, uint64_t checkNanos, uint64_t currentNanos)
+{
+    if(this->guardSamples > 0)
+    {
+        double prevValue = this->guardValues[this->guardSamples - 1];
+        uint64_t prevTime = this->guardTimes[this->guardSamples - 1];
+        bool rising = prevValue < 0.0 && guardValue >= 0.0;
+        bool falling = prevValue >= 0.0 && guardValue < 0.0;
+        if((rising && this->guardDirection >= 0) || (falling && this->guardDirection <= 0))
+        {
+            this->eventTime = prevTime + (uint64_t) std::llround((double) (currentNanos - prevTime) * prevValue
+                                                                 / (prevValue - guardValue));
+            return true;
+        }
+    }
+
+    if(this->guardSamples > 0 && currentNanos <= this->guardTimes[this->guardSamples - 1])
+    {
+        // no frame was executed since the last check, the guard value replaces the last one
+        this->guardValues[this->guardSamples - 1] = guardValue;
+        this->nextCheckTime = checkNanos + 1;
+        return false;
+    }
+    if(this->guardSamples == 3)
+    {
+        std::copy(this->guardValues + 1, this->guardValues + 3, this->guardValues);
+        std::copy(this->guardTimes + 1, this->guardTimes + 3, this->guardTimes);
+        this->guardSamples--;
+    }
+    this->guardValues[this->guardSamples] = guardValue;
+    this->guardTimes[this->guardSamples] = currentNanos;
+    this->guardSamples++;
+
+    if(!this->guardProbed)
+    {
+        this->nextCheckTime = checkNanos + 1;
+        this->guardProbed = true;
+        return false;
+    }
+    double crossingTime = this->predictGuardCrossing();
+    if(crossingTime > currentNanos && crossingTime < this->nextCheckTime)
+    {
+        this->nextCheckTime = std::max((uint64_t) std::ceil(crossingTime), checkNanos + 1);
+    }
+    return false;
+}
+
+/*! This method fits a polynomial through the last guard values, a line through two
+    or a quadratic through three values, and returns the first time after the last
+    guard value at which it crosses zero in a firing direction.
+    @return double [ns] Predicted crossing time, or -1 if no crossing is predicted
+ */
+double SimEvent::predictGuardCrossing()
+{
+    if(this->guardSamples < 2)
+    {
+        return -1.0;
+    }
+    int last = this->guardSamples - 1;
+    double g2 = this->guardValues[last];
+    double t2 = (double) this->guardTimes[last];
+    double t1 = (double) this->guardTimes[last - 1];
+    double slope12 = (g2 - this->guardValues[last - 1]) / (t2 - t1);
+    double c = 0.0;
+    if(this->guardSamples == 3)
+    {
+        double t0 = (double) this->guardTimes[0];
+        double slope01 = (this->guardValues[1] - this->guardValues[0]) / (t1 - t0);
+        c = (slope12 - slope01) / (t2 - t0);
+    }
+    double b = slope12 + c * (t2 - t1);
+
+    // roots of g2 + b tau + c tau^2 in increasing order
+    double roots[2] = {-1.0, -1.0};
+    if(std::fabs(c) * std::fabs(g2) < 1.0E-12 * b * b)
+    {
+        roots[0] = b != 0.0 ? -g2 / b : -1.0;
+    }
+    else
+    {
+        double discriminant = b * b - 4.0 * c * g2;
+        if(discriminant < 0.0)
+        {
+            return -1.0;
+        }
+        double sqrtDisc = std::sqrt(discriminant);
+        roots[0] = (-b - sqrtDisc) / (2.0 * c);
+        roots[1] = (-b + sqrtDisc) / (2.0 * c);
+        if(roots[0] > roots[1])
+        {
+            std::swap(roots[0], roots[1]);
+        }
+    }
+    for(double tau : roots)
+    {
+        double crossingSlope = b + 2.0 * c * tau;
+        if(tau > 0.0 && (this->guardDirection == 0 || crossingSlope * this->guardDirection > 0.0))
+        {
+            return t2 + tau;
+        }
+    }
+    return -1.0;
+}
+
+/*! This method runs the condition program on the value stack.
+    @param currentNanos [ns] Time of the last executed frame
+    @return double
+ */
+double SimEvent::evaluate(uint64_t currentNanos)
+{
+    double a, b;
+    size_t index;
+    this->stack.clear();
+    for(index = 0; index < this->condition.size(); index++)
+    {
+        const EventInstruction &instruction = this->condition[index];
+        if(instruction.opCode == EventConst) {
+            this->stack.push_back(instruction.value);
+            continue;
+        }
+        if(instruction.opCode == EventTime) {
+            this->stack.push_back(currentNanos * 1.0E-9);
+            continue;
+        }
+        if(instruction.opCode == EventLoad) {
+            const void *source = reinterpret_cast<const void *>(instruction.address);
+            switch(instruction.dataType)
+            {
+                case EventDouble: {double v; memcpy(&v, source, sizeof(v)); a = v; break;}
+                case EventFloat: {float v; memcpy(&v, source, sizeof(v)); a = v; break;}
+                case EventInt8: {int8_t v; memcpy(&v, source, sizeof(v)); a = v; break;}
+                case EventInt16: {int16_t v; memcpy(&v, source, sizeof(v)); a = v; break;}
+                case EventInt32: {int32_t v; memcpy(&v, source, sizeof(v)); a = v; break;}
+                case EventInt64: {int64_t v; memcpy(&v, source, sizeof(v)); a = (double) v; break;}
+                case EventUInt8: {uint8_t v; memcpy(&v, source, sizeof(v)); a = v; break;}
+                case EventUInt16: {uint16_t v; memcpy(&v, source, sizeof(v)); a = v; break;}
+                case EventUInt32: {uint32_t v; memcpy(&v, source, sizeof(v)); a = v; break;}
+                default: {uint64_t v; memcpy(&v, source, sizeof(v)); a = (double) v; break;}
+            }
+            this->stack.push_back(a);
+            continue;
+        }
+
+        a = this->stack.back();
+        switch(instruction.opCode)
+        {
+            case EventNeg: this->stack.back() = -a; continue;
+            case EventAbs: this->stack.back() = std::fabs(a); continue;
+            case EventSqrt: this->stack.back() = std::sqrt(a); continue;
+            case EventNot: this->stack.back() = a == 0.0; continue;
+            case EventCrossAbove:
+            case EventCrossBelow:
+                b = this->previousValues[index];
+                this->stack.back() = this->hasPrevious[index] &&
+                    (instruction.opCode == EventCrossAbove ? (b < 0.0 && a >= 0.0) : (b >= 0.0 && a < 0.0));
+                this->previousValues[index] = a;
+                this->hasPrevious[index] = true;
+                continue;
+            default:
+                break;
+        }
+
+        this->stack.pop_back();
+        b = a;
+        a = this->stack.back();
+        switch(instruction.opCode)
+        {
+            case EventAdd: a = a + b; break;
+            case EventSub: a = a - b; break;
+            case EventMul: a = a * b; break;
+            case EventDiv: a = a / b; break;
+            case EventLess: a = a < b; break;
+            case EventLessEqual: a = a <= b; break;
+            case EventGreater: a = a > b; break;
+            case EventGreaterEqual: a = a >= b; break;
+            case EventEqual: a = a == b; break;
+            case EventNotEqual: a = a != b; break;
+            case EventAnd: a = a != 0.0 && b != 0.0; break;
+            case EventOr: a = a != 0.0 || b != 0.0; break;
+            default: break;
+        }
+        this->stack.back() = a;
+    }
+    return this->stack.empty() ? 0.0 : this->stack.back();
+}
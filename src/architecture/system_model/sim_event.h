@@ -0,0 +1,94 @@
+/*
+ ISC License
+
+ Copyright (c) 2024, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#ifndef _SimEvent_HH_
+#define _SimEvent_HH_
+
+#include <vector>
+#include <string>
+#include <stdint.h>
+
+//! Operations of an event condition program, which is evaluated on a stack in reverse polish notation
+enum EventOpCode {
+    EventConst,          //!< push the instruction value
+    EventTime,           //!< push the simulation time in seconds
+    EventLoad,           //!< push the payload variable at the instruction address
+    EventAdd, EventSub, EventMul, EventDiv, EventNeg, EventAbs, EventSqrt,
+    EventLess, EventLessEqual, EventGreater, EventGreaterEqual, EventEqual, EventNotEqual,
+    EventAnd, EventOr, EventNot,
+    EventCrossAbove,     //!< true if the top value became larger than or equal to zero since the last evaluation
+    EventCrossBelow      //!< true if the top value became smaller than zero since the last evaluation
+};
+
+//! Type of the payload variable read by an EventLoad instruction
+enum EventDataType {
+    EventDouble, EventFloat,
+    EventInt8, EventInt16, EventInt32, EventInt64,
+    EventUInt8, EventUInt16, EventUInt32, EventUInt64
+};
+
+//! Single instruction of an event condition program
+typedef struct {
+    int32_t opCode;      //!< [-] EventOpCode of the instruction
+    int32_t dataType;    //!< [-] EventDataType of the variable read by an EventLoad instruction
+    uint64_t address;    //!< [-] memory address of the variable read by an EventLoad instruction
+    double value;        //!< [-] constant pushed by an EventConst instruction
+}EventInstruction;
+
+/*! Event whose condition is evaluated by the simulation at the frame barriers, without calling into python.
+ The condition is either a boolean program, or the program of a continuous guard function whose sign changes are
+ located by checking it again at the predicted time of its zero crossing. */
+class SimEvent
+{
+public:
+    SimEvent();
+    SimEvent(std::string name, uint64_t rate, std::vector<EventInstruction> program, bool active);
+    SimEvent(std::string name, uint64_t rate, std::vector<EventInstruction> guard, int32_t direction, bool active);
+    ~SimEvent();
+    bool checkDue(uint64_t checkNanos) {return eventActive && nextCheckTime <= checkNanos;} //!< Tells the caller if the condition has to be checked at the given time
+    bool checkCondition(uint64_t checkNanos, uint64_t currentNanos);
+    void setActive(bool active);
+    bool programValid();
+
+public:
+    std::string eventName;  //!< -- Identifier of the event
+    uint64_t eventRate;  //!< [ns] Period with which the condition is checked
+    bool eventActive;  //!< -- Flag indicating whether the condition is checked
+    uint64_t nextCheckTime;  //!< [ns] Time at which the condition is checked next
+    int64_t prevCheckTime;  //!< [ns] Time at which the condition was checked last, -1 if never checked
+    bool guardEvent;  //!< -- Flag indicating that the condition program is a guard function firing on its zero crossings
+    int32_t guardDirection;  //!< -- Guard crossings that fire the event, 1 rising, -1 falling, 0 both
+    uint64_t eventTime;  //!< [ns] Time at which the event fired last, the interpolated zero crossing for guard events
+    std::vector<EventInstruction> condition;  //!< -- Condition program of the event
+
+private:
+    double evaluate(uint64_t currentNanos);
+    bool checkGuard(double guardValue, uint64_t checkNanos, uint64_t currentNanos);
+    double predictGuardCrossing();
+
+    std::vector<double> stack;  //!< -- Evaluation stack of the condition program
+    std::vector<double> previousValues;  //!< -- Value seen by each crossing instruction at the previous evaluation
+    std::vector<bool> hasPrevious;  //!< -- Flag indicating that a crossing instruction has a previous value
+    double guardValues[3];  //!< -- Guard values of the last checks, the latest last
+    uint64_t guardTimes[3];  //!< [ns] Simulation times of the guard values
+    int guardSamples;  //!< -- Number of valid guard values
+    bool guardProbed;  //!< -- Flag indicating that the guard was checked again one frame after the last regular check
+};
+
+#endif /* _SimEvent_HH_ */
@@ -20,6 +20,12 @@
 #include "sim_model.h"
 #include <cstring>
 #include <iostream>
+#include <algorithm>
+#include <map>
+#include <limits>
+
+//! Number of frame barrier checks before a waiting thread is put to sleep, used when every thread has a core
+static const uint64_t defaultBarrierSpinCount = 4096;
 
 void activateNewThread(void *threadData)
 {
@@ -72,6 +78,7 @@ SimThreadExecution::SimThreadExecution() {
     selfInitNow = false;
     crossInitNow = false;
     resetNow = false;
+    measureProcessCost = false;
     threadID = 0;
     CurrentNanos = 0;
     NextTaskTime = 0;
@@ -99,6 +106,16 @@ void SimThreadExecution::lockParent() {
     this->parentThreadLock.acquire();
 }
 
+/*! This method sets how many times the thread and parent locks check for a
+    release before the waiting thread is put to sleep.
+ @param spinCount Number of checks before sleeping
+ @return void
+ */
+void SimThreadExecution::setSpinCount(uint64_t spinCount) {
+    this->selfThreadLock.setSpinCount(spinCount);
+    this->parentThreadLock.setSpinCount(spinCount);
+}
+
 /*! This method provides an entry point for the "parent" thread to release the
     child thread for a single frame's execution.  It is intended to only be
     called from the parent thread.
@@ -134,12 +151,22 @@ void SimThreadExecution::SingleStepProcesses(int64_t stopPri)
         SysProcess *localProc = (*it);
         if(localProc->processEnabled())
         {
+            std::chrono::steady_clock::time_point stepStart;
+            if(this->measureProcessCost)
+            {
+                stepStart = std::chrono::steady_clock::now();
+            }
             while(localProc->nextTaskTime < this->CurrentNanos ||
                   (localProc->nextTaskTime == this->CurrentNanos &&
                    localProc->processPriority >= stopPri))
             {
                 localProc->singleStepNextTask(this->CurrentNanos);
             }
+            if(this->measureProcessCost)
+            {
+                localProc->addExecutionNanos(std::chrono::duration_cast<std::chrono::nanoseconds>(
+                    std::chrono::steady_clock::now() - stepStart).count());
+            }
             if(localProc->getNextTime() < nextCallTime)
             {
                 nextCallTime = localProc->getNextTime();
@@ -177,9 +204,40 @@ void SimThreadExecution::StepUntilStop()
     }
 }
 
-/*! This method is currently vestigial and needs to be populated once the message
-    sharing process between different threads is handled.
-    TODO: Make this method move messages safely between threads
+/*! This method recomputes the next task time and priority of the thread from
+    its current process list.  It is needed when processes are moved between
+    threads in the middle of a simulation run.
+ @return void
+ */
+void SimThreadExecution::updateNextTaskTime()
+{
+    uint64_t nextCallTime = ~((uint64_t) 0);
+    std::vector<SysProcess *>::iterator it;
+    for(it = this->processList.begin(); it != this->processList.end(); it++)
+    {
+        SysProcess *localProc = (*it);
+        if(!localProc->processEnabled())
+        {
+            continue;
+        }
+        if(localProc->getNextTime() < nextCallTime)
+        {
+            nextCallTime = localProc->getNextTime();
+            this->nextProcPriority = localProc->processPriority;
+        }
+        else if(localProc->getNextTime() == nextCallTime &&
+                localProc->processPriority > this->nextProcPriority)
+        {
+            this->nextProcPriority = localProc->processPriority;
+        }
+    }
+    this->NextTaskTime = nextCallTime != ~((uint64_t) 0) ? nextCallTime : this->CurrentNanos;
+}
+
+/*! This method is called for every thread at the frame barrier before the
+    threads are released.  Messages that are read across threads are moved
+    safely by double buffering them, see SimModel::publishMessageBuffers, so
+    there is nothing left to move per process here.
  @return void
  */
 void SimThreadExecution::moveProcessMessages() {
@@ -277,54 +335,265 @@ SimModel::SimModel()
     //Default to single-threaded runtime
     SimThreadExecution *newThread = new SimThreadExecution(0, 0);
     this->threadList.push_back(newThread);
+    this->setBarrierSpinCount(std::thread::hardware_concurrency() > 1 ? defaultBarrierSpinCount : 0);
 
     this->NextTaskTime = 0;
 
     this->CurrentNanos = 0;
     this->NextTaskTime = 0;
     this->nextProcPriority = -1;
+    this->processBalanceFrames = 0;
+    this->balanceFramesLeft = 0;
 }
 
-/*! Nothing to destroy really */
+/*! The destructor stops the double buffering of the messages that are still
+    published by this simulation and shuts the threads down.
+ */
 SimModel::~SimModel()
 {
+    std::vector<MessageBuffer *>::iterator it;
+    for(it = this->messageBuffers.begin(); it != this->messageBuffers.end(); it++)
+    {
+        (*it)->detachBuffer();
+    }
+    this->messageBuffers.clear();
     this->deleteThreads();
 }
 
 /*! This method steps the simulation until the specified stop time and
- stop priority have been reached.
+ stop priority have been reached.  If process balancing is enabled, the first
+ frames are stepped one at a time while the process costs are measured, and
+ the processes are rebalanced across the threads before the rest of the run.
+ If double buffered messages are present, every frame is stepped separately
+ so that the message buffers are published at the barrier between frames.
+ Active native events are checked at the start and at the barriers of their
+ check times, and the method returns early if any of them fired.
  @param SimStopTime Nanoseconds to step the simulation for
  @param stopPri The priority level below which the sim won't go
  @return void
  */
 void SimModel::StepUntilStop(uint64_t SimStopTime, int64_t stopPri)
 {
-    std::vector<SimThreadExecution*>::iterator thrIt;
     std::cout << std::flush;
+    this->firedEvents.clear();
+    if(this->checkEvents(this->CurrentNanos))
+    {
+        return;
+    }
+    while(this->NextTaskTime < SimStopTime)
+    {
+        uint64_t frameStop = this->NextTaskTime;
+        if(this->balanceFramesLeft == 0 && this->messageBuffers.empty())
+        {
+            frameStop = this->nextEventCheckTime();
+            if(frameStop >= SimStopTime)
+            {
+                break;
+            }
+            frameStop = std::max(frameStop, this->NextTaskTime);
+        }
+        this->stepThreads(frameStop, std::numeric_limits<int64_t>::min());
+        if(this->balanceFramesLeft > 0 && --this->balanceFramesLeft == 0)
+        {
+            this->rebalanceProcs();
+        }
+        if(this->checkEvents(frameStop))
+        {
+            return;
+        }
+    }
+    this->stepThreads(SimStopTime, stopPri);
+}
+
+/*! This method releases all of the threads that have processes to step before
+ the specified stop time and stop priority, and waits for them to finish.
+ Threads that have nothing to execute in that interval are left asleep.  The
+ double buffered messages are published while all threads are held, before and
+ after the step, such that writes made from python between steps are visible.
+ @param stopNanos Nanoseconds to step the threads for
+ @param stopPri The priority level below which the threads won't go
+ @return void
+ */
+void SimModel::stepThreads(uint64_t stopNanos, int64_t stopPri)
+{
+    std::vector<SimThreadExecution*>::iterator thrIt;
+    std::vector<bool> threadReleased(this->threadList.size(), false);
+    std::vector<bool>::iterator releasedIt;
     for(thrIt=this->threadList.begin(); thrIt != this->threadList.end(); thrIt++)
     {
         (*thrIt)->moveProcessMessages();
     }
-    for(thrIt=this->threadList.begin(); thrIt != this->threadList.end(); thrIt++)
+    this->publishMessageBuffers();
+    for(thrIt=this->threadList.begin(), releasedIt=threadReleased.begin(); thrIt != this->threadList.end();
+        thrIt++, releasedIt++)
     {
-        (*thrIt)->stopThreadNanos = SimStopTime;
+        (*thrIt)->stopThreadNanos = stopNanos;
         (*thrIt)->stopThreadPriority = stopPri;
-        if((*thrIt)->procCount() > 0) {
+        if((*thrIt)->stepPending(stopNanos, stopPri)) {
             (*thrIt)->unlockThread();
+            *releasedIt = true;
         }
     }
     this->NextTaskTime = (uint64_t) ~0;
     this->CurrentNanos = (uint64_t) ~0;
-    for(thrIt=this->threadList.begin(); thrIt != this->threadList.end(); thrIt++)
+    for(thrIt=this->threadList.begin(), releasedIt=threadReleased.begin(); thrIt != this->threadList.end();
+        thrIt++, releasedIt++)
     {
         if((*thrIt)->procCount() > 0) {
-            (*thrIt)->lockParent();
+            if(*releasedIt) {
+                (*thrIt)->lockParent();
+            }
             this->NextTaskTime = (*thrIt)->NextTaskTime < this->NextTaskTime ?
                                  (*thrIt)->NextTaskTime : this->NextTaskTime;
             this->CurrentNanos = (*thrIt)->CurrentNanos < this->CurrentNanos ?
                                  (*thrIt)->CurrentNanos : this->CurrentNanos;
         }
     }
+    this->publishMessageBuffers();
+}
+
+/*! This method returns the earliest time at which an active native event has
+    to be checked.
+ @return uint64_t
+ */
+uint64_t SimModel::nextEventCheckTime()
+{
+    uint64_t nextCheck = (uint64_t) ~0;
+    std::vector<SimEvent>::iterator it;
+    for(it = this->eventList.begin(); it != this->eventList.end(); it++)
+    {
+        if(it->eventActive && it->nextCheckTime < nextCheck)
+        {
+            nextCheck = it->nextCheckTime;
+        }
+    }
+    return nextCheck;
+}
+
+/*! This method checks the conditions of the active native events that are due
+    once the simulation has been stepped up to the given time.  It must only be
+    called at a frame barrier, while the threads are waiting on the parent thread.
+ @param checkNanos Nanoseconds up to which the simulation has been stepped
+ @return bool True if any event fired
+ */
+bool SimModel::checkEvents(uint64_t checkNanos)
+{
+    std::vector<SimEvent>::iterator it;
+    for(it = this->eventList.begin(); it != this->eventList.end(); it++)
+    {
+        if(it->checkDue(checkNanos) && it->checkCondition(checkNanos, this->CurrentNanos))
+        {
+            this->firedEvents.push_back((int) (it - this->eventList.begin()));
+        }
+    }
+    return !this->firedEvents.empty();
+}
+
+/*! This method adds an event whose condition is checked by the simulation itself
+    at the frame barriers, without calling into python.  The condition is a
+    program of EventInstruction in reverse polish notation.  Once the condition is
+    met the event is deactivated and its index is reported by getFiredEvents().
+ @param eventName Identifier of the event
+ @param eventRate [ns] Period with which the condition is checked
+ @param condition Condition program of the event
+ @param eventActive Flag indicating whether the condition is checked
+ @return int64_t Index of the event, or -1 if the condition program is invalid
+ */
+int64_t SimModel::addEvent(std::string eventName, uint64_t eventRate, std::vector<EventInstruction> condition,
+                           bool eventActive)
+{
+    SimEvent newEvent(eventName, eventRate, condition, eventActive);
+    if(!newEvent.programValid())
+    {
+        bskLogger.bskLog(BSK_ERROR, "The condition of the event %s is not a valid program.", eventName.c_str());
+        return -1;
+    }
+    this->eventList.push_back(newEvent);
+    return (int64_t) this->eventList.size() - 1;
+}
+
+/*! This method adds an event that fires when a guard function crosses zero.  The
+    guard is checked at least with the event rate, and again at the linear
+    prediction of its zero crossing whenever that falls before the next regular
+    check.  The simulation therefore stops at the first frame after the crossing,
+    and the crossing time interpolated between the last two checks is returned by
+    getEventTime().
+ @param eventName Identifier of the event
+ @param eventRate [ns] Largest period with which the guard is checked
+ @param guard Guard function program of the event
+ @param guardDirection Guard crossings that fire the event, 1 rising, -1 falling, 0 both
+ @param eventActive Flag indicating whether the guard is checked
+ @return int64_t Index of the event, or -1 if the guard program is invalid
+ */
+int64_t SimModel::addGuardEvent(std::string eventName, uint64_t eventRate, std::vector<EventInstruction> guard,
+                                int32_t guardDirection, bool eventActive)
+{
+    SimEvent newEvent(eventName, eventRate, guard, guardDirection, eventActive);
+    if(!newEvent.programValid())
+    {
+        bskLogger.bskLog(BSK_ERROR, "The guard of the event %s is not a valid program.", eventName.c_str());
+        return -1;
+    }
+    this->eventList.push_back(newEvent);
+    return (int64_t) this->eventList.size() - 1;
+}
+
+/*! This method activates or deactivates a native event.
+ @param eventIndex Index of the event returned by addEvent()
+ @param eventActive Flag indicating whether the condition is checked
+ @return void
+ */
+void SimModel::setEventActivity(uint64_t eventIndex, bool eventActive)
+{
+    if(eventIndex >= this->eventList.size())
+    {
+        bskLogger.bskLog(BSK_ERROR, "The event index %d does not exist.", (int) eventIndex);
+        return;
+    }
+    this->eventList[eventIndex].setActive(eventActive);
+}
+
+/*! This method tells the caller if a native event is active.
+ @param eventIndex Index of the event returned by addEvent()
+ @return bool
+ */
+bool SimModel::getEventActivity(uint64_t eventIndex)
+{
+    if(eventIndex >= this->eventList.size())
+    {
+        bskLogger.bskLog(BSK_ERROR, "The event index %d does not exist.", (int) eventIndex);
+        return false;
+    }
+    return this->eventList[eventIndex].eventActive;
+}
+
+/*! This method returns the time at which a native event fired last.  For guard
+    events this is the zero crossing interpolated between the last two checks.
+ @param eventIndex Index of the event returned by addEvent() or addGuardEvent()
+ @return uint64_t
+ */
+uint64_t SimModel::getEventTime(uint64_t eventIndex)
+{
+    if(eventIndex >= this->eventList.size())
+    {
+        bskLogger.bskLog(BSK_ERROR, "The event index %d does not exist.", (int) eventIndex);
+        return 0;
+    }
+    return this->eventList[eventIndex].eventTime;
+}
+
+/*! This method makes the payloads written into the double buffered messages
+    visible to their readers.  It must only be called at a frame barrier, while
+    the threads are waiting on the parent thread.
+ @return void
+ */
+void SimModel::publishMessageBuffers()
+{
+    std::vector<MessageBuffer *>::iterator it;
+    for(it = this->messageBuffers.begin(); it != this->messageBuffers.end(); it++)
+    {
+        (*it)->publishBuffer();
+    }
 }
 
 
@@ -474,6 +743,7 @@ void SimModel::clearProcsFromThreads() {
     {
         (*it)->setProcessControlStatus(false);
     }
+    this->pinnedProcs.clear();
 
 }
 
@@ -481,6 +751,7 @@ void SimModel::clearProcsFromThreads() {
     number of concurrent threads that will be executing in a given simulation.
     You tell the method how many threads you want in the system, it clears out
     any existing thread data, and then allocates fresh threads for the runtime.
+    The threads spin on the frame barrier if there are enough cores available.
  @param threadCount number of threads
  @return void
  */
@@ -495,6 +766,8 @@ void SimModel::resetThreads(uint64_t threadCount)
         SimThreadExecution *newThread = new SimThreadExecution(0, 0);
         this->threadList.push_back(newThread);
     }
+    //! - Only spin on the frame barrier if every thread, including the parent thread, has a core of its own
+    this->setBarrierSpinCount(threadCount < std::thread::hardware_concurrency() ? defaultBarrierSpinCount : 0);
 
 }
 
@@ -523,6 +796,8 @@ void SimModel::deleteThreads() {
     for any processes that haven't already been placed onto a thread.  If the
     user has allocated N threads, this method just walks through those threads
     and pops all of the processes onto those threads in a round-robin fashion.
+    If process balancing is enabled, the threads start measuring the process
+    costs so that the processes can be rebalanced after the first frames.
  @return void
  */
 void SimModel::assignRemainingProcs() {
@@ -543,8 +818,14 @@ void SimModel::assignRemainingProcs() {
             (*thrIt)->addNewProcess((*it));
         }
     }
+    this->balanceFramesLeft = this->processBalanceFrames;
+    for(it=this->processList.begin(); it!= this->processList.end(); it++)
+    {
+        (*it)->clearExecutionNanos();
+    }
     for(thrIt=this->threadList.begin(); thrIt != this->threadList.end(); thrIt++)
     {
+        (*thrIt)->measureProcessCost = this->balanceFramesLeft > 0;
         it=this->processList.begin();
         (*thrIt)->nextProcPriority = (*it)->processPriority;
         (*thrIt)->NextTaskTime = 0;
@@ -558,6 +839,23 @@ void SimModel::assignRemainingProcs() {
     }
 }
 
+/*! This method sets how long the simulation threads and the parent thread spin
+    on the frame barrier before they are put to sleep.  Spinning avoids the cost
+    of waking a sleeping thread when frames are short, but wastes cores if there
+    are more threads than cores.
+ @param spinCount Number of times the barrier is checked before sleeping, 0 to
+                  sleep right away
+ @return void
+ */
+void SimModel::setBarrierSpinCount(uint64_t spinCount)
+{
+    std::vector<SimThreadExecution*>::iterator thrIt;
+    for(thrIt=this->threadList.begin(); thrIt != this->threadList.end(); thrIt++)
+    {
+        (*thrIt)->setSpinCount(spinCount);
+    }
+}
+
 /*! This method allows the user to specifically place a given process onto a
     specific thread index based on the currently active thread-pool.  This is the
     mechanism that a user has to specifically spread out processing in a way that
@@ -573,6 +871,110 @@ void SimModel::addProcessToThread(SysProcess *newProc, uint64_t threadSel)
     std::vector<SimThreadExecution*>::iterator thrIt;
     thrIt=threadList.begin() + threadSel;
     (*thrIt)->addNewProcess(newProc);
+    this->pinnedProcs.insert(newProc);
+}
+
+/*! This method turns on the cost-aware process balancing.  When the simulation
+    is initialized, the wall-clock time that each process takes to execute is
+    measured over the first frames.  The processes are then redistributed across
+    the thread pool so that every thread carries a similar load.  Processes that
+    were placed on a thread with addProcessToThread are never moved.
+ @param measureFrames The number of frames to measure before rebalancing
+ @return void
+ */
+void SimModel::enableProcessBalancing(uint64_t measureFrames)
+{
+    this->processBalanceFrames = measureFrames;
+}
+
+/*! This method redistributes the processes across the threads using their
+    measured execution cost.  The most expensive process is placed first onto the
+    thread with the lowest load (longest-processing-time first).  The processes
+    keep their priority order inside each thread.  It must only be called while
+    the threads are waiting on the parent thread.
+ @return void
+ */
+void SimModel::rebalanceProcs()
+{
+    std::vector<uint64_t> threadLoad(this->threadList.size(), 0);
+    std::map<SysProcess *, size_t> procThread;
+    std::vector<SysProcess *> movableProcs;
+    std::vector<SysProcess *>::iterator it;
+
+    //! - Pinned processes stay on their thread and count towards its load
+    for(size_t i=0; i<this->threadList.size(); i++)
+    {
+        const std::vector<SysProcess *> &threadProcs = this->threadList[i]->getProcessList();
+        for(SysProcess *proc : threadProcs)
+        {
+            if(this->pinnedProcs.count(proc) > 0)
+            {
+                procThread[proc] = i;
+                threadLoad[i] += proc->getExecutionNanos();
+            }
+            else
+            {
+                movableProcs.push_back(proc);
+            }
+        }
+    }
+
+    //! - Place the most expensive remaining process onto the least loaded thread
+    std::stable_sort(movableProcs.begin(), movableProcs.end(), [](SysProcess *a, SysProcess *b) {
+        return a->getExecutionNanos() > b->getExecutionNanos();
+    });
+    for(SysProcess *proc : movableProcs)
+    {
+        size_t threadSel = std::min_element(threadLoad.begin(), threadLoad.end()) - threadLoad.begin();
+        procThread[proc] = threadSel;
+        threadLoad[threadSel] += proc->getExecutionNanos();
+    }
+
+    //! - Rebuild the thread process lists in the simulation priority order
+    std::vector<SimThreadExecution*>::iterator thrIt;
+    for(thrIt=this->threadList.begin(); thrIt != this->threadList.end(); thrIt++)
+    {
+        (*thrIt)->clearProcessList();
+        (*thrIt)->measureProcessCost = false;
+    }
+    for(it = this->processList.begin(); it != this->processList.end(); it++)
+    {
+        if(procThread.count(*it) > 0)
+        {
+            this->threadList[procThread[*it]]->addNewProcess(*it);
+        }
+    }
+    for(thrIt=this->threadList.begin(); thrIt != this->threadList.end(); thrIt++)
+    {
+        (*thrIt)->updateNextTaskTime();
+    }
+    this->balanceFramesLeft = 0;
+}
+
+/*! This method returns the index of the thread that executes each process, in
+    the order of the simulation process list.  Processes that are not yet placed
+    on a thread are marked with -1.
+ @return vector of thread indices
+ */
+std::vector<int> SimModel::getProcessThreadAssignment()
+{
+    std::vector<int> assignment;
+    std::vector<SysProcess *>::iterator it;
+    for(it = this->processList.begin(); it != this->processList.end(); it++)
+    {
+        int threadSel = -1;
+        for(size_t i=0; i<this->threadList.size(); i++)
+        {
+            const std::vector<SysProcess *> &threadProcs = this->threadList[i]->getProcessList();
+            if(std::find(threadProcs.begin(), threadProcs.end(), *it) != threadProcs.end())
+            {
+                threadSel = (int) i;
+                break;
+            }
+        }
+        assignment.push_back(threadSel);
+    }
+    return assignment;
 }
 
 
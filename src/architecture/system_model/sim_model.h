@@ -26,7 +26,11 @@
 #include <mutex>
 #include <condition_variable>
 #include <iostream>
+#include <chrono>
+#include <algorithm>
 #include "architecture/system_model/sys_process.h"
+#include "architecture/system_model/sim_event.h"
+#include "architecture/_GeneralModuleFiles/messageBuffer.h"
 #include "architecture/utilities/bskLogging.h"
 #include "architecture/utilities/bskSemaphore.h"
 
@@ -54,9 +58,16 @@ public:
     void unlockThread();
     void lockParent();
     void unlockParent();
+    void setSpinCount(uint64_t spinCount);
+    //! Tells the caller if the thread has a process to step before the given stop time and priority
+    bool stepPending(uint64_t stopNanos, int64_t stopPri) {
+        return procCount() > 0 && (NextTaskTime < stopNanos || (NextTaskTime == stopNanos && nextProcPriority >= stopPri));
+    }
     void StepUntilStop();  //!< Step simulation until stop time uint64_t reached
     void SingleStepProcesses(int64_t stopPri=-1); //!< Step only the next Task in the simulation
     void moveProcessMessages();
+    void updateNextTaskTime();
+    const std::vector<SysProcess*>& getProcessList() {return processList;} //!< Returns the processes executed by this thread
 public:
     uint64_t currentThreadNanos;  //!< Current simulation time available at thread
     uint64_t stopThreadNanos;   //!< Current stop conditions for the thread
@@ -69,6 +80,7 @@ public:
     bool selfInitNow;              //!< Flag requesting self init
     bool crossInitNow;             //!< Flag requesting cross-init
     bool resetNow;                 //!< Flag requesting that the thread execute reset
+    bool measureProcessCost;       //!< Flag requesting that the wall-clock time of each process step is measured
 private:
     bool threadRunning;            //!< Flag that will allow for easy concurrent locking
     bool terminateThread;          //!< Flag that indicates that it is time to take thread down
@@ -98,6 +110,25 @@ public:
     void deleteThreads();
     void assignRemainingProcs();
     uint64_t getThreadCount() {return threadList.size();} //!< returns the number of threads used
+    void enableProcessBalancing(uint64_t measureFrames);
+    void disableProcessBalancing() {processBalanceFrames = 0; balanceFramesLeft = 0;} //!< Keeps the initial process to thread assignment
+    void rebalanceProcs();
+    void setBarrierSpinCount(uint64_t spinCount);
+    std::vector<int> getProcessThreadAssignment();
+    void addMessageBuffer(MessageBuffer *msgBuffer) {messageBuffers.push_back(msgBuffer);} //!< Publishes the message buffer at every frame barrier
+    void removeMessageBuffer(MessageBuffer *msgBuffer) {
+        messageBuffers.erase(std::remove(messageBuffers.begin(), messageBuffers.end(), msgBuffer), messageBuffers.end());
+    } //!< Stops publishing the message buffer
+    void publishMessageBuffers();
+    int64_t addEvent(std::string eventName, uint64_t eventRate, std::vector<EventInstruction> condition,
+                     bool eventActive=false);
+    int64_t addGuardEvent(std::string eventName, uint64_t eventRate, std::vector<EventInstruction> guard,
+                          int32_t guardDirection=0, bool eventActive=false);
+    void setEventActivity(uint64_t eventIndex, bool eventActive);
+    bool getEventActivity(uint64_t eventIndex);
+    uint64_t getEventTime(uint64_t eventIndex);
+    std::vector<int> getFiredEvents() {return firedEvents;} //!< Returns the indices of the events fired during the last StepUntilStop
+    void clearEvents() {eventList.clear(); firedEvents.clear();} //!< Removes all of the native events
 
     BSKLogger bskLogger;                      //!< -- BSK Logging
 
@@ -108,6 +139,17 @@ public:
     uint64_t CurrentNanos;  //!< [ns] Current sim time
     uint64_t NextTaskTime;  //!< [ns] time for the next Task
     int64_t nextProcPriority;  //!< [-] Priority level for the next process
+    uint64_t processBalanceFrames;  //!< -- Number of frames measured before the processes are rebalanced, 0 to disable
+    uint64_t balanceFramesLeft;  //!< -- Number of frames left to measure before the processes are rebalanced
+    std::set<SysProcess *> pinnedProcs;  //!< -- Processes explicitly placed on a thread, these are never moved
+    std::vector<MessageBuffer *> messageBuffers;  //!< -- Double buffered messages published at every frame barrier
+    std::vector<SimEvent> eventList;  //!< -- Events whose conditions are checked at the frame barriers
+    std::vector<int> firedEvents;  //!< -- Indices of the events fired during the last StepUntilStop
+
+private:
+    void stepThreads(uint64_t stopNanos, int64_t stopPri);
+    uint64_t nextEventCheckTime();
+    bool checkEvents(uint64_t checkNanos);
 };
 
 #endif /* _SimModel_H_ */
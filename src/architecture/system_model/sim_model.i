@@ -76,4 +76,9 @@ namespace std {
 %include "sys_model_task.h"
 %include "sys_model.h"
 %include "sys_process.h"
+%include "architecture/_GeneralModuleFiles/messageBuffer.h"
+%include "sim_event.h"
+namespace std {
+   %template(EventProgram) vector<EventInstruction>;
+}
 %include "sim_model.h"
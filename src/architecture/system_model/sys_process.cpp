@@ -28,6 +28,7 @@ SysProcess :: SysProcess()
     this->processActive = true;
     this->processPriority = -1;
     this->processOnThread = false;
+    this->executionNanos = 0;
     this->disableProcess();
 }
 /*! Make a process AND attach a storage bucket with the provided name. Give
@@ -42,6 +43,7 @@ SysProcess::SysProcess(std::string messageContainer)
     this->processName = messageContainer;
     this->prevRouteTime = 0xFF;
     this->processOnThread = false;
+    this->executionNanos = 0;
     this->disableProcess();
 }
 
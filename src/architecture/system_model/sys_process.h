@@ -59,6 +59,9 @@ public:
     void enableAllTasks(); //!< class method
     bool getProcessControlStatus() {return this->processOnThread;} //!< Allows caller to see if this process is parented by a thread
     void setProcessControlStatus(bool processTaken) {processOnThread = processTaken;} //!< Provides a mechanism to say that this process is allocated to a thread
+    void addExecutionNanos(uint64_t wallNanos) {this->executionNanos += wallNanos;} //!< Adds measured wall-clock time to the process execution cost
+    uint64_t getExecutionNanos() {return this->executionNanos;} //!< Returns the measured wall-clock time spent executing the process
+    void clearExecutionNanos() {this->executionNanos = 0;} //!< Clears the measured process execution cost
     
 public:
     std::vector<ModelScheduleEntry> processTasks;  //!< -- Array that has pointers to all process tasks
@@ -68,6 +71,7 @@ public:
 	bool processActive;  //!< -- Flag indicating whether the Process is active
 	bool processOnThread; //!< -- Flag indicating that the process has been added to a thread for execution
     int64_t processPriority;  //!< [-] Priority level for process (higher first)
+    uint64_t executionNanos;  //!< [ns] Wall-clock time measured while executing the process tasks
     BSKLogger bskLogger;                      //!< -- BSK Logging
 };
 
@@ -23,43 +23,77 @@
 
 #include <mutex>
 #include <condition_variable>
+#include <atomic>
 
 
-/*! Basilisk semaphore class */
+/*! Basilisk semaphore class.  A thread that acquires the semaphore first spins for a short while, such that
+ it can pick up a release that follows quickly without being put to sleep, and only then waits on the
+ condition variable. */
 class BSKSemaphore
 {
     std::mutex mutex;
     std::condition_variable cv;
-    size_t count;
+    std::atomic<size_t> count;
+    std::atomic<size_t> waiting;
+    size_t spinCount;
+
+    /*! take one count if available */
+    inline bool tryAcquire()
+    {
+        size_t current = count.load();
+        while (current > 0)
+        {
+            if (count.compare_exchange_weak(current, current - 1))
+            {
+                return true;
+            }
+        }
+        return false;
+    }
 
 public:
     /*! method description */
-    BSKSemaphore(int count_in = 0)
-        : count(count_in)
+    BSKSemaphore(int count_in = 0, size_t spin_in = 0)
+        : count(count_in), waiting(0), spinCount(spin_in)
     {
     }
     
     /*! release the lock */
     inline void release()
     {
+        ++count;
+        //notify the waiting thread, if any thread went to sleep
+        if (waiting.load() > 0)
         {
             std::unique_lock<std::mutex> lock(mutex);
-            ++count;
-            //notify the waiting thread
+            cv.notify_one();
         }
-        cv.notify_one();
     }
     
     /*! aquire the lock */
     inline void acquire()
     {
+        for (size_t i = 0; i < spinCount; i++)
+        {
+            if (tryAcquire())
+            {
+                return;
+            }
+        }
         std::unique_lock<std::mutex> lock(mutex);
-        while (count == 0)
+        ++waiting;
+        while (!tryAcquire())
         {
             //wait on the mutex until notify is called
             cv.wait(lock);
         }
-        --count;
+        --waiting;
+    }
+
+    /*! set how many times acquire checks the count before the thread is put to sleep */
+    inline void setSpinCount(size_t spin_in)
+    {
+        spinCount = spin_in;
     }
 };
 
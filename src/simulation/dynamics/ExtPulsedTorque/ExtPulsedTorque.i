@@ -29,6 +29,7 @@ from Basilisk.architecture.swig_common_model import *
 %include "swig_eigen.i"
 
 %include "sys_model.i"
+%include "simulation/dynamics/_GeneralModuleFiles/profilingCounter.h"
 %include "simulation/dynamics/_GeneralModuleFiles/dynamicEffector.h"
 %include "ExtPulsedTorque.h"
 
@@ -34,6 +34,7 @@ from Basilisk.architecture.swig_common_model import *
 // Instantiate templates used by example
 %include "sys_model.i"
 %include "simulation/dynamics/_GeneralModuleFiles/stateData.h"
+%include "simulation/dynamics/_GeneralModuleFiles/profilingCounter.h"
 %include "simulation/dynamics/_GeneralModuleFiles/dynamicEffector.h"
 %include "simulation/dynamics/_GeneralModuleFiles/dynParamManager.h"
 
@@ -149,8 +149,8 @@ void HingedRigidBodyStateEffector::updateEffectorMassProps(double integTime)
 
     // - Find hinged rigid bodies' position with respect to point B
     // - First need to grab current states
-    this->theta = this->thetaState->getState()(0, 0);
-    this->thetaDot = this->thetaDotState->getState()(0, 0);
+    this->theta = this->thetaState->getStateView<1>()(0, 0);
+    this->thetaDot = this->thetaDotState->getStateView<1>()(0, 0);
     // - Next find the sHat unit vectors
     this->dcm_SH = eigenM2(this->theta);
     this->dcm_SP = this->dcm_SH*this->dcm_HP;
@@ -260,11 +260,9 @@ void HingedRigidBodyStateEffector::computeDerivatives(double integTime, Eigen::V
 
     // - Compute Derivatives
     // - First is trivial
-    this->thetaState->setDerivative(thetaDotState->getState());
+    this->thetaState->stateDerivView<1>() = thetaDotState->getStateView<1>();
     // - Second, a little more involved
-    Eigen::MatrixXd thetaDDot(1,1);
-    thetaDDot(0,0) = this->aTheta.dot(rDDotLoc_PN_P) + this->bTheta.dot(omegaDot_BN_B) + this->cTheta;
-    this->thetaDotState->setDerivative(thetaDDot);
+    this->thetaDotState->stateDerivView<1>()(0, 0) = this->aTheta.dot(rDDotLoc_PN_P) + this->bTheta.dot(omegaDot_BN_B) + this->cTheta;
 
     return;
 }
@@ -331,7 +329,7 @@ void HingedRigidBodyStateEffector::calcForceTorqueOnBody(double integTime, Eigen
 
     // - Get thetaDDot from last integrator call
     double thetaDDotLocal;
-    thetaDDotLocal = thetaDotState->getStateDeriv()(0, 0);
+    thetaDDotLocal = thetaDotState->getStateDerivView<1>()(0, 0);
 
     // - Calculate force that the HRB is applying to the spacecraft
     this->forceOnBody_B = -(this->mass*this->d*this->sHat3_P*thetaDDotLocal + this->mass*this->d*this->thetaDot
@@ -372,7 +370,7 @@ void HingedRigidBodyStateEffector::computePanelInertialStates()
 {
     // inertial attitude
     Eigen::MRPd sigmaBN;
-    sigmaBN = (Eigen::Vector3d)this->sigma_BN->getState();
+    sigmaBN = (Eigen::Vector3d)this->sigma_BN->getStateView<3>();
     Eigen::Matrix3d dcm_NP = sigmaBN.toRotationMatrix();  // assumes P and B are idential
     Eigen::Matrix3d dcm_SN;
     dcm_SN = this->dcm_SP*dcm_NP.transpose();
@@ -381,7 +379,7 @@ void HingedRigidBodyStateEffector::computePanelInertialStates()
 
     // inertial angular velocity
     Eigen::Vector3d omega_BN_B;
-    omega_BN_B = (Eigen::Vector3d)this->omega_BN_B->getState();
+    omega_BN_B = (Eigen::Vector3d)this->omega_BN_B->getStateView<3>();
     this->omega_SN_S = this->dcm_SP * ( omega_BN_B + this->thetaDot*this->sHat2_P);
 
     // inertial position vector
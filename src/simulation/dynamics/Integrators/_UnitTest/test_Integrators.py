@@ -52,7 +52,8 @@ path = os.path.dirname(os.path.abspath(filename))
 # @pytest.mark.xfail(True, reason="Scott's brain no-worky\n")
 # The following 'parametrize' function decorator provides the parameters and expected results for each
 #   of the multiple test runs for this test.
-@pytest.mark.parametrize("integratorCase", ["rk4", "rkf45", "rkf78", "euler", "rk2", "rk3", "bogackiShampine"])
+@pytest.mark.parametrize("integratorCase", ["rk4", "rkf45", "rkf78", "euler", "rk2", "rk3", "bogackiShampine",
+                                            "rkf45Controlled", "abm4", "symplectic"])
 def test_scenarioIntegrators(show_plots, integratorCase):
     """This function is called by the py.test environment."""
     # each test method requires a single assert method to be called
@@ -95,6 +96,13 @@ def run(doUnitTests, show_plots, integratorCase):
         integratorObject.setRelativeTolerance(0)
         integratorObject.setAbsoluteTolerance(0.01)
         scObject.setIntegrator(integratorObject)
+    if integratorCase == "rkf45Controlled":
+        integratorObject = svIntegrators.svIntegratorRKF45(scObject)
+        integratorObject.setRelativeTolerance(0)
+        integratorObject.setAbsoluteTolerance(0.01)
+        integratorObject.stepSizeControllerBeta = 0.08
+        integratorObject.useInitialStepSizeHeuristic = True
+        scObject.setIntegrator(integratorObject)
     if integratorCase == "rkf78":
         integratorObject = svIntegrators.svIntegratorRKF78(scObject)
         integratorObject.setRelativeTolerance(0)
@@ -106,6 +114,14 @@ def run(doUnitTests, show_plots, integratorCase):
     elif integratorCase == "rk2":
         integratorObject = svIntegrators.svIntegratorRK2(scObject)
         scObject.setIntegrator(integratorObject)
+    elif integratorCase == "abm4":
+        integratorObject = svIntegrators.svIntegratorABM4(scObject)
+        integratorObject.correctedStateEvaluation = True
+        scObject.setIntegrator(integratorObject)
+    elif integratorCase == "symplectic":
+        integratorObject = svIntegrators.svIntegratorSymplectic(scObject)
+        integratorObject.setOrder(6)
+        scObject.setIntegrator(integratorObject)
     elif integratorCase == "rk3":
         integratorObject = svIntegrators.svIntegratorRungeKutta(
             scObject,
@@ -193,6 +209,17 @@ def run(doUnitTests, show_plots, integratorCase):
     scSim.ConfigureStopTime(simulationTime)
     scSim.ExecuteSimulation()
 
+    if doUnitTests and integratorCase in {"rkf45", "rkf45Controlled"}:
+        # the step size the tolerances allow is carried over to the next task call
+        stepSize = integratorObject.getStepSize()
+        if not 0 < stepSize < macros.NANO2SEC * simulationTimeStep:
+            testFailCount += 1
+            testMessages.append(f"FAILED: unexpected adaptive step size {stepSize}")
+        integratorObject.resetStepSize()
+        if integratorObject.getStepSize() != 0:
+            testFailCount += 1
+            testMessages.append("FAILED: adaptive step size was not reset")
+
     #
     #   retrieve the logged data
     #
@@ -284,7 +311,7 @@ def run(doUnitTests, show_plots, integratorCase):
                 , [4.614900659014343e6, -3.60224207689023e6, -3.837022825958977e6]
                 , [5.879095186201691e6, 3.561495655367985e6, -1.3195821703218794e6]
             ]
-        if integratorCase in {"rkf45", "rkf78", "bogackiShampine"}:
+        if integratorCase in {"rkf45", "rkf78", "bogackiShampine", "rkf45Controlled", "abm4", "symplectic"}:
             truePos = [[ 5879286.370258273, 3561242.50810664, -1319786.625981673]]
             dataPosRed = dataPosRed[-1,:][np.newaxis]
         if integratorCase == "euler":
@@ -314,6 +341,12 @@ def run(doUnitTests, show_plots, integratorCase):
 
         # compare the results to the truth values
         accuracy = 1.0  # meters
+        # the fixed step multistep and symplectic methods are compared to the accurate final position
+        # of the adaptive methods, their truncation error with 120 s steps is a few km and a few m
+        if integratorCase == "abm4":
+            accuracy = 5000.0
+        if integratorCase == "symplectic":
+            accuracy = 100.0
 
         testFailCount, testMessages = unitTestSupport.compareArray(
             truePos, dataPosRed, accuracy, "r_BN_N Vector",
@@ -347,6 +380,84 @@ def run(doUnitTests, show_plots, integratorCase):
     return [testFailCount, ''.join(testMessages)]
 
 
+def propagateWithDenseOutput(taskTimeStep, simulationTime, denseOutput):
+    """Propagates a LEO orbit with RKF45 and returns the simulation, the spacecraft object and its integrator"""
+    scSim = SimulationBaseClass.SimBaseClass()
+    dynProcess = scSim.CreateNewProcess("simProcess")
+    dynProcess.addTask(scSim.CreateNewTask("simTask", taskTimeStep))
+
+    scObject = spacecraft.Spacecraft()
+    scObject.ModelTag = "spacecraftBody"
+    integratorObject = svIntegrators.svIntegratorRKF45(scObject)
+    integratorObject.setRelativeTolerance(0)
+    integratorObject.setAbsoluteTolerance(0.001)
+    integratorObject.denseOutput = denseOutput
+    scObject.setIntegrator(integratorObject)
+    scSim.AddModelToTask("simTask", scObject)
+
+    gravFactory = simIncludeGravBody.gravBodyFactory()
+    earth = gravFactory.createEarth()
+    earth.isCentralBody = True
+    scObject.gravField.gravBodies = spacecraft.GravBodyVector(list(gravFactory.gravBodies.values()))
+
+    oe = orbitalMotion.ClassicElements()
+    oe.a = 7000. * 1000
+    oe.e = 0.0001
+    oe.i = 33.3 * macros.D2R
+    oe.Omega = 48.2 * macros.D2R
+    oe.omega = 347.8 * macros.D2R
+    oe.f = 85.3 * macros.D2R
+    rN, vN = orbitalMotion.elem2rv(earth.mu, oe)
+    scObject.hub.r_CN_NInit = rN
+    scObject.hub.v_CN_NInit = vN
+
+    scSim.InitializeSimulation()
+    scSim.ConfigureStopTime(simulationTime)
+    scSim.ExecuteSimulation()
+    return scSim, scObject, integratorObject
+
+
+def test_denseOutput():
+    """Checks that the states interpolated within a large task time step match a propagation with a small task
+    time step"""
+    stopTime = macros.sec2nano(1200.)
+    _, scObject, _ = propagateWithDenseOutput(macros.sec2nano(600.), stopTime, True)
+
+    # the states are interpolated within the last 600 s task time step
+    stateName = scObject.hub.nameOfHubPosition
+    for sampleTime in [600., 750., 930., 1200.]:
+        _, truthObject, _ = propagateWithDenseOutput(macros.sec2nano(10.), macros.sec2nano(sampleTime), False)
+        np.testing.assert_allclose(scObject.getStateAtTime(stateName, sampleTime),
+                                   truthObject.dynManager.getStateObject(stateName).getState(),
+                                   rtol=0, atol=0.5)
+
+    # the states before the last task time step are no longer available
+    assert scObject.getStateAtTime(stateName, 300.).size == 0
+
+    # integrators without dense output don't interpolate the states
+    _, scObject, _ = propagateWithDenseOutput(macros.sec2nano(600.), stopTime, False)
+    assert scObject.getStateAtTime(stateName, 900.).size == 0
+
+
+@pytest.mark.parametrize("changeStates", [False, True])
+def test_stepSizeReset(changeStates):
+    """Checks that the step size of the previous call is only reused if the states didn't jump between calls"""
+    scSim, scObject, integratorObject = propagateWithDenseOutput(macros.sec2nano(60.), macros.sec2nano(600.), False)
+    assert 0 < integratorObject.getStepSize() < 60.
+
+    if changeStates:
+        velocity = scObject.dynManager.getStateObject(scObject.hub.nameOfHubVelocity)
+        velocity.setState(-velocity.getState())
+
+    scSim.resetProfilingCounters()
+    scSim.ConfigureStopTime(macros.sec2nano(660.))
+    scSim.ExecuteSimulation()
+
+    # once the step size is forgotten, the full task time step is attempted and rejected
+    rejectedSteps = scSim.getProfilingReport()["spacecraftBody"]["integrator"]["rejectedSteps"]
+    assert (rejectedSteps > 0) == changeStates
+
+
 #
 # This statement below ensures that the unit test scrip can be run as a
 # stand-along python script
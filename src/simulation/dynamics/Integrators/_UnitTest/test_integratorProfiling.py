@@ -0,0 +1,119 @@
+# ISC License
+#
+# Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+
+#
+# Basilisk Unit Test
+#
+# Purpose:  Test the profiling counters of the integrators, the equations of motion and the effectors
+#
+
+import pytest
+from Basilisk.simulation import extForceTorque
+from Basilisk.simulation import linearSpringMassDamper
+from Basilisk.simulation import spacecraft
+from Basilisk.simulation import svIntegrators
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+from Basilisk.utilities import simIncludeGravBody
+
+
+@pytest.mark.parametrize("integratorCase", ["rk4", "rkf45"])
+@pytest.mark.parametrize("profileEvaluationTimes", [False, True])
+def test_integratorProfiling(integratorCase, profileEvaluationTimes):
+    """
+    Checks that the profiling report counts every integration step and equations of motion evaluation,
+    and that the evaluation times are only measured on request
+    """
+    scSim = SimulationBaseClass.SimBaseClass()
+    dynProcess = scSim.CreateNewProcess("dynamicsProcess")
+    dynProcess.addTask(scSim.CreateNewTask("dynamicsTask", macros.sec2nano(10.)))
+
+    scObject = spacecraft.Spacecraft()
+    scObject.ModelTag = "spacecraftBody"
+    scObject.hub.mHub = 750.0
+    scObject.hub.IHubPntBc_B = [[900.0, 0.0, 0.0], [0.0, 800.0, 0.0], [0.0, 0.0, 600.0]]
+    scObject.hub.r_CN_NInit = [[-4020338.690396649], [7490566.741852513], [5248299.211589362]]
+    scObject.hub.v_CN_NInit = [[-5199.77710904224], [-3436.681645356935], [1041.576797498721]]
+    scObject.hub.omega_BN_BInit = [[0.01], [-0.02], [0.03]]
+    scObject.profileEvaluationTimes = profileEvaluationTimes
+
+    if integratorCase == "rkf45":
+        integratorObject = svIntegrators.svIntegratorRKF45(scObject)
+        integratorObject.setRelativeTolerance(0)
+        integratorObject.setAbsoluteTolerance(1e-6)
+        scObject.setIntegrator(integratorObject)
+
+    gravFactory = simIncludeGravBody.gravBodyFactory()
+    gravFactory.createEarth().isCentralBody = True
+    gravFactory.addBodiesTo(scObject)
+
+    particle = linearSpringMassDamper.LinearSpringMassDamper()
+    particle.k = 100.0
+    particle.c = 0.0
+    particle.r_PB_B = [[0.1], [0.0], [-0.1]]
+    particle.pHat_B = [[1.0], [0.0], [0.0]]
+    particle.rhoInit = 0.05
+    particle.massInit = 10.0
+    scObject.addStateEffector(particle)
+
+    extForce = extForceTorque.ExtForceTorque()
+    extForce.ModelTag = "externalDisturbance"
+    extForce.extTorquePntB_B = [[0.001], [0.0], [0.0]]
+    scObject.addDynamicEffector(extForce)
+
+    scSim.AddModelToTask("dynamicsTask", scObject)
+    scSim.AddModelToTask("dynamicsTask", extForce)
+
+    scSim.InitializeSimulation()
+    scSim.resetProfilingCounters()
+    scSim.ConfigureStopTime(macros.sec2nano(100.))
+    scSim.ExecuteSimulation()
+
+    report = scSim.getProfilingReport()
+    assert list(report) == ["spacecraftBody"]
+    eom = report["spacecraftBody"]["equationsOfMotion"]
+    integrator = report["spacecraftBody"]["integrator"]
+    effectors = report["spacecraftBody"]["effectors"]
+
+    # one integrate call per task step
+    assert integrator["calls"] == 11
+    assert integrator["nanoseconds"] > 0
+    if integratorCase == "rk4":
+        assert integrator["acceptedSteps"] == integrator["calls"]
+        assert integrator["rejectedSteps"] == 0
+        assert eom["calls"] == 4 * integrator["calls"]
+    else:
+        # the first call integrates over a zero time step
+        assert integrator["acceptedSteps"] >= integrator["calls"] - 1
+        assert eom["calls"] == 6 * (integrator["acceptedSteps"] + integrator["rejectedSteps"])
+
+    # every effector is evaluated once per equations of motion call
+    assert list(effectors) == ["stateEffector0", "externalDisturbance"]
+    for counter in effectors.values():
+        assert counter["calls"] == eom["calls"]
+        assert (counter["nanoseconds"] > 0) == profileEvaluationTimes
+    assert (eom["nanoseconds"] > 0) == profileEvaluationTimes
+
+    scSim.resetProfilingCounters()
+    report = scSim.getProfilingReport()
+    assert report["spacecraftBody"]["equationsOfMotion"]["calls"] == 0
+    assert report["spacecraftBody"]["integrator"]["acceptedSteps"] == 0
+    assert all(counter["calls"] == 0 for counter in report["spacecraftBody"]["effectors"].values())
+
+
+if __name__ == "__main__":
+    test_integratorProfiling("rkf45", True)
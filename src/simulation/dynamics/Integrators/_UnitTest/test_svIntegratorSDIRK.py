@@ -0,0 +1,114 @@
+# ISC License
+#
+# Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+
+
+#
+# Basilisk Unit Test
+#
+# Purpose:  Test the implicit SDIRK integrator on a spacecraft with a stiff spring mass damper
+#
+
+import numpy as np
+import pytest
+from Basilisk.simulation import linearSpringMassDamper
+from Basilisk.simulation import spacecraft
+from Basilisk.simulation import svIntegrators
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+
+
+def propagateStiffSpacecraft(timeStep, useSDIRK, maximumNewtonIterations=None):
+    """Propagate a spacecraft with a stiff and heavily damped spring mass damper for 5 seconds"""
+    scSim = SimulationBaseClass.SimBaseClass()
+    dynProcess = scSim.CreateNewProcess("dynamicsProcess")
+    dynProcess.addTask(scSim.CreateNewTask("dynamicsTask", macros.sec2nano(timeStep)))
+
+    scObject = spacecraft.Spacecraft()
+    scObject.ModelTag = "spacecraftBody"
+    scObject.hub.mHub = 750.0
+    scObject.hub.r_BcB_B = [[0.0], [0.0], [1.0]]
+    scObject.hub.IHubPntBc_B = [[900.0, 0.0, 0.0], [0.0, 800.0, 0.0], [0.0, 0.0, 600.0]]
+    scObject.hub.r_CN_NInit = [[-4020338.69], [7490566.74], [5248299.21]]
+    scObject.hub.v_CN_NInit = [[-5199.78], [-3436.68], [1041.58]]
+    scObject.hub.omega_BN_BInit = [[0.05], [-0.04], [0.07]]
+
+    # the spring and damper modes have time constants of about a millisecond
+    particle = linearSpringMassDamper.LinearSpringMassDamper()
+    particle.k = 1e6
+    particle.c = 1e4
+    particle.r_PB_B = [[0.1], [0], [-0.1]]
+    particle.pHat_B = [[np.sqrt(3)/3], [np.sqrt(3)/3], [np.sqrt(3)/3]]
+    particle.rhoInit = 0.01
+    particle.rhoDotInit = 0.0
+    particle.massInit = 10.0
+    scObject.addStateEffector(particle)
+
+    integratorObject = None
+    if useSDIRK:
+        integratorObject = svIntegrators.svIntegratorSDIRK(scObject)
+        if maximumNewtonIterations is not None:
+            integratorObject.maximumNewtonIterations = maximumNewtonIterations
+            integratorObject.maximumStepHalvings = 1
+        scObject.setIntegrator(integratorObject)
+
+    scSim.AddModelToTask("dynamicsTask", scObject)
+    scSim.InitializeSimulation()
+    scSim.ConfigureStopTime(macros.sec2nano(5.))
+    scSim.ExecuteSimulation()
+
+    omega = scObject.dynManager.getStateObject(scObject.hub.nameOfHubOmega).getState()
+    return np.array(omega).flatten(), integratorObject
+
+
+def test_svIntegratorSDIRK():
+    """
+    Checks that the SDIRK integrator follows the hub rotation of a spacecraft with a stiff spring mass damper
+    with a time step at which RK4 is unstable, and that it reuses its Jacobian and factorization
+    """
+    truthOmega, _ = propagateStiffSpacecraft(2e-3, False)
+
+    # RK4 diverges once the time step exceeds its stability limit
+    rk4Omega, _ = propagateStiffSpacecraft(5e-3, False)
+    assert not np.all(np.isfinite(rk4Omega))
+
+    omega, integratorObject = propagateStiffSpacecraft(0.1, True)
+    np.testing.assert_allclose(omega, truthOmega, rtol=0, atol=1e-6)
+
+    # the Jacobian and the factorization of the constant step size iteration matrix are reused
+    assert integratorObject.getJacobianEvaluations() <= 2
+    assert integratorObject.getFactorizations() <= 2
+
+    # the tolerances must be positive
+    with pytest.raises(RuntimeError):
+        integratorObject.setRelativeTolerance(-1.)
+    with pytest.raises(RuntimeError):
+        integratorObject.setAbsoluteTolerance(0.)
+
+
+def test_svIntegratorSDIRKNotConverged():
+    """
+    Checks that the SDIRK integrator keeps the states at the end of the last converged step when the Newton
+    iteration does not converge, instead of writing an unconverged stage into them
+    """
+    # without Newton iterations no stage converges, such that every step fails
+    omega, _ = propagateStiffSpacecraft(0.1, True, maximumNewtonIterations=0)
+    np.testing.assert_array_equal(omega, [0.05, -0.04, 0.07])
+
+
+if __name__ == "__main__":
+    test_svIntegratorSDIRK()
+    test_svIntegratorSDIRKNotConverged()
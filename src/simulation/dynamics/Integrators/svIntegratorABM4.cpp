@@ -0,0 +1,135 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#include "svIntegratorABM4.h"
+#include <algorithm>
+#include <cmath>
+
+svIntegratorABM4::svIntegratorABM4(DynamicObject* dyn)
+    : svIntegratorRungeKutta(dyn, svIntegratorABM4::getCoefficients())
+{
+}
+
+RKCoefficients<4> svIntegratorABM4::getCoefficients()
+{
+    RKCoefficients<4> coefficients;
+    coefficients.aMatrix.at(1).at(0) = 0.5;
+    coefficients.aMatrix.at(2).at(1) = 0.5;
+    coefficients.aMatrix.at(3).at(2) = 1.0;
+
+    coefficients.bArray = {1. / 6., 1. / 3., 1. / 3., 1. / 6.};
+
+    coefficients.cArray = {0., 1. / 2., 1. / 2., 1.};
+
+    return coefficients;
+}
+
+void svIntegratorABM4::integrate(double currentTime, double timeStep)
+{
+    const bool layoutChanged = this->updateStateLayout();
+    this->stateLayout.gatherStates(this->currentState);
+
+    if (layoutChanged || !this->isHistoryValid(currentTime, timeStep)) {
+        this->resetHistory();
+    }
+
+    if (this->historySize < 3) {
+        // Startup with RK4, whose first "k" coefficient is the derivative at the current states
+        this->computeKCoefficients(currentTime, timeStep, this->currentState);
+        this->computeNextState(timeStep, this->currentState, this->nextState);
+        this->pushDerivative(this->kVectors.at(0));
+        this->hasCurrentDerivative = false;
+    }
+    else {
+        if (!this->hasCurrentDerivative) {
+            this->computeDerivatives(currentTime, timeStep, this->currentState, this->derivative);
+            this->pushDerivative(this->derivative);
+        }
+
+        const auto& f = this->derivativeHistory;
+
+        // Predict with the 4-step Adams-Bashforth method
+        this->stageState = this->currentState + (timeStep / 24.) * (55. * f[0] - 59. * f[1] +
+                                                                     37. * f[2] - 9. * f[3]);
+
+        // Evaluate the dynamics at the predicted states
+        this->computeDerivatives(currentTime + timeStep, timeStep, this->stageState, this->derivative);
+
+        // Correct with the 3-step Adams-Moulton method
+        this->nextState = this->currentState + (timeStep / 24.) * (9. * this->derivative +
+                                                                   19. * f[0] - 5. * f[1] + f[2]);
+
+        if (this->correctedStateEvaluation) {
+            this->computeDerivatives(
+                currentTime + timeStep, timeStep, this->nextState, this->derivative);
+        }
+        this->pushDerivative(this->derivative);
+        this->hasCurrentDerivative = true;
+    }
+
+    this->previousEndState = this->nextState;
+    this->previousEndTime = currentTime + timeStep;
+    this->previousTimeStep = timeStep;
+    this->stateLayout.scatterStates(this->nextState);
+    this->profile.acceptedSteps++;
+}
+
+void svIntegratorABM4::resetHistory()
+{
+    this->historySize = 0;
+    this->hasCurrentDerivative = false;
+}
+
+size_t svIntegratorABM4::getHistorySize() const
+{
+    return this->historySize;
+}
+
+bool svIntegratorABM4::isHistoryValid(double currentTime, double timeStep) const
+{
+    // The multistep method requires equally spaced nodes
+    if (!(std::abs(currentTime - this->previousEndTime) <= 1e-12 * std::max(1.0, std::abs(currentTime))) ||
+        !(std::abs(timeStep - this->previousTimeStep) <= 1e-12 * std::max(1.0, std::abs(timeStep)))) {
+        return false;
+    }
+
+    // Small changes of the states between calls (such as the gravity velocity of the
+    // spacecraft hub being reset) don't invalidate the derivatives, but jumps do
+    for (const auto& entry : this->stateLayout.getEntries()) {
+        auto state = this->currentState.segment(entry.offset, entry.size());
+        auto previousState = this->previousEndState.segment(entry.offset, entry.size());
+        double change = (state - previousState).norm();
+        if (change > 0 &&
+            change > this->historyResetThreshold * std::max(state.norm(), previousState.norm())) {
+            return false;
+        }
+    }
+
+    return true;
+}
+
+void svIntegratorABM4::pushDerivative(Eigen::VectorXd& derivative)
+{
+    // Rotating the history only swaps the storage of the vectors
+    std::rotate(this->derivativeHistory.rbegin(),
+                this->derivativeHistory.rbegin() + 1,
+                this->derivativeHistory.rend());
+    this->derivativeHistory[0].swap(derivative);
+    this->historySize = std::min<size_t>(this->historySize + 1, this->derivativeHistory.size());
+}
@@ -0,0 +1,82 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#ifndef svIntegratorABM4_h
+#define svIntegratorABM4_h
+
+#include "../_GeneralModuleFiles/svIntegratorRungeKutta.h"
+
+/*! @brief 4th order Adams-Bashforth-Moulton predictor-corrector integrator
+ *
+ * The state is predicted with the 4-step Adams-Bashforth method, the dynamics are
+ * evaluated at the predicted state, and the prediction is corrected with the 3-step
+ * Adams-Moulton method. Once the history of derivatives is built, a step only costs a
+ * single evaluation of the dynamics (two if correctedStateEvaluation is set).
+ *
+ * The first three steps, and the steps after the history was invalidated, are taken
+ * with the RK4 method.
+ */
+class svIntegratorABM4 : public svIntegratorRungeKutta<4> {
+  public:
+    svIntegratorABM4(DynamicObject* dyn); //!< class method
+
+    /** Performs the integration of the associated dynamic objects up to time currentTime+timeStep
+     */
+    virtual void integrate(double currentTime, double timeStep) override;
+
+    /** Discards the history of derivatives, so that the next steps are taken with RK4 again.
+     *
+     * This should be called after the states were changed discontinuously.
+     */
+    void resetHistory();
+
+    /** Returns the number of derivatives in the history, the multistep method is used once it is 4 */
+    size_t getHistorySize() const;
+
+    /** If true, the dynamics are evaluated again at the corrected state (PECE mode).
+     *
+     * This doubles the cost of a step, but improves the stability of the method.
+     * Otherwise, the derivative at the predicted state is kept in the history (PEC mode).
+     */
+    bool correctedStateEvaluation = false;
+
+    /** The history is discarded if a state changed by more than this fraction of its norm between
+     * two calls, as happens for example when MRPs are switched to their shadow set.
+     */
+    double historyResetThreshold = 0.1;
+
+  private:
+    static RKCoefficients<4> getCoefficients();
+
+    /** Checks that the history of derivatives can be used to continue the integration */
+    bool isHistoryValid(double currentTime, double timeStep) const;
+
+    /** Adds a derivative to the history, the given vector is swapped into the history */
+    void pushDerivative(Eigen::VectorXd& derivative);
+
+    std::array<Eigen::VectorXd, 4> derivativeHistory; //!< Derivatives at the last nodes, newest first
+    size_t historySize = 0;              //!< Number of valid derivatives in the history
+    bool hasCurrentDerivative = false;   //!< True if the newest derivative is at the current states
+    Eigen::VectorXd derivative;          //!< Derivative at the predicted or corrected states
+    Eigen::VectorXd previousEndState;    //!< Packed states at the end of the last call
+    double previousEndTime = NAN;        //!< Time at the end of the last call
+    double previousTimeStep = NAN;       //!< Time step of the last call
+};
+
+#endif /* svIntegratorABM4_h */
@@ -0,0 +1,271 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#include "svIntegratorSDIRK.h"
+#include <algorithm>
+#include <cfloat>
+#include <cmath>
+#include <limits>
+#include <stdexcept>
+
+// Three stage, third order, L-stable and stiffly accurate SDIRK method of
+// Alexander (1977): gamma is the root of x^3 - 3x^2 + 3x/2 - 1/6 in (1/6, 1/2)
+const double svIntegratorSDIRK::diagonalCoefficient = 0.43586652150845899941601945;
+
+const std::array<std::array<double, 3>, 3> svIntegratorSDIRK::aMatrix = {{
+    {{0.43586652150845899941601945, 0.0, 0.0}},
+    {{(1.0 - 0.43586652150845899941601945) / 2.0, 0.43586652150845899941601945, 0.0}},
+    {{-1.5 * 0.43586652150845899941601945 * 0.43586652150845899941601945 +
+          4.0 * 0.43586652150845899941601945 - 0.25,
+      1.5 * 0.43586652150845899941601945 * 0.43586652150845899941601945 -
+          5.0 * 0.43586652150845899941601945 + 1.25,
+      0.43586652150845899941601945}},
+}};
+
+const std::array<double, 3> svIntegratorSDIRK::cArray = {
+    0.43586652150845899941601945, (1.0 + 0.43586652150845899941601945) / 2.0, 1.0};
+
+svIntegratorSDIRK::svIntegratorSDIRK(DynamicObject* dyn)
+    : StateVecIntegrator(dyn)
+{
+}
+
+void svIntegratorSDIRK::setRelativeTolerance(double relTol)
+{
+    if (!(relTol >= 0)) {
+        throw std::invalid_argument("The relative tolerance of the SDIRK integrator can't be negative");
+    }
+    this->relTol = relTol;
+}
+
+double svIntegratorSDIRK::getRelativeTolerance() const
+{
+    return this->relTol;
+}
+
+void svIntegratorSDIRK::setAbsoluteTolerance(double absTol)
+{
+    if (!(absTol > 0)) {
+        throw std::invalid_argument("The absolute tolerance of the SDIRK integrator must be positive");
+    }
+    this->absTol = absTol;
+}
+
+double svIntegratorSDIRK::getAbsoluteTolerance() const
+{
+    return this->absTol;
+}
+
+size_t svIntegratorSDIRK::getJacobianEvaluations() const
+{
+    return this->jacobianEvaluations;
+}
+
+size_t svIntegratorSDIRK::getFactorizations() const
+{
+    return this->factorizations;
+}
+
+void svIntegratorSDIRK::integrate(double currentTime, double timeStep)
+{
+    if (this->stateLayout.update(this->dynPtrs)) {
+        const Eigen::Index size = this->stateLayout.size();
+        for (Eigen::VectorXd* vector : {&this->currentState, &this->stageBase, &this->stageState,
+                                        &this->stageDerivative, &this->residual, &this->newtonStep,
+                                        &this->errorWeights, &this->perturbedState,
+                                        &this->perturbedDerivative}) {
+            vector->resize(size);
+        }
+        for (auto& kVector : this->kVectors) {
+            kVector.resize(size);
+        }
+        this->hasJacobian = false;
+        this->hasLastDerivative = false;
+        this->factoredTimeStep = 0.0;
+    }
+    this->stateLayout.gatherStates(this->currentState);
+    this->jacobianTime = NAN;
+
+    if (timeStep == 0.0) {
+        return;
+    }
+
+    // Steps whose Newton iteration fails with a fresh Jacobian are split in halves,
+    // the intervals still to be integrated are kept as (time, step size, halvings)
+    struct Interval {
+        double time;
+        double timeStep;
+        size_t halvings;
+    };
+    std::vector<Interval> pending = {{currentTime, timeStep, 0}};
+    while (!pending.empty()) {
+        const Interval interval = pending.back();
+        pending.pop_back();
+
+        if (this->step(interval.time, interval.timeStep)) {
+            this->profile.acceptedSteps++;
+        }
+        else if (interval.halvings < this->maximumStepHalvings) {
+            this->profile.rejectedSteps++;
+            const double halfStep = interval.timeStep / 2.0;
+            pending.push_back({interval.time + halfStep, halfStep, interval.halvings + 1});
+            pending.push_back({interval.time, halfStep, interval.halvings + 1});
+            continue;
+        }
+        else {
+            // The stages of the failed step are no states, keep the end of the last converged step
+            this->profile.rejectedSteps++;
+            this->hasLastDerivative = false;
+            this->dynPtrs.at(0)->bskLogger.bskLog(
+                BSK_ERROR,
+                "The Newton iteration of the SDIRK integrator did not converge at time %f s. The states "
+                "are kept at this time instead of being integrated to %f s.",
+                interval.time, currentTime + timeStep);
+            break;
+        }
+        // The method is stiffly accurate, the last stage is the state at the end of the step
+        this->currentState = this->stageState;
+        this->hasLastDerivative = true;
+    }
+
+    this->stateLayout.scatterStates(this->currentState);
+}
+
+bool svIntegratorSDIRK::step(double time, double timeStep)
+{
+    if (!this->hasJacobian) {
+        this->updateJacobian(time, timeStep);
+    }
+    this->errorWeights = this->absTol + this->relTol * this->currentState.array().abs();
+
+    while (true) {
+        this->updateFactorization(timeStep);
+
+        bool converged = true;
+        for (size_t stageIndex = 0; stageIndex < numberStages && converged; stageIndex++) {
+            converged = this->solveStage(time, timeStep, stageIndex);
+        }
+        if (converged) {
+            return true;
+        }
+        // A Jacobian reused from earlier steps may no longer describe the dynamics
+        if (this->jacobianTime == time) {
+            return false;
+        }
+        this->updateJacobian(time, timeStep);
+    }
+}
+
+bool svIntegratorSDIRK::solveStage(double time, double timeStep, size_t stageIndex)
+{
+    const double hGamma = timeStep * diagonalCoefficient;
+
+    this->stageBase = this->currentState;
+    for (size_t j = 0; j < stageIndex; j++) {
+        this->stageBase += (timeStep * aMatrix.at(stageIndex).at(j)) * this->kVectors.at(j);
+    }
+
+    // The derivatives of the previous stage (or step) predict the derivatives of this stage
+    this->stageState = this->stageBase;
+    if (stageIndex > 0) {
+        this->stageState += hGamma * this->kVectors.at(stageIndex - 1);
+    }
+    else if (this->hasLastDerivative) {
+        this->stageState += hGamma * this->kVectors.at(numberStages - 1);
+    }
+
+    const double stageTime = time + cArray.at(stageIndex) * timeStep;
+    double previousNorm = std::numeric_limits<double>::infinity();
+    for (size_t iteration = 0; iteration < this->maximumNewtonIterations; iteration++) {
+        this->computeDerivatives(stageTime, timeStep, this->stageState, this->stageDerivative);
+        this->residual = this->stageState - this->stageBase - hGamma * this->stageDerivative;
+        this->newtonStep.noalias() = this->factorization.solve(this->residual);
+        this->stageState -= this->newtonStep;
+
+        const double norm = (this->newtonStep.array() / this->errorWeights.array()).abs().maxCoeff();
+        if (norm <= 1.0) {
+            // The stage derivative follows from the stage equation without another evaluation
+            this->kVectors.at(stageIndex) = (this->stageState - this->stageBase) / hGamma;
+            return true;
+        }
+        // The corrections must shrink for the iteration to converge
+        if (!(norm < previousNorm)) {
+            return false;
+        }
+        previousNorm = norm;
+    }
+    return false;
+}
+
+void svIntegratorSDIRK::updateJacobian(double time, double timeStep)
+{
+    this->computeDerivatives(time, timeStep, this->currentState, this->stageDerivative);
+    this->computeJacobian(time, timeStep, this->currentState, this->stageDerivative, this->jacobian);
+    this->jacobianEvaluations++;
+    this->hasJacobian = true;
+    this->jacobianTime = time;
+    this->factoredTimeStep = 0.0;
+}
+
+void svIntegratorSDIRK::updateFactorization(double timeStep)
+{
+    // The simplified Newton iteration only needs an approximate iteration matrix, so the
+    // round-off of the task time step doesn't require a new factorization
+    if (std::abs(timeStep - this->factoredTimeStep) <= 1e-3 * std::abs(this->factoredTimeStep)) {
+        return;
+    }
+    this->iterationMatrix = -(timeStep * diagonalCoefficient) * this->jacobian;
+    this->iterationMatrix.diagonal().array() += 1.0;
+    this->factorization.compute(this->iterationMatrix);
+    this->factoredTimeStep = timeStep;
+    this->factorizations++;
+}
+
+void svIntegratorSDIRK::computeJacobian(double time,
+                                        double timeStep,
+                                        const Eigen::VectorXd& states,
+                                        const Eigen::VectorXd& derivatives,
+                                        Eigen::MatrixXd& jacobian)
+{
+    const Eigen::Index size = states.size();
+    jacobian.resize(size, size);
+    this->perturbedState = states;
+    for (Eigen::Index column = 0; column < size; column++) {
+        this->perturbedState[column] += std::sqrt(DBL_EPSILON) * std::max(std::abs(states[column]), 1.0);
+        const double perturbation = this->perturbedState[column] - states[column];
+        this->computeDerivatives(time, timeStep, this->perturbedState, this->perturbedDerivative);
+        jacobian.col(column) = (this->perturbedDerivative - derivatives) / perturbation;
+        this->perturbedState[column] = states[column];
+    }
+}
+
+void svIntegratorSDIRK::computeDerivatives(double time,
+                                          double timeStep,
+                                          const Eigen::VectorXd& states,
+                                          Eigen::VectorXd& derivatives)
+{
+    this->stateLayout.scatterStates(states);
+
+    for (auto dynPtr : this->dynPtrs) {
+        ProfilingTimer timer(dynPtr->equationsOfMotionProfile, true, dynPtr->profileEvaluationTimes);
+        dynPtr->equationsOfMotion(time, timeStep);
+    }
+
+    this->stateLayout.gatherStateDerivs(derivatives);
+}
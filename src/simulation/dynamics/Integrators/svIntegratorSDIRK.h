@@ -0,0 +1,141 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#ifndef svIntegratorSDIRK_h
+#define svIntegratorSDIRK_h
+
+#include "../_GeneralModuleFiles/dynamicObject.h"
+#include "../_GeneralModuleFiles/packedStateVector.h"
+#include "../_GeneralModuleFiles/stateVecIntegrator.h"
+#include <Eigen/Dense>
+#include <array>
+#include <cmath>
+
+/*! @brief Implicit singly diagonally implicit Runge-Kutta (SDIRK) integrator for stiff dynamics
+ *
+ * The three stage, third order and L-stable SDIRK method of Alexander is used. Every stage
+ * is an implicit equation in the packed states of all integrated dynamic objects, which is
+ * solved with a simplified Newton iteration. The iteration matrix I - h*gamma*J is the same
+ * for all stages, and the Jacobian J of the packed state derivatives is only recomputed when
+ * the Newton iteration converges too slowly. The Jacobian and the LU factorization of the
+ * iteration matrix are thus reused across stages and across time steps, and the matrix is
+ * only factored again when the Jacobian or the time step changes.
+ *
+ * The Jacobian is computed by forward finite differences of the equations of motion, which
+ * costs one evaluation of the dynamics per packed state element. Integrators with a known
+ * (analytic) Jacobian can override computeJacobian. A step whose Newton iteration fails with a
+ * fresh Jacobian is rejected and taken as two half steps. If the iteration still fails after
+ * maximumStepHalvings halvings, an error is logged and the states are kept at the end of the
+ * last converged step.
+ */
+class svIntegratorSDIRK : public StateVecIntegrator {
+  public:
+    svIntegratorSDIRK(DynamicObject* dyn); //!< class method
+
+    /** Performs the integration of the associated dynamic objects up to time currentTime+timeStep
+     */
+    virtual void integrate(double currentTime, double timeStep) override;
+
+    /** Sets the relative tolerance of the Newton iteration of each packed state element */
+    void setRelativeTolerance(double relTol);
+
+    /** Returns the relative tolerance of the Newton iteration */
+    double getRelativeTolerance() const;
+
+    /** Sets the absolute tolerance of the Newton iteration of each packed state element */
+    void setAbsoluteTolerance(double absTol);
+
+    /** Returns the absolute tolerance of the Newton iteration */
+    double getAbsoluteTolerance() const;
+
+    /** Returns the number of Jacobian evaluations since the integrator was created */
+    size_t getJacobianEvaluations() const;
+
+    /** Returns the number of factorizations of the iteration matrix since the integrator was created */
+    size_t getFactorizations() const;
+
+    /** Maximum number of Newton iterations per stage before the Jacobian is recomputed */
+    size_t maximumNewtonIterations = 7;
+
+    /** Maximum number of times a step is halved when the Newton iteration fails */
+    size_t maximumStepHalvings = 6;
+
+  protected:
+    /** Computes the Jacobian of the packed state derivatives at the given packed states.
+     *
+     * The derivatives at these states are given. The default implementation uses forward
+     * finite differences of the equations of motion.
+     */
+    virtual void computeJacobian(double time,
+                                 double timeStep,
+                                 const Eigen::VectorXd& states,
+                                 const Eigen::VectorXd& derivatives,
+                                 Eigen::MatrixXd& jacobian);
+
+    /** Sets the states on the dynamic objects and computes their derivatives */
+    void computeDerivatives(double time,
+                            double timeStep,
+                            const Eigen::VectorXd& states,
+                            Eigen::VectorXd& derivatives);
+
+    PackedStateLayout stateLayout; //!< Location of every integrated state in the packed vectors
+
+  private:
+    /** Takes a step from the current states, returns false if a stage did not converge */
+    bool step(double time, double timeStep);
+
+    /** Solves the implicit equation of a stage, returns false if the Newton iteration did not converge */
+    bool solveStage(double time, double timeStep, size_t stageIndex);
+
+    /** Recomputes the Jacobian at the current states */
+    void updateJacobian(double time, double timeStep);
+
+    /** Factors the iteration matrix if it was not factored for a time step within 0.1 percent of the given one */
+    void updateFactorization(double timeStep);
+
+    static constexpr size_t numberStages = 3; //!< Number of stages of the method
+    static const double diagonalCoefficient;  //!< Coefficient gamma on the diagonal of the method
+    static const std::array<std::array<double, numberStages>, numberStages> aMatrix; //!< Coefficients of the stages
+    static const std::array<double, numberStages> cArray; //!< Time fraction of every stage
+
+    double relTol = 1e-10; //!< Relative tolerance of the Newton iteration
+    double absTol = 1e-10; //!< Absolute tolerance of the Newton iteration
+
+    Eigen::VectorXd currentState;                        //!< Packed states at the beginning of the step
+    Eigen::VectorXd stageBase;                           //!< Explicit part of the stage being solved
+    Eigen::VectorXd stageState;                          //!< Packed states of the stage being solved
+    Eigen::VectorXd stageDerivative;                     //!< Packed derivatives at the stage states
+    Eigen::VectorXd residual;                            //!< Residual of the stage equation
+    Eigen::VectorXd newtonStep;                          //!< Correction of the stage states by a Newton iteration
+    Eigen::VectorXd errorWeights;                        //!< Scale of every packed state element in the convergence test
+    std::array<Eigen::VectorXd, numberStages> kVectors;  //!< Packed derivatives of every stage
+    Eigen::VectorXd perturbedState;                      //!< Packed states perturbed by the finite differences
+    Eigen::VectorXd perturbedDerivative;                 //!< Packed derivatives at the perturbed states
+    Eigen::MatrixXd jacobian;                            //!< Jacobian of the packed state derivatives
+    Eigen::MatrixXd iterationMatrix;                     //!< Iteration matrix I - h*gamma*J of the Newton iteration
+    Eigen::PartialPivLU<Eigen::MatrixXd> factorization;  //!< LU factorization of the iteration matrix
+    double factoredTimeStep = 0.0;                       //!< Time step of the factored iteration matrix, 0 if not factored
+    bool hasJacobian = false;                            //!< True if the Jacobian is valid for the current states layout
+    double jacobianTime = NAN;                           //!< Time at which the Jacobian was computed within the current call, NAN otherwise
+    bool hasLastDerivative = false;                      //!< True if the last stage derivative predicts the first stage
+    size_t jacobianEvaluations = 0;                      //!< Number of Jacobian evaluations
+    size_t factorizations = 0;                           //!< Number of factorizations of the iteration matrix
+};
+
+#endif /* svIntegratorSDIRK_h */
@@ -0,0 +1,158 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#include "svIntegratorSymplectic.h"
+#include <cmath>
+#include <stdexcept>
+
+svIntegratorSymplectic::svIntegratorSymplectic(DynamicObject* dyn)
+    : StateVecIntegrator(dyn)
+{
+    this->setOrder(4);
+    this->setPositionVelocityPair("hubPosition", "hubVelocity");
+}
+
+void svIntegratorSymplectic::setPositionVelocityPair(std::string positionStateName,
+                                                     std::string velocityStateName)
+{
+    this->positionVelocityNames.emplace_back(positionStateName, velocityStateName);
+    this->pairsChanged = true;
+}
+
+void svIntegratorSymplectic::setOrder(size_t order)
+{
+    if (order == 0 || order % 2 != 0) {
+        throw std::invalid_argument("The order of the symplectic integrator must be a positive even number");
+    }
+    this->order = order;
+
+    // Each triple jump raises the order of the composed method by two
+    this->compositionWeights = {1.0};
+    for (size_t composedOrder = 2; composedOrder < order; composedOrder += 2) {
+        const double outerWeight = 1.0 / (2.0 - std::pow(2.0, 1.0 / (composedOrder + 1)));
+        const double innerWeight = 1.0 - 2.0 * outerWeight;
+        std::vector<double> weights;
+        for (double jumpWeight : {outerWeight, innerWeight, outerWeight}) {
+            for (double weight : this->compositionWeights) {
+                weights.push_back(jumpWeight * weight);
+            }
+        }
+        this->compositionWeights = std::move(weights);
+    }
+}
+
+size_t svIntegratorSymplectic::getOrder() const
+{
+    return this->order;
+}
+
+void svIntegratorSymplectic::integrate(double currentTime, double timeStep)
+{
+    this->updateStateLayout();
+    this->stateLayout.gatherStates(this->state);
+    this->startState = this->state;
+
+    // The accelerations at the end of the last call can be reused if the
+    // positions and velocities were not changed since then
+    const bool continuous =
+        std::abs(currentTime - this->previousEndTime) <= 1e-12 * std::max(1.0, std::abs(currentTime)) &&
+        this->previousEndState.size() == this->state.size() &&
+        (((this->state - this->previousEndState).array() * (1.0 - this->unpairedMask)) == 0).all();
+    if (!continuous) {
+        this->computeDerivatives(currentTime, timeStep, this->state);
+    }
+    this->startDerivative = this->derivative;
+
+    double time = currentTime;
+    for (double weight : this->compositionWeights) {
+        const double subStep = weight * timeStep;
+        this->kick(subStep / 2);
+        this->drift(subStep);
+        time += subStep;
+
+        // The unpaired states are evaluated at their first order prediction
+        this->evaluationState = this->state;
+        this->evaluationState.array() +=
+            this->unpairedMask * ((this->startState + (time - currentTime) * this->startDerivative) -
+                                  this->state).array();
+        this->computeDerivatives(time, timeStep, this->evaluationState);
+
+        this->kick(subStep / 2);
+    }
+
+    this->previousEndState = this->state;
+    this->previousEndTime = currentTime + timeStep;
+    this->stateLayout.scatterStates(this->state);
+    this->profile.acceptedSteps++;
+}
+
+void svIntegratorSymplectic::updateStateLayout()
+{
+    if (!this->stateLayout.update(this->dynPtrs) && !this->pairsChanged) return;
+    this->pairsChanged = false;
+    this->previousEndState.resize(0);
+
+    const auto& entries = this->stateLayout.getEntries();
+    this->pairOffsets.clear();
+    this->kickMask = Eigen::ArrayXd::Ones(this->stateLayout.size());
+    this->unpairedMask = Eigen::ArrayXd::Ones(this->stateLayout.size());
+
+    for (const auto& [positionName, velocityName] : this->positionVelocityNames) {
+        for (const auto& position : entries) {
+            if (position.stateName != positionName) continue;
+            for (const auto& velocity : entries) {
+                if (velocity.dynObjIndex != position.dynObjIndex || velocity.stateName != velocityName ||
+                    velocity.size() != position.size()) {
+                    continue;
+                }
+                this->pairOffsets.push_back({position.offset, velocity.offset, position.size()});
+                this->kickMask.segment(position.offset, position.size()).setZero();
+                this->unpairedMask.segment(position.offset, position.size()).setZero();
+                this->unpairedMask.segment(velocity.offset, velocity.size()).setZero();
+            }
+        }
+    }
+}
+
+void svIntegratorSymplectic::computeDerivatives(double time,
+                                                double timeStep,
+                                                const Eigen::VectorXd& states)
+{
+    this->stateLayout.scatterStates(states);
+
+    for (auto dynPtr : this->dynPtrs) {
+        ProfilingTimer timer(dynPtr->equationsOfMotionProfile, true, dynPtr->profileEvaluationTimes);
+        dynPtr->equationsOfMotion(time, timeStep);
+    }
+
+    this->stateLayout.gatherStateDerivs(this->derivative);
+}
+
+void svIntegratorSymplectic::kick(double timeStep)
+{
+    this->state.array() += timeStep * this->kickMask * this->derivative.array();
+}
+
+void svIntegratorSymplectic::drift(double timeStep)
+{
+    for (const auto& pair : this->pairOffsets) {
+        this->state.segment(pair.positionOffset, pair.size) +=
+            timeStep * this->state.segment(pair.velocityOffset, pair.size);
+    }
+}
@@ -0,0 +1,102 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#ifndef svIntegratorSymplectic_h
+#define svIntegratorSymplectic_h
+
+#include "../_GeneralModuleFiles/dynamicObject.h"
+#include "../_GeneralModuleFiles/packedStateVector.h"
+#include "../_GeneralModuleFiles/stateVecIntegrator.h"
+#include <string>
+#include <utility>
+#include <vector>
+
+/*! @brief Explicit symplectic integrator of even order for conservative orbit propagation
+ *
+ * The position states are advanced ("drifted") with their velocity states, and the velocity
+ * states are advanced ("kicked") with the accelerations computed by the equations of motion.
+ * A second order step is the kick-drift-kick leapfrog (velocity Verlet) method, and higher
+ * orders are obtained by composing leapfrog steps with the triple jump coefficients of Yoshida.
+ * The accelerations at the end of a step are reused at the beginning of the next step, so
+ * that a step of order 2, 4 or 6 costs 1, 3 or 9 evaluations of the dynamics.
+ *
+ * The position and velocity states must be declared with setPositionVelocityPair; the
+ * derivative of the position must be the velocity, and the acceleration must only depend
+ * on the positions for the method to be symplectic. Any other state is integrated with
+ * a second order quadrature of its derivatives.
+ */
+class svIntegratorSymplectic : public StateVecIntegrator {
+  public:
+    svIntegratorSymplectic(DynamicObject* dyn); //!< class method
+
+    /** Performs the integration of the associated dynamic objects up to time currentTime+timeStep
+     */
+    virtual void integrate(double currentTime, double timeStep) override;
+
+    /** Declares that the state positionStateName of every dynamic object is integrated with the
+     * state velocityStateName as its derivative. The hub position and velocity of a spacecraft
+     * ("hubPosition" and "hubVelocity") are declared by default.
+     */
+    void setPositionVelocityPair(std::string positionStateName, std::string velocityStateName);
+
+    /** Sets the order of the method, which must be a positive even number (4 by default) */
+    void setOrder(size_t order);
+
+    /** Returns the order of the method */
+    size_t getOrder() const;
+
+  private:
+    /** Rebuilds the position and velocity offsets if the integrated states changed */
+    void updateStateLayout();
+
+    /** Sets the states on the dynamic objects and computes their derivatives */
+    void computeDerivatives(double time, double timeStep, const Eigen::VectorXd& states);
+
+    /** Advances the velocity and unpaired states with the current derivatives */
+    void kick(double timeStep);
+
+    /** Advances the position states with the velocity states */
+    void drift(double timeStep);
+
+    /** Location of a position state and its velocity state in the packed state vector */
+    struct PositionVelocityOffsets {
+        Eigen::Index positionOffset; //!< Index of the first element of the position state
+        Eigen::Index velocityOffset; //!< Index of the first element of the velocity state
+        Eigen::Index size;           //!< Number of elements of the states
+    };
+
+    size_t order = 4;                                                      //!< Order of the method
+    std::vector<double> compositionWeights;                                //!< Fractions of the time step taken by each leapfrog step
+    std::vector<std::pair<std::string, std::string>> positionVelocityNames; //!< Names of the position and velocity states
+    bool pairsChanged = true;                                              //!< True if a pair was declared since the layout was built
+
+    PackedStateLayout stateLayout;                      //!< Location of every integrated state in the packed vectors
+    std::vector<PositionVelocityOffsets> pairOffsets;   //!< Location of every position and velocity state pair
+    Eigen::ArrayXd kickMask;                            //!< 1 for the elements of the states that are kicked, 0 for positions
+    Eigen::ArrayXd unpairedMask;                        //!< 1 for the elements of the states that are not in a pair
+    Eigen::VectorXd state;                              //!< Packed states being integrated
+    Eigen::VectorXd startState;                         //!< Packed states at the beginning of the step
+    Eigen::VectorXd evaluationState;                    //!< Packed states at which the dynamics are evaluated
+    Eigen::VectorXd derivative;                         //!< Packed derivatives of the last evaluation
+    Eigen::VectorXd startDerivative;                    //!< Packed derivatives at the beginning of the step
+    Eigen::VectorXd previousEndState;                   //!< Packed states at the end of the last call
+    double previousEndTime = NAN;                       //!< Time at the end of the last call
+};
+
+#endif /* svIntegratorSymplectic_h */
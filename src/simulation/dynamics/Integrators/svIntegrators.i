@@ -27,6 +27,9 @@
    #include "svIntegratorRK2.h"
    #include "svIntegratorRKF45.h"
    #include "svIntegratorRKF78.h"
+   #include "svIntegratorABM4.h"
+   #include "svIntegratorSymplectic.h"
+   #include "svIntegratorSDIRK.h"
    #include "architecture/_GeneralModuleFiles/sys_model.h"
    #include "../_GeneralModuleFiles/dynamicObject.h"
 %}
@@ -39,6 +42,16 @@ _rk_base_classes = {}
 _rk_adaptive_base_classes = {}
 %}
 
+%include "exception.i"
+
+%exception {
+  try {
+    $action
+  } catch (const std::exception& e) {
+    SWIG_exception(SWIG_RuntimeError, e.what());
+  }
+}
+
 %include <std_vector.i>
 %template() std::vector<double>;
 %template() std::vector<std::vector<double>>;
@@ -53,6 +66,11 @@ _rk_adaptive_base_classes = {}
 }
 
 %include "sys_model.i"
+
+// The states are interpolated through DynamicObject::getStateAtTime
+%ignore StateVecIntegrator::interpolateState;
+%ignore svIntegratorAdaptiveRungeKutta::interpolateState;
+%include "../_GeneralModuleFiles/profilingCounter.h"
 %include "../_GeneralModuleFiles/stateVecIntegrator.h"
 
 %include "../_GeneralModuleFiles/svIntegratorRungeKutta.h"
@@ -129,6 +147,9 @@ TEMPLATE_HELPER(13)
 %include "svIntegratorRK2.h"
 %include "svIntegratorRKF45.h"
 %include "svIntegratorRKF78.h"
+%include "svIntegratorABM4.h"
+%include "svIntegratorSymplectic.h"
+%include "svIntegratorSDIRK.h"
 
 // The following methods allow users to create new Runge-Kutta
 // methods simply by providing their coefficients on the Python side
@@ -100,9 +100,9 @@ void LinearSpringMassDamper::registerStates(DynParamManager& states)
 void LinearSpringMassDamper::updateEffectorMassProps(double integTime)
 {
 	// - Grab rho from state manager and define r_PcB_B
-	this->rho = this->rhoState->getState()(0,0);
+	this->rho = this->rhoState->getStateView<1>()(0, 0);
 	this->r_PcB_B = this->rho * this->pHat_B + this->r_PB_B;
-	this->massSMD = this->massState->getState()(0, 0);
+	this->massSMD = this->massState->getStateView<1>()(0, 0);
 
 	// - Update the effectors mass
 	this->effProps.mEff = this->massSMD;
@@ -113,7 +113,7 @@ void LinearSpringMassDamper::updateEffectorMassProps(double integTime)
 	this->effProps.IEffPntB_B = this->massSMD * this->rTilde_PcB_B * this->rTilde_PcB_B.transpose();
 
 	// - Grab rhoDot from the stateManager and define rPrime_PcB_B
-	this->rhoDot = this->rhoDotState->getState()(0, 0);
+	this->rhoDot = this->rhoDotState->getStateView<1>()(0, 0);
 	this->rPrime_PcB_B = this->rhoDot * this->pHat_B;
 	this->effProps.rEffPrime_CB_B = this->rPrime_PcB_B;
 
@@ -141,7 +141,7 @@ void LinearSpringMassDamper::updateContributions(double integTime, BackSubMatric
     Eigen::MRPd sigmaLocal_BN;
     Eigen::Matrix3d dcm_BN;
     Eigen::Matrix3d dcm_NB;
-    sigmaLocal_BN = (Eigen::Vector3d ) this->sigmaState->getState();
+    sigmaLocal_BN = (Eigen::Vector3d ) this->sigmaState->getStateView<3>();
     dcm_NB = sigmaLocal_BN.toRotationMatrix();
     dcm_BN = dcm_NB.transpose();
 
@@ -158,7 +158,7 @@ void LinearSpringMassDamper::updateContributions(double integTime, BackSubMatric
     this->bRho = -this->rTilde_PcB_B*this->pHat_B;
 
     // - Define cRho
-    Eigen::Vector3d omega_BN_B_local = this->omegaState->getState();
+    Eigen::Vector3d omega_BN_B_local = this->omegaState->getStateView<3>();
     Eigen::Matrix3d omegaTilde_BN_B_local;
     omegaTilde_BN_B_local = eigenTilde(omega_BN_B_local);
 	cRho = 1.0/(this->massSMD)*(this->pHat_B.dot(this->massSMD * g_B) - this->k*this->rho - this->c*this->rhoDot
@@ -184,23 +184,20 @@ void LinearSpringMassDamper::computeDerivatives(double integTime, Eigen::Vector3
 	// - Find DCM
 	Eigen::MRPd sigmaLocal_BN;
 	Eigen::Matrix3d dcm_BN;
-	sigmaLocal_BN = (Eigen::Vector3d) this->sigmaState->getState();
+	sigmaLocal_BN = (Eigen::Vector3d) this->sigmaState->getStateView<3>();
 	dcm_BN = (sigmaLocal_BN.toRotationMatrix()).transpose();
 	
 	// - Set the derivative of rho to rhoDot
-	this->rhoState->setDerivative(this->rhoDotState->getState());
+	this->rhoState->stateDerivView<1>() = this->rhoDotState->getStateView<1>();
 
 	// - Compute rhoDDot
-	Eigen::MatrixXd conv(1,1);
-    Eigen::Vector3d omegaDot_BN_B_local = this->omegaState->getStateDeriv();
-    Eigen::Vector3d rDDot_BN_N_local = this->velocityState->getStateDeriv();
+    Eigen::Vector3d omegaDot_BN_B_local = this->omegaState->getStateDerivView<3>();
+    Eigen::Vector3d rDDot_BN_N_local = this->velocityState->getStateDerivView<3>();
 	Eigen::Vector3d rDDot_BN_B_local = dcm_BN*rDDot_BN_N_local;
-    conv(0, 0) = this->aRho.dot(rDDot_BN_B_local) + this->bRho.dot(omegaDot_BN_B_local) + this->cRho;
-	this->rhoDotState->setDerivative(conv);
+    this->rhoDotState->stateDerivView<1>()(0, 0) = this->aRho.dot(rDDot_BN_B_local) + this->bRho.dot(omegaDot_BN_B_local) + this->cRho;
 
     // - Set the massDot already computed from fuelTank to the stateDerivative of mass
-    conv(0,0) = this->fuelMassDot;
-    this->massState->setDerivative(conv);
+    this->massState->stateDerivView<1>()(0, 0) = this->fuelMassDot;
 
     return;
 }
@@ -211,7 +208,7 @@ void LinearSpringMassDamper::updateEnergyMomContributions(double integTime, Eige
 {
     //  - Get variables needed for energy momentum calcs
     Eigen::Vector3d omegaLocal_BN_B;
-    omegaLocal_BN_B = omegaState->getState();
+    omegaLocal_BN_B = omegaState->getStateView<3>();
     Eigen::Vector3d rDotPcB_B;
 
     // - Find rotational angular momentum contribution from hub
@@ -228,13 +225,13 @@ void LinearSpringMassDamper::calcForceTorqueOnBody(double integTime, Eigen::Vect
 {
     // - Get the current omega state
     Eigen::Vector3d omegaLocal_BN_B;
-    omegaLocal_BN_B = this->omegaState->getState();
+    omegaLocal_BN_B = this->omegaState->getStateView<3>();
     Eigen::Matrix3d omegaLocalTilde_BN_B;
     omegaLocalTilde_BN_B = eigenTilde(omegaLocal_BN_B);
 
     // - Get rhoDDot from last integrator call
     double rhoDDotLocal;
-    rhoDDotLocal = rhoDotState->getStateDeriv()(0, 0);
+    rhoDDotLocal = rhoDotState->getStateDerivView<1>()(0, 0);
 
     // - Calculate force that the FSP is applying to the spacecraft
     this->forceOnBody_B = -(this->massSMD*this->pHat_B*rhoDDotLocal + 2*omegaLocalTilde_BN_B*this->massSMD
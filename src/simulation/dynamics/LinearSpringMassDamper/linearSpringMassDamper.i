@@ -35,6 +35,7 @@ from Basilisk.architecture.swig_common_model import *
 %include "sys_model.i"
 %include "simulation/dynamics/_GeneralModuleFiles/stateData.h"
 %include "simulation/dynamics/_GeneralModuleFiles/fuelSlosh.h"
+%include "simulation/dynamics/_GeneralModuleFiles/profilingCounter.h"
 %include "simulation/dynamics/_GeneralModuleFiles/stateEffector.h"
 %include "simulation/dynamics/_GeneralModuleFiles/dynParamManager.h"
 %include "linearSpringMassDamper.h"
@@ -30,6 +30,7 @@ from Basilisk.architecture.swig_common_model import *
 
 %include "sys_model.i"
 %include "../_GeneralModuleFiles/stateData.h"
+%include "../_GeneralModuleFiles/profilingCounter.h"
 %include "../_GeneralModuleFiles/stateEffector.h"
 %include "../_GeneralModuleFiles/dynamicEffector.h"
 %include "../_GeneralModuleFiles/dynParamManager.h"
@@ -19,6 +19,7 @@
 
 
 #include "dynParamManager.h"
+#include <algorithm>
 #include <iostream>
 
 DynParamManager::DynParamManager()
@@ -39,12 +40,11 @@ StateData* DynParamManager::registerState(uint32_t nRow, uint32_t nCol,
         return nullptr;
     }
 
-    std::map<std::string, StateData>::iterator it;
-    it = stateContainer.stateMap.find(stateName);
-    if(it != stateContainer.stateMap.end())
+    StateHandle handle = getStateHandle(stateName);
+    if(handle.isValid())
     {
         bskLogger.bskLog(BSK_WARNING, "You created a state with the name: %s more than once.  Go ahead and don't do this.", stateName.c_str());
-        if(it->second.getRowSize() != nRow || it->second.getColumnSize() != nCol)
+        if(stateSlots[handle.slot].getRowSize() != nRow || stateSlots[handle.slot].getColumnSize() != nCol)
         {
             bskLogger.bskLog(BSK_ERROR, "In addition to that, you tried to change the size of the state in question.  Come on.  You get null.");
             return nullptr;
@@ -54,140 +54,151 @@ StateData* DynParamManager::registerState(uint32_t nRow, uint32_t nCol,
     {
         Eigen::MatrixXd stateMatrix;
         stateMatrix.resize(nRow, nCol);
-        StateData newState(stateName, stateMatrix);
-        stateContainer.stateMap.insert(std::pair<std::string, StateData>
-                              (stateName, newState));
-        it = stateContainer.stateMap.find(stateName);
+        handle.slot = stateSlots.size();
+        stateSlots.emplace_back(stateName, stateMatrix);
+        stateSlotIndex.emplace(stateName, handle.slot);
     }
-    return (&(it->second));
+    return (getState(handle));
 }
 
 StateData* DynParamManager::getStateObject(std::string stateName)
 {
-    StateData *statePtr;
-    std::map<std::string, StateData>::iterator it;
-    
-    statePtr = nullptr;
-    it = stateContainer.stateMap.find(stateName);
-    if(it != stateContainer.stateMap.end())
-    {
-        statePtr = &(it->second);
-    }
-
-    if (statePtr == nullptr)
+    StateHandle handle = getStateHandle(stateName);
+    if (!handle.isValid())
     {
         /*  The requested state could not be found.
             Either the state name was miss-spelled, or the state simply
             doesn't exit in the current simulaiton setup (i.e. asking for the
             hub attitude in a translation only simulation setup */
         bskLogger.bskLog(BSK_WARNING, "You requested this non-existent state name: %s You either miss-typed the stateName, or you asked for a state that doesn't exist in your simulation setup.", stateName.c_str());
+        return nullptr;
     }
-    
-    return(statePtr);
+
+    return(getState(handle));
 }
 
-StateVector DynParamManager::getStateVector()
+StateHandle DynParamManager::getStateHandle(const std::string& stateName) const
 {
-    return(stateContainer);
+    StateHandle handle;
+    auto it = stateSlotIndex.find(stateName);
+    if(it != stateSlotIndex.end())
+    {
+        handle.slot = it->second;
+    }
+    return handle;
 }
 
-void DynParamManager::updateStateVector(const StateVector & newState)
+StateVector DynParamManager::getStateVector()
 {
+    Eigen::Index totalSize = 0;
+    for (const auto& stateData : stateSlots)
+    {
+        totalSize += stateData.state.size();
+    }
 
-    std::map<std::string, StateData>::iterator it;
-    std::map<std::string, StateData>::const_iterator inIt;
-    for (it = stateContainer.stateMap.begin(), inIt = newState.stateMap.begin();
-         it != stateContainer.stateMap.end() && inIt != newState.stateMap.end(); it++, inIt++)
+    StateVector outVector;
+    outVector.stateValues.resize(totalSize);
+    Eigen::Index offset = 0;
+    for (const auto& stateData : stateSlots)
     {
-        it->second.setState(inIt->second.getState());
+        outVector.stateValues.segment(offset, stateData.state.size()) =
+            Eigen::Map<const Eigen::VectorXd>(stateData.state.data(), stateData.state.size());
+        offset += stateData.state.size();
+    }
+    return(outVector);
+}
 
+void DynParamManager::updateStateVector(const StateVector & newState)
+{
+    Eigen::Index offset = 0;
+    for (auto& stateData : stateSlots)
+    {
+        Eigen::Index stateSize = stateData.state.size();
+        if (offset + stateSize > newState.stateValues.size())
+        {
+            break;
+        }
+        Eigen::Map<Eigen::VectorXd>(stateData.state.data(), stateSize) =
+            newState.stateValues.segment(offset, stateSize);
+        offset += stateSize;
     }
 }
 
 void DynParamManager::propagateStateVector(double dt)
 {
-    std::map<std::string, StateData>::iterator it;
-    for (it = stateContainer.stateMap.begin();
-         it != stateContainer.stateMap.end(); it++)
+    for (auto& stateData : stateSlots)
     {
-        it->second.propagateState(dt);
-
+        stateData.propagateState(dt);
     }
 }
 
 StateVector StateVector::operator+(const StateVector& operand)
 {
-    std::map<std::string, StateData>::iterator it;
-    std::map<std::string, StateData>::const_iterator opIt;
+    Eigen::Index size = std::min(stateValues.size(), operand.stateValues.size());
     StateVector outVector;
-    for (it = stateMap.begin(), opIt = operand.stateMap.begin();
-         it != stateMap.end() && opIt != operand.stateMap.end(); it++, opIt++)
-    {
-        StateData newState = it->second + opIt->second;
-        outVector.stateMap.insert(std::pair<std::string, StateData>
-                                  (it->first, newState));
-
-    }
+    outVector.stateValues = stateValues.head(size) + operand.stateValues.head(size);
     return outVector;
 }
 
 StateVector StateVector::operator*(double scaleFactor)
 {
     StateVector outVector;
-    std::map<std::string, StateData>::iterator it;
-    for (it = stateMap.begin(); it != stateMap.end(); it++)
-    {
-        outVector.stateMap.insert(std::pair<std::string, StateData>
-                                  (it->first, it->second*scaleFactor));
-
-    }
-
+    outVector.stateValues = stateValues*scaleFactor;
     return outVector;
 }
 
 Eigen::MatrixXd* DynParamManager::createProperty(std::string propName,
     const Eigen::MatrixXd & propValue)
 {
-    std::map<std::string, Eigen::MatrixXd>::iterator it;
-    it = dynProperties.find(propName);
-    if(it == dynProperties.end())
+    PropertyHandle handle = getPropertyHandle(propName);
+    if(!handle.isValid())
     {
-        dynProperties.insert(std::pair<std::string, Eigen::MatrixXd>
-                             (propName, propValue));
+        handle.slot = propertySlots.size();
+        propertySlots.push_back(propValue);
+        propertySlotIndex.emplace(propName, handle.slot);
     }
     else{
         bskLogger.bskLog(BSK_WARNING, "You created the dynamic property: %s more than once.  You shouldn't be doing that.", propName.c_str());
-        it->second = propValue;
+        *getProperty(handle) = propValue;
     }
-    return(&(dynProperties.find(propName)->second));
+    return(getProperty(handle));
 }
 
 Eigen::MatrixXd* DynParamManager::getPropertyReference(std::string propName)
 {
-    std::map<std::string, Eigen::MatrixXd>::iterator it;
-    it = dynProperties.find(propName);
-    if(it == dynProperties.end())
+    PropertyHandle handle = getPropertyHandle(propName);
+    if(!handle.isValid())
     {
         bskLogger.bskLog(BSK_ERROR, "You requested the property: %s which doesn't exist.  Null returned.", propName.c_str());
         return nullptr;
     }
     else
     {
-        return(&(it->second));
+        return(getProperty(handle));
+    }
+}
+
+PropertyHandle DynParamManager::getPropertyHandle(const std::string& propName) const
+{
+    PropertyHandle handle;
+    auto it = propertySlotIndex.find(propName);
+    if(it != propertySlotIndex.end())
+    {
+        handle.slot = it->second;
     }
+    return handle;
 }
 
 void DynParamManager::setPropertyValue(const std::string propName,
                       const Eigen::MatrixXd & propValue)
 {
-    std::map<std::string, Eigen::MatrixXd>::iterator it;
-    it = dynProperties.find(propName);
-    if(it == dynProperties.end())
+    PropertyHandle handle = getPropertyHandle(propName);
+    if(!handle.isValid())
     {
         bskLogger.bskLog(BSK_ERROR, "You tried to set the property value for: %s which has not been created yet. I can't do that.", propName.c_str());
     }
     else
     {
-        it->second = propValue;
+        *getProperty(handle) = propValue;
     }
 }
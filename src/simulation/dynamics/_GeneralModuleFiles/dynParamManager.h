@@ -22,42 +22,69 @@
 #define STATE_MANAGER_H
 
 #include <stdint.h>
-#include <map>
+#include <deque>
+#include <string>
+#include <unordered_map>
 #include <vector>
 #include <Eigen/Dense>
 #include "stateData.h"
 #include "architecture/utilities/bskLogging.h"
 
 
-/*! state vector class */
+/*! handle of a state in the slot table of a DynParamManager */
+struct StateHandle {
+    size_t slot = SIZE_MAX;                                     //!< index of the state slot
+    bool isValid() const {return slot != SIZE_MAX;}             //!< class method
+};
+
+/*! handle of a property in the slot table of a DynParamManager */
+struct PropertyHandle {
+    size_t slot = SIZE_MAX;                                     //!< index of the property slot
+    bool isValid() const {return slot != SIZE_MAX;}             //!< class method
+};
+
+/*! state vector class, holding the values of all the states of a DynParamManager packed in slot order */
 class StateVector {
 public:
-    std::map<std::string, StateData> stateMap;          //!< class method
+    Eigen::VectorXd stateValues;                        //!< class variable
 public:
     StateVector operator+(const StateVector& operand);  //!< class method
     StateVector operator*(double scaleFactor);          //!< class method
 };
 
-/*! dynamic parameter manager class */
+/*! dynamic parameter manager class
+
+ The states and properties are stored in slot tables in the order in which they are registered.  The name of a
+ state or property is only used to find its slot, so the StateData and Eigen::MatrixXd pointers returned by
+ registerState() and createProperty() remain valid for the life of the manager, and the state vector operations
+ run over the slots without any name lookup.
+ */
 class DynParamManager {
 public:
-    std::map<std::string, Eigen::MatrixXd> dynProperties; //!< class variable
-    StateVector stateContainer;                             //!< class variable
+    std::deque<StateData> stateSlots;                   //!< class variable
+    std::deque<Eigen::MatrixXd> propertySlots;          //!< class variable
     BSKLogger bskLogger;                      //!< -- BSK Logging
 public:
     DynParamManager();
     ~DynParamManager();
     StateData* registerState(uint32_t nRow, uint32_t nCol, std::string stateName); //!< class method
     StateData* getStateObject(std::string stateName); //!< class method
+    StateHandle getStateHandle(const std::string& stateName) const; //!< class method
+    StateData* getState(StateHandle handle) {return &stateSlots[handle.slot];} //!< class method
     StateVector getStateVector(); //!< class method
     void updateStateVector(const StateVector & newState); //!< class method
     void propagateStateVector(double dt); //!< class method
     Eigen::MatrixXd* createProperty(std::string propName,
                                     const Eigen::MatrixXd & propValue); //!< class method
     Eigen::MatrixXd* getPropertyReference(std::string propName); //!< class method
+    PropertyHandle getPropertyHandle(const std::string& propName) const; //!< class method
+    Eigen::MatrixXd* getProperty(PropertyHandle handle) {return &propertySlots[handle.slot];} //!< class method
     void setPropertyValue(const std::string propName,
                           const Eigen::MatrixXd & propValue); //!< class method
-    
+
+private:
+    std::unordered_map<std::string, size_t> stateSlotIndex;     //!< slot of every state name
+    std::unordered_map<std::string, size_t> propertySlotIndex;  //!< slot of every property name
 };
 
 
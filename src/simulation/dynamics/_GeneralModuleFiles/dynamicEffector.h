@@ -22,6 +22,7 @@
 
 #include <Eigen/Dense>
 #include "dynParamManager.h"
+#include "profilingCounter.h"
 #include "architecture/utilities/bskLogging.h"
 
 /*! @brief dynamic effector class */
@@ -39,6 +40,7 @@ public:
     Eigen::Vector3d forceExternal_B = Eigen::Vector3d::Zero();      //!< [N] External force applied by this effector in body frame components
     Eigen::Vector3d torqueExternalPntB_B = Eigen::Vector3d::Zero(); //!< [Nm] External torque applied by this effector
     BSKLogger bskLogger;                    //!< -- BSK Logging
+    ProfilingCounter profile;               //!< -- Number of evaluations and wall clock time spent in the effector by the equations of motion
 };
 
 
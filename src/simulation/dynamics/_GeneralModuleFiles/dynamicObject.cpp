@@ -56,6 +56,29 @@ void DynamicObject::syncDynamicsIntegration(DynamicObject* dynPtr)
 {
     this->integrator->dynPtrs.push_back(dynPtr);
     dynPtr->isDynamicsSynced = true;
+    dynPtr->syncedDynamicObject = this;
+}
+
+Eigen::MatrixXd DynamicObject::getStateAtTime(const std::string& stateName, double time)
+{
+    // Synced objects are integrated by the integrator of the primary DynamicObject
+    DynamicObject* primary = this;
+    while (primary->isDynamicsSynced && primary->syncedDynamicObject) {
+        primary = primary->syncedDynamicObject;
+    }
+
+    Eigen::MatrixXd state;
+    if (!primary->integrator ||
+        !primary->integrator->interpolateState(*this, stateName, time, state)) {
+        bskLogger.bskLog(BSK_ERROR,
+                         "The state %s can't be interpolated at time %f s. This requires an "
+                         "integrator with an enabled dense output, and a time within the last "
+                         "integration step.",
+                         stateName.c_str(),
+                         time);
+        return Eigen::MatrixXd();
+    }
+    return state;
 }
 
 void DynamicObject::integrateState(double integrateToThisTime)
@@ -66,9 +89,30 @@ void DynamicObject::integrateState(double integrateToThisTime)
         dynPtr->preIntegration(integrateToThisTime);
     }
 
-    this->integrator->integrate(this->timeBefore, this->timeStep);
+    {
+        ProfilingTimer timer(this->integrator->profile.integrate);
+        this->integrator->integrate(this->timeBefore, this->timeStep);
+    }
 
     for (const auto& dynPtr : this->integrator->dynPtrs) {
         dynPtr->postIntegration(integrateToThisTime);
     }
 }
+
+IntegratorProfile DynamicObject::getIntegratorProfile() const
+{
+    // Synced objects are integrated by the integrator of the primary DynamicObject
+    const DynamicObject* primary = this;
+    while (primary->isDynamicsSynced && primary->syncedDynamicObject) {
+        primary = primary->syncedDynamicObject;
+    }
+    return primary->integrator ? primary->integrator->profile : IntegratorProfile();
+}
+
+void DynamicObject::resetProfiling()
+{
+    this->equationsOfMotionProfile.reset();
+    if (this->integrator && !this->isDynamicsSynced) {
+        this->integrator->profile.reset();
+    }
+}
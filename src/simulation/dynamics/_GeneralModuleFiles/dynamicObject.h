@@ -26,7 +26,9 @@
 #include "dynParamManager.h"
 #include "stateEffector.h"
 #include "stateVecIntegrator.h"
+#include "profilingCounter.h"
 #include <stdint.h>
+#include <string>
 #include <vector>
 
 /** A DynamicObject is a Basilisk model with states that must be integrated */
@@ -75,11 +77,39 @@ class DynamicObject : public SysModel {
     /** Connects the integration of a DynamicObject to the integration of this DynamicObject. */
     void syncDynamicsIntegration(DynamicObject* dynPtr);
 
+    /** Returns the value of a state at a time [s] within the last integration step.
+     *
+     * The state is interpolated by the dense output of the integrator, so this
+     * is only supported by integrators that provide one (and have it enabled).
+     * If the state can't be interpolated, an error is logged and an empty
+     * matrix is returned.
+     */
+    Eigen::MatrixXd getStateAtTime(const std::string& stateName, double time);
+
+    /** Returns the profiling counters of the integrator that integrates this object */
+    IntegratorProfile getIntegratorProfile() const;
+
+    /** Returns the names of the effectors whose evaluations are profiled by this object */
+    virtual std::vector<std::string> getEffectorProfileNames() const { return {}; }
+
+    /** Returns the profiling counter of the effector at the given index of getEffectorProfileNames() */
+    virtual ProfilingCounter getEffectorProfile(size_t index) { return ProfilingCounter(); }
+
+    /** Sets the profiling counters of this object, its integrator and its effectors back to zero */
+    virtual void resetProfiling();
+
   public:
     /** flag indicating that another spacecraft object is controlling the integration */
     bool isDynamicsSynced = false;
+    /** DynamicObject whose integrator integrates this object when the integration is synced */
+    DynamicObject* syncedDynamicObject = nullptr;
     double timeStep;   /**< [s] integration time step */
     double timeBefore; /**< [s] prior time value */
+    /** Number and wall clock time of the equationsOfMotion calls made by the integrator */
+    ProfilingCounter equationsOfMotionProfile;
+    /** Flag to measure the wall clock time of every equationsOfMotion call and effector evaluation.
+     * The calls are always counted, but timing them costs two clock reads per evaluation. */
+    bool profileEvaluationTimes = false;
 };
 
 #endif /* DYNAMICOBJECT_H */
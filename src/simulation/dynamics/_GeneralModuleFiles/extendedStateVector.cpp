@@ -85,8 +85,8 @@ void ExtendedStateVector::setStates(std::vector<DynamicObject*>& dynPtrs) const
     this->apply([&dynPtrs](const size_t& dynObjIndex,
                                  const std::string& stateName,
                                  const Eigen::MatrixXd& thisState) {
-        StateData& stateData =
-            dynPtrs.at(dynObjIndex)->dynManager.stateContainer.stateMap.at(stateName);
+        DynParamManager& dynManager = dynPtrs.at(dynObjIndex)->dynManager;
+        StateData& stateData = dynManager.stateSlots.at(dynManager.getStateHandle(stateName).slot);
         stateData.setState(thisState);
     });
 }
@@ -98,9 +98,8 @@ ExtendedStateVector::fromStateData(const std::vector<DynamicObject*>& dynPtrs,
     ExtendedStateVector result;
 
     for (size_t dynIndex = 0; dynIndex < dynPtrs.size(); dynIndex++) {
-        for (auto&& [stateName, stateData] :
-             dynPtrs.at(dynIndex)->dynManager.stateContainer.stateMap) {
-            result.emplace(std::make_pair(dynIndex, stateName), functor(stateData));
+        for (const auto& stateData : dynPtrs.at(dynIndex)->dynManager.stateSlots) {
+            result.emplace(std::make_pair(dynIndex, stateData.getName()), functor(stateData));
         }
     }
 
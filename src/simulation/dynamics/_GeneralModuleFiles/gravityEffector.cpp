@@ -91,6 +91,32 @@ Eigen::Vector3d GravBodyData::computeGravityInertial(Eigen::Vector3d r_I, uint64
     return dcm_PfixN * grav_Pfix;
 }
 
+void GravBodyData::computeGravityInertialBatch(const Eigen::MatrixX3d& r_I, uint64_t simTimeNanos,
+                                               Eigen::MatrixX3d& grav_I)
+{
+    double dt = computeDtInSeconds(simTimeNanos, this->timeWritten);
+    Eigen::Matrix3d dcm_PfixN = c2DArray2EigenMatrix3d(this->localPlanet.J20002Pfix).transpose();
+    if (dcm_PfixN
+            .isZero()) { // Sanity check for connected messages that do not initialize J20002Pfix
+        dcm_PfixN = Eigen::Matrix3d::Identity();
+    }
+
+    Eigen::Matrix3d dcm_PfixN_dot =
+        c2DArray2EigenMatrix3d(this->localPlanet.J20002Pfix_dot).transpose();
+    dcm_PfixN += dcm_PfixN_dot * dt;
+
+    // store the current planet orientation and rates
+    *this->J20002Pfix = dcm_PfixN;
+    *this->J20002Pfix_dot = dcm_PfixN_dot;
+
+    // The positions are stored as rows, so the frame rotations multiply from the right.
+    // The batch is computed in the calling thread, which may already be a simulation thread.
+    this->positionsBatch_Pfix.noalias() = r_I * dcm_PfixN;
+    this->fieldsBatch_Pfix.resize(r_I.rows(), 3);
+    this->gravityModel->computeFieldBatch(this->positionsBatch_Pfix, this->fieldsBatch_Pfix, 1);
+    grav_I.noalias() = this->fieldsBatch_Pfix * dcm_PfixN.transpose();
+}
+
 void GravBodyData::loadEphemeris()
 {
     if (this->planetBodyInMsg.isLinked()) {
@@ -241,6 +267,62 @@ void GravityEffector::computeGravityField(Eigen::Vector3d r_cF_N, Eigen::Vector3
     *this->gravProperty = rDotDot_cF_N;
 }
 
+void GravityEffector::computeGravityFieldBatch(const Eigen::MatrixX3d& r_cF_N,
+                                               Eigen::MatrixX3d& rDDot_cF_N)
+{
+    uint64_t systemClock = (uint64_t)this->timeCorr->data()[0];
+    Eigen::Vector3d r_CN_N = Eigen::Vector3d::Zero(); // inertial position of central body if there is one
+
+    if (this->centralBody) // If there is a central body
+    {
+        r_CN_N = getEulerSteppedGravBodyPosition(this->centralBody);
+    }
+
+    rDDot_cF_N.setZero(r_cF_N.rows(), 3);
+
+    for (auto&& body : this->gravBodies) {
+        // position of Planet being queried wrt N
+        Eigen::Vector3d r_PN_N = getEulerSteppedGravBodyPosition(body);
+
+        if (this->centralBody && !body->isCentralBody) // If there is a central body, and its not
+                                                       // 'body'
+        {
+            // Subtract accel of central body due to other bodies to get RELATIVE accel of s/c
+            rDDot_cF_N.rowwise() +=
+                body->computeGravityInertial(r_PN_N - r_CN_N, systemClock).transpose();
+        }
+
+        // acceleration of c wrt N in N, due to P
+        this->bodyRelativePositions = r_cF_N.rowwise() + (r_CN_N - r_PN_N).transpose();
+        body->computeGravityInertialBatch(this->bodyRelativePositions, systemClock,
+                                          this->bodyAccelerations);
+        rDDot_cF_N += this->bodyAccelerations;
+
+        // store planet states in the state engine parameters
+        *(body->r_PN_N) = r_PN_N;
+        *(body->v_PN_N) = cArray2EigenVector3d(body->localPlanet.VelocityVector);
+        (*(body->muPlanet))(0, 0) = body->mu;
+    }
+}
+
+void GravityEffector::computeInertialPosAndVelBatch(const Eigen::MatrixX3d& r_BF_N,
+                                                    const Eigen::MatrixX3d& rDot_BF_N,
+                                                    Eigen::MatrixX3d& r_BN_N,
+                                                    Eigen::MatrixX3d& rDot_BN_N)
+{
+    if (this->centralBody) // If there is a central body
+    {
+        Eigen::Vector3d r_CN_N = getEulerSteppedGravBodyPosition(this->centralBody);
+        Eigen::Vector3d v_CN_N = cArray2EigenVector3d(this->centralBody->localPlanet.VelocityVector);
+        r_BN_N = r_BF_N.rowwise() + r_CN_N.transpose();
+        rDot_BN_N = rDot_BF_N.rowwise() + v_CN_N.transpose();
+    }
+    else {
+        r_BN_N = r_BF_N;
+        rDot_BN_N = rDot_BF_N;
+    }
+}
+
 void GravityEffector::updateInertialPosAndVel(Eigen::Vector3d r_BF_N, Eigen::Vector3d rDot_BF_N)
 {
     // Here we add the central body inertial position and velocities to the
@@ -61,6 +61,15 @@ public:
      */
     Eigen::Vector3d computeGravityInertial(Eigen::Vector3d r_I, uint64_t simTimeNanos);
 
+    /** Computes the gravitational acceleration at a batch of positions
+     *
+     * @param r_I inertial position vectors, one per row
+     * @param simTimeNanos simulation time (ns)
+     * @param grav_I inertial gravitational accelerations, one per row
+     */
+    void computeGravityInertialBatch(const Eigen::MatrixX3d& r_I, uint64_t simTimeNanos,
+                                     Eigen::MatrixX3d& grav_I);
+
     /** Read the ephemeris data from planetBodyInMsg if it's linked.
      * Otherwise, zeros `this->localPlanet`.
      */
@@ -105,6 +114,9 @@ private:
     Eigen::MatrixXd *J20002Pfix_dot; /**< [m/s]    (state engine property) planet attitude rate [PN_dot] */
 
     uint64_t timeWritten = 0; /**< [ns]     time the input planet state message was written */
+
+    GravityModel::Vector3dBatch positionsBatch_Pfix; /**< [m]      batch positions in the planet fixed frame */
+    GravityModel::Vector3dBatch fieldsBatch_Pfix;    /**< [m/s^2]  batch accelerations in the planet fixed frame */
 };
 
 /*! @brief gravity effector class */
@@ -133,6 +145,18 @@ public:
      */
     void computeGravityField(Eigen::Vector3d r_cF_N, Eigen::Vector3d rDot_cF_N);
 
+    /** Calculate gravitational acceleration of a batch of s/c, as computeGravityField does for a single one
+     *
+     *   @param r_cF_N positions of the centers of mass of the s/c wrt frame, one per row
+     *   @param rDDot_cF_N gravitational accelerations of the s/c, one per row
+     */
+    void computeGravityFieldBatch(const Eigen::MatrixX3d& r_cF_N, Eigen::MatrixX3d& rDDot_cF_N);
+
+    /** Computes the inertial positions and velocities of a batch of s/c, as updateInertialPosAndVel does for a
+     * single one, without updating the properties */
+    void computeInertialPosAndVelBatch(const Eigen::MatrixX3d& r_BF_N, const Eigen::MatrixX3d& rDot_BF_N,
+                                       Eigen::MatrixX3d& r_BN_N, Eigen::MatrixX3d& rDot_BN_N);
+
     /** Updates the inertial position and velocity properties */
     void updateInertialPosAndVel(Eigen::Vector3d r_BF_N, Eigen::Vector3d rDot_BF_N);
 
@@ -181,6 +205,8 @@ private:
     Eigen::MatrixXd *timeCorr;                 /**< [-] Time correlation property */
     Eigen::MatrixXd *inertialPositionProperty; /**< [m] r_N inertial position relative to system spice zeroBase/refBase coordinate frame, property for output. */
     Eigen::MatrixXd *inertialVelocityProperty; /**< [m/s] v_N inertial velocity relative to system spice zeroBase/refBase coordinate frame, property for output. */
+    Eigen::MatrixX3d bodyRelativePositions;    /**< [m] Batch positions wrt the planet being queried */
+    Eigen::MatrixX3d bodyAccelerations;        /**< [m/s^2] Batch accelerations due to the planet being queried */
 };
 
 #endif /* GRAVITY_EFFECTOR_H */
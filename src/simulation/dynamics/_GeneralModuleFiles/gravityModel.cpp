@@ -0,0 +1,107 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#include "gravityModel.h"
+
+#include <algorithm>
+#include <exception>
+#include <stdexcept>
+#include <thread>
+#include <vector>
+
+namespace {
+// Spreading fewer rows than this over several threads costs more than it saves
+constexpr Eigen::Index minimumRowsPerThread = 16;
+
+// Whether this thread computes a range of rows split between several threads, whose
+// nested row ranges are then computed in this thread instead of oversubscribing the cores
+thread_local bool insideThreadedRange = false;
+}
+
+void GravityModel::computeFieldBatch(const Eigen::Ref<const Vector3dBatch>& positions_planetFixed,
+                                     Eigen::Ref<Vector3dBatch> fields_planetFixed,
+                                     unsigned int numThreads) const
+{
+    if (fields_planetFixed.rows() != positions_planetFixed.rows()) {
+        throw std::invalid_argument("The batch of fields must have as many rows as the batch of positions");
+    }
+
+    forEachRowRange(positions_planetFixed.rows(), numThreads, [&](Eigen::Index begin, Eigen::Index end) {
+        for (Eigen::Index i = begin; i < end; i++) {
+            fields_planetFixed.row(i) =
+                this->computeField(positions_planetFixed.row(i).transpose()).transpose();
+        }
+    });
+}
+
+void GravityModel::computePotentialEnergyBatch(const Eigen::Ref<const Vector3dBatch>& positionsWrtPlanet_N,
+                                               Eigen::Ref<Eigen::VectorXd> potentialEnergies,
+                                               unsigned int numThreads) const
+{
+    if (potentialEnergies.size() != positionsWrtPlanet_N.rows()) {
+        throw std::invalid_argument(
+            "The batch of potential energies must have as many rows as the batch of positions");
+    }
+
+    forEachRowRange(positionsWrtPlanet_N.rows(), numThreads, [&](Eigen::Index begin, Eigen::Index end) {
+        for (Eigen::Index i = begin; i < end; i++) {
+            potentialEnergies(i) = this->computePotentialEnergy(positionsWrtPlanet_N.row(i).transpose());
+        }
+    });
+}
+
+void GravityModel::forEachRowRange(Eigen::Index rows, unsigned int numThreads,
+                                   const std::function<void(Eigen::Index, Eigen::Index)>& function)
+{
+    if (numThreads == 0) {
+        numThreads = std::max(std::thread::hardware_concurrency(), 1u);
+    }
+    Eigen::Index threadCount =
+        std::min<Eigen::Index>(numThreads, (rows + minimumRowsPerThread - 1) / minimumRowsPerThread);
+    if (threadCount <= 1 || insideThreadedRange) {
+        function(0, rows);
+        return;
+    }
+
+    // The calling thread computes the first range while the other threads compute the others
+    std::vector<std::exception_ptr> errors(threadCount);
+    std::vector<std::thread> threads;
+    threads.reserve(threadCount - 1);
+    auto runRange = [&](Eigen::Index k) {
+        insideThreadedRange = true;
+        try {
+            function(rows * k / threadCount, rows * (k + 1) / threadCount);
+        }
+        catch (...) {
+            errors[k] = std::current_exception();
+        }
+        insideThreadedRange = false;
+    };
+    for (Eigen::Index k = 1; k < threadCount; k++) {
+        threads.emplace_back(runRange, k);
+    }
+    runRange(0);
+    for (auto& thread : threads) {
+        thread.join();
+    }
+
+    for (auto& error : errors) {
+        if (error) { std::rethrow_exception(error); }
+    }
+}
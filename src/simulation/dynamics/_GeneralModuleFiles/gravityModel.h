@@ -21,6 +21,7 @@
 #define GRAVITY_MODEL_H
 
 #include <Eigen/Dense>
+#include <functional>
 #include <optional>
 #include <stdint.h>
 #include <string>
@@ -83,6 +84,45 @@ class GravityModel {
      */
     virtual double computePotentialEnergy(const Eigen::Vector3d& positionWrtPlanet_N) const = 0;
 
+    /** Positions or accelerations of a batch of points, one point per row */
+    using Vector3dBatch = Eigen::Matrix<double, Eigen::Dynamic, 3, Eigen::RowMajor>;
+
+    /** Computes the gravity acceleration at a batch of positions around this body.
+     *
+     * Every row of `positions_planetFixed` is a position in the body-fixed reference
+     * frame, and the acceleration at this position is written to the same row of
+     * `fields_planetFixed`, which must have as many rows.
+     *
+     * The rows are split between `numThreads` threads, or between all the hardware
+     * threads if `numThreads` is zero. The default implementation calls computeField
+     * for every row, which must then be safe to call from several threads at once.
+     * When the rows are split between several threads, the field at each row is
+     * computed without threads of its own, see forEachRowRange.
+     */
+    virtual void computeFieldBatch(const Eigen::Ref<const Vector3dBatch>& positions_planetFixed,
+                                   Eigen::Ref<Vector3dBatch> fields_planetFixed,
+                                   unsigned int numThreads = 0) const;
+
+    /** Computes the gravitational potential energy at a batch of positions around this body.
+     *
+     * Every row of `positionsWrtPlanet_N` is a position relative to the body and in the
+     * inertial reference frame, see computePotentialEnergy. The threads are used as in
+     * computeFieldBatch.
+     */
+    virtual void computePotentialEnergyBatch(const Eigen::Ref<const Vector3dBatch>& positionsWrtPlanet_N,
+                                             Eigen::Ref<Eigen::VectorXd> potentialEnergies,
+                                             unsigned int numThreads = 0) const;
+
+  protected:
+    /** Calls `function(begin, end)` on consecutive ranges of the rows [0, rows), which are
+     * split between `numThreads` threads (all the hardware threads if zero). An exception
+     * thrown by `function` is rethrown in the calling thread. When called from within a
+     * range that is already split between several threads, all the rows are computed in
+     * the calling thread.
+     */
+    static void forEachRowRange(Eigen::Index rows, unsigned int numThreads,
+                                const std::function<void(Eigen::Index, Eigen::Index)>& function);
+
   public:
     BSKLogger *bskLogger;  /*!< pointer to bsk logging instance */
 };
@@ -134,13 +134,13 @@ void HubEffector::computeDerivatives(double integTime, Eigen::Vector3d rDDot_BN_
     Eigen::Vector3d cLocal_B;
     Eigen::Vector3d cPrimeLocal_B;
     Eigen::Vector3d gLocal_N;
-    rDotLocal_BN_N = velocityState->getState();
-    sigmaLocal_BN = (Eigen::Vector3d )sigmaState->getState();
-    omegaLocal_BN_B = omegaState->getState();
+    rDotLocal_BN_N = velocityState->getStateView<3>();
+    sigmaLocal_BN = (Eigen::Vector3d) sigmaState->getStateView<3>();
+    omegaLocal_BN_B = omegaState->getStateView<3>();
     gLocal_N = *this->g_N;
 
     // - Set kinematic derivative
-    sigmaState->setDerivative(1.0/4.0*sigmaLocal_BN.Bmat()*omegaLocal_BN_B);
+    sigmaState->stateDerivView<3>() = 1.0/4.0*sigmaLocal_BN.Bmat()*omegaLocal_BN_B;
 
     // - Define dcm's
     Eigen::Matrix3d dcm_NB;
@@ -155,17 +155,17 @@ void HubEffector::computeDerivatives(double integTime, Eigen::Vector3d rDDot_BN_
     intermediateVector = this->hubBackSubMatrices.vecRot - this->hubBackSubMatrices.matrixC*this->hubBackSubMatrices.matrixA.inverse()*this->hubBackSubMatrices.vecTrans;
     intermediateMatrix = hubBackSubMatrices.matrixD - hubBackSubMatrices.matrixC*hubBackSubMatrices.matrixA.inverse()*hubBackSubMatrices.matrixB;
     omegaDotLocal_BN_B = intermediateMatrix.inverse()*intermediateVector;
-    omegaState->setDerivative(omegaDotLocal_BN_B);
+    omegaState->stateDerivView<3>() = omegaDotLocal_BN_B;
 
     // - Solve for rDDot_BN_N
-    velocityState->setDerivative(dcm_NB*hubBackSubMatrices.matrixA.inverse()*(hubBackSubMatrices.vecTrans - hubBackSubMatrices.matrixB*omegaDotLocal_BN_B));
+    velocityState->stateDerivView<3>() = dcm_NB*hubBackSubMatrices.matrixA.inverse()*(hubBackSubMatrices.vecTrans - hubBackSubMatrices.matrixB*omegaDotLocal_BN_B);
 
     // - Set gravity velocity derivatives
-    gravVelocityState->setDerivative(gLocal_N);
-    gravVelocityBcState->setDerivative(gLocal_N);
+    gravVelocityState->stateDerivView<3>() = gLocal_N;
+    gravVelocityBcState->stateDerivView<3>() = gLocal_N;
 
     // - Set kinematic derivative
-    posState->setDerivative(rDotLocal_BN_N);
+    posState->stateDerivView<3>() = rDotLocal_BN_N;
 
     return;
 }
@@ -176,7 +176,7 @@ void HubEffector::updateEnergyMomContributions(double integTime, Eigen::Vector3d
 {
     // - Get variables needed for energy momentum calcs
     Eigen::Vector3d omegaLocal_BN_B;
-    omegaLocal_BN_B = omegaState->getState();
+    omegaLocal_BN_B = omegaState->getStateView<3>();
 
     //  - Find rotational angular momentum contribution from hub
     Eigen::Vector3d rDot_BcB_B;
@@ -194,10 +194,10 @@ void HubEffector::modifyStates(double integTime)
 {
     // Lets switch those MRPs!!
     Eigen::Vector3d sigmaBNLoc;
-    sigmaBNLoc = (Eigen::Vector3d) this->sigmaState->getState();
+    sigmaBNLoc = this->sigmaState->getStateView<3>();
     if (sigmaBNLoc.norm() > 1) {
         sigmaBNLoc = -sigmaBNLoc/(sigmaBNLoc.dot(sigmaBNLoc));
-        this->sigmaState->setState(sigmaBNLoc);
+        this->sigmaState->stateView<3>() = sigmaBNLoc;
         this->MRPSwitchCount++;
     }
     return;
@@ -206,6 +206,6 @@ void HubEffector::modifyStates(double integTime)
 /*! This method is used to set the gravitational velocity state equal to the base velocity state */
 void HubEffector::matchGravitytoVelocityState(Eigen::Vector3d v_CN_N)
 {
-    this->gravVelocityState->setState(this->velocityState->getState());
-    this->gravVelocityBcState->setState(v_CN_N);
+    this->gravVelocityState->stateView<3>() = this->velocityState->getStateView<3>();
+    this->gravVelocityBcState->stateView<3>() = v_CN_N;
 }
\ No newline at end of file
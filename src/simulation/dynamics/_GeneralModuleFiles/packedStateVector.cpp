@@ -0,0 +1,96 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#include "packedStateVector.h"
+
+bool PackedStateLayout::update(const std::vector<DynamicObject*>& dynPtrs)
+{
+    if (this->isCurrent(dynPtrs)) return false;
+
+    this->entries.clear();
+    this->dynObjects = dynPtrs;
+    this->stateCounts.clear();
+    this->totalSize = 0;
+
+    for (size_t dynIndex = 0; dynIndex < dynPtrs.size(); dynIndex++) {
+        auto& stateSlots = dynPtrs.at(dynIndex)->dynManager.stateSlots;
+        this->stateCounts.push_back(stateSlots.size());
+        for (auto& stateData : stateSlots) {
+            PackedStateEntry entry{dynIndex,
+                                   stateData.getName(),
+                                   &stateData,
+                                   this->totalSize,
+                                   stateData.state.rows(),
+                                   stateData.state.cols()};
+            this->totalSize += entry.size();
+            this->entries.push_back(std::move(entry));
+        }
+    }
+
+    return true;
+}
+
+bool PackedStateLayout::isCurrent(const std::vector<DynamicObject*>& dynPtrs) const
+{
+    if (dynPtrs != this->dynObjects) return false;
+
+    // StateData objects are stored in the slot table of the DynParamManager, so
+    // their addresses remain valid and no slot is ever removed
+    for (size_t dynIndex = 0; dynIndex < dynPtrs.size(); dynIndex++) {
+        if (dynPtrs.at(dynIndex)->dynManager.stateSlots.size() !=
+            this->stateCounts.at(dynIndex)) {
+            return false;
+        }
+    }
+
+    for (const auto& entry : this->entries) {
+        if (entry.stateData->state.rows() != entry.rows ||
+            entry.stateData->state.cols() != entry.cols) {
+            return false;
+        }
+    }
+
+    return true;
+}
+
+void PackedStateLayout::gatherStates(Eigen::VectorXd& packed) const
+{
+    packed.resize(this->totalSize);
+    for (const auto& entry : this->entries) {
+        packed.segment(entry.offset, entry.size()) =
+            Eigen::Map<const Eigen::VectorXd>(entry.stateData->state.data(), entry.size());
+    }
+}
+
+void PackedStateLayout::gatherStateDerivs(Eigen::VectorXd& packed) const
+{
+    packed.resize(this->totalSize);
+    for (const auto& entry : this->entries) {
+        packed.segment(entry.offset, entry.size()) =
+            Eigen::Map<const Eigen::VectorXd>(entry.stateData->stateDeriv.data(), entry.size());
+    }
+}
+
+void PackedStateLayout::scatterStates(const Eigen::VectorXd& packed) const
+{
+    for (const auto& entry : this->entries) {
+        Eigen::Map<Eigen::VectorXd>(entry.stateData->state.data(), entry.size()) =
+            packed.segment(entry.offset, entry.size());
+    }
+}
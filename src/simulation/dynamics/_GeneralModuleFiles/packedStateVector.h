@@ -0,0 +1,97 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#ifndef packedStateVector_h
+#define packedStateVector_h
+
+#include "../_GeneralModuleFiles/dynamicObject.h"
+#include "../_GeneralModuleFiles/dynParamManager.h"
+
+#include <Eigen/Dense>
+#include <string>
+#include <vector>
+
+/*
+The Runge-Kutta integrators evaluate the dynamics several times per step,
+and every stage needs the states of all integrated DynamicObjects combined
+into a single vector. Storing this vector as an ExtendedStateVector means
+hashing the state identifiers and allocating a new matrix for every state
+in every stage.
+
+Instead, the states can be packed into a single contiguous Eigen::VectorXd.
+The PackedStateLayout stores where each state of each DynamicObject lives
+in this vector, so that the stage arithmetic of the integrators becomes
+plain vector operations. The layout is computed once and only rebuilt
+when the integrated states change.
+*/
+
+/** Location of a single state of a DynamicObject in a packed state vector */
+struct PackedStateEntry {
+    size_t dynObjIndex;     //!< Index of the DynamicObject in the integrator's dynPtrs vector
+    std::string stateName;  //!< Name of the state
+    StateData* stateData;   //!< State of the DynamicObject
+    Eigen::Index offset;    //!< Index of the first element of the state in the packed vector
+    Eigen::Index rows;      //!< Number of rows of the state matrix
+    Eigen::Index cols;      //!< Number of columns of the state matrix
+
+    /** Number of elements of the state in the packed vector */
+    Eigen::Index size() const { return rows * cols; }
+};
+
+/**
+ * Maps every state of a group of DynamicObjects onto a contiguous
+ * Eigen::VectorXd.
+ *
+ * States are stored in column-major order, which matches the storage of
+ * Eigen::MatrixXd, so packing and unpacking a state is a single contiguous copy.
+ */
+class PackedStateLayout {
+  public:
+    /**
+     * Rebuilds the layout if the states of the given dynamic objects
+     * changed since the last call. Returns true if the layout was rebuilt.
+     */
+    bool update(const std::vector<DynamicObject*>& dynPtrs);
+
+    /** Copies the value of every state into the packed vector */
+    void gatherStates(Eigen::VectorXd& packed) const;
+
+    /** Copies the derivative of every state into the packed vector */
+    void gatherStateDerivs(Eigen::VectorXd& packed) const;
+
+    /** Sets the value of every state from the packed vector, reusing the storage of the states */
+    void scatterStates(const Eigen::VectorXd& packed) const;
+
+    /** Returns the number of elements of the packed vector */
+    Eigen::Index size() const { return this->totalSize; }
+
+    /** Returns the location of every state in the packed vector */
+    const std::vector<PackedStateEntry>& getEntries() const { return this->entries; }
+
+  private:
+    /** Checks that the layout still describes the states of the given dynamic objects */
+    bool isCurrent(const std::vector<DynamicObject*>& dynPtrs) const;
+
+    std::vector<PackedStateEntry> entries;   //!< Location of every state in the packed vector
+    std::vector<DynamicObject*> dynObjects;  //!< Dynamic objects the layout was built for
+    std::vector<size_t> stateCounts;         //!< Number of states of each dynamic object
+    Eigen::Index totalSize = 0;              //!< Number of elements of the packed vector
+};
+
+#endif /* packedStateVector_h */
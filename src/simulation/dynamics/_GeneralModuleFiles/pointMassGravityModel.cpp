@@ -20,6 +20,8 @@
 #include "pointMassGravityModel.h"
 #include "gravityEffector.h"
 
+#include <stdexcept>
+
 std::optional<std::string> PointMassGravityModel::initializeParameters(const GravBodyData& body)
 {
     this->muBody = body.mu;
@@ -33,6 +35,23 @@ PointMassGravityModel::computeField(const Eigen::Vector3d& position_planetFixed)
     return -position_planetFixed * this->muBody / (rMag * rMag * rMag);
 }
 
+void PointMassGravityModel::computeFieldBatch(const Eigen::Ref<const Vector3dBatch>& positions_planetFixed,
+                                              Eigen::Ref<Vector3dBatch> fields_planetFixed,
+                                              unsigned int numThreads) const
+{
+    if (fields_planetFixed.rows() != positions_planetFixed.rows()) {
+        throw std::invalid_argument("The batch of fields must have as many rows as the batch of positions");
+    }
+
+    // The rows are computed in place, without a virtual call per position
+    forEachRowRange(positions_planetFixed.rows(), numThreads, [&](Eigen::Index begin, Eigen::Index end) {
+        for (Eigen::Index i = begin; i < end; i++) {
+            const double rMag = positions_planetFixed.row(i).norm();
+            fields_planetFixed.row(i) = -positions_planetFixed.row(i) * this->muBody / (rMag * rMag * rMag);
+        }
+    });
+}
+
 double
 PointMassGravityModel::computePotentialEnergy(const Eigen::Vector3d& positionWrtPlanet_N) const
 {
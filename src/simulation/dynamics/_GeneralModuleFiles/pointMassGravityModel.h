@@ -50,6 +50,11 @@ class PointMassGravityModel : public GravityModel {
      */
     double computePotentialEnergy(const Eigen::Vector3d& positionWrtPlanet_N) const override;
 
+    /** Returns the gravity acceleration at a batch of positions, see GravityModel::computeFieldBatch */
+    void computeFieldBatch(const Eigen::Ref<const Vector3dBatch>& positions_planetFixed,
+                           Eigen::Ref<Vector3dBatch> fields_planetFixed,
+                           unsigned int numThreads = 0) const override;
+
   public:
     double muBody = 0; /**< [m^3/s^2] Gravitation parameter for the planet */
 };
@@ -0,0 +1,84 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#ifndef PROFILING_COUNTER_H
+#define PROFILING_COUNTER_H
+
+#include <chrono>
+#include <cstdint>
+
+/*! @brief Number of calls and cumulative wall clock time of a profiled operation */
+struct ProfilingCounter {
+    uint64_t calls = 0;             //!< -- Number of times the operation was called
+    uint64_t nanoseconds = 0;       //!< [ns] Cumulative wall clock time spent in the operation
+
+    /** Sets the counter back to zero */
+    void reset() { this->calls = 0; this->nanoseconds = 0; }
+};
+
+/*! @brief Profiling counters of a state vector integrator */
+struct IntegratorProfile {
+    ProfilingCounter integrate;     //!< -- Calls and wall clock time of the integrate method
+    uint64_t acceptedSteps = 0;     //!< -- Number of accepted integration steps
+    uint64_t rejectedSteps = 0;     //!< -- Number of rejected integration steps, only adaptive integrators reject steps
+
+    /** Sets the counters back to zero */
+    void reset() { this->integrate.reset(); this->acceptedSteps = 0; this->rejectedSteps = 0; }
+};
+
+#ifndef SWIG
+/*! @brief Adds the wall clock time of its scope to a ProfilingCounter.
+
+ Reading the clock twice costs from a few tens up to about a hundred nanoseconds, so operations that take a
+ few microseconds or less are only timed on request. The calls are always counted.
+ */
+class ProfilingTimer {
+public:
+    /** Starts timing, the call is only counted if countCall is true and the time only measured if measureTime is true */
+    explicit ProfilingTimer(ProfilingCounter& counter, bool countCall = true, bool measureTime = true)
+        : counter(counter), measureTime(measureTime)
+    {
+        if (countCall) {
+            this->counter.calls++;
+        }
+        if (measureTime) {
+            this->start = std::chrono::steady_clock::now();
+        }
+    }
+
+    /** Adds the elapsed time to the counter */
+    ~ProfilingTimer()
+    {
+        if (this->measureTime) {
+            this->counter.nanoseconds += static_cast<uint64_t>(std::chrono::duration_cast<std::chrono::nanoseconds>(
+                std::chrono::steady_clock::now() - this->start).count());
+        }
+    }
+
+    ProfilingTimer(const ProfilingTimer&) = delete;
+    ProfilingTimer& operator=(const ProfilingTimer&) = delete;
+
+private:
+    ProfilingCounter& counter;                              //!< counter the time is added to
+    bool measureTime;                                       //!< flag to measure the wall clock time
+    std::chrono::steady_clock::time_point start;            //!< time at which the timer was started
+};
+#endif
+
+#endif /* PROFILING_COUNTER_H */
@@ -53,6 +53,32 @@ public:
     StateData operator+ (const StateData & operand);    //!< class method
     StateData operator* (double scaleFactor);           //!< class method
 
+#ifndef SWIG
+    /*! Fixed-size views of the state and its derivative for the common small state sizes (1x1, 3x1, 4x1, 3x3).
+     Unlike getState() and setDerivative(), the views don't copy the state into or out of a dynamic matrix, so they
+     can be used in the equations of motion without any heap allocation.  The state must have the given size. */
+    template <int nRow, int nCol = 1>
+    Eigen::Map<const Eigen::Matrix<double, nRow, nCol>> getStateView() const {
+        eigen_assert(state.rows() == nRow && state.cols() == nCol);
+        return Eigen::Map<const Eigen::Matrix<double, nRow, nCol>>(state.data());
+    }
+    template <int nRow, int nCol = 1>
+    Eigen::Map<const Eigen::Matrix<double, nRow, nCol>> getStateDerivView() const {
+        eigen_assert(stateDeriv.rows() == nRow && stateDeriv.cols() == nCol);
+        return Eigen::Map<const Eigen::Matrix<double, nRow, nCol>>(stateDeriv.data());
+    }
+    template <int nRow, int nCol = 1>
+    Eigen::Map<Eigen::Matrix<double, nRow, nCol>> stateView() {
+        eigen_assert(state.rows() == nRow && state.cols() == nCol);
+        return Eigen::Map<Eigen::Matrix<double, nRow, nCol>>(state.data());
+    }
+    template <int nRow, int nCol = 1>
+    Eigen::Map<Eigen::Matrix<double, nRow, nCol>> stateDerivView() {
+        eigen_assert(stateDeriv.rows() == nRow && stateDeriv.cols() == nCol);
+        return Eigen::Map<Eigen::Matrix<double, nRow, nCol>>(stateDeriv.data());
+    }
+#endif
+
 };
 
 
@@ -36,6 +36,9 @@ StateEffector::StateEffector()
     this->nameOfSpacecraftAttachedTo = "";
     this->r_BP_P.setZero();
     this->dcm_BP.setIdentity();
+
+    // - Integrate the effector states with the spacecraft by default
+    this->integrationSubSteps = 1;
     return;
 }
 
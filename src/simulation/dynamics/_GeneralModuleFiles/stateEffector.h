@@ -23,6 +23,7 @@
 #include <Eigen/Dense>
 #include "architecture/utilities/avsEigenMRP.h"
 #include "dynParamManager.h"
+#include "profilingCounter.h"
 #include "architecture/utilities/bskLogging.h"
 
 
@@ -60,6 +61,8 @@ public:
     Eigen::Vector3d r_BP_P;                //!< position vector of the spacecraft mody frame origin B relative to the primary spacecraft body frame P.  This is used in the SpacecraftSystem module where multiple spacecraft hubs can be a single spacecraft
     Eigen::Matrix3d dcm_BP;                //!< DCM of the spacecraft body frame B relative to primary spacecraft body frame P
     BSKLogger bskLogger;                   //!< -- BSK Logging
+    int integrationSubSteps;               //!< -- Number of sub-steps the effector states take within each spacecraft integration step, 1 integrates them with the spacecraft
+    ProfilingCounter profile;              //!< -- Number of derivative evaluations and wall clock time spent in the effector by the equations of motion
 
 public:
     StateEffector();                       //!< -- Contructor
@@ -31,3 +31,12 @@ StateVecIntegrator::~StateVecIntegrator(void)
 {
     this->dynPtrs.clear();
 }
+
+/*! @brief Integrators only provide the states at the end of the integration step by default */
+bool StateVecIntegrator::interpolateState(const DynamicObject& dynObject,
+                                          const std::string& stateName,
+                                          double time,
+                                          Eigen::MatrixXd& state) const
+{
+    return false;
+}
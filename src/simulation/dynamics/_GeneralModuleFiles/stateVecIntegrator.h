@@ -21,7 +21,10 @@
 #ifndef stateVecIntegrator_h
 #define stateVecIntegrator_h
 
+#include <Eigen/Dense>
+#include <string>
 #include <vector>
+#include "profilingCounter.h"
 
 class DynamicObject;
 
@@ -33,7 +36,16 @@ public:
     StateVecIntegrator(DynamicObject* dynIn);
     virtual ~StateVecIntegrator(void);
     virtual void integrate(double currentTime, double timeStep) = 0; //!< class method
+
+    /** Interpolates the value of a state of a DynamicObject at a time within the last call to
+     * integrate. Returns false if the integrator does not provide a dense output for this time.
+     */
+    virtual bool interpolateState(const DynamicObject& dynObject,
+                                  const std::string& stateName,
+                                  double time,
+                                  Eigen::MatrixXd& state) const;
     std::vector<DynamicObject*> dynPtrs; //!< This is an object that contains the method equationsOfMotion(), also known as the F function.
+    IntegratorProfile profile; //!< Number and wall clock time of the integrate calls, and the accepted and rejected steps
 
 };
 
@@ -23,6 +23,7 @@
 #include "../_GeneralModuleFiles/dynamicObject.h"
 #include "../_GeneralModuleFiles/dynParamManager.h"
 #include "../_GeneralModuleFiles/svIntegratorRungeKutta.h"
+#include <algorithm>
 #include <cmath>
 #include <memory>
 #include <optional>
@@ -53,6 +54,11 @@ template <size_t numberStages> struct RKAdaptiveCoefficients : public RKCoeffici
  * try to integrate with the given time step. It will then evaluate the error commited
  * and, if it's too large, internally use smaller time steps until the error tolerances
  * are met.
+ *
+ * The step size proposed at the end of a call is used to start the next call, as long
+ * as that call continues the integration where the previous one stopped. This avoids
+ * rejecting the first steps of every call when the task rate is larger than the step
+ * size the tolerances allow.
  */
 template <size_t numberStages>
 class svIntegratorAdaptiveRungeKutta : public svIntegratorRungeKutta<numberStages> {
@@ -173,6 +179,33 @@ class svIntegratorAdaptiveRungeKutta : public svIntegratorRungeKutta<numberStage
     std::optional<double> getAbsoluteTolerance(const DynamicObject& dynamicObject,
                                                std::string stateName);
 
+    /**
+     * Returns the step size the next integration step will be attempted with,
+     * or zero if the next call starts with its full time step.
+     */
+    double getStepSize() const;
+
+    /**
+     * Forgets the step size and error of the previous calls, so that the
+     * next call starts with its full time step (or the initial step size heuristic).
+     *
+     * This should be called after the states were changed discontinuously.
+     */
+    void resetStepSize();
+
+    /**
+     * Interpolates the value of a state of a DynamicObject at a time within the
+     * last call to integrate.
+     *
+     * A cubic Hermite polynomial is fitted through the states and derivatives at the
+     * beginning and end of the integration step that contains the given time.
+     * Returns false if denseOutput is disabled or the time is not within the last call.
+     */
+    virtual bool interpolateState(const DynamicObject& dynObject,
+                                  const std::string& stateName,
+                                  double time,
+                                  Eigen::MatrixXd& state) const override;
+
     /** Maximum relative truncation error allowed.
      *
      * The relative truncation error is the absolute error of the state divided by the magnitude of
@@ -202,6 +235,43 @@ class svIntegratorAdaptiveRungeKutta : public svIntegratorRungeKutta<numberStage
      */
     double minimumFactorDecreaseForNextStepSize = 0.1;
 
+    /** If true, the step size proposed at the end of a call is used to start the next call.
+     *
+     * Otherwise, every call first attempts to integrate over its full time step.
+     */
+    bool persistStepSize = true;
+
+    /** The step size of the previous call is forgotten if a state changed by more than this
+     * fraction of its norm between two calls, as happens for example when MRPs are switched
+     * to their shadow set or a state is set by the user.
+     */
+    double stepSizeResetThreshold = 0.1;
+
+    /** Exponent of the previous error in the proportional-integral (PI) step size controller.
+     *
+     * With the default value of 0, the new step size only depends on the error of the
+     * last step. Positive values make the step size follow the error history more
+     * smoothly, which reduces the number of rejected steps; 0.4/methodLargestOrder
+     * is a common choice.
+     */
+    double stepSizeControllerBeta = 0.0;
+
+    /** If true, the first step of an integration is estimated from the states and their
+     * derivatives instead of attempting the full time step.
+     *
+     * This costs one extra evaluation of the dynamics, and is only done when there is no
+     * step size from a previous call to start from.
+     */
+    bool useInitialStepSizeHeuristic = false;
+
+    /** If true, the states and derivatives at the end of every accepted step are stored so that
+     * the states can be interpolated at any time within the last call to integrate.
+     *
+     * This costs one extra evaluation of the dynamics per call, which is far less than what
+     * shortening the time step of the dynamics task to the desired output rate would cost.
+     */
+    bool denseOutput = false;
+
   protected:
     /**
      * Computes the absolute error of every state
@@ -212,11 +282,38 @@ class svIntegratorAdaptiveRungeKutta : public svIntegratorRungeKutta<numberStage
      * between error and tolerance is returned,
      * which is the relation that defines the minimum acceptable
      * time step.
+     *
+     * The "k" coefficients are read from kVectors.
+     */
+    double computeMaxRelativeError(double timeStep, const Eigen::VectorXd& candidateNextState);
+
+    /**
+     * Looks up the tolerances of every state in the packed state layout.
+     *
+     * This is done once per call to integrate, so that the tolerance maps
+     * are not searched on every integration step.
      */
-    double computeMaxRelativeError(
-        double timeStep,
-        const ExtendedStateVector& candidateNextState,
-        const typename svIntegratorRungeKutta<numberStages>::KCoefficientsValues& kVectors) const;
+    void updateStateTolerances();
+
+    /**
+     * Computes the step size to use after a step of size timeStep was
+     * taken with the given ratio between error and tolerance.
+     */
+    double computeNextStepSize(double timeStep, double maxRelError, bool accepted) const;
+
+    /**
+     * Estimates the size of the first integration step from the current states
+     * and their derivatives, as described by Hairer, Norsett and Wanner
+     * in "Solving Ordinary Differential Equations I", section II.4.
+     */
+    double computeInitialStepSize(double time, double maxTimeStep);
+
+    /** Returns true if a state changed by more than stepSizeResetThreshold times its norm
+     * since the end of the last call to integrate */
+    bool statesJumped() const;
+
+    /** Stores the current states at the given time as the next node of the dense output */
+    void storeDenseOutputNode(double time);
 
     /** Finds index of dynamicObject in dynPtrs (vector of pointers to DynamicObject) */
     size_t findDynamicObjectIndex(const DynamicObject& dynamicObject) const;
@@ -230,6 +327,12 @@ class svIntegratorAdaptiveRungeKutta : public svIntegratorRungeKutta<numberStage
     double
     getTolerance(size_t dynamicObjectIndex, const std::string& stateName, double stateNorm) const;
 
+    /** Returns the most specific relative tolerance for the given state */
+    double findRelativeTolerance(size_t dynamicObjectIndex, const std::string& stateName) const;
+
+    /** Returns the most specific absolute tolerance for the given state */
+    double findAbsoluteTolerance(size_t dynamicObjectIndex, const std::string& stateName) const;
+
     /** The higher order of the two orders used in adaptive RK methods.
      *
      * For the RKF45 method, for example, methodLargestOrder should be 5.
@@ -249,6 +352,39 @@ class svIntegratorAdaptiveRungeKutta : public svIntegratorRungeKutta<numberStage
     /** Holds the maximum absolute truncation error allowed for specific states of specific dynamic
      * objects*/
     std::unordered_map<ExtendedStateId, double, ExtendedStateIdHash> dynObjectStateSpecificAbsTol;
+
+    /** Packed absolute truncation error of the last integration step */
+    Eigen::VectorXd truncationError;
+
+    /** Relative tolerance of every entry in the packed state layout */
+    std::vector<double> stateRelTol;
+
+    /** Absolute tolerance of every entry in the packed state layout */
+    std::vector<double> stateAbsTol;
+
+    /** Step size the next integration step is attempted with, zero if unknown */
+    double nextStepSize = 0.0;
+
+    /** Ratio between error and tolerance of the last accepted step, used by the PI controller */
+    double previousErrorRatio = 0.0;
+
+    /** Time at which the last call to integrate stopped */
+    double lastIntegrationTime = NAN;
+
+    /** Packed states at the end of the last call to integrate */
+    Eigen::VectorXd previousEndState;
+
+    /** Number of valid nodes of the dense output of the last call to integrate */
+    size_t denseOutputNodes = 0;
+
+    /** Times of the dense output nodes (the buffers are reused between calls) */
+    std::vector<double> denseOutputTimes;
+
+    /** Packed states at the dense output nodes */
+    std::vector<Eigen::VectorXd> denseOutputStates;
+
+    /** Packed state derivatives at the dense output nodes */
+    std::vector<Eigen::VectorXd> denseOutputDerivs;
 };
 
 template <size_t numberStages>
@@ -269,65 +405,263 @@ void svIntegratorAdaptiveRungeKutta<numberStages>::integrate(double startingTime
                                                              double desiredTimeStep)
 {
     double time = startingTime;
+    const double endTime = startingTime + desiredTimeStep;
+    const bool layoutChanged = this->updateStateLayout();
+    this->updateStateTolerances();
+    this->stateLayout.gatherStates(this->currentState);
+
+    // The step size of the previous call can only be reused if this call
+    // continues the integration of the same states where the previous one stopped
+    if (layoutChanged || !this->persistStepSize ||
+        !(std::abs(startingTime - this->lastIntegrationTime) <=
+          1e-12 * std::max(1.0, std::abs(startingTime))) ||
+        this->statesJumped()) {
+        this->resetStepSize();
+    }
+
     double timeStep = desiredTimeStep;
-    ExtendedStateVector state = ExtendedStateVector::fromStates(this->dynPtrs);
-    typename svIntegratorRungeKutta<numberStages>::KCoefficientsValues kValues;
+    if (this->nextStepSize > 0) {
+        timeStep = std::min(this->nextStepSize, desiredTimeStep);
+    }
+    else if (this->useInitialStepSizeHeuristic) {
+        timeStep = this->computeInitialStepSize(startingTime, desiredTimeStep);
+    }
+
+    this->denseOutputNodes = 0;
+    if (this->denseOutput) {
+        this->storeDenseOutputNode(time);
+    }
 
     // Continue until we are done with the desired time step
-    while (time < startingTime + desiredTimeStep) {
+    while (time < endTime) {
         // Much like regular Runge Kutta, we compute the
         // "k" coefficients and the next state from them.
-        kValues = this->computeKCoefficients(time, timeStep, state);
-        ExtendedStateVector candidateNextState = this->computeNextState(timeStep, state, kValues);
+        this->computeKCoefficients(time, timeStep, this->currentState);
+        this->computeNextState(timeStep, this->currentState, this->nextState);
 
         // For the adaptive RK, we also compute the maximum
         // relationship between error and tolerance
-        double maxRelError = this->computeMaxRelativeError(timeStep, candidateNextState, kValues);
+        double maxRelError = this->computeMaxRelativeError(timeStep, this->nextState);
 
         // If maxRelError > 1, then we need a smaller time step,
         // so we should reject the current time step.
         // Otherwise, we can afford a greater time step for the next
         // integration, and this step was valid.
-        if (maxRelError <= 1.) // Accept integration step
+        bool accepted = maxRelError <= 1.;
+        if (accepted) // Accept integration step
         {
+            // The first "k" coefficient is the derivative at the beginning of the step
+            if (this->denseOutput) {
+                this->denseOutputDerivs.at(this->denseOutputNodes - 1) = this->kVectors.at(0);
+            }
+
             // Advance time and set new state to the computed state
+            // (swapping the buffers does not copy nor allocate)
             time += timeStep;
-            state = std::move(candidateNextState);
+            this->currentState.swap(this->nextState);
+
+            if (this->denseOutput) {
+                this->storeDenseOutputNode(time);
+            }
+            this->profile.acceptedSteps++;
+        }
+        else {
+            this->profile.rejectedSteps++;
         }
 
-        // Regardless of accepting or not the step, we compute a new time step
-        double newTimeStep = this->safetyFactorForNextStepSize * timeStep *
-                             std::pow(1.0 / maxRelError, 1.0 / this->methodLargestOrder);
-        newTimeStep = std::min(newTimeStep, timeStep * this->maximumFactorIncreaseForNextStepSize);
-        newTimeStep = std::max(newTimeStep, timeStep * this->minimumFactorDecreaseForNextStepSize);
-        newTimeStep =
-            std::min(newTimeStep, startingTime + desiredTimeStep - time); // Avoid over-stepping
-        timeStep = newTimeStep;
+        // Regardless of accepting or not the step, we compute a new time step.
+        // An accepted step that was shortened to stop at the end of this call does not
+        // tell how large the steps can be, so the proposal and error of the last full
+        // step are kept for the next call.
+        if (!accepted || !(timeStep < this->nextStepSize)) {
+            this->nextStepSize = this->computeNextStepSize(timeStep, maxRelError, accepted);
+            if (accepted) {
+                this->previousErrorRatio = std::max(maxRelError, 1e-4);
+            }
+        }
+        timeStep = std::min(this->nextStepSize, endTime - time); // Avoid over-stepping
+    }
+
+    this->lastIntegrationTime = endTime;
+    this->previousEndState = this->currentState;
+
+    // The derivative at the end of the last step completes the dense output
+    if (this->denseOutputNodes > 1) {
+        this->computeDerivatives(time,
+                                 desiredTimeStep,
+                                 this->currentState,
+                                 this->denseOutputDerivs.at(this->denseOutputNodes - 1));
     }
 
     // Update the dynamic objects with the final state obtained
-    state.setStates(this->dynPtrs);
+    this->stateLayout.scatterStates(this->currentState);
+}
+
+template <size_t numberStages>
+bool svIntegratorAdaptiveRungeKutta<numberStages>::statesJumped() const
+{
+    if (this->previousEndState.size() != this->currentState.size()) return true;
+
+    // Small changes of the states between calls (such as the gravity velocity of the
+    // spacecraft hub being reset) don't invalidate the step size, but jumps do
+    for (const auto& entry : this->stateLayout.getEntries()) {
+        auto state = this->currentState.segment(entry.offset, entry.size());
+        auto previousState = this->previousEndState.segment(entry.offset, entry.size());
+        double change = (state - previousState).norm();
+        if (change > 0 &&
+            change > this->stepSizeResetThreshold * std::max(state.norm(), previousState.norm())) {
+            return true;
+        }
+    }
+    return false;
+}
+
+template <size_t numberStages>
+void svIntegratorAdaptiveRungeKutta<numberStages>::storeDenseOutputNode(double time)
+{
+    if (this->denseOutputNodes == this->denseOutputTimes.size()) {
+        this->denseOutputTimes.push_back(time);
+        this->denseOutputStates.push_back(this->currentState);
+        this->denseOutputDerivs.emplace_back(this->currentState.size());
+    }
+    else {
+        this->denseOutputTimes.at(this->denseOutputNodes) = time;
+        this->denseOutputStates.at(this->denseOutputNodes) = this->currentState;
+        this->denseOutputDerivs.at(this->denseOutputNodes).resize(this->currentState.size());
+    }
+    this->denseOutputNodes++;
+}
+
+template <size_t numberStages>
+bool svIntegratorAdaptiveRungeKutta<numberStages>::interpolateState(
+    const DynamicObject& dynObject,
+    const std::string& stateName,
+    double time,
+    Eigen::MatrixXd& state) const
+{
+    if (!this->denseOutput || this->denseOutputNodes < 2) return false;
+
+    const double firstTime = this->denseOutputTimes.front();
+    const double lastTime = this->denseOutputTimes.at(this->denseOutputNodes - 1);
+    const double timeTolerance = 1e-12 * std::max(1.0, std::abs(lastTime));
+    if (time < firstTime - timeTolerance || time > lastTime + timeTolerance) return false;
+
+    auto dynIt = std::find(this->dynPtrs.cbegin(), this->dynPtrs.cend(), &dynObject);
+    if (dynIt == this->dynPtrs.cend()) return false;
+    const size_t dynObjIndex = std::distance(this->dynPtrs.cbegin(), dynIt);
+
+    const auto& entries = this->stateLayout.getEntries();
+    auto entryIt = std::find_if(entries.cbegin(), entries.cend(), [&](const PackedStateEntry& entry) {
+        return entry.dynObjIndex == dynObjIndex && entry.stateName == stateName;
+    });
+    if (entryIt == entries.cend()) return false;
+
+    // Find the step [t_i, t_i+1] that contains the time
+    auto nodesEnd = this->denseOutputTimes.cbegin() + this->denseOutputNodes;
+    size_t node = std::distance(this->denseOutputTimes.cbegin(),
+                                std::upper_bound(this->denseOutputTimes.cbegin(), nodesEnd, time));
+    node = std::min(std::max<size_t>(node, 1), this->denseOutputNodes - 1) - 1;
+
+    const double stepSize = this->denseOutputTimes.at(node + 1) - this->denseOutputTimes.at(node);
+    const double theta = std::min(std::max((time - this->denseOutputTimes.at(node)) / stepSize, 0.0), 1.0);
+    const double theta2 = theta * theta;
+    const double theta3 = theta2 * theta;
+
+    // Cubic Hermite basis functions
+    const double h00 = 2 * theta3 - 3 * theta2 + 1;
+    const double h10 = theta3 - 2 * theta2 + theta;
+    const double h01 = -2 * theta3 + 3 * theta2;
+    const double h11 = theta3 - theta2;
+
+    const Eigen::Index offset = entryIt->offset;
+    const Eigen::Index size = entryIt->size();
+    Eigen::VectorXd packedState =
+        h00 * this->denseOutputStates.at(node).segment(offset, size) +
+        (h10 * stepSize) * this->denseOutputDerivs.at(node).segment(offset, size) +
+        h01 * this->denseOutputStates.at(node + 1).segment(offset, size) +
+        (h11 * stepSize) * this->denseOutputDerivs.at(node + 1).segment(offset, size);
+
+    state = Eigen::Map<Eigen::MatrixXd>(packedState.data(), entryIt->rows, entryIt->cols);
+    return true;
+}
+
+template <size_t numberStages>
+double svIntegratorAdaptiveRungeKutta<numberStages>::computeNextStepSize(double timeStep,
+                                                                         double maxRelError,
+                                                                         bool accepted) const
+{
+    // The PI controller only uses the error history after accepted steps,
+    // after a rejection the step size is chosen from the last error alone
+    const bool usePI = accepted && this->stepSizeControllerBeta > 0 && this->previousErrorRatio > 0;
+    const double beta = usePI ? this->stepSizeControllerBeta : 0.0;
+    const double alpha = 1.0 / this->methodLargestOrder - 0.75 * beta;
+
+    double newTimeStep = this->safetyFactorForNextStepSize * timeStep *
+                         std::pow(1.0 / maxRelError, alpha) *
+                         (usePI ? std::pow(this->previousErrorRatio, beta) : 1.0);
+    newTimeStep = std::min(newTimeStep, timeStep * this->maximumFactorIncreaseForNextStepSize);
+    newTimeStep = std::max(newTimeStep, timeStep * this->minimumFactorDecreaseForNextStepSize);
+    return newTimeStep;
+}
+
+template <size_t numberStages>
+double svIntegratorAdaptiveRungeKutta<numberStages>::computeInitialStepSize(double time,
+                                                                            double maxTimeStep)
+{
+    // Norm of a packed vector scaled by the error tolerance of every state
+    const auto& entries = this->stateLayout.getEntries();
+    auto scaledNorm = [this, &entries](const Eigen::VectorXd& vector) {
+        double sumSquares = 0;
+        for (size_t entryIndex = 0; entryIndex < entries.size(); entryIndex++) {
+            const auto& entry = entries[entryIndex];
+            auto scale = (this->currentState.segment(entry.offset, entry.size()).array().abs() *
+                              this->stateRelTol[entryIndex] +
+                          this->stateAbsTol[entryIndex]);
+            sumSquares +=
+                (vector.segment(entry.offset, entry.size()).array() / scale).square().sum();
+        }
+        return std::sqrt(sumSquares / std::max<Eigen::Index>(this->currentState.size(), 1));
+    };
+
+    // Derivatives at the initial states
+    this->computeDerivatives(time, maxTimeStep, this->currentState, this->kVectors.at(0));
+    const double stateNorm = scaledNorm(this->currentState);
+    const double derivNorm = scaledNorm(this->kVectors.at(0));
+    double firstGuess = (stateNorm < 1e-5 || derivNorm < 1e-5) ? 1e-6 : 0.01 * stateNorm / derivNorm;
+    firstGuess = std::min(firstGuess, maxTimeStep);
+
+    // Explicit Euler step to estimate the second derivative
+    this->stageState = this->currentState + firstGuess * this->kVectors.at(0);
+    this->computeDerivatives(time + firstGuess, maxTimeStep, this->stageState, this->nextState);
+    this->nextState -= this->kVectors.at(0);
+    const double secondDerivNorm = scaledNorm(this->nextState) / firstGuess;
+
+    const double maxNorm = std::max(derivNorm, secondDerivNorm);
+    double secondGuess = maxNorm <= 1e-15
+                             ? std::max(1e-6, firstGuess * 1e-3)
+                             : std::pow(0.01 / maxNorm, 1.0 / this->methodLargestOrder);
+
+    return std::min({100 * firstGuess, secondGuess, maxTimeStep});
 }
 
 template <size_t numberStages>
 double svIntegratorAdaptiveRungeKutta<numberStages>::computeMaxRelativeError(
     double timeStep,
-    const ExtendedStateVector& candidateNextState,
-    const typename svIntegratorRungeKutta<numberStages>::KCoefficientsValues& kVectors) const
+    const Eigen::VectorXd& candidateNextState)
 {
     auto castCoefficients =
         static_cast<RKAdaptiveCoefficients<numberStages>*>(this->coefficients.get());
 
     // Compute the absolute truncation error for every state
-    ExtendedStateVector truncationError =
-        kVectors.at(0) *
-        ((castCoefficients->bArray.at(0) - castCoefficients->bStarArray.at(0)) * timeStep);
+    this->truncationError =
+        ((castCoefficients->bArray.at(0) - castCoefficients->bStarArray.at(0)) * timeStep) *
+        this->kVectors.at(0);
 
     for (size_t stageIndex = 1; stageIndex < numberStages; stageIndex++) {
         double bDiff =
             castCoefficients->bArray.at(stageIndex) - castCoefficients->bStarArray.at(stageIndex);
         if (bDiff == 0) continue;
-        truncationError += kVectors.at(stageIndex) * (bDiff * timeStep);
+        this->truncationError += (bDiff * timeStep) * this->kVectors.at(stageIndex);
     }
 
     // Compute the maximum relative error being committed
@@ -336,20 +670,36 @@ double svIntegratorAdaptiveRungeKutta<numberStages>::computeMaxRelativeError(
     // We care only about the largest relationship between
     // truncation error and tolerance.
     double maxRelativeError = 0;
-    auto maxRelativeErrorRef = std::ref(maxRelativeError);
-    candidateNextState.apply([this, &maxRelativeErrorRef, &truncationError](
-                                 const size_t& dynObjIndex,
-                                 const std::string& stateName,
-                                 const Eigen::MatrixXd& thisState) {
-        double thisTruncationError = truncationError.at({dynObjIndex, stateName}).norm();
-        double thisErrorTolerance = this->getTolerance(dynObjIndex, stateName, thisState.norm());
-        maxRelativeErrorRef.get() =
-            std::max(maxRelativeErrorRef.get(), thisTruncationError / thisErrorTolerance);
-    });
+    const auto& entries = this->stateLayout.getEntries();
+    for (size_t entryIndex = 0; entryIndex < entries.size(); entryIndex++) {
+        const auto& entry = entries[entryIndex];
+        double thisTruncationError =
+            this->truncationError.segment(entry.offset, entry.size()).norm();
+        double thisErrorTolerance =
+            candidateNextState.segment(entry.offset, entry.size()).norm() *
+                this->stateRelTol[entryIndex] +
+            this->stateAbsTol[entryIndex];
+        maxRelativeError = std::max(maxRelativeError, thisTruncationError / thisErrorTolerance);
+    }
 
     return maxRelativeError;
 }
 
+template <size_t numberStages>
+void svIntegratorAdaptiveRungeKutta<numberStages>::updateStateTolerances()
+{
+    const auto& entries = this->stateLayout.getEntries();
+    this->stateRelTol.resize(entries.size());
+    this->stateAbsTol.resize(entries.size());
+    for (size_t entryIndex = 0; entryIndex < entries.size(); entryIndex++) {
+        const auto& entry = entries[entryIndex];
+        this->stateRelTol[entryIndex] =
+            this->findRelativeTolerance(entry.dynObjIndex, entry.stateName);
+        this->stateAbsTol[entryIndex] =
+            this->findAbsoluteTolerance(entry.dynObjIndex, entry.stateName);
+    }
+}
+
 template <size_t numberStages>
 void svIntegratorAdaptiveRungeKutta<numberStages>::setRelativeTolerance(double relTol)
 {
@@ -452,6 +802,19 @@ inline std::optional<double> svIntegratorAdaptiveRungeKutta<numberStages>::getAb
     return std::optional<double>();
 }
 
+template <size_t numberStages>
+double svIntegratorAdaptiveRungeKutta<numberStages>::getStepSize() const
+{
+    return this->nextStepSize;
+}
+
+template <size_t numberStages>
+void svIntegratorAdaptiveRungeKutta<numberStages>::resetStepSize()
+{
+    this->nextStepSize = 0.0;
+    this->previousErrorRatio = 0.0;
+}
+
 template <size_t numberStages>
 size_t svIntegratorAdaptiveRungeKutta<numberStages>::findDynamicObjectIndex(
     const DynamicObject& dynamicObject) const
@@ -469,26 +832,40 @@ double svIntegratorAdaptiveRungeKutta<numberStages>::getTolerance(size_t dynamic
                                                                   const std::string& stateName,
                                                                   double stateNorm) const
 {
-    const ExtendedStateId id{dynamicObjectIndex, stateName};
+    return stateNorm * this->findRelativeTolerance(dynamicObjectIndex, stateName) +
+           this->findAbsoluteTolerance(dynamicObjectIndex, stateName);
+}
 
-    double relTol{this->relTol};
-    double absTol{this->absTol};
+template <size_t numberStages>
+double svIntegratorAdaptiveRungeKutta<numberStages>::findRelativeTolerance(
+    size_t dynamicObjectIndex,
+    const std::string& stateName) const
+{
+    const ExtendedStateId id{dynamicObjectIndex, stateName};
 
     if (this->dynObjectStateSpecificRelTol.count(id) > 0) {
-        relTol = this->dynObjectStateSpecificRelTol.at(id);
+        return this->dynObjectStateSpecificRelTol.at(id);
     }
     else if (this->stateSpecificRelTol.count(stateName) > 0) {
-        relTol = this->stateSpecificRelTol.at(stateName);
+        return this->stateSpecificRelTol.at(stateName);
     }
+    return this->relTol;
+}
+
+template <size_t numberStages>
+double svIntegratorAdaptiveRungeKutta<numberStages>::findAbsoluteTolerance(
+    size_t dynamicObjectIndex,
+    const std::string& stateName) const
+{
+    const ExtendedStateId id{dynamicObjectIndex, stateName};
 
     if (this->dynObjectStateSpecificAbsTol.count(id) > 0) {
-        absTol = this->dynObjectStateSpecificAbsTol.at(id);
+        return this->dynObjectStateSpecificAbsTol.at(id);
     }
     else if (this->stateSpecificAbsTol.count(stateName) > 0) {
-        absTol = this->stateSpecificAbsTol.at(stateName);
+        return this->stateSpecificAbsTol.at(stateName);
     }
-
-    return stateNorm * relTol + absTol;
+    return this->absTol;
 }
 
 #endif /* svIntegratorAdaptiveRungeKutta_h */
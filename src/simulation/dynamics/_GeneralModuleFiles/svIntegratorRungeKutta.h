@@ -24,6 +24,7 @@
 #include "../_GeneralModuleFiles/dynParamManager.h"
 #include "../_GeneralModuleFiles/stateVecIntegrator.h"
 #include "extendedStateVector.h"
+#include "packedStateVector.h"
 #include <array>
 #include <functional>
 #include <memory>
@@ -91,7 +92,14 @@ template <size_t numberStages> class svIntegratorRungeKutta : public StateVecInt
      * needed, where each "k" coefficient has the same size as the state.
      * This type allows us to store these "k" coefficients.
      */
-    using KCoefficientsValues = std::array<ExtendedStateVector, numberStages>;
+    using KCoefficientsValues = std::array<Eigen::VectorXd, numberStages>;
+
+    /**
+     * Rebuilds the packed state layout if the integrated states changed,
+     * and resizes the state and "k" coefficient buffers accordingly.
+     * Returns true if the layout was rebuilt.
+     */
+    bool updateStateLayout();
 
     /**
      * Computes the derivatives of every state given a time and current states.
@@ -99,29 +107,46 @@ template <size_t numberStages> class svIntegratorRungeKutta : public StateVecInt
      * Internally, this sets the states on the dynamic objects and
      * calls the equationsOfMotion methods.
      */
-    ExtendedStateVector
-    computeDerivatives(double time, double timeStep, const ExtendedStateVector& states);
+    void computeDerivatives(double time,
+                            double timeStep,
+                            const Eigen::VectorXd& states,
+                            Eigen::VectorXd& derivatives);
 
     /**
      * Computes the "k" coefficients of the Runge-Kutta method
-     * for a time and state.
+     * for a time and state, and stores them in kVectors.
      */
-    KCoefficientsValues computeKCoefficients(double currentTime,
-                                             double timeStep,
-                                             const ExtendedStateVector& currentStates);
+    void computeKCoefficients(double currentTime,
+                              double timeStep,
+                              const Eigen::VectorXd& currentStates);
 
     /**
-     * Adds the "k" coefficients, weighted by the "c" coefficients
+     * Adds the "k" coefficients, weighted by the "b" coefficients
      * to find the state after the time step.
      */
-    ExtendedStateVector computeNextState(double timeStep,
-                                         const ExtendedStateVector& currentStates,
-                                         const KCoefficientsValues& kVectors);
+    void computeNextState(double timeStep,
+                          const Eigen::VectorXd& currentStates,
+                          Eigen::VectorXd& nextStates);
 
   protected:
     // coefficients is stored as a pointer to support polymorphism
     /** Coefficients to be used in the method */
     const std::unique_ptr<RKCoefficients<numberStages>> coefficients;
+
+    /** Location of every integrated state in the packed state vectors */
+    PackedStateLayout stateLayout;
+
+    /** Packed states at the beginning of the integration step */
+    Eigen::VectorXd currentState;
+
+    /** Packed states used to evaluate the dynamics at every stage */
+    Eigen::VectorXd stageState;
+
+    /** Packed states at the end of the integration step */
+    Eigen::VectorXd nextState;
+
+    /** Packed "k" coefficients of every stage */
+    KCoefficientsValues kVectors;
 };
 
 template <size_t numberStages>
@@ -144,73 +169,85 @@ svIntegratorRungeKutta<numberStages>::svIntegratorRungeKutta(
 template <size_t numberStages>
 void svIntegratorRungeKutta<numberStages>::integrate(double currentTime, double timeStep)
 {
-    ExtendedStateVector currentState = ExtendedStateVector::fromStates(this->dynPtrs);
-    KCoefficientsValues kValues = this->computeKCoefficients(currentTime, timeStep, currentState);
-    ExtendedStateVector nextState = this->computeNextState(timeStep, currentState, kValues);
-    nextState.setStates(this->dynPtrs);
+    this->updateStateLayout();
+    this->stateLayout.gatherStates(this->currentState);
+    this->computeKCoefficients(currentTime, timeStep, this->currentState);
+    this->computeNextState(timeStep, this->currentState, this->nextState);
+    this->stateLayout.scatterStates(this->nextState);
+    this->profile.acceptedSteps++;
 }
 
 template <size_t numberStages>
-ExtendedStateVector
-svIntegratorRungeKutta<numberStages>::computeDerivatives(double time,
-                                                         double timeStep,
-                                                         const ExtendedStateVector& states)
+bool svIntegratorRungeKutta<numberStages>::updateStateLayout()
 {
-    states.setStates(this->dynPtrs);
+    if (!this->stateLayout.update(this->dynPtrs)) return false;
+
+    const Eigen::Index size = this->stateLayout.size();
+    this->currentState.resize(size);
+    this->stageState.resize(size);
+    this->nextState.resize(size);
+    for (auto& kVector : this->kVectors) {
+        kVector.resize(size);
+    }
+    return true;
+}
+
+template <size_t numberStages>
+void svIntegratorRungeKutta<numberStages>::computeDerivatives(double time,
+                                                              double timeStep,
+                                                              const Eigen::VectorXd& states,
+                                                              Eigen::VectorXd& derivatives)
+{
+    this->stateLayout.scatterStates(states);
 
     for (auto dynPtr : this->dynPtrs) {
+        ProfilingTimer timer(dynPtr->equationsOfMotionProfile, true, dynPtr->profileEvaluationTimes);
         dynPtr->equationsOfMotion(time, timeStep);
     }
 
-    return ExtendedStateVector::fromStateDerivs(this->dynPtrs);
+    this->stateLayout.gatherStateDerivs(derivatives);
 }
 
 template <size_t numberStages>
-auto svIntegratorRungeKutta<numberStages>::computeKCoefficients(
+void svIntegratorRungeKutta<numberStages>::computeKCoefficients(
     double currentTime,
     double timeStep,
-    const ExtendedStateVector& currentStates) -> KCoefficientsValues
+    const Eigen::VectorXd& currentStates)
 {
-    KCoefficientsValues kVectors;
-
     for (size_t stageIndex = 0; stageIndex < numberStages; stageIndex++) {
         double timeToComputeK = currentTime + this->coefficients->cArray.at(stageIndex) * timeStep;
 
-        if (stageIndex == 0) // Avoids one ExtendedStateVector copy
+        if (stageIndex == 0) // The first stage is evaluated at the current states
         {
-            kVectors.at(stageIndex) =
-                this->computeDerivatives(timeToComputeK, timeStep, currentStates);
+            this->computeDerivatives(
+                timeToComputeK, timeStep, currentStates, this->kVectors.at(stageIndex));
             continue;
         }
 
-        ExtendedStateVector stateToComputeK = currentStates;
+        this->stageState = currentStates;
         for (size_t subStageIndex = 0; subStageIndex < stageIndex; subStageIndex++) {
             if (this->coefficients->aMatrix.at(stageIndex).at(subStageIndex) == 0) continue;
-            stateToComputeK +=
-                kVectors.at(subStageIndex) *
-                (this->coefficients->aMatrix.at(stageIndex).at(subStageIndex) * timeStep);
+            this->stageState +=
+                (this->coefficients->aMatrix.at(stageIndex).at(subStageIndex) * timeStep) *
+                this->kVectors.at(subStageIndex);
         }
 
-        kVectors.at(stageIndex) =
-            this->computeDerivatives(timeToComputeK, timeStep, stateToComputeK);
+        this->computeDerivatives(
+            timeToComputeK, timeStep, this->stageState, this->kVectors.at(stageIndex));
     }
-
-    return kVectors;
 }
 
 template <size_t numberStages>
-ExtendedStateVector
-svIntegratorRungeKutta<numberStages>::computeNextState(double timeStep,
-                                                       const ExtendedStateVector& currentStates,
-                                                       const KCoefficientsValues& kVectors)
+void svIntegratorRungeKutta<numberStages>::computeNextState(double timeStep,
+                                                            const Eigen::VectorXd& currentStates,
+                                                            Eigen::VectorXd& nextStates)
 {
-    ExtendedStateVector result = currentStates;
+    nextStates = currentStates;
     for (size_t stageIndex = 0; stageIndex < numberStages; stageIndex++) {
         if (this->coefficients->bArray.at(stageIndex) == 0) continue;
-        result += kVectors.at(stageIndex) * (this->coefficients->bArray.at(stageIndex) * timeStep);
+        nextStates +=
+            (this->coefficients->bArray.at(stageIndex) * timeStep) * this->kVectors.at(stageIndex);
     }
-
-    return result;
 }
 
 #endif /* svIntegratorRungeKutta_h */
@@ -0,0 +1,126 @@
+# ISC License
+#
+# Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+
+
+#
+# Basilisk Unit Test
+#
+# Purpose:  Test the cached gravity model, which interpolates the field of another gravity model sampled on nested
+#           grids, and the cache files it is saved to and loaded from
+#
+
+import os
+
+import numpy as np
+import pytest
+from Basilisk.simulation.cachedGravityModel import CachedGravityModel
+from Basilisk.simulation.pointMassGravityModel import PointMassGravityModel
+from Basilisk.simulation.polyhedralGravityModel import PolyhedralGravityModel
+
+path = os.path.dirname(os.path.abspath(__file__))
+
+
+def erosModel():
+    polyhedral = PolyhedralGravityModel().loadFromFile(path + '/EROS856Vert1708Fac.txt')
+    polyhedral.muBody = 4.46275472004 * 1e5
+    return polyhedral
+
+
+def test_cachedGravityModel(tmp_path):
+    """Checks the interpolated field against the cached polyhedral model within the error bound, and that a saved
+    cache is loaded with the same field"""
+    polyhedral = erosModel()
+    radius = np.max(np.linalg.norm(polyhedral.xyzVertex, axis=1))
+
+    cached = CachedGravityModel()
+    cached.model = polyhedral
+    cached.cacheRadius = 4 * radius
+    cached.numLevels = 3
+    cached.nodesPerSide = 12
+    assert cached.initializeParameters() is None
+    assert cached.hasCache()
+
+    rng = np.random.default_rng(0)
+    directions = rng.normal(size=(50, 3))
+    positions = directions / np.linalg.norm(directions, axis=1)[:, None] * rng.uniform(1.5, 8, (50, 1)) * radius
+    numInterpolated = 0
+    for position in positions:
+        field = np.array(cached.computeField(position)).flatten()
+        modelField = np.array(polyhedral.computeField(position)).flatten()
+        bound = cached.getErrorBound(position)
+        if bound == 0:
+            # the cached model is used beyond the outermost grid
+            assert np.max(np.abs(position)) > 0.8 * cached.cacheRadius
+            np.testing.assert_array_equal(field, modelField)
+        else:
+            assert np.linalg.norm(field - modelField) <= bound
+            numInterpolated += 1
+    assert 0 < numInterpolated < len(positions)
+
+    # the loaded cache has the same grids and field, and is not sampled again
+    fileName = str(tmp_path / "eros.cache")
+    cached.saveCache(fileName)
+    loaded = CachedGravityModel()
+    loaded.model = erosModel()
+    loaded.loadCache(fileName)
+    assert (loaded.numLevels, loaded.nodesPerSide, loaded.cacheRadius) == (3, 12, 4 * radius)
+    assert loaded.initializeParameters() is None
+    for position in positions:
+        np.testing.assert_array_equal(loaded.computeField(position), cached.computeField(position))
+        assert loaded.getErrorBound(position) == cached.getErrorBound(position)
+
+    with pytest.raises(RuntimeError):
+        loaded.loadCache(path + '/EROS856Vert1708Fac.txt')
+    assert loaded.hasCache()
+
+    loaded.clearCache()
+    assert not loaded.hasCache()
+    with pytest.raises(RuntimeError):
+        loaded.saveCache(fileName)
+
+    # the cached model and valid grid parameters are required
+    assert CachedGravityModel().initializeParameters() is not None
+    cached = CachedGravityModel()
+    cached.model = erosModel()
+    assert cached.initializeParameters() is not None
+
+
+def test_cachedGravityModelCenterNode():
+    """Checks that a grid node at the center of the body, where the point mass field is not defined, doesn't spoil
+    the interpolation around it. The scaled point mass field is linear and interpolated exactly."""
+    pointMass = PointMassGravityModel()
+    pointMass.muBody = 4e5
+
+    cached = CachedGravityModel()
+    cached.model = pointMass
+    cached.cacheRadius = 10e3
+    cached.numLevels = 2
+    cached.nodesPerSide = 9
+    assert cached.initializeParameters() is None
+
+    for position in [[100., 50., -30.], [700., -400., 200.], [4000., 1000., -2000.]]:
+        field = np.array(cached.computeField(position)).flatten()
+        np.testing.assert_allclose(field, np.array(pointMass.computeField(position)).flatten(), rtol=1e-12)
+        assert np.isfinite(cached.getErrorBound(position))
+
+
+if __name__ == "__main__":
+    import tempfile
+    import pathlib
+    with tempfile.TemporaryDirectory() as directory:
+        test_cachedGravityModel(pathlib.Path(directory))
+    test_cachedGravityModelCenterNode()
@@ -154,6 +154,52 @@ def test_gravityEffectorAllTest(show_plots):
     [testResults, testMessage] = multiBodyGravity(show_plots)
     assert testResults < 1, testMessage
 
+def test_sphericalHarmonicsTruncation():
+    """Checks that a field truncated to a lower degree matches a model loaded up to that degree, and that
+    the coefficients are packed again when the model is initialized again"""
+    position = [[15000.0], [10000.0], [(6378.1363) * 1.0E3]]
+
+    spherHarm = gravityEffector.SphericalHarmonics()
+    gravityEffector.loadGravFromFile(path + '/GGM03S.txt', spherHarm, 20)
+    spherHarm.initializeParameters()
+    gravTruncated = spherHarm.computeField(position, 10, True)
+
+    spherHarmLow = gravityEffector.SphericalHarmonics()
+    gravityEffector.loadGravFromFile(path + '/GGM03S.txt', spherHarmLow, 10)
+    spherHarmLow.initializeParameters()
+    np.testing.assert_allclose(spherHarmLow.computeField(position, 10, True), gravTruncated, rtol=1e-14)
+
+    spherHarm.maxDeg = 10
+    spherHarm.initializeParameters()
+    np.testing.assert_allclose(spherHarm.computeField(position, 10, True), gravTruncated, rtol=1e-14)
+
+def test_polyhedralField():
+    """Checks the field of a polyhedral cube against a point mass far from the cube, and that initializing the
+    model again or splitting the evaluation between threads doesn't change the field"""
+    poly = gravityEffector.PolyhedralGravityModel()
+    poly.muBody = 4.46275472004 * 1e5
+    poly.xyzVertex = [[-1., -1., -1.], [1., -1., -1.], [1., 1., -1.], [-1., 1., -1.],
+                      [-1., -1., 1.], [1., -1., 1.], [1., 1., 1.], [-1., 1., 1.]]
+    poly.orderFacet = [[1, 3, 2], [1, 4, 3], [5, 6, 7], [5, 7, 8], [1, 2, 6], [1, 6, 5],
+                       [2, 3, 7], [2, 7, 6], [3, 4, 8], [3, 8, 7], [4, 1, 5], [4, 5, 8]]
+    poly.initializeParameters()
+
+    position = np.array([300., 200., -100.])
+    gravOut = np.array(poly.computeField(position)).flatten()
+    gravPointMass = -poly.muBody * position / np.linalg.norm(position)**3
+    np.testing.assert_allclose(gravOut, gravPointMass, rtol=1e-8)
+
+    poly.initializeParameters()
+    np.testing.assert_allclose(np.array(poly.computeField(position)).flatten(), gravOut, rtol=1e-14)
+
+    poly.numThreads = 0
+    np.testing.assert_allclose(np.array(poly.computeField(position)).flatten(), gravOut, rtol=1e-14)
+
+    # the evaluations of a threaded batch don't split the polyhedron between threads of their own
+    positions = np.outer(np.linspace(1., 2., 64), position)
+    fields = poly.computeFieldBatch(positions, 0)
+    np.testing.assert_allclose(fields[-1], np.array(poly.computeField(positions[-1])).flatten(), rtol=1e-14)
+
 def independentSphericalHarmonics(show_plots):
     testCase = "independentCheck"
     # The __tracebackhide__ setting influences pytest showing of tracebacks:
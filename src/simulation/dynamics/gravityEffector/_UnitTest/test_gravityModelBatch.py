@@ -0,0 +1,84 @@
+# ISC License
+#
+# Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+
+
+#
+# Basilisk Unit Test
+#
+# Purpose:  Test the batch evaluation of the gravity fields and potential energies of the gravity models
+#
+
+import os
+
+import numpy as np
+import pytest
+from Basilisk.simulation.pointMassGravityModel import PointMassGravityModel
+from Basilisk.simulation.polyhedralGravityModel import PolyhedralGravityModel
+from Basilisk.simulation.sphericalHarmonicsGravityModel import SphericalHarmonicsGravityModel
+
+path = os.path.dirname(os.path.abspath(__file__))
+
+
+def createGravityModel(modelName):
+    """Returns an initialized gravity model and the radius of the body"""
+    if modelName == "pointMass":
+        model = PointMassGravityModel()
+        model.muBody = 0.3986004415E+15
+        radius = 6378.1363E3
+    elif modelName == "sphericalHarmonics":
+        model = SphericalHarmonicsGravityModel().loadFromFile(path + '/GGM03S.txt', 20)
+        radius = model.radEquator
+    else:
+        model = PolyhedralGravityModel().loadFromFile(path + '/EROS856Vert1708Fac.txt')
+        model.muBody = 4.46275472004 * 1e5
+        radius = 2e4
+    model.initializeParameters()
+    return model, radius
+
+
+@pytest.mark.parametrize("modelName", ["pointMass", "sphericalHarmonics", "polyhedral"])
+@pytest.mark.parametrize("numThreads", [1, 0, 3])
+def test_gravityModelBatch(modelName, numThreads):
+    """Checks that the batch evaluations match the evaluations at every single position"""
+    model, radius = createGravityModel(modelName)
+
+    rng = np.random.default_rng(0)
+    directions = rng.normal(size=(200, 3))
+    positions = directions / np.linalg.norm(directions, axis=1)[:, None] * radius * rng.uniform(1.2, 3., (200, 1))
+
+    fields = model.computeFieldBatch(positions, numThreads)
+    assert fields.shape == (200, 3)
+    for position, field in zip(positions, fields):
+        np.testing.assert_allclose(field, np.array(model.computeField(position)).flatten(), rtol=1e-14)
+
+    energies = model.computePotentialEnergyBatch(positions, numThreads)
+    np.testing.assert_allclose(energies, [model.computePotentialEnergy(position) for position in positions],
+                               rtol=1e-14)
+
+    # non contiguous positions and lists are converted before the evaluation
+    np.testing.assert_allclose(model.computeFieldBatch(np.asfortranarray(positions), numThreads), fields,
+                               rtol=1e-14)
+    np.testing.assert_allclose(model.computeFieldBatch(positions[:5].tolist(), numThreads), fields[:5],
+                               rtol=1e-14)
+    assert model.computeFieldBatch(np.zeros((0, 3)), numThreads).shape == (0, 3)
+
+    with pytest.raises(ValueError):
+        model.computeFieldBatch(positions[:, :2], numThreads)
+
+
+if __name__ == "__main__":
+    test_gravityModelBatch("sphericalHarmonics", 0)
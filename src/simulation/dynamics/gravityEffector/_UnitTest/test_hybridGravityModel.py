@@ -0,0 +1,82 @@
+# ISC License
+#
+# Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+
+
+#
+# Basilisk Unit Test
+#
+# Purpose:  Test the hybrid gravity model, which blends a polyhedral model close to the body with a spherical
+#           harmonics expansion fitted to it far from the body
+#
+
+import os
+
+import numpy as np
+from Basilisk.simulation import gravityEffector
+from Basilisk.simulation.hybridGravityModel import HybridGravityModel
+
+path = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_hybridGravityModel():
+    """Checks that the polyhedral model is used close to the body, that the fitted spherical harmonics match
+    it far from the body, and that loaded coefficients are not fitted"""
+    hybrid = HybridGravityModel().loadFromFile(path + '/EROS856Vert1708Fac.txt')
+    hybrid.polyhedral.muBody = 4.46275472004 * 1e5
+    assert hybrid.initializeParameters() is None
+
+    radius = hybrid.getBrillouinRadius()
+    np.testing.assert_allclose(radius, np.max(np.linalg.norm(hybrid.polyhedral.xyzVertex, axis=1)))
+
+    # the fitted expansion has the mass of the polyhedron
+    assert hybrid.sphericalHarmonics.maxDeg == 12
+    assert abs(hybrid.sphericalHarmonics.cBar[0][0] - 1) < 1e-10
+
+    rng = np.random.default_rng(0)
+    for ratio in [1.2, 1.7, 3.0]:
+        for direction in rng.normal(size=(20, 3)):
+            position = direction / np.linalg.norm(direction) * ratio * radius
+            field = np.array(hybrid.computeField(position)).flatten()
+            polyhedralField = np.array(hybrid.polyhedral.computeField(position)).flatten()
+            if ratio < hybrid.nearRadiusRatio:
+                np.testing.assert_array_equal(field, polyhedralField)
+            else:
+                np.testing.assert_allclose(field, polyhedralField, rtol=1e-3 if ratio < 2 else 1e-6)
+
+    # loaded coefficients are used as they are
+    hybrid = HybridGravityModel().loadFromFile(path + '/EROS856Vert1708Fac.txt')
+    hybrid.polyhedral.muBody = 4.46275472004 * 1e5
+    hybrid.sphericalHarmonics.muBody = hybrid.polyhedral.muBody
+    hybrid.sphericalHarmonics.radEquator = 16e3
+    hybrid.sphericalHarmonics.cBar = [[1.0], [0.0, 0.0]]
+    hybrid.sphericalHarmonics.sBar = [[0.0], [0.0, 0.0]]
+    hybrid.sphericalHarmonics.maxDeg = 1
+    assert hybrid.initializeParameters() is None
+    assert [list(row) for row in hybrid.sphericalHarmonics.cBar] == [[1.0], [0.0, 0.0]]
+
+    # the switching radii must be ordered
+    hybrid.nearRadiusRatio = 2.5
+    assert hybrid.initializeParameters() is not None
+
+    gravBody = gravityEffector.GravBodyData()
+    gravBody.useHybridGravityModel(path + '/EROS856Vert1708Fac.txt', 8)
+    assert isinstance(gravBody.gravityModel, HybridGravityModel)
+    assert gravBody.gravityModel.maxDeg == 8
+
+
+if __name__ == "__main__":
+    test_hybridGravityModel()
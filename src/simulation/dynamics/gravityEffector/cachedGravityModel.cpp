@@ -0,0 +1,329 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#include "cachedGravityModel.h"
+
+#include <algorithm>
+#include <array>
+#include <cmath>
+#include <cstring>
+#include <fstream>
+#include <stdexcept>
+
+#ifdef _WIN32
+#ifndef NOMINMAX
+#define NOMINMAX
+#endif
+#include <windows.h>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+namespace {
+// The cache file starts with this tag, the format version, the number of grids, the number of
+// nodes per side and the radius of the outermost grid, followed by the error bound of every grid
+// and the scaled field at the nodes of every grid
+const char cacheFileTag[8] = {'B', 'S', 'K', 'G', 'R', 'A', 'V', 'C'};
+const uint64_t cacheFileVersion = 1;
+const size_t cacheFileHeaderBytes = sizeof(cacheFileTag) + 3 * sizeof(uint64_t) + sizeof(double);
+
+// Maps the whole file read-only in memory, the mapping is released with the returned pointer
+std::shared_ptr<const char> mapFile(const std::string& fileName, size_t& size)
+{
+    const std::string error = "Could not map the gravity cache file " + fileName;
+#ifdef _WIN32
+    HANDLE file = CreateFileA(fileName.c_str(), GENERIC_READ, FILE_SHARE_READ, nullptr, OPEN_EXISTING,
+                              FILE_ATTRIBUTE_NORMAL, nullptr);
+    if (file == INVALID_HANDLE_VALUE) { throw std::runtime_error(error); }
+    LARGE_INTEGER fileSize;
+    if (!GetFileSizeEx(file, &fileSize) || fileSize.QuadPart == 0) {
+        CloseHandle(file);
+        throw std::runtime_error(error);
+    }
+    HANDLE mapping = CreateFileMappingA(file, nullptr, PAGE_READONLY, 0, 0, nullptr);
+    CloseHandle(file);
+    if (!mapping) { throw std::runtime_error(error); }
+    // The view keeps the mapping alive once it is created
+    const void* view = MapViewOfFile(mapping, FILE_MAP_READ, 0, 0, 0);
+    CloseHandle(mapping);
+    if (!view) { throw std::runtime_error(error); }
+    size = static_cast<size_t>(fileSize.QuadPart);
+    return std::shared_ptr<const char>(static_cast<const char*>(view),
+                                       [](const char* data) { UnmapViewOfFile(data); });
+#else
+    const int file = open(fileName.c_str(), O_RDONLY);
+    if (file < 0) { throw std::runtime_error(error); }
+    struct stat fileStatus;
+    if (fstat(file, &fileStatus) != 0 || fileStatus.st_size == 0) {
+        close(file);
+        throw std::runtime_error(error);
+    }
+    const size_t fileSize = static_cast<size_t>(fileStatus.st_size);
+    // The mapping stays valid once the file is closed
+    void* view = mmap(nullptr, fileSize, PROT_READ, MAP_SHARED, file, 0);
+    close(file);
+    if (view == MAP_FAILED) { throw std::runtime_error(error); }
+    size = fileSize;
+    return std::shared_ptr<const char>(static_cast<const char*>(view), [fileSize](const char* data) {
+        munmap(const_cast<char*>(data), fileSize);
+    });
+#endif
+}
+}
+
+std::optional<std::string> CachedGravityModel::initializeParameters()
+{
+    if (!this->model) {
+        return "Could not initialize the cached gravity model: the cached model is missing.";
+    }
+    this->model->bskLogger = this->bskLogger;
+    auto error = this->model->initializeParameters();
+    if (error) { return error; }
+    return this->initializeCache();
+}
+
+std::optional<std::string> CachedGravityModel::initializeParameters(const GravBodyData& body)
+{
+    if (!this->model) {
+        return "Could not initialize the cached gravity model: the cached model is missing.";
+    }
+    this->model->bskLogger = this->bskLogger;
+    auto error = this->model->initializeParameters(body);
+    if (error) { return error; }
+    return this->initializeCache();
+}
+
+std::optional<std::string> CachedGravityModel::initializeCache()
+{
+    if (this->hasCache()) { return {}; }
+    if (!(this->cacheRadius > 0) || this->numLevels < 1 || this->nodesPerSide < 4) {
+        return "Could not initialize the cached gravity model: cacheRadius must be positive, "
+               "numLevels at least 1 and nodesPerSide at least 4.";
+    }
+    this->buildCache();
+    return {};
+}
+
+void CachedGravityModel::buildCache()
+{
+    const size_t n = this->nodesPerSide;
+    const size_t levelNodes = n * n * n;
+    this->gridLevels = this->numLevels;
+    this->gridNodesPerSide = n;
+    this->gridRadius = this->cacheRadius;
+
+    GravityModel::Vector3dBatch positions(this->gridLevels * levelNodes, 3);
+    for (size_t level = 0; level < this->gridLevels; level++) {
+        const double halfWidth = this->levelHalfWidth(level);
+        const double spacing = 2 * halfWidth / (n - 1);
+        for (size_t i = 0; i < n; i++) {
+            for (size_t j = 0; j < n; j++) {
+                for (size_t k = 0; k < n; k++) {
+                    positions.row(level * levelNodes + (i * n + j) * n + k)
+                        << i * spacing - halfWidth, j * spacing - halfWidth, k * spacing - halfWidth;
+                }
+            }
+        }
+    }
+    this->mappedFile.reset();
+    this->builtFields.resize(3 * positions.rows());
+    Eigen::Map<GravityModel::Vector3dBatch> fields(this->builtFields.data(), positions.rows(), 3);
+    this->model->computeFieldBatch(positions, fields, this->numThreads);
+    // The field is scaled by the cube of the distance, such that its point mass part is linear and
+    // interpolated exactly. The scaled field vanishes at the center of the body, where the field of
+    // some models is not defined.
+    const Eigen::ArrayXd distances = positions.rowwise().norm();
+    fields.array().colwise() *= distances.cube();
+    for (Eigen::Index row = 0; row < fields.rows(); row++) {
+        if (distances[row] == 0) { fields.row(row).setZero(); }
+    }
+    this->nodeFields = this->builtFields.data();
+
+    // The error of every grid is sampled at the centers of the cells that overlap the region where
+    // the grid is used, which lie farthest from the nodes
+    std::vector<size_t> centerLevels;
+    for (size_t level = 0; level < this->gridLevels; level++) {
+        const double halfWidth = this->levelHalfWidth(level);
+        const double spacing = 2 * halfWidth / (n - 1);
+        const double finerExtent = level > 0 ? halfWidth / 2 - spacing / 2 : 0.0;
+        for (size_t i = 1; i + 2 < n; i++) {
+            for (size_t j = 1; j + 2 < n; j++) {
+                for (size_t k = 1; k + 2 < n; k++) {
+                    const Eigen::Vector3d center =
+                        Eigen::Vector3d(i + 0.5, j + 0.5, k + 0.5) * spacing - Eigen::Vector3d::Constant(halfWidth);
+                    if (center.isZero() || center.cwiseAbs().maxCoeff() + spacing / 2 <= finerExtent) {
+                        continue;
+                    }
+                    positions.row(centerLevels.size()) = center;
+                    centerLevels.push_back(level);
+                }
+            }
+        }
+    }
+    const Eigen::Index numCenters = static_cast<Eigen::Index>(centerLevels.size());
+    GravityModel::Vector3dBatch centerFields(numCenters, 3);
+    this->model->computeFieldBatch(positions.topRows(numCenters), centerFields, this->numThreads);
+
+    this->levelErrors.assign(this->gridLevels, 0.0);
+    for (Eigen::Index c = 0; c < numCenters; c++) {
+        const size_t level = centerLevels[c];
+        const Eigen::Vector3d error = this->interpolate(level, positions.row(c)) - centerFields.row(c).transpose();
+        this->levelErrors[level] = std::max(this->levelErrors[level], error.norm());
+    }
+}
+
+Eigen::Vector3d CachedGravityModel::computeField(const Eigen::Vector3d& position_planetFixed) const
+{
+    const size_t level = this->findLevel(position_planetFixed);
+    if (level == this->gridLevels) { return this->model->computeField(position_planetFixed); }
+    return this->interpolate(level, position_planetFixed);
+}
+
+double CachedGravityModel::computePotentialEnergy(const Eigen::Vector3d& positionWrtPlanet_N) const
+{
+    return this->model->computePotentialEnergy(positionWrtPlanet_N);
+}
+
+double CachedGravityModel::getErrorBound(const Eigen::Vector3d& position_planetFixed) const
+{
+    const size_t level = this->findLevel(position_planetFixed);
+    return level < this->gridLevels ? this->levelErrors[level] : 0.0;
+}
+
+bool CachedGravityModel::hasCache() const
+{
+    return this->nodeFields != nullptr;
+}
+
+void CachedGravityModel::clearCache()
+{
+    this->nodeFields = nullptr;
+    this->builtFields = std::vector<double>();
+    this->mappedFile.reset();
+    this->levelErrors.clear();
+    this->gridLevels = 0;
+    this->gridNodesPerSide = 0;
+    this->gridRadius = 0;
+}
+
+void CachedGravityModel::saveCache(const std::string& fileName) const
+{
+    if (!this->hasCache()) {
+        throw std::runtime_error("The cached gravity model has no cache to save, it must be initialized first.");
+    }
+    std::ofstream file(fileName, std::ios::binary | std::ios::trunc);
+    const uint64_t header[3] = {cacheFileVersion, this->gridLevels, this->gridNodesPerSide};
+    const size_t numFields = 3 * this->gridLevels * this->gridNodesPerSide * this->gridNodesPerSide *
+                             this->gridNodesPerSide;
+    file.write(cacheFileTag, sizeof(cacheFileTag));
+    file.write(reinterpret_cast<const char*>(header), sizeof(header));
+    file.write(reinterpret_cast<const char*>(&this->gridRadius), sizeof(double));
+    file.write(reinterpret_cast<const char*>(this->levelErrors.data()), this->gridLevels * sizeof(double));
+    file.write(reinterpret_cast<const char*>(this->nodeFields), numFields * sizeof(double));
+    file.close();
+    if (!file) { throw std::runtime_error("Could not write the gravity cache file " + fileName); }
+}
+
+void CachedGravityModel::loadCache(const std::string& fileName)
+{
+    size_t size = 0;
+    std::shared_ptr<const char> data = mapFile(fileName, size);
+
+    const std::string error = "The file " + fileName + " is not a valid gravity cache";
+    if (size < cacheFileHeaderBytes || std::memcmp(data.get(), cacheFileTag, sizeof(cacheFileTag)) != 0) {
+        throw std::runtime_error(error);
+    }
+    uint64_t header[3];
+    double radius;
+    std::memcpy(header, data.get() + sizeof(cacheFileTag), sizeof(header));
+    std::memcpy(&radius, data.get() + sizeof(cacheFileTag) + sizeof(header), sizeof(double));
+    const uint64_t levels = header[1];
+    const uint64_t n = header[2];
+    if (header[0] != cacheFileVersion || levels < 1 || levels > 64 || n < 4 || n > (1 << 16) ||
+        !(radius > 0)) {
+        throw std::runtime_error(error);
+    }
+    const size_t fieldsOffset = cacheFileHeaderBytes + levels * sizeof(double);
+    if (size != fieldsOffset + 3 * levels * n * n * n * sizeof(double)) { throw std::runtime_error(error); }
+
+    this->clearCache();
+    this->mappedFile = data;
+    // The mapping starts on a page boundary and the header is a multiple of 8 bytes long,
+    // so the fields are aligned
+    this->nodeFields = reinterpret_cast<const double*>(data.get() + fieldsOffset);
+    this->levelErrors.resize(levels);
+    std::memcpy(this->levelErrors.data(), data.get() + cacheFileHeaderBytes, levels * sizeof(double));
+    this->numLevels = this->gridLevels = levels;
+    this->nodesPerSide = this->gridNodesPerSide = n;
+    this->cacheRadius = this->gridRadius = radius;
+}
+
+size_t CachedGravityModel::findLevel(const Eigen::Vector3d& position_planetFixed) const
+{
+    // The scaled field can't be divided at the center of the body, where the wrapped model is used
+    if (!this->hasCache() || position_planetFixed.isZero()) { return this->gridLevels; }
+    // The interpolation stencils reach one node beyond the cell around the position
+    const double extentRatio = 1 - 2.0 / (this->gridNodesPerSide - 1);
+    const double distance = position_planetFixed.cwiseAbs().maxCoeff();
+    for (size_t level = 0; level < this->gridLevels; level++) {
+        if (distance <= extentRatio * this->levelHalfWidth(level)) { return level; }
+    }
+    return this->gridLevels;
+}
+
+Eigen::Vector3d CachedGravityModel::interpolate(size_t level, const Eigen::Vector3d& position_planetFixed) const
+{
+    const size_t n = this->gridNodesPerSide;
+    const double halfWidth = this->levelHalfWidth(level);
+    const double spacing = 2 * halfWidth / (n - 1);
+
+    // Lagrange weights of the four nodes around the position along every axis
+    std::array<size_t, 3> firstNode;
+    std::array<std::array<double, 4>, 3> weights;
+    for (size_t axis = 0; axis < 3; axis++) {
+        const double u = (position_planetFixed[axis] + halfWidth) / spacing;
+        const double cell = std::clamp(std::floor(u), 1.0, double(n - 3));
+        const double t = u - cell;
+        firstNode[axis] = static_cast<size_t>(cell) - 1;
+        weights[axis] = {-t * (t - 1) * (t - 2) / 6, (t + 1) * (t - 1) * (t - 2) / 2,
+                         -(t + 1) * t * (t - 2) / 2, (t + 1) * t * (t - 1) / 6};
+    }
+
+    const double* levelFields = this->nodeFields + 3 * level * n * n * n;
+    Eigen::Vector3d field = Eigen::Vector3d::Zero();
+    for (size_t i = 0; i < 4; i++) {
+        for (size_t j = 0; j < 4; j++) {
+            const double weight = weights[0][i] * weights[1][j];
+            const double* nodes = levelFields + 3 * (((firstNode[0] + i) * n + firstNode[1] + j) * n + firstNode[2]);
+            for (size_t k = 0; k < 4; k++) {
+                field += (weight * weights[2][k]) * Eigen::Map<const Eigen::Vector3d>(nodes + 3 * k);
+            }
+        }
+    }
+    const double r = position_planetFixed.norm();
+    return field / (r * r * r);
+}
+
+double CachedGravityModel::levelHalfWidth(size_t level) const
+{
+    return std::ldexp(this->gridRadius, -static_cast<int>(this->gridLevels - 1 - level));
+}
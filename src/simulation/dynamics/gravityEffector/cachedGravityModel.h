@@ -0,0 +1,153 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#ifndef CACHED_GRAVITY_MODEL_H
+#define CACHED_GRAVITY_MODEL_H
+
+#include "simulation/dynamics/_GeneralModuleFiles/gravityModel.h"
+
+#include <memory>
+#include <vector>
+
+/** The cached gravity model, which interpolates the field of another gravity model.
+ *
+ * The field of the wrapped model is sampled on nested cubic grids centered on the
+ * body. Every grid has `nodesPerSide` nodes along each axis and is twice as large as
+ * the grid it contains, such that the spacing of the nodes grows with the distance
+ * to the body like the length over which the field varies. The field at a position
+ * is interpolated with tricubic Lagrange polynomials on the finest grid around the
+ * position, and computed with the wrapped model beyond the outermost grid. The field is
+ * interpolated after scaling it by the cube of the distance to the center of the body,
+ * which makes its point mass part linear and thus exactly interpolated.
+ *
+ * The sampled field can be saved to a file, which is then mapped read-only in memory
+ * by loadCache, such that processes that load the same cache share its memory.
+ */
+class CachedGravityModel : public GravityModel {
+  public:
+    /** Initialize all parameters necessary for the computation of gravity.
+     *
+     * The wrapped model is initialized first. Unless a cache was built before or
+     * loaded, its field is then sampled on the grids.
+     *
+     * Will return an error message (string) if the wrapped model could not be
+     * initialized or the grid parameters are not valid. Otherwise, returns an
+     * empty optional.
+     */
+    std::optional<std::string> initializeParameters() override;
+
+    /** Initialize all parameters necessary for the computation of gravity.
+     *
+     * The wrapped model is initialized with the given `GravBodyData`, see
+     * CachedGravityModel::initializeParameters().
+     */
+    std::optional<std::string> initializeParameters(const GravBodyData&) override;
+
+    /** Returns the gravity acceleration at a position around this body.
+     *
+     * The position is given in the body-fixed reference frame.
+     * Likewise, the resulting acceleration should be given in the
+     * body-fixed reference frame.
+     */
+    Eigen::Vector3d computeField(const Eigen::Vector3d& position_planetFixed) const override;
+
+    /** Returns the gravitational potential energy at a position around this body.
+     *
+     * The potential energy is computed with the wrapped model.
+     *
+     * The position is given relative to the body and in the inertial
+     * reference frame.
+     */
+    double computePotentialEnergy(const Eigen::Vector3d& positionWrtPlanet_N) const override;
+
+    /** Returns the estimated error bound of the interpolated field at a position around this body.
+     *
+     * The bound [m/s^2] is the largest difference between the interpolated field and the
+     * field of the wrapped model at the centers of the cells of the grid used at this
+     * position, which lie farthest from the nodes. As it is sampled, it may be exceeded
+     * where the field varies over less than a cell. Zero is returned beyond the outermost
+     * grid, where the wrapped model is used.
+     */
+    double getErrorBound(const Eigen::Vector3d& position_planetFixed) const;
+
+    /** Returns whether the field was sampled or loaded from a file */
+    bool hasCache() const;
+
+    /** Forgets the sampled or loaded field, which is sampled again at the next initialization */
+    void clearCache();
+
+    /** Writes the sampled field and the grid parameters to a binary file.
+     *
+     * Throws std::runtime_error if there is no cache or the file can't be written.
+     */
+    void saveCache(const std::string& fileName) const;
+
+    /** Maps a file written by saveCache read-only in memory and uses it as cache.
+     *
+     * The grid parameters are read from the file. The file must have been written for
+     * the same wrapped model, which is still used beyond the outermost grid. Throws
+     * std::runtime_error if the file can't be mapped or isn't a gravity cache.
+     */
+    void loadCache(const std::string& fileName);
+
+  public:
+    /** The gravity model whose field is cached */
+    std::shared_ptr<GravityModel> model;
+
+    /** [m] Half of the side length of the outermost grid */
+    double cacheRadius = 0;
+
+    /** [-] Number of nested grids, whose size halves from the outermost grid inwards */
+    size_t numLevels = 4;
+
+    /** [-] Number of nodes along each axis of every grid */
+    size_t nodesPerSide = 32;
+
+    /** [-] Number of threads sampling the field of the wrapped model, all the hardware threads if zero */
+    unsigned int numThreads = 0;
+
+  private:
+    /** Samples the field unless it is cached already. Returns an error message if the
+     * grid parameters are not valid. */
+    std::optional<std::string> initializeCache();
+
+    /** Samples the field of the wrapped model on the grids and estimates their errors */
+    void buildCache();
+
+    /** Returns the finest grid whose interpolation stencils contain the position, or
+     * the number of grids if the position is beyond the outermost grid */
+    size_t findLevel(const Eigen::Vector3d& position_planetFixed) const;
+
+    /** Interpolates the field on the given grid */
+    Eigen::Vector3d interpolate(size_t level, const Eigen::Vector3d& position_planetFixed) const;
+
+    /** Returns half of the side length of the given grid */
+    double levelHalfWidth(size_t level) const;
+
+  private:
+    size_t gridLevels = 0;                   /**< [-] Number of grids of the cache */
+    size_t gridNodesPerSide = 0;             /**< [-] Number of nodes along each axis of the cached grids */
+    double gridRadius = 0;                   /**< [m] Half of the side length of the outermost cached grid */
+    std::vector<double> builtFields;         /**< [m^4/s^2] Sampled field when it was built in this process */
+    std::shared_ptr<const char> mappedFile;  /**< Cache file mapped in memory when it was loaded */
+    const double* nodeFields = nullptr;      /**< [m^4/s^2] Scaled field at the nodes of every grid, x major */
+    std::vector<double> levelErrors;         /**< [m/s^2] Error bound of the interpolation on every grid */
+};
+
+#endif /* CACHED_GRAVITY_MODEL_H */
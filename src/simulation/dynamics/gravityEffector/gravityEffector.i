@@ -28,6 +28,8 @@ from Basilisk.architecture.swig_common_model import *
 from Basilisk.simulation.pointMassGravityModel import PointMassGravityModel
 from Basilisk.simulation.polyhedralGravityModel import PolyhedralGravityModel
 from Basilisk.simulation.sphericalHarmonicsGravityModel import SphericalHarmonicsGravityModel
+from Basilisk.simulation.hybridGravityModel import HybridGravityModel
+from Basilisk.simulation.cachedGravityModel import CachedGravityModel
 
 from Basilisk.utilities import deprecated
 
@@ -68,6 +70,7 @@ from typing import Optional, Union
 
 %import "simulation/dynamics/gravityEffector/gravityModel.i"
 
+%include "simulation/dynamics/_GeneralModuleFiles/profilingCounter.h"
 %include "simulation/dynamics/_GeneralModuleFiles/dynamicEffector.h"
 %include "simulation/dynamics/_GeneralModuleFiles/stateData.h"
 %include "sys_model.i"
@@ -185,6 +188,18 @@ struct SpicePlanetStateMsg_C;
                 data for the polyhedral.
         """
         self.gravityModel = PolyhedralGravityModel().loadFromFile(file)
+
+    def useHybridGravityModel(self, file: str, maxDeg: int = 12):
+        """Makes the GravBodyData use the polyhedral gravity model close to the body
+        and a spherical harmonics expansion fitted to it far from the body.
+
+        Args:
+            file (str): The file that contains the vertices and facet
+                data for the polyhedral.
+            maxDeg (int): The degree of the fitted spherical harmonics.
+        """
+        self.gravityModel = HybridGravityModel().loadFromFile(file)
+        self.gravityModel.maxDeg = maxDeg
         
     %}
 }
@@ -25,6 +25,7 @@
 
 %pythoncode %{
 from Basilisk.architecture.swig_common_model import *
+import numpy as np
 %}
 %include "std_string.i"
 %include "swig_eigen.i"
@@ -42,4 +43,71 @@ from Basilisk.architecture.swig_common_model import *
     }
 }
 
+%include "exception.i"
+
+%exception {
+  try {
+    $action
+  } catch (const std::exception& e) {
+    SWIG_exception(SWIG_RuntimeError, e.what());
+  }
+}
+
+// The batch methods are wrapped below to read and write numpy arrays in place
+%ignore GravityModel::computeFieldBatch;
+%ignore GravityModel::computePotentialEnergyBatch;
+
 %include "simulation/dynamics/_GeneralModuleFiles/gravityModel.h"
+
+%extend GravityModel {
+    void _computeFieldBatch(uint64_t positionsAddress, uint64_t fieldsAddress, size_t rows,
+                            unsigned int numThreads) {
+        Eigen::Map<const GravityModel::Vector3dBatch> positions((const double*) positionsAddress, rows, 3);
+        Eigen::Map<GravityModel::Vector3dBatch> fields((double*) fieldsAddress, rows, 3);
+        $self->computeFieldBatch(positions, fields, numThreads);
+    }
+
+    void _computePotentialEnergyBatch(uint64_t positionsAddress, uint64_t energiesAddress, size_t rows,
+                                      unsigned int numThreads) {
+        Eigen::Map<const GravityModel::Vector3dBatch> positions((const double*) positionsAddress, rows, 3);
+        Eigen::Map<Eigen::VectorXd> energies((double*) energiesAddress, rows);
+        $self->computePotentialEnergyBatch(positions, energies, numThreads);
+    }
+
+    %pythoncode %{
+        def computeFieldBatch(self, positions, numThreads: int = 0):
+            """Returns the gravity accelerations at a batch of positions around this body.
+
+            ``positions`` is an N x 3 array with one position in the body-fixed reference frame per row,
+            and the accelerations are returned as an N x 3 array in the same frame.  A C contiguous
+            ``float64`` array is read in place, other arrays are converted first.  The positions are split
+            between ``numThreads`` threads, or between all the hardware threads if ``numThreads`` is zero.
+            """
+            positions = _batchPositions(positions)
+            fields = np.empty_like(positions)
+            self._computeFieldBatch(positions.ctypes.data, fields.ctypes.data, positions.shape[0], numThreads)
+            return fields
+
+        def computePotentialEnergyBatch(self, positions, numThreads: int = 0):
+            """Returns the gravitational potential energies at a batch of positions around this body.
+
+            ``positions`` is an N x 3 array with one position relative to the body and in the inertial
+            reference frame per row, and the energies are returned as an array of size N.  The positions
+            are read and split between threads as in ``computeFieldBatch``.
+            """
+            positions = _batchPositions(positions)
+            energies = np.empty(positions.shape[0])
+            self._computePotentialEnergyBatch(positions.ctypes.data, energies.ctypes.data,
+                                              positions.shape[0], numThreads)
+            return energies
+    %}
+}
+
+%pythoncode %{
+def _batchPositions(positions):
+    """Returns the positions as a C contiguous N x 3 float64 array, without a copy if they already are"""
+    positions = np.ascontiguousarray(positions, dtype=np.float64)
+    if positions.ndim != 2 or positions.shape[1] != 3:
+        raise ValueError(f"The positions must be an N x 3 array, got an array of shape {positions.shape}")
+    return positions
+%}
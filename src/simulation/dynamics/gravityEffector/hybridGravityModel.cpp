@@ -0,0 +1,208 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#include "hybridGravityModel.h"
+#include "simulation/dynamics/_GeneralModuleFiles/gravityEffector.h"
+
+#include <cmath>
+#include <vector>
+
+namespace {
+// Computes the nodes and weights of the Gauss-Legendre quadrature of order n over [-1, 1]
+void gaussLegendre(size_t n, std::vector<double>& nodes, std::vector<double>& weights)
+{
+    nodes.resize(n);
+    weights.resize(n);
+    for (size_t i = 0; i < n; i++) {
+        // Newton iteration on the Legendre polynomial of degree n, from the Chebyshev node
+        double x = cos(M_PI * (i + 0.75) / (n + 0.5));
+        double dP = 1.0;
+        for (int iteration = 0; iteration < 100; iteration++) {
+            double P0 = 1.0, P1 = x;
+            for (size_t k = 2; k <= n; k++) {
+                const double P2 = ((2 * k - 1) * x * P1 - (k - 1) * P0) / k;
+                P0 = P1;
+                P1 = P2;
+            }
+            dP = n * (x * P1 - P0) / (x * x - 1);
+            const double dx = P1 / dP;
+            x -= dx;
+            if (std::abs(dx) < 1e-15) { break; }
+        }
+        nodes[i] = x;
+        weights[i] = 2 / ((1 - x * x) * dP * dP);
+    }
+}
+
+// Computes the normalized associated Legendre functions of sin(latitude) up to the given degree,
+// with the normalization of the spherical harmonics coefficients, stored at index l*(l+1)/2 + m
+void normalizedLegendre(size_t degree, double sinLatitude, std::vector<double>& legendre)
+{
+    const double cosLatitude = sqrt(std::max(1 - sinLatitude * sinLatitude, 0.0));
+    legendre.assign((degree + 1) * (degree + 2) / 2, 0.0);
+    auto P = [&](size_t l, size_t m) -> double& { return legendre[l * (l + 1) / 2 + m]; };
+
+    P(0, 0) = 1.0;
+    for (size_t m = 0; m <= degree; m++) {
+        if (m == 1) { P(1, 1) = sqrt(3.0) * cosLatitude; }
+        else if (m > 1) { P(m, m) = sqrt((2.0 * m + 1) / (2.0 * m)) * cosLatitude * P(m - 1, m - 1); }
+        if (m + 1 <= degree) { P(m + 1, m) = sqrt(2.0 * m + 3) * sinLatitude * P(m, m); }
+        for (size_t l = m + 2; l <= degree; l++) {
+            const double a = sqrt(double((2 * l + 1) * (2 * l - 1)) / ((l - m) * (l + m)));
+            const double b = sqrt(double((2 * l + 1) * (l + m - 1) * (l - m - 1)) /
+                                  ((l - m) * (l + m) * (2 * l - 3)));
+            P(l, m) = a * sinLatitude * P(l - 1, m) - b * P(l - 2, m);
+        }
+    }
+}
+}
+
+std::optional<std::string> HybridGravityModel::initializeParameters()
+{
+    if (!this->polyhedral || !this->sphericalHarmonics) {
+        return "Could not initialize the hybrid gravity model: the polyhedral or spherical "
+               "harmonics model is missing.";
+    }
+    if (!(this->nearRadiusRatio >= 1) || !(this->farRadiusRatio >= this->nearRadiusRatio)) {
+        return "Could not initialize the hybrid gravity model: nearRadiusRatio must be at least 1 "
+               "and farRadiusRatio at least nearRadiusRatio.";
+    }
+
+    this->polyhedral->bskLogger = this->bskLogger;
+    this->sphericalHarmonics->bskLogger = this->bskLogger;
+
+    auto error = this->polyhedral->initializeParameters();
+    if (error) { return error; }
+    this->brillouinRadius = this->polyhedral->xyzVertex.rowwise().norm().maxCoeff();
+
+    // Coefficients fitted before are fitted again, in case the polyhedron changed
+    if (this->isFitted || this->sphericalHarmonics->cBar.empty()) {
+        this->fitSphericalHarmonics();
+        this->isFitted = true;
+    }
+    return this->sphericalHarmonics->initializeParameters();
+}
+
+std::optional<std::string> HybridGravityModel::initializeParameters(const GravBodyData& body)
+{
+    this->polyhedral->muBody = body.mu;
+    return this->initializeParameters();
+}
+
+void HybridGravityModel::fitSphericalHarmonics()
+{
+    const size_t degree = this->maxDeg;
+    const double mu = this->polyhedral->muBody;
+    const double radius = this->brillouinRadius;
+
+    // The radial field is sampled on the innermost sphere where the spherical harmonics are used,
+    // on a grid that integrates the products of spherical harmonics exactly up to degree 4*(degree+1)
+    const double sampleRadius = this->nearRadiusRatio * radius;
+    const size_t nLatitude = 2 * (degree + 1);
+    const size_t nLongitude = 2 * nLatitude;
+    std::vector<double> nodes, weights;
+    gaussLegendre(nLatitude, nodes, weights);
+
+    GravityModel::Vector3dBatch positions(nLatitude * nLongitude, 3);
+    GravityModel::Vector3dBatch fields(nLatitude * nLongitude, 3);
+    for (size_t i = 0; i < nLatitude; i++) {
+        const double cosLatitude = sqrt(1 - nodes[i] * nodes[i]);
+        for (size_t j = 0; j < nLongitude; j++) {
+            const double longitude = 2 * M_PI * j / nLongitude;
+            positions.row(i * nLongitude + j) << cosLatitude * cos(longitude),
+                cosLatitude * sin(longitude), nodes[i];
+        }
+    }
+    positions *= sampleRadius;
+    this->polyhedral->computeFieldBatch(positions, fields, 0);
+
+    // Project the radial field on the spherical harmonics of every degree and order
+    std::vector<std::vector<double>> cBar(degree + 1), sBar(degree + 1);
+    for (size_t l = 0; l <= degree; l++) {
+        cBar[l].assign(l + 1, 0.0);
+        sBar[l].assign(l + 1, 0.0);
+    }
+    std::vector<double> legendre, cosSum(degree + 1), sinSum(degree + 1);
+    for (size_t i = 0; i < nLatitude; i++) {
+        std::fill(cosSum.begin(), cosSum.end(), 0.0);
+        std::fill(sinSum.begin(), sinSum.end(), 0.0);
+        for (size_t j = 0; j < nLongitude; j++) {
+            const size_t k = i * nLongitude + j;
+            const double radialField = fields.row(k).dot(positions.row(k)) / sampleRadius;
+            const double longitude = 2 * M_PI * j / nLongitude;
+            for (size_t m = 0; m <= degree; m++) {
+                cosSum[m] += radialField * cos(m * longitude);
+                sinSum[m] += radialField * sin(m * longitude);
+            }
+        }
+
+        normalizedLegendre(degree, nodes[i], legendre);
+        const double weight = weights[i] * 2 * M_PI / nLongitude;
+        for (size_t l = 0; l <= degree; l++) {
+            for (size_t m = 0; m <= l; m++) {
+                cBar[l][m] += weight * legendre[l * (l + 1) / 2 + m] * cosSum[m];
+                sBar[l][m] += weight * legendre[l * (l + 1) / 2 + m] * sinSum[m];
+            }
+        }
+    }
+
+    // The radial field of degree l at the sample radius is -(l+1) mu/r^2 (R/r)^l times its harmonics,
+    // whose mean square over the sphere is one
+    for (size_t l = 0; l <= degree; l++) {
+        const double scale = -sampleRadius * sampleRadius / (4 * M_PI * mu * (l + 1)) *
+                             pow(sampleRadius / radius, double(l));
+        for (size_t m = 0; m <= l; m++) {
+            cBar[l][m] *= scale;
+            sBar[l][m] *= scale;
+        }
+    }
+
+    this->sphericalHarmonics->muBody = mu;
+    this->sphericalHarmonics->radEquator = radius;
+    this->sphericalHarmonics->maxDeg = degree;
+    this->sphericalHarmonics->cBar = cBar;
+    this->sphericalHarmonics->sBar = sBar;
+}
+
+Eigen::Vector3d
+HybridGravityModel::computeField(const Eigen::Vector3d& position_planetFixed) const
+{
+    const double nearRadius = this->nearRadiusRatio * this->brillouinRadius;
+    const double farRadius = this->farRadiusRatio * this->brillouinRadius;
+    const double r = position_planetFixed.norm();
+
+    if (r >= farRadius) { return this->sphericalHarmonics->computeField(position_planetFixed); }
+    if (r <= nearRadius) { return this->polyhedral->computeField(position_planetFixed); }
+
+    // Smooth blend of both models between the near and far radii
+    const double s = (r - nearRadius) / (farRadius - nearRadius);
+    const double weight = s * s * (3 - 2 * s);
+    return (1 - weight) * this->polyhedral->computeField(position_planetFixed) +
+           weight * this->sphericalHarmonics->computeField(position_planetFixed);
+}
+
+double HybridGravityModel::computePotentialEnergy(const Eigen::Vector3d& positionWrtPlanet_N) const
+{
+    return -this->polyhedral->muBody / positionWrtPlanet_N.norm();
+}
+
+double HybridGravityModel::getBrillouinRadius() const
+{
+    return this->brillouinRadius;
+}
@@ -0,0 +1,111 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+#ifndef HYBRID_GRAVITY_MODEL_H
+#define HYBRID_GRAVITY_MODEL_H
+
+#include "simulation/dynamics/_GeneralModuleFiles/gravityModel.h"
+#include "simulation/dynamics/gravityEffector/polyhedralGravityModel.h"
+#include "simulation/dynamics/gravityEffector/sphericalHarmonicsGravityModel.h"
+
+#include <memory>
+
+/** The hybrid near and far field gravity model.
+ *
+ * The field close to the body is computed with a polyhedral model, whose cost grows
+ * with its number of facets, while the field far from the body is computed with an
+ * exterior spherical harmonics expansion. Both are blended smoothly in between.
+ *
+ * The radii at which the models are switched are given relative to the Brillouin
+ * radius of the polyhedron, the distance from its center of mass to its farthest
+ * vertex. If the spherical harmonics model has no coefficients, they are fitted to
+ * the polyhedral field when the model is initialized.
+ */
+class HybridGravityModel : public GravityModel {
+  public:
+    /** Initialize all parameters necessary for the computation of gravity.
+     *
+     * The polyhedral model is initialized first. Unless its coefficients were set,
+     * the spherical harmonics model is then fitted to the polyhedral field up to
+     * degree `maxDeg`, with the Brillouin radius as reference radius.
+     *
+     * Will return an error message (string) if either model could not be initialized
+     * or the switching radii are not valid. Otherwise, returns an empty optional.
+     */
+    std::optional<std::string> initializeParameters() override;
+
+    /** Initialize all parameters necessary for the computation of gravity.
+     *
+     * The gravitational parameter of the polyhedral model is read from the given
+     * `GravBodyData`, see HybridGravityModel::initializeParameters().
+     */
+    std::optional<std::string> initializeParameters(const GravBodyData&) override;
+
+    /** Returns the gravity acceleration at a position around this body.
+     *
+     * The position is given in the body-fixed reference frame.
+     * Likewise, the resulting acceleration should be given in the
+     * body-fixed reference frame.
+     */
+    Eigen::Vector3d computeField(const Eigen::Vector3d& position_planetFixed) const override;
+
+    /** Returns the gravitational potential energy at a position around this body.
+     *
+     * The current implementation returns the potential energy of a point-mass,
+     * as the polyhedral and spherical harmonics models do.
+     *
+     * The position is given relative to the body and in the inertial
+     * reference frame.
+     */
+    double computePotentialEnergy(const Eigen::Vector3d& positionWrtPlanet_N) const override;
+
+    /** Returns the Brillouin radius of the polyhedron, once the model is initialized */
+    double getBrillouinRadius() const;
+
+  public:
+    /** The polyhedral model used close to the body */
+    std::shared_ptr<PolyhedralGravityModel> polyhedral = std::make_shared<PolyhedralGravityModel>();
+
+    /** The spherical harmonics model used far from the body
+     *
+     * If its coefficients are not set, they are fitted to the polyhedral model, and
+     * fitted again every time this model is initialized.
+     */
+    std::shared_ptr<SphericalHarmonicsGravityModel> sphericalHarmonics =
+        std::make_shared<SphericalHarmonicsGravityModel>();
+
+    /** The degree of the fitted spherical harmonics */
+    size_t maxDeg = 12;
+
+    /** [-] Only the polyhedral model is used within this ratio of the Brillouin radius */
+    double nearRadiusRatio = 1.5;
+
+    /** [-] Only the spherical harmonics are used beyond this ratio of the Brillouin radius */
+    double farRadiusRatio = 2.0;
+
+  private:
+    /** Fits the spherical harmonics coefficients to the radial polyhedral field */
+    void fitSphericalHarmonics();
+
+  private:
+    double brillouinRadius = 0;  /**< [m] Distance from the center of mass to the farthest vertex */
+    bool isFitted = false;       /**< [-] Whether the spherical harmonics coefficients are fitted */
+};
+
+#endif /* HYBRID_GRAVITY_MODEL_H */
@@ -0,0 +1,44 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+%module(package="Basilisk.simulation") hybridGravityModel
+%{
+   #include "simulation/dynamics/gravityEffector/hybridGravityModel.h"
+   #include <memory>
+%}
+
+%include "swig_eigen.i"
+
+%import "simulation/dynamics/gravityEffector/gravityModel.i"
+%import "simulation/dynamics/gravityEffector/polyhedralGravityModel.i"
+%import "simulation/dynamics/gravityEffector/sphericalHarmonicsGravityModel.i"
+
+%include <std_shared_ptr.i>
+%shared_ptr(HybridGravityModel)
+
+%include "simulation/dynamics/gravityEffector/hybridGravityModel.h"
+
+%extend HybridGravityModel {
+   %pythoncode %{
+      def loadFromFile(self, fileName: str):
+          """Loads the vertices and facet data of the polyhedral model from the given file."""
+          self.polyhedral.loadFromFile(fileName)
+          return self
+   %}
+}
@@ -30,4 +30,7 @@
 %include <std_shared_ptr.i>
 %shared_ptr(PointMassGravityModel)
 
+// The batch method is wrapped in gravityModel.i
+%ignore PointMassGravityModel::computeFieldBatch;
+
 %include "simulation/dynamics/_GeneralModuleFiles/pointMassGravityModel.h"
@@ -20,6 +20,22 @@
 #include "polyhedralGravityModel.h"
 #include "simulation/dynamics/_GeneralModuleFiles/gravityEffector.h"
 
+#include <array>
+#include <unordered_map>
+
+namespace {
+// The edges and facets of a field evaluation are summed in blocks of this size, in a fixed
+// order, so the result doesn't depend on the number of threads
+constexpr Eigen::Index blockSize = 1024;
+
+// Buffers of a field evaluation, owned by every thread computing a field
+struct PolyhedralScratch {
+    Eigen::Matrix<double, Eigen::Dynamic, 4, Eigen::RowMajor> vertices;  // position to vertex and its norm
+    std::vector<Eigen::Vector3d> dUe;  // edge sum of every block
+    std::vector<Eigen::Vector3d> dUf;  // facet sum of every block
+};
+}
+
 std::optional<std::string> PolyhedralGravityModel::initializeParameters()
 {
     // If data hasn't been loaded, quit and return failure
@@ -29,32 +45,65 @@ std::optional<std::string> PolyhedralGravityModel::initializeParameters()
     }
 
     const size_t nFacet = this->orderFacet.rows();
-    int i, j, k;
-    Eigen::Vector3i v;
+    const int nVertex = static_cast<int>(this->xyzVertex.rows());
     Eigen::Vector3d xyz1, xyz2, xyz3, e21, e32;
 
-    /* Initialize normal */
+    /* The facet vertex order is one based */
+    this->vertexFacet = this->orderFacet.array() - 1;
+    if (this->vertexFacet.minCoeff() < 0 || this->vertexFacet.maxCoeff() >= nVertex) {
+        return "Could not initialize polyhedral data: the facets (orderFacet) refer to vertices "
+               "missing from xyzVertex.";
+    }
+
+    /* Initialize normal and volume */
     this->normalFacet.setZero(nFacet, 3);
+    this->volPoly = 0;
+
+    /* Edges found so far, by the index of their two vertices */
+    std::unordered_map<int64_t, Eigen::Index> edgeIndex;
+    edgeIndex.reserve(3 * nFacet / 2);
+    std::vector<std::array<int, 2>> vertexEdge;
+    std::vector<double> lengthEdge;
+    this->dyadEdge.clear();
 
     /* Loop through each facet to compute volume */
     for (unsigned int m = 0; m < nFacet; m++) {
-        /* Fill auxiliary variables with vertex order on each facet */
-        v = this->orderFacet.row(m);
-        i = v[0] - 1;
-        j = v[1] - 1;
-        k = v[2] - 1;
-
-        xyz1 = this->xyzVertex.row(i);
-        xyz2 = this->xyzVertex.row(j);
-        xyz3 = this->xyzVertex.row(k);
+        xyz1 = this->xyzVertex.row(this->vertexFacet(m, 0));
+        xyz2 = this->xyzVertex.row(this->vertexFacet(m, 1));
+        xyz3 = this->xyzVertex.row(this->vertexFacet(m, 2));
 
         /* Compute two edge vectors and normal to facet */
         e21 = xyz2 - xyz1;
         e32 = xyz3 - xyz2;
-        this->normalFacet.row(m) = e21.cross(e32) / e21.cross(e32).norm();
+        const Eigen::Vector3d nf = e21.cross(e32) / e21.cross(e32).norm();
+        this->normalFacet.row(m) = nf;
 
         /* Add volume contribution */
-        this->volPoly += abs(xyz1.cross(xyz2).transpose() * xyz3) / 6;
+        this->volPoly += std::abs(xyz1.cross(xyz2).dot(xyz3)) / 6;
+
+        /* Add the dyad of every facet edge to the edge table */
+        for (unsigned int n = 0; n <= 2; n++) {
+            const int i = this->vertexFacet(m, n);
+            const int j = this->vertexFacet(m, (n + 1) % 3);
+            const Eigen::Vector3d r21 = this->xyzVertex.row(j) - this->xyzVertex.row(i);
+            const Eigen::Vector3d n21 = r21.cross(nf) / r21.cross(nf).norm();
+
+            const int64_t key = int64_t(std::min(i, j)) * nVertex + std::max(i, j);
+            auto [edge, isNew] = edgeIndex.emplace(key, Eigen::Index(lengthEdge.size()));
+            if (isNew) {
+                vertexEdge.push_back({std::min(i, j), std::max(i, j)});
+                lengthEdge.push_back(r21.norm());
+                this->dyadEdge.push_back(Eigen::Matrix3d::Zero());
+            }
+            this->dyadEdge[edge->second] += nf * n21.transpose();
+        }
+    }
+
+    this->vertexEdge.resize(vertexEdge.size(), 2);
+    this->lengthEdge.resize(lengthEdge.size());
+    for (size_t e = 0; e < vertexEdge.size(); e++) {
+        this->vertexEdge.row(e) << vertexEdge[e][0], vertexEdge[e][1];
+        this->lengthEdge(e) = lengthEdge[e];
     }
 
     return {};
@@ -69,95 +118,84 @@ std::optional<std::string> PolyhedralGravityModel::initializeParameters(const Gr
 Eigen::Vector3d
 PolyhedralGravityModel::computeField(const Eigen::Vector3d& position_planetFixed) const
 {
-    int i, j, k;
-    Eigen::Vector3i v;
-    Eigen::Vector3d ri, rj, rk;
-    Eigen::Vector3d nf;
-    Eigen::Vector3d r1, r2, re;
-    Eigen::Vector3d r21, n21;
-    Eigen::Matrix3d Ee;
-
-    int idx_min;
-    double a, b, e, Le;
-    double wy, wx, wf;
-
-    Eigen::Vector3d dUe, dUf, acc;
-    dUe.setZero(3);
-    dUf.setZero(3);
-
-    const size_t nFacet = this->orderFacet.rows();
-
-    /* Loop through each facet */
-    for (unsigned int m = 0; m < nFacet; m++) {
-        /* Fill auxiliary variables with vertex order on each facet */
-        v = this->orderFacet.row(m);
-        i = v[0] - 1;
-        j = v[1] - 1;
-        k = v[2] - 1;
-
-        /* Compute vectors and norm from each vertex to the evaluation position */
-        ri = this->xyzVertex.row(i).transpose() - position_planetFixed;
-        rj = this->xyzVertex.row(j).transpose() - position_planetFixed;
-        rk = this->xyzVertex.row(k).transpose() - position_planetFixed;
-
-        /* Extract normal to facet */
-        nf = this->normalFacet.row(m).transpose();
-
-        /* Loop through each facet edge */
-        for (unsigned int n = 0; n <= 2; n++) {
-            switch (n) {
-            case 0:
-                idx_min = std::min(i, j);
-                r1 = ri;
-                r2 = rj;
-                re = this->xyzVertex.row(idx_min).transpose() - position_planetFixed;
-
-                a = ri.norm();
-                b = rj.norm();
-                break;
-            case 1:
-                idx_min = std::min(j, k);
-                r1 = rj;
-                r2 = rk;
-                re = this->xyzVertex.row(idx_min).transpose() - position_planetFixed;
-
-                a = rj.norm();
-                b = rk.norm();
-                break;
-            case 2:
-                idx_min = std::min(i, k);
-                r1 = rk;
-                r2 = ri;
-                re = this->xyzVertex.row(idx_min).transpose() - position_planetFixed;
-
-                a = rk.norm();
-                b = ri.norm();
-                break;
+    const Eigen::Index nVertex = this->xyzVertex.rows();
+    const Eigen::Index nEdge = this->lengthEdge.size();
+    const Eigen::Index nFacet = this->vertexFacet.rows();
+    const Eigen::Index nBlock = (std::max(nEdge, nFacet) + blockSize - 1) / blockSize;
+
+    // The scratch buffers only grow, so they are allocated once per thread
+    thread_local PolyhedralScratch scratch;
+    scratch.vertices.resize(nVertex, 4);
+    if (Eigen::Index(scratch.dUe.size()) < nBlock) {
+        scratch.dUe.resize(nBlock);
+        scratch.dUf.resize(nBlock);
+    }
+    // The other threads must use the buffers of the calling thread
+    auto& vertices = scratch.vertices;
+    auto& dUeBlocks = scratch.dUe;
+    auto& dUfBlocks = scratch.dUf;
+
+    /* Compute vectors and norm from each vertex to the evaluation position */
+    const Eigen::Index nVertexBlock = (nVertex + blockSize - 1) / blockSize;
+    forEachRowRange(nVertexBlock, this->numThreads, [&](Eigen::Index beginBlock, Eigen::Index endBlock) {
+        for (Eigen::Index v = beginBlock * blockSize; v < std::min(endBlock * blockSize, nVertex); v++) {
+            vertices.block<1, 3>(v, 0) = this->xyzVertex.row(v) - position_planetFixed.transpose();
+            vertices(v, 3) = vertices.block<1, 3>(v, 0).norm();
+        }
+    });
+
+    forEachRowRange(nBlock, this->numThreads, [&](Eigen::Index beginBlock, Eigen::Index endBlock) {
+        for (Eigen::Index block = beginBlock; block < endBlock; block++) {
+            Eigen::Vector3d dUe = Eigen::Vector3d::Zero();
+            Eigen::Vector3d dUf = Eigen::Vector3d::Zero();
+
+            /* Loop through each edge */
+            for (Eigen::Index e = nEdge * block / nBlock; e < nEdge * (block + 1) / nBlock; e++) {
+                const int i = this->vertexEdge(e, 0);
+                const int j = this->vertexEdge(e, 1);
+                const double a = vertices(i, 3);
+                const double b = vertices(j, 3);
+                const double le = this->lengthEdge(e);
+
+                /* Dimensionless per edge factor */
+                const double Le = log((a + b + le) / (a + b - le));
+
+                /* Add current edge contribution, with the summed dyads of its facets */
+                dUe += this->dyadEdge[e] * vertices.block<1, 3>(i, 0).transpose() * Le;
             }
 
-            /* Compute along edge vector and norm */
-            r21 = r2 - r1;
-            e = r21.norm();
-            n21 = r21.cross(nf) / r21.cross(nf).norm();
-
-            /* Dimensionless per edge factor */
-            Le = log((a + b + e) / (a + b - e));
-
-            /* Compute dyad product */
-            Ee = nf * n21.transpose();
+            /* Loop through each facet */
+            for (Eigen::Index m = nFacet * block / nBlock; m < nFacet * (block + 1) / nBlock; m++) {
+                const Eigen::Vector3d ri = vertices.block<1, 3>(this->vertexFacet(m, 0), 0).transpose();
+                const Eigen::Vector3d rj = vertices.block<1, 3>(this->vertexFacet(m, 1), 0).transpose();
+                const Eigen::Vector3d rk = vertices.block<1, 3>(this->vertexFacet(m, 2), 0).transpose();
+                const double riNorm = vertices(this->vertexFacet(m, 0), 3);
+                const double rjNorm = vertices(this->vertexFacet(m, 1), 3);
+                const double rkNorm = vertices(this->vertexFacet(m, 2), 3);
+
+                /* Extract normal to facet */
+                const Eigen::Vector3d nf = this->normalFacet.row(m).transpose();
+
+                /* Compute solid angle for the current facet */
+                const double wy = ri.dot(rj.cross(rk));
+                const double wx = riNorm * rjNorm * rkNorm + riNorm * rj.dot(rk) + rjNorm * rk.dot(ri) +
+                                  rkNorm * ri.dot(rj);
+                const double wf = 2 * atan2(wy, wx);
+
+                /* Add current solid angle facet */
+                dUf += nf * nf.dot(ri) * wf;
+            }
 
-            /* Add current facet distribution */
-            dUe += Ee * re * Le;
+            dUeBlocks[block] = dUe;
+            dUfBlocks[block] = dUf;
         }
+    });
 
-        /* Compute solid angle for the current facet */
-        wy = ri.transpose() * rj.cross(rk);
-        wx = ri.norm() * rj.norm() * rk.norm() + ri.norm() * rj.transpose() * rk +
-             rj.norm() * rk.transpose() * ri + rk.norm() * ri.transpose() * rj;
-        wf = 2 * atan2(wy, wx);
-
-        /* Add current solid angle facet */
-        dUf += nf * (nf.transpose() * ri) * wf;
+    Eigen::Vector3d dUe = Eigen::Vector3d::Zero();
+    Eigen::Vector3d dUf = Eigen::Vector3d::Zero();
+    for (Eigen::Index block = 0; block < nBlock; block++) {
+        dUe += dUeBlocks[block];
+        dUf += dUfBlocks[block];
     }
 
     /* Compute acceleration contribution */
@@ -22,6 +22,8 @@
 
 #include "simulation/dynamics/_GeneralModuleFiles/gravityModel.h"
 
+#include <vector>
+
 /** The Polyhedral gravity model.
  *
  * In this class, a polyhedron is defined by its triangular facets.
@@ -89,9 +91,29 @@ class PolyhedralGravityModel : public GravityModel {
      */
     Eigen::MatrixX3i orderFacet;
 
+    /**
+     * The number of threads splitting the edges and facets of a single field
+     * evaluation, zero uses all the hardware threads. Small polyhedra are always
+     * computed in the calling thread. To compute the field at many positions,
+     * computeFieldBatch splits the positions between threads instead. Both are
+     * mutually exclusive: when computeFieldBatch uses several threads, every
+     * evaluation runs in one of them regardless of this number.
+     */
+    unsigned int numThreads = 1;
+
   private:
     double volPoly = 0;  /**< [m^3] Volume of the polyhedral */
     Eigen::MatrixX3d normalFacet;  /**< [-] Normal of a facet */
+    Eigen::MatrixX3i vertexFacet;  /**< [-] Zero based index of the vertices of a facet */
+
+    /**
+     * Every edge shared by facets is stored once, with the zero based index of its
+     * two vertices (the lower index first), its length and the sum of the edge dyads
+     * nf * n21^T of its facets, which don't depend on the evaluation position.
+     */
+    Eigen::Matrix<int, Eigen::Dynamic, 2> vertexEdge;  /**< [-] Vertices of an edge */
+    Eigen::VectorXd lengthEdge;                        /**< [m] Length of an edge */
+    std::vector<Eigen::Matrix3d> dyadEdge;             /**< [-] Summed facet dyads of an edge */
 };
 
 #endif /* POLY_GRAVITY_MODEL_H */
@@ -21,12 +21,30 @@
 #include "architecture/utilities/bskLogging.h"
 #include "simulation/dynamics/_GeneralModuleFiles/gravityEffector.h"
 
+#include <Eigen/Core>
+
 namespace {
 // Computes the term (2 - d_l), where d_l is the kronecker delta.
 inline double getK(const unsigned int degree)
 {
     return (degree == 0) ? 1.0 : 2.0;
 }
+
+// Index of the coefficient of degree l and order m in the triangular layout
+inline size_t triangularIndex(const size_t degree, const size_t order)
+{
+    return degree * (degree + 1) / 2 + order;
+}
+
+using ConstArrayMap = Eigen::Map<const Eigen::ArrayXd>;
+using ArrayMap = Eigen::Map<Eigen::ArrayXd>;
+
+// Buffers for the terms that depend on the position, owned by every thread computing a field
+struct PinesScratch {
+    std::vector<double> aBar;  // A_bar, in the triangular layout
+    std::vector<double> rE;    // Real part of (s + j*t)^m
+    std::vector<double> iM;    // Imaginary part of (s + j*t)^m
+};
 }
 
 std::optional<std::string> SphericalHarmonicsGravityModel::initializeParameters()
@@ -36,43 +54,58 @@ std::optional<std::string> SphericalHarmonicsGravityModel::initializeParameters(
                "provided.";
     }
 
+    // Coefficients missing from cBar or sBar up to maxDeg are zero
+    this->cBarPacked.assign(triangularIndex(this->maxDeg + 1, 0), 0.0);
+    this->sBarPacked.assign(triangularIndex(this->maxDeg + 1, 0), 0.0);
+    for (size_t l = 0; l <= this->maxDeg; l++) {
+        for (size_t m = 0; m <= l; m++) {
+            if (l < this->cBar.size() && m < this->cBar[l].size()) {
+                this->cBarPacked[triangularIndex(l, m)] = this->cBar[l][m];
+            }
+            if (l < this->sBar.size() && m < this->sBar[l].size()) {
+                this->sBarPacked[triangularIndex(l, m)] = this->sBar[l][m];
+            }
+        }
+    }
+
+    this->aBarDiagonal.assign(this->maxDeg + 2, 0.0);
+    this->aBarLowDiagonal.assign(this->maxDeg + 2, 0.0);
+    this->n1.assign(triangularIndex(this->maxDeg + 2, 0), 0.0);
+    this->n2.assign(triangularIndex(this->maxDeg + 2, 0), 0.0);
     for (size_t i = 0; i <= this->maxDeg + 1; i++) {
-        std::vector<double> aRow, n1Row, n2Row;
-        aRow.resize(i + 1, 0.0);
         // Diagonal elements of A_bar
-        if (i == 0) { aRow[i] = 1.0; }
+        if (i == 0) { this->aBarDiagonal[i] = 1.0; }
         else {
-            aRow[i] = sqrt(double((2 * i + 1) * getK(i)) / (2 * i * getK(i - 1))) *
-                      this->aBar[i - 1][i - 1];
+            this->aBarDiagonal[i] = sqrt(double((2 * i + 1) * getK(i)) / (2 * i * getK(i - 1))) *
+                                    this->aBarDiagonal[i - 1];
+            this->aBarLowDiagonal[i] = sqrt(double((2 * i) * getK(i - 1)) / getK(i));
         }
-        n1Row.resize(i + 1, 0.0);
-        n2Row.resize(i + 1, 0.0);
-        for (size_t m = 0; m <= i; m++) {
-            if (i >= m + 2) {
-                n1Row[m] = sqrt(double((2 * i + 1) * (2 * i - 1)) / ((i - m) * (i + m)));
-                n2Row[m] = sqrt(double((i + m - 1) * (2 * i + 1) * (i - m - 1)) /
-                                ((i + m) * (i - m) * (2 * i - 3)));
-            }
+        for (size_t m = 0; m + 2 <= i; m++) {
+            this->n1[triangularIndex(i, m)] =
+                sqrt(double((2 * i + 1) * (2 * i - 1)) / ((i - m) * (i + m)));
+            this->n2[triangularIndex(i, m)] = sqrt(double((i + m - 1) * (2 * i + 1) * (i - m - 1)) /
+                                                   ((i + m) * (i - m) * (2 * i - 3)));
         }
-        this->n1.push_back(n1Row);
-        this->n2.push_back(n2Row);
-        this->aBar.push_back(aRow);
     }
 
+    this->nQuot1.assign(triangularIndex(this->maxDeg + 1, 0), 0.0);
+    this->nQuot2.assign(triangularIndex(this->maxDeg + 1, 0), 0.0);
     for (size_t l = 0; l <= this->maxDeg; l++) // up to _maxDegree-1
     {
-        std::vector<double> nq1Row, nq2Row;
-        nq1Row.resize(l + 1, 0.0);
-        nq2Row.resize(l + 1, 0.0);
         for (size_t m = 0; m <= l; m++) {
-            if (m < l) { nq1Row[m] = sqrt(double((l - m) * getK(m) * (l + m + 1)) / getK(m + 1)); }
-            nq2Row[m] = sqrt(double((l + m + 2) * (l + m + 1) * (2 * l + 1) * getK(m)) /
-                             ((2 * l + 3) * getK(m + 1)));
+            if (m < l) {
+                this->nQuot1[triangularIndex(l, m)] =
+                    sqrt(double((l - m) * getK(m) * (l + m + 1)) / getK(m + 1));
+            }
+            this->nQuot2[triangularIndex(l, m)] =
+                sqrt(double((l + m + 2) * (l + m + 1) * (2 * l + 1) * getK(m)) /
+                     ((2 * l + 3) * getK(m + 1)));
         }
-        this->nQuot1.push_back(nq1Row);
-        this->nQuot2.push_back(nq2Row);
     }
 
+    this->orders.resize(this->maxDeg + 1);
+    for (size_t m = 0; m <= this->maxDeg; m++) { this->orders[m] = double(m); }
+
     return {}; // No error!
 }
 
@@ -105,10 +138,21 @@ SphericalHarmonicsGravityModel::computeField(const Eigen::Vector3d& position_pla
     double y = position_planetFixed[1];
     double z = position_planetFixed[2];
     double r, s, t, u;
-    double order;
-    double rho;
-    double a1, a2, a3, a4, sum_a1, sum_a2, sum_a3, sum_a4;
-    std::vector<double> rE, iM, rhol;
+    double rho, rhol;
+    double a1, a2, a3, a4;
+
+    // The scratch buffers only grow, so they are allocated once per thread
+    thread_local PinesScratch scratch;
+    if (scratch.aBar.size() < triangularIndex(degree + 2, 0)) {
+        scratch.aBar.resize(triangularIndex(degree + 2, 0));
+    }
+    if (scratch.rE.size() < degree + 1) {
+        scratch.rE.resize(degree + 1);
+        scratch.iM.resize(degree + 1);
+    }
+    double* aBar = scratch.aBar.data();
+    double* rE = scratch.rE.data();
+    double* iM = scratch.iM.data();
 
     // Change of variables: direction cosines
     r = sqrt(x * x + y * y + z * z);
@@ -116,37 +160,34 @@ SphericalHarmonicsGravityModel::computeField(const Eigen::Vector3d& position_pla
     t = y / r;
     u = z / r;
 
-    // Future work: allow maximum order different than maximum degree
-    order = degree;
-
-    for (size_t l = 1; l <= degree + 1; l++) {
+    // Every degree of A_bar only depends on the two previous degrees
+    for (size_t l = 0; l <= degree + 1; l++) {
+        double* aBarRow = aBar + triangularIndex(l, 0);
         // Diagonal terms are computed in initializeParameters()
+        aBarRow[l] = this->aBarDiagonal[l];
+        if (l == 0) { continue; }
         //  Low diagonal terms
-        this->aBar[l][l - 1] = sqrt(double((2 * l) * getK(l - 1)) / getK(l)) * this->aBar[l][l] * u;
+        aBarRow[l - 1] = this->aBarLowDiagonal[l] * aBarRow[l] * u;
+        if (l == 1) { continue; }
+        // Lower terms of A_bar
+        const size_t k = triangularIndex(l, 0);
+        ArrayMap(aBarRow, l - 1) =
+            u * ConstArrayMap(this->n1.data() + k, l - 1) *
+                ConstArrayMap(aBar + triangularIndex(l - 1, 0), l - 1) -
+            ConstArrayMap(this->n2.data() + k, l - 1) *
+                ConstArrayMap(aBar + triangularIndex(l - 2, 0), l - 1);
     }
 
-    // Lower terms of A_bar
-    for (size_t m = 0; m <= order + 1; m++) {
-        for (size_t l = m + 2; l <= degree + 1; l++) {
-            this->aBar[l][m] =
-                u * this->n1[l][m] * this->aBar[l - 1][m] - this->n2[l][m] * this->aBar[l - 2][m];
-        }
-
-        // Computation of real and imaginary parts of (2+j*t)^m
-        if (m == 0) {
-            rE.push_back(1.0);
-            iM.push_back(0.0);
-        }
-        else {
-            rE.push_back(s * rE[m - 1] - t * iM[m - 1]);
-            iM.push_back(s * iM[m - 1] + t * rE[m - 1]);
-        }
+    // Computation of real and imaginary parts of (s+j*t)^m
+    rE[0] = 1.0;
+    iM[0] = 0.0;
+    for (size_t m = 1; m <= degree; m++) {
+        rE[m] = s * rE[m - 1] - t * iM[m - 1];
+        iM[m] = s * iM[m - 1] + t * rE[m - 1];
     }
 
     rho = radEquator / r;
-    rhol.resize(degree + 2, 0.0);
-    rhol[0] = muBody / r;
-    rhol[1] = rhol[0] * rho;
+    rhol = muBody / r * rho;
 
     // Degree 0
 
@@ -158,41 +199,40 @@ SphericalHarmonicsGravityModel::computeField(const Eigen::Vector3d& position_pla
     a4 = 0.0;
 
     if (include_zero_degree) {
-        a4 = -rhol[1] / radEquator; // * this->_Nquot_2[0][0] * this->_A_bar[1][1]; //This is 1, so
-                                    // it's not included!
+        a4 = -rhol / radEquator; // * this->_Nquot_2[0][0] * this->_A_bar[1][1]; //This is 1, so
+                                 // it's not included!
     }
 
     for (size_t l = 1; l <= degree; l++) // does not include l = maxDegree
     {
-        rhol[l + 1] = rho * rhol[l]; // rho_l computed
-
-        sum_a1 = 0.0;
-        sum_a2 = 0.0;
-        sum_a3 = 0.0;
-        sum_a4 = 0.0;
-
-        for (size_t m = 0; m <= l; m++) {
-            double D, E, F;
-            D = this->cBar[l][m] * rE[m] + this->sBar[l][m] * iM[m];
-            if (m == 0) {
-                E = 0.0;
-                F = 0.0;
-            }
-            else {
-                E = this->cBar[l][m] * rE[m - 1] + this->sBar[l][m] * iM[m - 1];
-                F = this->sBar[l][m] * rE[m - 1] - this->cBar[l][m] * iM[m - 1];
-            }
-
-            sum_a1 = sum_a1 + m * this->aBar[l][m] * E;
-            sum_a2 = sum_a2 + m * this->aBar[l][m] * F;
-            if (m < l) { sum_a3 = sum_a3 + this->nQuot1[l][m] * this->aBar[l][m + 1] * D; }
-            sum_a4 = sum_a4 + this->nQuot2[l][m] * this->aBar[l + 1][m + 1] * D;
-        }
-
-        a1 = a1 + rhol[l + 1] / radEquator * sum_a1;
-        a2 = a2 + rhol[l + 1] / radEquator * sum_a2;
-        a3 = a3 + rhol[l + 1] / radEquator * sum_a3;
-        a4 = a4 - rhol[l + 1] / radEquator * sum_a4;
+        rhol = rho * rhol; // rho_l computed
+
+        // The terms of order m = 0...l of this degree, the orders m >= 1 are the tails
+        const size_t k = triangularIndex(l, 0);
+        const ConstArrayMap cBarRow(this->cBarPacked.data() + k, l + 1);
+        const ConstArrayMap sBarRow(this->sBarPacked.data() + k, l + 1);
+        const ConstArrayMap aBarRow(aBar + k, l + 1);
+        const ConstArrayMap aBarNextRow(aBar + triangularIndex(l + 1, 0), l + 2);
+        const ConstArrayMap rERow(rE, l + 1);
+        const ConstArrayMap iMRow(iM, l + 1);
+
+        const auto D = cBarRow * rERow + sBarRow * iMRow;
+        const auto E = cBarRow.tail(l) * rERow.head(l) + sBarRow.tail(l) * iMRow.head(l);
+        const auto F = sBarRow.tail(l) * rERow.head(l) - cBarRow.tail(l) * iMRow.head(l);
+
+        const double sum_a1 =
+            (ConstArrayMap(this->orders.data() + 1, l) * aBarRow.tail(l) * E).sum();
+        const double sum_a2 =
+            (ConstArrayMap(this->orders.data() + 1, l) * aBarRow.tail(l) * F).sum();
+        const double sum_a3 =
+            (ConstArrayMap(this->nQuot1.data() + k, l) * aBarRow.tail(l) * D.head(l)).sum();
+        const double sum_a4 =
+            (ConstArrayMap(this->nQuot2.data() + k, l + 1) * aBarNextRow.tail(l + 1) * D).sum();
+
+        a1 = a1 + rhol / radEquator * sum_a1;
+        a2 = a2 + rhol / radEquator * sum_a2;
+        a3 = a3 + rhol / radEquator * sum_a3;
+        a4 = a4 - rhol / radEquator * sum_a4;
     }
 
     return {a1 + s * a4, a2 + t * a4, a3 + u * a4};
@@ -106,12 +106,21 @@ class SphericalHarmonicsGravityModel : public GravityModel {
      *
      * They are coefficients used in the method of Pines for the gravity due to SH.
      * For their definition, see the 'Basilisk-GravityEffector' documentation.
+     *
+     * The coefficients of degree l and order m are stored in flat vectors, one degree
+     * after the other, at the index l*(l+1)/2 + m. The terms of A_bar that depend on
+     * the position are computed in a scratch buffer owned by the calling thread, such
+     * that the same model can compute the field from several threads at once.
      */
-    mutable std::vector<std::vector<double>> aBar;  /**< [-] Eq. 61 */
-    std::vector<std::vector<double>> n1;            /**< [-] Eq. 63 */
-    std::vector<std::vector<double>> n2;            /**< [-] Eq. 64 */
-    std::vector<std::vector<double>> nQuot1;        /**< [-] Eq. 79 */
-    std::vector<std::vector<double>> nQuot2;        /**< [-] Eq. 80 */
+    std::vector<double> cBarPacked;       /**< [-] cBar in the triangular layout */
+    std::vector<double> sBarPacked;       /**< [-] sBar in the triangular layout */
+    std::vector<double> aBarDiagonal;     /**< [-] Diagonal terms of A_bar, Eq. 61 */
+    std::vector<double> aBarLowDiagonal;  /**< [-] Factor between the diagonal and low diagonal terms of A_bar */
+    std::vector<double> n1;               /**< [-] Eq. 63 */
+    std::vector<double> n2;               /**< [-] Eq. 64 */
+    std::vector<double> nQuot1;           /**< [-] Eq. 79 */
+    std::vector<double> nQuot2;           /**< [-] Eq. 80 */
+    std::vector<double> orders;           /**< [-] The order m of every column, as a double */
 };
 
 #endif /* SH_GRAVITY_MODEL_H */
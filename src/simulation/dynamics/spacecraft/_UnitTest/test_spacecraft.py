@@ -36,6 +36,7 @@ from Basilisk.simulation import extForceTorque
 from Basilisk.utilities import RigidBodyKinematics
 from Basilisk.utilities import simIncludeGravBody
 from Basilisk.simulation import GravityGradientEffector
+from Basilisk.simulation import linearSpringMassDamper
 from Basilisk.architecture import messaging
 
 def addTimeColumn(time, data):
@@ -56,12 +57,13 @@ def addTimeColumn(time, data):
                                       , "scOptionalRef"
                                       , "scAccumDV"
                                       , "scAccumDVExtForce"
+                                      , "scSubCycledEffector"
                                       ])
 def test_spacecraftAllTest(show_plots, function):
     """Module Unit Test"""
     if function == "scOptionalRef":
         [testResults, testMessage] = eval(function + '(show_plots, 1e-3)')
-    elif function == "scAccumDV" or function == "scAccumDVExtForce":
+    elif function in ["scAccumDV", "scAccumDVExtForce", "scSubCycledEffector"]:
         [testResults, testMessage] = eval(function + '()')
     else:
         [testResults, testMessage] = eval(function + '(show_plots)')
@@ -1168,6 +1170,72 @@ def scAccumDVExtForce():
     return [testFailCount, ''.join(testMessages)]
 
 
+
+def propagateSlosh(timeStep, subSteps):
+    """Propagate a spinning spacecraft with a stiff spring mass damper particle and return the final hub and particle
+    states"""
+    scObject = spacecraft.Spacecraft()
+    scObject.ModelTag = "spacecraftBody"
+
+    unitTestSim = SimulationBaseClass.SimBaseClass()
+    testProc = unitTestSim.CreateNewProcess("TestProcess")
+    testProc.addTask(unitTestSim.CreateNewTask("unitTask", macros.sec2nano(timeStep)))
+
+    particle = linearSpringMassDamper.LinearSpringMassDamper()
+    particle.k = 2000.0
+    particle.c = 0.0
+    particle.r_PB_B = [[0.1], [0], [-0.1]]
+    particle.pHat_B = [[numpy.sqrt(3)/3], [numpy.sqrt(3)/3], [numpy.sqrt(3)/3]]
+    particle.rhoInit = 0.05
+    particle.rhoDotInit = 0.0
+    particle.massInit = 10.0
+    particle.integrationSubSteps = subSteps
+    scObject.addStateEffector(particle)
+
+    scObject.hub.mHub = 750.0
+    scObject.hub.r_BcB_B = [[0.0], [0.0], [1.0]]
+    scObject.hub.IHubPntBc_B = [[900.0, 0.0, 0.0], [0.0, 800.0, 0.0], [0.0, 0.0, 600.0]]
+    scObject.hub.r_CN_NInit = [[-4020338.690396649], [7490566.741852513], [5248299.211589362]]
+    scObject.hub.v_CN_NInit = [[-5199.77710904224], [-3436.681645356935], [1041.576797498721]]
+    scObject.hub.sigma_BNInit = [[0.0], [0.0], [0.0]]
+    scObject.hub.omega_BN_BInit = [[0.5], [-0.4], [0.7]]
+    unitTestSim.AddModelToTask("unitTask", scObject)
+
+    unitTestSim.InitializeSimulation()
+    unitTestSim.ConfigureStopTime(macros.sec2nano(10.0))
+    unitTestSim.ExecuteSimulation()
+
+    omega = numpy.array(scObject.dynManager.getStateObject("hubOmega").getState()).flatten()
+    rho = scObject.dynManager.getStateObject(particle.nameOfRhoState).getState()[0][0]
+    return omega, rho
+
+
+def scSubCycledEffector():
+    """Check that a sub-cycled state effector recovers the accuracy of a small integration step"""
+    testFailCount = 0
+    testMessages = []
+
+    truthOmega, truthRho = propagateSlosh(0.005, 1)
+    singleRateOmega, singleRateRho = propagateSlosh(0.05, 1)
+    subCycledOmega, subCycledRho = propagateSlosh(0.05, 10)
+
+    # the single rate integration at the large time step is far less accurate than the sub-cycled one
+    if abs(singleRateRho - truthRho) < 1e-3:
+        testFailCount += 1
+        testMessages.append("FAILED: Spacecraft single rate slosh reference is unexpectedly accurate")
+    if abs(subCycledRho - truthRho) > 2e-4:
+        testFailCount += 1
+        testMessages.append("FAILED: Spacecraft sub-cycled slosh displacement test failed")
+    if not unitTestSupport.isArrayEqual(subCycledOmega, truthOmega, 3, 1e-4):
+        testFailCount += 1
+        testMessages.append("FAILED: Spacecraft sub-cycled slosh hub rate test failed")
+
+    if testFailCount == 0:
+        print("PASSED: Spacecraft sub-cycled state effector test")
+
+    return [testFailCount, ''.join(testMessages)]
+
+
 if __name__ == "__main__":
     # scAttRef(True, 1e-3)
     # SCTranslation(True)
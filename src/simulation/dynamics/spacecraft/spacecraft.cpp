@@ -23,6 +23,7 @@
 #include "architecture/utilities/avsEigenSupport.h"
 #include "architecture/utilities/avsEigenMRP.h"
 #include <iostream>
+#include <algorithm>
 
 
 /*! This is the constructor, setting variables to default values */
@@ -38,6 +39,8 @@ Spacecraft::Spacecraft()
     this->dvAccum_CN_B.setZero();
     this->dvAccum_BN_B.setZero();
     this->dvAccum_CN_N.setZero();
+    this->extrapolateSubCycleCoupling = true;
+    this->subCycledStepActive = false;
 
     // - Set integrator as RK4 by default
     this->integrator = new svIntegratorRK4(this);
@@ -59,7 +62,7 @@ void Spacecraft::Reset(uint64_t CurrentSimNanos)
     this->initializeDynamics();
 
     // compute initial spacecraft states relative to inertial frame, taking into account initial sc states might be defined relative to a planet
-    this->gravField.updateInertialPosAndVel(this->hubR_N->getState(), this->hubV_N->getState());
+    this->gravField.updateInertialPosAndVel(this->hubR_N->getStateView<3>(), this->hubV_N->getStateView<3>());
     this->writeOutputStateMessages(CurrentSimNanos);
     // - Loop over stateEffectors to call writeOutputStateMessages and write initial state output messages
     std::vector<StateEffector*>::iterator it;
@@ -91,14 +94,14 @@ void Spacecraft::writeOutputStateMessages(uint64_t clockTime)
     eigenMatrixXd2CArray(*this->inertialPositionProperty, stateOut.r_BN_N);
     eigenMatrixXd2CArray(*this->inertialVelocityProperty, stateOut.v_BN_N);
     Eigen::MRPd sigmaLocal_BN;
-    sigmaLocal_BN = (Eigen::Vector3d) this->hubSigma->getState();
+    sigmaLocal_BN = (Eigen::Vector3d) this->hubSigma->getStateView<3>();
     Eigen::Matrix3d dcm_NB = sigmaLocal_BN.toRotationMatrix();
     Eigen::Vector3d rLocal_CN_N = (*this->inertialPositionProperty) + dcm_NB*(*this->c_B);
     Eigen::Vector3d vLocal_CN_N = (*this->inertialVelocityProperty) + dcm_NB*(*this->cDot_B);
     eigenVector3d2CArray(rLocal_CN_N, stateOut.r_CN_N);
     eigenVector3d2CArray(vLocal_CN_N, stateOut.v_CN_N);
-    eigenMatrixXd2CArray(this->hubSigma->getState(), stateOut.sigma_BN);
-    eigenMatrixXd2CArray(this->hubOmega_BN_B->getState(), stateOut.omega_BN_B);
+    eigenMatrixXd2CArray(this->hubSigma->getStateView<3>(), stateOut.sigma_BN);
+    eigenMatrixXd2CArray(this->hubOmega_BN_B->getStateView<3>(), stateOut.omega_BN_B);
     eigenMatrixXd2CArray(this->dvAccum_CN_B, stateOut.TotalAccumDVBdy);
     stateOut.MRPSwitchCount = this->hub.MRPSwitchCount;
     eigenMatrixXd2CArray(this->dvAccum_BN_B, stateOut.TotalAccumDV_BN_B);
@@ -161,8 +164,8 @@ void Spacecraft::UpdateState(uint64_t CurrentSimNanos)
     // If set, read in and prescribe attitude reference motion
     readOptionalRefMsg();
 
-    Eigen::Vector3d rLocal_BN_N = this->hubR_N->getState();
-    Eigen::Vector3d vLocal_BN_N = this->hubV_N->getState();
+    Eigen::Vector3d rLocal_BN_N = this->hubR_N->getStateView<3>();
+    Eigen::Vector3d vLocal_BN_N = this->hubV_N->getStateView<3>();
     this->gravField.updateInertialPosAndVel(rLocal_BN_N, vLocal_BN_N);
 
     // - Write the state of the vehicle into messages
@@ -226,11 +229,24 @@ void Spacecraft::initializeDynamics()
     // - Register the hub states
     this->hub.registerStates(this->dynManager);
 
-    // - Loop through stateEffectors to register their states
+    // - Loop through stateEffectors to register their states and keep track of the states each of them owns
     std::vector<StateEffector*>::iterator stateIt;
-    for(stateIt = this->states.begin(); stateIt != this->states.end(); stateIt++)
+    std::deque<StateData>& stateSlots = this->dynManager.stateSlots;
+    for(size_t k = 0; k < this->states.size(); k++)
     {
-        (*stateIt)->registerStates(this->dynManager);
+        size_t firstNewSlot = stateSlots.size();
+        this->states[k]->registerStates(this->dynManager);
+
+        // - States registered again on a later reset are already known
+        if(k == this->effectorStates.size())
+        {
+            std::vector<StateData*> newStates;
+            for(size_t slot = firstNewSlot; slot < stateSlots.size(); slot++)
+            {
+                newStates.push_back(&stateSlots[slot]);
+            }
+            this->effectorStates.push_back(newStates);
+        }
     }
 
     // - Link in states for the Spacecraft, gravity and the hub
@@ -243,14 +259,14 @@ void Spacecraft::initializeDynamics()
 
     // - Edit r_BN_N and v_BN_N to take into account that point B and point C are not coincident
     // - Pulling the state from the hub at this time gives us r_CN_N
-    Eigen::Vector3d rInit_BN_N = this->hubR_N->getState();
+    Eigen::Vector3d rInit_BN_N = this->hubR_N->getStateView<3>();
     Eigen::MRPd sigma_BN;
-    sigma_BN = (Eigen::Vector3d) this->hubSigma->getState();
+    sigma_BN = (Eigen::Vector3d) this->hubSigma->getStateView<3>();
     Eigen::Matrix3d dcm_NB = sigma_BN.toRotationMatrix();
     // - Substract off the center mass to leave r_BN_N
     rInit_BN_N -= dcm_NB*(*this->c_B);
     // - Subtract off cDot_B to get v_BN_N
-    Eigen::Vector3d vInit_BN_N = this->hubV_N->getState();
+    Eigen::Vector3d vInit_BN_N = this->hubV_N->getStateView<3>();
     vInit_BN_N -= dcm_NB*(*this->cDot_B);
     // - Finally set the translational states r_BN_N and v_BN_N with the corrections
     this->hubR_N->setState(rInit_BN_N);
@@ -298,7 +314,10 @@ void Spacecraft::updateSCMassProps(double time)
     std::vector<StateEffector*>::iterator it;
     for(it = this->states.begin(); it != this->states.end(); it++)
     {
-        (*it)->updateEffectorMassProps(time);
+        {
+            ProfilingTimer timer((*it)->profile, false, this->profileEvaluationTimes);
+            (*it)->updateEffectorMassProps(time);
+        }
         // - Add in effectors mass props into mass props of spacecraft
         (*this->m_SC)(0,0) += (*it)->effProps.mEff;
         (*this->mDot_SC)(0,0) += (*it)->effProps.mEffDot;
@@ -313,7 +332,7 @@ void Spacecraft::updateSCMassProps(double time)
     (*this->c_B) = (*this->c_B)/(*this->m_SC)(0,0);
     (*this->cPrime_B) = (*this->cPrime_B)/(*this->m_SC)(0,0)
                                              - (*this->mDot_SC)(0,0)*(*this->c_B)/(*this->m_SC)(0,0)/(*this->m_SC)(0,0);
-    Eigen::Vector3d omegaLocal_BN_B = hubOmega_BN_B->getState();
+    Eigen::Vector3d omegaLocal_BN_B = hubOmega_BN_B->getStateView<3>();
     Eigen::Vector3d cLocal_B = (*this->c_B);
     (*this->cDot_B) = (*this->cPrime_B) + omegaLocal_BN_B.cross(cLocal_B);
 }
@@ -328,6 +347,11 @@ void Spacecraft::equationsOfMotion(double integTimeSeconds, double timeStep)
     uint64_t integTimeNanos = this->simTimePrevious + (uint64_t) ((integTimeSeconds-this->timePrevious)/NANO2SEC);
     (*this->sysTime) << (double) integTimeNanos, integTimeSeconds;
 
+    // - Sub-cycled stateEffectors follow the trajectory they were propagated along for this step
+    if (this->subCycledStepActive) {
+        this->setSubCycledStates(integTimeSeconds);
+    }
+
     // - Zero all Matrices and vectors for back-sub and the dynamics
     this->hub.hubBackSubMatrices.matrixA.setZero();
     this->hub.hubBackSubMatrices.matrixB.setZero();
@@ -347,11 +371,14 @@ void Spacecraft::equationsOfMotion(double integTimeSeconds, double timeStep)
     Eigen::Matrix3d dcm_NB;
     Eigen::Vector3d cLocal_N;
 
-    sigmaBNLoc = (Eigen::Vector3d) this->hubSigma->getState();
+    Eigen::Vector3d cLocal_B = *this->c_B;
+    Eigen::Vector3d cDotLocal_B = *this->cDot_B;
+
+    sigmaBNLoc = (Eigen::Vector3d) this->hubSigma->getStateView<3>();
     dcm_NB = sigmaBNLoc.toRotationMatrix();
-    cLocal_N = dcm_NB*(*this->c_B);
-    Eigen::Vector3d rLocal_CN_N = this->hubR_N->getState() + dcm_NB*(*this->c_B);
-    Eigen::Vector3d vLocal_CN_N = this->hubV_N->getState() + dcm_NB*(*this->cDot_B);
+    cLocal_N = dcm_NB*cLocal_B;
+    Eigen::Vector3d rLocal_CN_N = this->hubR_N->getStateView<3>() + cLocal_N;
+    Eigen::Vector3d vLocal_CN_N = this->hubV_N->getStateView<3>() + dcm_NB*cDotLocal_B;
 
     this->gravField.computeGravityField(rLocal_CN_N, vLocal_CN_N);
 
@@ -360,36 +387,85 @@ void Spacecraft::equationsOfMotion(double integTimeSeconds, double timeStep)
     for(dynIt = this->dynEffectors.begin(); dynIt != this->dynEffectors.end(); dynIt++)
     {
         // - Compute the force and torque contributions from the dynamicEffectors
-        (*dynIt)->computeForceTorque(integTimeSeconds, timeStep);
+        {
+            ProfilingTimer timer((*dynIt)->profile, true, this->profileEvaluationTimes);
+            (*dynIt)->computeForceTorque(integTimeSeconds, timeStep);
+        }
         this->sumForceExternal_N += (*dynIt)->forceExternal_N;
         this->sumForceExternal_B += (*dynIt)->forceExternal_B;
         this->sumTorquePntB_B += (*dynIt)->torqueExternalPntB_B;
     }
 
-    // - Loop through state effectors to get contributions for back-substitution
+    // - Loop through state effectors to get contributions for back-substitution, the sub-cycled stateEffectors last
     std::vector<StateEffector*>::iterator it;
     for(it = this->states.begin(); it != this->states.end(); it++)
     {
-        /* - Set the contribution matrices to zero (just in case a stateEffector += on the matrix or the stateEffector
-         doesn't have a contribution for a matrix and doesn't set the matrix to zero */
-        this->backSubContributions.matrixA.setZero();
-        this->backSubContributions.matrixB.setZero();
-        this->backSubContributions.matrixC.setZero();
-        this->backSubContributions.matrixD.setZero();
-        this->backSubContributions.vecTrans.setZero();
-        this->backSubContributions.vecRot.setZero();
-
-        // - Call the update contributions method for the stateEffectors and add in contributions to the hub matrices
-        (*it)->updateContributions(integTimeSeconds, this->backSubContributions, this->hubSigma->getState(), this->hubOmega_BN_B->getState(), *this->g_N);
-        this->hub.hubBackSubMatrices.matrixA += this->backSubContributions.matrixA;
-        this->hub.hubBackSubMatrices.matrixB += this->backSubContributions.matrixB;
-        this->hub.hubBackSubMatrices.matrixC += this->backSubContributions.matrixC;
-        this->hub.hubBackSubMatrices.matrixD += this->backSubContributions.matrixD;
-        this->hub.hubBackSubMatrices.vecTrans += this->backSubContributions.vecTrans;
-        this->hub.hubBackSubMatrices.vecRot += this->backSubContributions.vecRot;
+        if((*it)->integrationSubSteps <= 1)
+        {
+            this->addStateEffectorContributions(*it, integTimeSeconds);
+        }
+    }
+    this->slowBackSubMatrices = this->hub.hubBackSubMatrices;
+    for(it = this->states.begin(); it != this->states.end(); it++)
+    {
+        if((*it)->integrationSubSteps > 1)
+        {
+            this->addStateEffectorContributions(*it, integTimeSeconds);
+        }
     }
 
+    // - Finish the math that is needed and compute the derivatives of the hub states
+    this->computeHubDerivatives(integTimeSeconds);
+
+    // - Loop through state effectors for compute derivatives
+    for(it = states.begin(); it != states.end(); it++)
+    {
+        ProfilingTimer timer((*it)->profile, true, this->profileEvaluationTimes);
+        (*it)->computeDerivatives(integTimeSeconds, this->hubV_N->getStateDerivView<3>(), this->hubOmega_BN_B->getStateDerivView<3>(), this->hubSigma->getStateView<3>());
+    }
+
+    // - Sub-cycled stateEffectors are not propagated by the integrator
+    this->freezeSubCycledStates();
+}
+
+/*! This method adds the back-substitution contributions of a stateEffector to the hub matrices
+ @param effector stateEffector to add the contributions of
+ @param integTimeSeconds [s] time to compute the contributions at
+ */
+void Spacecraft::addStateEffectorContributions(StateEffector* effector, double integTimeSeconds)
+{
+    /* - Set the contribution matrices to zero (just in case a stateEffector += on the matrix or the stateEffector
+     doesn't have a contribution for a matrix and doesn't set the matrix to zero */
+    this->backSubContributions.matrixA.setZero();
+    this->backSubContributions.matrixB.setZero();
+    this->backSubContributions.matrixC.setZero();
+    this->backSubContributions.matrixD.setZero();
+    this->backSubContributions.vecTrans.setZero();
+    this->backSubContributions.vecRot.setZero();
+
+    // - Call the update contributions method for the stateEffectors and add in contributions to the hub matrices
+    {
+        ProfilingTimer timer(effector->profile, false, this->profileEvaluationTimes);
+        effector->updateContributions(integTimeSeconds, this->backSubContributions, this->hubSigma->getStateView<3>(), this->hubOmega_BN_B->getStateView<3>(), *this->g_N);
+    }
+    this->hub.hubBackSubMatrices.matrixA += this->backSubContributions.matrixA;
+    this->hub.hubBackSubMatrices.matrixB += this->backSubContributions.matrixB;
+    this->hub.hubBackSubMatrices.matrixC += this->backSubContributions.matrixC;
+    this->hub.hubBackSubMatrices.matrixD += this->backSubContributions.matrixD;
+    this->hub.hubBackSubMatrices.vecTrans += this->backSubContributions.vecTrans;
+    this->hub.hubBackSubMatrices.vecRot += this->backSubContributions.vecRot;
+}
+
+/*! This method adds the hub, gravity and external force contributions to the back-substitution matrices, which
+ already hold the stateEffector contributions, and computes the derivatives of the hub states
+ @param integTimeSeconds [s] time to compute the derivatives at
+ */
+void Spacecraft::computeHubDerivatives(double integTimeSeconds)
+{
     // - Finish the math that is needed
+    Eigen::MRPd sigmaBNLoc;
+    sigmaBNLoc = (Eigen::Vector3d) this->hubSigma->getStateView<3>();
+    Eigen::Matrix3d dcm_NB = sigmaBNLoc.toRotationMatrix();
     Eigen::Vector3d cLocal_B;
     Eigen::Vector3d cPrimeLocal_B;
     cLocal_B = *this->c_B;
@@ -397,7 +473,7 @@ void Spacecraft::equationsOfMotion(double integTimeSeconds, double timeStep)
 
     Eigen::Matrix3d intermediateMatrix;
     Eigen::Vector3d intermediateVector;
-    Eigen::Vector3d omegaLocalBN_B = this->hubOmega_BN_B->getState();
+    Eigen::Vector3d omegaLocalBN_B = this->hubOmega_BN_B->getStateView<3>();
     this->hub.hubBackSubMatrices.matrixA += (*this->m_SC)(0,0)*intermediateMatrix.Identity();
     intermediateMatrix = eigenTilde((*this->c_B));  // make c_B skew symmetric matrix
     this->hub.hubBackSubMatrices.matrixB += -(*this->m_SC)(0,0)*intermediateMatrix;
@@ -406,8 +482,10 @@ void Spacecraft::equationsOfMotion(double integTimeSeconds, double timeStep)
     this->hub.hubBackSubMatrices.vecTrans += -2.0*(*this->m_SC)(0, 0)*omegaLocalBN_B.cross(cPrimeLocal_B)
     - (*this->m_SC)(0, 0)*omegaLocalBN_B.cross(omegaLocalBN_B.cross(cLocal_B))
     - 2.0*(*mDot_SC)(0,0)*(cPrimeLocal_B+omegaLocalBN_B.cross(cLocal_B));
-    intermediateVector = *ISCPntB_B*omegaLocalBN_B;
-    this->hub.hubBackSubMatrices.vecRot += -omegaLocalBN_B.cross(intermediateVector) - *ISCPntBPrime_B*omegaLocalBN_B;
+    Eigen::Matrix3d ISCLocalPntB_B = *ISCPntB_B;
+    Eigen::Matrix3d ISCPrimeLocalPntB_B = *ISCPntBPrime_B;
+    intermediateVector = ISCLocalPntB_B*omegaLocalBN_B;
+    this->hub.hubBackSubMatrices.vecRot += -omegaLocalBN_B.cross(intermediateVector) - ISCPrimeLocalPntB_B*omegaLocalBN_B;
 
     // - Map external force_N to the body frame
     Eigen::Vector3d sumForceExternalMappedToB;
@@ -428,13 +506,7 @@ void Spacecraft::equationsOfMotion(double integTimeSeconds, double timeStep)
     this->hub.hubBackSubMatrices.vecRot += cLocal_B.cross(gravityForce_B) + this->sumTorquePntB_B;
 
     // - Compute the derivatives of the hub states before looping through stateEffectors
-    this->hub.computeDerivatives(integTimeSeconds, this->hubV_N->getStateDeriv(), this->hubOmega_BN_B->getStateDeriv(), this->hubSigma->getState());
-
-    // - Loop through state effectors for compute derivatives
-    for(it = states.begin(); it != states.end(); it++)
-    {
-        (*it)->computeDerivatives(integTimeSeconds, this->hubV_N->getStateDeriv(), this->hubOmega_BN_B->getStateDeriv(), this->hubSigma->getState());
-    }
+    this->hub.computeDerivatives(integTimeSeconds, this->hubV_N->getStateDerivView<3>(), this->hubOmega_BN_B->getStateDerivView<3>(), this->hubSigma->getStateView<3>());
 }
 
 /*! Prepare for integration process
@@ -444,14 +516,14 @@ void Spacecraft::preIntegration(double integrateToThisTime) {
     this->timeStep = integrateToThisTime - this->timePrevious;
 
     // - Find v_CN_N before integration for accumulated DV
-    Eigen::Vector3d oldV_BN_N = this->hubV_N->getState();  // - V_BN_N before integration
+    Eigen::Vector3d oldV_BN_N = this->hubV_N->getStateView<3>();  // - V_BN_N before integration
     Eigen::Vector3d oldV_CN_N;  // - V_CN_N before integration
     Eigen::Vector3d oldC_B;     // - Center of mass offset before integration
     Eigen::MRPd oldSigma_BN;    // - Sigma_BN before integration
     // - Get the angular rate, oldOmega_BN_B from the dyn manager
-    this->oldOmega_BN_B = this->hubOmega_BN_B->getState();
+    this->oldOmega_BN_B = this->hubOmega_BN_B->getStateView<3>();
     // - Get center of mass, v_BN_N and dcm_NB from the dyn manager
-    oldSigma_BN = (Eigen::Vector3d) this->hubSigma->getState();
+    oldSigma_BN = (Eigen::Vector3d) this->hubSigma->getStateView<3>();
     // - Finally find v_CN_N
     Eigen::Matrix3d oldDcm_NB = oldSigma_BN.toRotationMatrix(); // - dcm_NB before integration
     oldV_CN_N = oldV_BN_N + oldDcm_NB*(*this->cDot_B);
@@ -459,46 +531,62 @@ void Spacecraft::preIntegration(double integrateToThisTime) {
     // - Integrate the state from the last time (timeBefore) to the integrateToThisTime
     this->hub.matchGravitytoVelocityState(oldV_CN_N); // Set gravity velocity to base velocity for DV estimation
     this->timeBefore = integrateToThisTime - this->timeStep;
+
+    // - Propagate the sub-cycled stateEffectors across the step before the integrator propagates the other states
+    int subSteps = this->findSubCycleSteps();
+    if (subSteps > 1 && this->timeStep != 0.0) {
+        this->equationsOfMotion(this->timeBefore, this->timeStep);
+        this->couplingStart = this->readHubCoupling();
+        this->subCycleStateEffectors(subSteps);
+        this->writeHubCoupling(this->couplingStart);
+        this->subCycledStepActive = true;
+    }
 }
 
 /*! Perform post-integration steps
  @param integrateToThisTime Time to integrate to
  */
 void Spacecraft::postIntegration(double integrateToThisTime) {
+    // - Set the sub-cycled stateEffectors to their states at the end of the step
+    if (this->subCycledStepActive) {
+        this->setSubCycledStates(integrateToThisTime);
+        this->subCycledStepActive = false;
+    }
+
     this->timePrevious = integrateToThisTime;     // - copy the current time into previous time for next integrate state call
 
     // - Call mass properties to get current info on the mass props of the spacecraft
     this->updateSCMassProps(integrateToThisTime);
 
     // - Find v_CN_N after the integration for accumulated DV
-    Eigen::Vector3d newV_BN_N = this->hubV_N->getState(); // - V_BN_N after integration
+    Eigen::Vector3d newV_BN_N = this->hubV_N->getStateView<3>(); // - V_BN_N after integration
     Eigen::Vector3d newV_CN_N;  // - V_CN_N after integration
     Eigen::MRPd newSigma_BN;    // - Sigma_BN after integration
     // - Get center of mass, v_BN_N and dcm_NB
     Eigen::Vector3d sigmaBNLoc;
-    sigmaBNLoc = (Eigen::Vector3d) this->hubSigma->getState();
+    sigmaBNLoc = (Eigen::Vector3d) this->hubSigma->getStateView<3>();
     newSigma_BN = sigmaBNLoc;
     Eigen::Matrix3d newDcm_NB = newSigma_BN.toRotationMatrix();  // - dcm_NB after integration
     newV_CN_N = newV_BN_N + newDcm_NB*(*this->cDot_B);
 
     // - Find accumulated DV of the center of mass in the body frame
     this->dvAccum_CN_B += newDcm_NB.transpose()*(newV_CN_N -
-                                              this->BcGravVelocity->getState());
+                                              this->BcGravVelocity->getStateView<3>());
 
     // - Find the accumulated DV of the body frame in the body frame
     this->dvAccum_BN_B += newDcm_NB.transpose()*(newV_BN_N -
-                                                 this->hubGravVelocity->getState());
+                                                 this->hubGravVelocity->getStateView<3>());
 
     // - Find the accumulated DV of the center of mass in the inertial frame
-    this->dvAccum_CN_N += newV_CN_N - this->BcGravVelocity->getState();
+    this->dvAccum_CN_N += newV_CN_N - this->BcGravVelocity->getStateView<3>();
 
     // - non-conservative acceleration of the body frame in the body frame
     this->nonConservativeAccelpntB_B = (newDcm_NB.transpose()*(newV_BN_N -
-                                                               this->hubGravVelocity->getState()))/this->timeStep;
+                                                               this->hubGravVelocity->getStateView<3>()))/this->timeStep;
 
     // - angular acceleration in the body frame
     Eigen::Vector3d newOmega_BN_B;
-    newOmega_BN_B = this->hubOmega_BN_B->getState();
+    newOmega_BN_B = this->hubOmega_BN_B->getStateView<3>();
     if (fabs(this->timeStep) > 1e-10) {
         this->omegaDot_BN_B = (newOmega_BN_B - this->oldOmega_BN_B)/this->timeStep; //angular acceleration of B wrt N in the Body frame
     } else {
@@ -522,16 +610,76 @@ void Spacecraft::postIntegration(double integrateToThisTime) {
     this->calcForceTorqueFromStateEffectors(integrateToThisTime, newOmega_BN_B);
 }
 
+/*! This method returns the names of the effectors whose evaluations are profiled, the stateEffectors followed by
+ the dynamicEffectors. Effectors that are also Basilisk modules are named after their ModelTag, the others after
+ their index.
+ @return names of the effectors
+ */
+std::vector<std::string> Spacecraft::getEffectorProfileNames() const
+{
+    std::vector<std::string> names;
+    names.reserve(this->states.size() + this->dynEffectors.size());
+    for(size_t k = 0; k < this->states.size(); k++)
+    {
+        const SysModel* model = dynamic_cast<const SysModel*>(this->states[k]);
+        names.push_back(model && !model->ModelTag.empty() ? model->ModelTag : "stateEffector" + std::to_string(k));
+    }
+    for(size_t k = 0; k < this->dynEffectors.size(); k++)
+    {
+        const SysModel* model = dynamic_cast<const SysModel*>(this->dynEffectors[k]);
+        names.push_back(model && !model->ModelTag.empty() ? model->ModelTag : "dynamicEffector" + std::to_string(k));
+    }
+    // - Effectors sharing a ModelTag are told apart by their index
+    for(size_t k = 1; k < names.size(); k++)
+    {
+        if(std::find(names.begin(), names.begin() + k, names[k]) != names.begin() + k)
+        {
+            names[k] += "_" + std::to_string(k);
+        }
+    }
+    return names;
+}
+
+/*! This method returns the profiling counter of an effector
+ @param index index of the effector name in getEffectorProfileNames()
+ @return number of evaluations and wall clock time spent in the effector
+ */
+ProfilingCounter Spacecraft::getEffectorProfile(size_t index)
+{
+    if (index < this->states.size()) {
+        return this->states[index]->profile;
+    }
+    if (index < this->states.size() + this->dynEffectors.size()) {
+        return this->dynEffectors[index - this->states.size()]->profile;
+    }
+    bskLogger.bskLog(BSK_ERROR, "Spacecraft has no effector with profile index %zu.", index);
+    return ProfilingCounter();
+}
+
+/*! This method resets the profiling counters of the spacecraft, its integrator and its effectors */
+void Spacecraft::resetProfiling()
+{
+    DynamicObject::resetProfiling();
+    for(auto* effector : this->states)
+    {
+        effector->profile.reset();
+    }
+    for(auto* effector : this->dynEffectors)
+    {
+        effector->profile.reset();
+    }
+}
+
 /*! This method is used to find the total energy and momentum of the spacecraft. It finds the total orbital energy,
  total orbital angular momentum, total rotational energy and total rotational angular momentum. These values are used
  for validation purposes. */
 void Spacecraft::computeEnergyMomentum(double time)
 {
     // - Grab values from state Manager
-    Eigen::Vector3d rLocal_BN_N = hubR_N->getState();
-    Eigen::Vector3d rDotLocal_BN_N = hubV_N->getState();
+    Eigen::Vector3d rLocal_BN_N = hubR_N->getStateView<3>();
+    Eigen::Vector3d rDotLocal_BN_N = hubV_N->getStateView<3>();
     Eigen::MRPd sigmaLocal_BN;
-    sigmaLocal_BN = (Eigen::Vector3d ) hubSigma->getState();
+    sigmaLocal_BN = (Eigen::Vector3d ) hubSigma->getStateView<3>();
 
     // - Find DCM's
     Eigen::Matrix3d dcmLocal_NB = sigmaLocal_BN.toRotationMatrix();
@@ -556,7 +704,7 @@ void Spacecraft::computeEnergyMomentum(double time)
     this->rotEnergyContr = 0.0;
 
     // - Get the hubs contribution
-    this->hub.updateEnergyMomContributions(time, this->rotAngMomPntCContr_B, this->rotEnergyContr, this->hubOmega_BN_B->getState());
+    this->hub.updateEnergyMomContributions(time, this->rotAngMomPntCContr_B, this->rotEnergyContr, this->hubOmega_BN_B->getStateView<3>());
     totRotAngMomPntC_B += this->rotAngMomPntCContr_B;
     this->totRotEnergy += this->rotEnergyContr;
 
@@ -569,7 +717,7 @@ void Spacecraft::computeEnergyMomentum(double time)
         this->rotEnergyContr = 0.0;
 
         // - Call energy and momentum calulations for stateEffectors
-        (*it)->updateEnergyMomContributions(time, this->rotAngMomPntCContr_B, this->rotEnergyContr, this->hubOmega_BN_B->getState());
+        (*it)->updateEnergyMomContributions(time, this->rotAngMomPntCContr_B, this->rotEnergyContr, this->hubOmega_BN_B->getStateView<3>());
         totRotAngMomPntC_B += this->rotAngMomPntCContr_B;
         this->totRotEnergy += this->rotEnergyContr;
     }
@@ -583,7 +731,7 @@ void Spacecraft::computeEnergyMomentum(double time)
 
     // - Call gravity effector and add in its potential contributions to the total orbital energy calculations
     this->orbPotentialEnergyContr = 0.0;
-    Eigen::Vector3d rLocal_CN_N = this->hubR_N->getState() + dcmLocal_NB*(*this->c_B);
+    Eigen::Vector3d rLocal_CN_N = this->hubR_N->getStateView<3>() + dcmLocal_NB*(*this->c_B);
     gravField.updateEnergyContributions(rLocal_CN_N, this->orbPotentialEnergyContr);
     this->totOrbEnergy += (*this->m_SC)(0,0)*this->orbPotentialEnergyContr;
 
@@ -614,3 +762,205 @@ void Spacecraft::calcForceTorqueFromStateEffectors(double time, Eigen::Vector3d
         (*it)->calcForceTorqueOnBody(time, omega_BN_B);
     }
 }
+
+/*! This method finds the number of sub-steps that the sub-cycled stateEffectors take within the spacecraft
+ integration step. The sub-cycled stateEffectors are propagated together, with the largest number of sub-steps
+ requested by any of them.
+ @return int number of sub-steps, 1 if no stateEffector is sub-cycled
+ */
+int Spacecraft::findSubCycleSteps() const
+{
+    int subSteps = 1;
+    for(size_t k = 0; k < this->states.size() && k < this->effectorStates.size(); k++)
+    {
+        subSteps = std::max(subSteps, this->states[k]->integrationSubSteps);
+    }
+    return subSteps;
+}
+
+/*! This method zeros the derivatives of the sub-cycled stateEffector states, such that the integrator leaves them
+ to the trajectory they were sub-cycled along */
+void Spacecraft::freezeSubCycledStates()
+{
+    for(size_t k = 0; k < this->states.size() && k < this->effectorStates.size(); k++)
+    {
+        if(this->states[k]->integrationSubSteps > 1)
+        {
+            for(StateData* state : this->effectorStates[k])
+            {
+                state->stateDeriv.setZero();
+            }
+        }
+    }
+}
+
+/*! This method reads the current hub states, hub rates and gravity that the sub-cycled stateEffectors are coupled to
+ @return HubCoupling current hub motion
+ */
+Spacecraft::HubCoupling Spacecraft::readHubCoupling() const
+{
+    HubCoupling coupling;
+    coupling.r_BN_N = this->hubR_N->getStateView<3>();
+    coupling.v_BN_N = this->hubV_N->getStateView<3>();
+    coupling.sigma_BN = this->hubSigma->getStateView<3>();
+    coupling.omega_BN_B = this->hubOmega_BN_B->getStateView<3>();
+    coupling.rDDot_BN_N = this->hubV_N->getStateDerivView<3>();
+    coupling.sigmaDot_BN = this->hubSigma->getStateDerivView<3>();
+    coupling.omegaDot_BN_B = this->hubOmega_BN_B->getStateDerivView<3>();
+    coupling.g_N = *this->g_N;
+    return coupling;
+}
+
+/*! This method sets the hub states, hub rates and gravity
+ @param coupling hub motion to set
+ */
+void Spacecraft::writeHubCoupling(const HubCoupling& coupling)
+{
+    this->hubR_N->stateView<3>() = coupling.r_BN_N;
+    this->hubV_N->stateView<3>() = coupling.v_BN_N;
+    this->hubSigma->stateView<3>() = coupling.sigma_BN;
+    this->hubOmega_BN_B->stateView<3>() = coupling.omega_BN_B;
+    this->hubR_N->stateDerivView<3>() = coupling.v_BN_N;
+    this->hubV_N->stateDerivView<3>() = coupling.rDDot_BN_N;
+    this->hubSigma->stateDerivView<3>() = coupling.sigmaDot_BN;
+    this->hubOmega_BN_B->stateDerivView<3>() = coupling.omegaDot_BN_B;
+    *this->g_N = coupling.g_N;
+}
+
+/*! This method computes the state derivatives of the sub-cycled stateEffectors. Only their own back-substitution
+ contributions and the hub terms are recomputed, the gravity, the dynamicEffectors and the other stateEffectors are
+ held at the start of the spacecraft integration step. The hub states are either held at the start of the step as
+ well or extrapolated from the hub rates at the start of the step.
+ @param integTime [s] time to compute the derivatives at
+ */
+void Spacecraft::computeSubCycledDerivatives(double integTime)
+{
+    // - Find the hub motion at this time
+    HubCoupling coupling = this->couplingStart;
+    if (this->extrapolateSubCycleCoupling) {
+        double dt = integTime - this->timeBefore;
+        coupling.r_BN_N += dt*this->couplingStart.v_BN_N + 0.5*dt*dt*this->couplingStart.rDDot_BN_N;
+        coupling.v_BN_N += dt*this->couplingStart.rDDot_BN_N;
+        coupling.sigma_BN += dt*this->couplingStart.sigmaDot_BN;
+        coupling.omega_BN_B += dt*this->couplingStart.omegaDot_BN_B;
+    }
+    this->writeHubCoupling(coupling);
+
+    // - Solve the back-substitution with the current contributions of the sub-cycled stateEffectors
+    this->updateSCMassProps(integTime);
+    this->hub.hubBackSubMatrices = this->slowBackSubMatrices;
+    std::vector<StateEffector*>::iterator it;
+    for(it = this->states.begin(); it != this->states.end(); it++)
+    {
+        if((*it)->integrationSubSteps > 1)
+        {
+            this->addStateEffectorContributions(*it, integTime);
+        }
+    }
+    this->computeHubDerivatives(integTime);
+    for(it = this->states.begin(); it != this->states.end(); it++)
+    {
+        if((*it)->integrationSubSteps > 1)
+        {
+            ProfilingTimer timer((*it)->profile, true, this->profileEvaluationTimes);
+            (*it)->computeDerivatives(integTime, this->hubV_N->getStateDerivView<3>(), this->hubOmega_BN_B->getStateDerivView<3>(), this->hubSigma->getStateView<3>());
+        }
+    }
+}
+
+/*! This method propagates the states of the sub-cycled stateEffectors across the spacecraft integration step with
+ RK4 sub-steps, and stores their trajectory. The states are left at the start of the step, the integrator then
+ propagates the other states while the sub-cycled states follow this trajectory.
+ @param subSteps number of sub-steps within the integration step
+ */
+void Spacecraft::subCycleStateEffectors(int subSteps)
+{
+    // - Collect the sub-cycled states
+    this->subCycledStates.clear();
+    for(size_t k = 0; k < this->states.size() && k < this->effectorStates.size(); k++)
+    {
+        if(this->states[k]->integrationSubSteps > 1)
+        {
+            this->subCycledStates.insert(this->subCycledStates.end(), this->effectorStates[k].begin(), this->effectorStates[k].end());
+        }
+    }
+
+    const double stageTimes[4] = {0.0, 0.5, 0.5, 1.0};
+    const double stageWeights[4] = {1.0/6.0, 1.0/3.0, 1.0/3.0, 1.0/6.0};
+    size_t numStates = this->subCycledStates.size();
+    double subStepSize = this->timeStep/subSteps;
+    this->subCycledStateHistory.resize(subSteps + 1, std::vector<Eigen::MatrixXd>(numStates));
+    this->subCycledDerivHistory.resize(subSteps + 1, std::vector<Eigen::MatrixXd>(numStates));
+    std::vector<Eigen::MatrixXd> stateIncrements(numStates);
+    for(int i = 0; i < subSteps; i++)
+    {
+        double subStepStart = this->timeBefore + i*subStepSize;
+        for(size_t j = 0; j < numStates; j++)
+        {
+            this->subCycledStateHistory[i][j] = this->subCycledStates[j]->state;
+        }
+
+        // - Each RK4 stage is evaluated from the derivatives of the previous one
+        for(int stage = 0; stage < 4; stage++)
+        {
+            for(size_t j = 0; j < numStates && stage > 0; j++)
+            {
+                this->subCycledStates[j]->state = this->subCycledStateHistory[i][j]
+                                                  + stageTimes[stage]*subStepSize*this->subCycledStates[j]->stateDeriv;
+            }
+            this->computeSubCycledDerivatives(subStepStart + stageTimes[stage]*subStepSize);
+            for(size_t j = 0; j < numStates; j++)
+            {
+                if(stage == 0)
+                {
+                    this->subCycledDerivHistory[i][j] = this->subCycledStates[j]->stateDeriv;
+                    stateIncrements[j] = stageWeights[stage]*subStepSize*this->subCycledStates[j]->stateDeriv;
+                }
+                else
+                {
+                    stateIncrements[j] += stageWeights[stage]*subStepSize*this->subCycledStates[j]->stateDeriv;
+                }
+            }
+        }
+
+        for(size_t j = 0; j < numStates; j++)
+        {
+            this->subCycledStates[j]->state = this->subCycledStateHistory[i][j] + stateIncrements[j];
+        }
+    }
+
+    // - The derivatives at the end of the step complete the trajectory
+    this->computeSubCycledDerivatives(this->timeBefore + this->timeStep);
+    for(size_t j = 0; j < numStates; j++)
+    {
+        this->subCycledStateHistory[subSteps][j] = this->subCycledStates[j]->state;
+        this->subCycledDerivHistory[subSteps][j] = this->subCycledStates[j]->stateDeriv;
+        this->subCycledStates[j]->state = this->subCycledStateHistory[0][j];
+    }
+}
+
+/*! This method sets the sub-cycled stateEffector states to their trajectory across the spacecraft integration step,
+ using a cubic Hermite interpolation between the sub-steps
+ @param integTime [s] time within the integration step
+ */
+void Spacecraft::setSubCycledStates(double integTime)
+{
+    // - Find the sub-step containing this time
+    int subSteps = (int) this->subCycledStateHistory.size() - 1;
+    double subStepSize = this->timeStep/subSteps;
+    double subStepFraction = (integTime - this->timeBefore)/subStepSize;
+    int i = std::min(std::max((int) std::floor(subStepFraction), 0), subSteps - 1);
+    double s = subStepFraction - i;
+
+    double h00 = (1.0 + 2.0*s)*(1.0 - s)*(1.0 - s);
+    double h10 = s*(1.0 - s)*(1.0 - s);
+    double h01 = s*s*(3.0 - 2.0*s);
+    double h11 = s*s*(s - 1.0);
+    for(size_t j = 0; j < this->subCycledStates.size(); j++)
+    {
+        this->subCycledStates[j]->state = h00*this->subCycledStateHistory[i][j]
+                                          + h10*subStepSize*this->subCycledDerivHistory[i][j]
+                                          + h01*this->subCycledStateHistory[i+1][j]
+                                          + h11*subStepSize*this->subCycledDerivHistory[i+1][j];
+    }
+}
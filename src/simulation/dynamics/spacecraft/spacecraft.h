@@ -74,6 +74,7 @@ public:
     BSKLogger bskLogger;                      //!< -- BSK Logging
     Message<SCStatesMsgPayload> scStateOutMsg;      //!< spacecraft state output message
     Message<SCMassPropsMsgPayload> scMassOutMsg;    //!< spacecraft mass properties output message
+    bool extrapolateSubCycleCoupling;    //!< -- Flag to extrapolate the hub motion seen by sub-cycled stateEffectors from its rates at the start of the integration step, otherwise it is held constant
 
 public:
     Spacecraft();                    //!< -- Constructor
@@ -91,6 +92,9 @@ public:
     void addDynamicEffector(DynamicEffector *newDynamicEffector);  //!< -- Attaches a dynamicEffector
     void preIntegration(double callTime) final;       //!< -- method to perform pre-integration steps
     void postIntegration(double callTime) final;      //!< -- method to perform post-integration steps
+    std::vector<std::string> getEffectorProfileNames() const override;  //!< -- Names of the stateEffectors followed by the dynamicEffectors
+    ProfilingCounter getEffectorProfile(size_t index) override;    //!< -- Profiling counter of an effector
+    void resetProfiling() override;      //!< -- Resets the profiling counters of the s/c and its effectors
 
 private:
     StateData *hubR_N;                          //!< -- State data accesss to inertial position for the hub
@@ -115,8 +119,36 @@ private:
 
     Eigen::Vector3d oldOmega_BN_B;       //!< [r/s] prior angular rate of B wrt N in the Body frame
 
+    /*! hub motion that the sub-cycled stateEffectors are coupled to */
+    struct HubCoupling {
+        Eigen::Vector3d r_BN_N;          //!< [m] Hub position
+        Eigen::Vector3d v_BN_N;          //!< [m/s] Hub velocity
+        Eigen::Vector3d sigma_BN;        //!< -- Hub attitude
+        Eigen::Vector3d omega_BN_B;      //!< [r/s] Hub angular rate
+        Eigen::Vector3d rDDot_BN_N;      //!< [m/s^2] Hub acceleration
+        Eigen::Vector3d sigmaDot_BN;     //!< -- Hub attitude rate
+        Eigen::Vector3d omegaDot_BN_B;   //!< [r/s^2] Hub angular acceleration
+        Eigen::Vector3d g_N;             //!< [m/s^2] Gravitational acceleration
+    };
+    std::vector<std::vector<StateData*>> effectorStates;  //!< -- States registered by each stateEffector
+    std::vector<StateData*> subCycledStates;  //!< -- States of the sub-cycled stateEffectors
+    std::vector<std::vector<Eigen::MatrixXd>> subCycledStateHistory;  //!< -- Sub-cycled states at the start of each sub-step and at the end of the step
+    std::vector<std::vector<Eigen::MatrixXd>> subCycledDerivHistory;  //!< -- Sub-cycled state derivatives at the same times
+    BackSubMatrices slowBackSubMatrices; //!< -- Back-substitution contributions of the stateEffectors that aren't sub-cycled
+    HubCoupling couplingStart;           //!< -- Hub motion at the start of the integration step
+    bool subCycledStepActive;            //!< -- Flag indicating that the sub-cycled trajectory covers the current integration step
+
 private:
     void readOptionalRefMsg();                  //!< -- Read the optional attitude or translational reference input message and set the reference states
+    void addStateEffectorContributions(StateEffector* effector, double integTimeSeconds);  //!< -- Add the back-substitution contributions of a stateEffector
+    void computeHubDerivatives(double integTimeSeconds);  //!< -- Finish the back-substitution and compute the hub derivatives
+    int findSubCycleSteps() const;              //!< -- Find the number of sub-steps of the sub-cycled stateEffectors
+    void freezeSubCycledStates();               //!< -- Zero the derivatives of the sub-cycled states for the spacecraft integration step
+    HubCoupling readHubCoupling() const;        //!< -- Read the current hub motion
+    void writeHubCoupling(const HubCoupling& coupling);  //!< -- Set the hub states and derivatives to the given hub motion
+    void computeSubCycledDerivatives(double integTime);  //!< -- Compute the derivatives of the sub-cycled stateEffectors
+    void subCycleStateEffectors(int subSteps);  //!< -- Propagate the sub-cycled stateEffectors across the integration step
+    void setSubCycledStates(double integTime);  //!< -- Set the sub-cycled states to their trajectory at a time within the integration step
 };
 
 
@@ -0,0 +1,100 @@
+
+# ISC License
+#
+# Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+#
+# Purpose:  Test that the spacecraft ensemble propagates the same trajectories as individual spacecraft modules
+#
+
+import numpy as np
+import pytest
+from Basilisk.architecture import bskLogging
+from Basilisk.simulation import spacecraft
+from Basilisk.simulation import spacecraftEnsemble
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+from Basilisk.utilities import simIncludeGravBody
+
+
+@pytest.mark.parametrize("rigid", [False, True])
+def test_spacecraftEnsemble(rigid):
+    """
+    Compare the states of an ensemble of spacecraft with the states of the same spacecraft simulated
+    with individual spacecraft modules
+    """
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    scSim = SimulationBaseClass.SimBaseClass()
+    dynProcess = scSim.CreateNewProcess("dynamicsProcess")
+    dynProcess.addTask(scSim.CreateNewTask("dynamicsTask", macros.sec2nano(1.)))
+
+    gravFactory = simIncludeGravBody.gravBodyFactory()
+    earth = gravFactory.createEarth()
+    earth.isCentralBody = True
+    gravBodies = list(gravFactory.gravBodies.values())
+
+    ensemble = spacecraftEnsemble.SpacecraftEnsemble()
+    ensemble.ModelTag = "ensemble"
+    ensemble.gravField.gravBodies = spacecraftEnsemble.GravBodyVector(gravBodies)
+    scSim.AddModelToTask("dynamicsTask", ensemble)
+
+    rng = np.random.default_rng(0)
+    numSpacecraft = 5
+    scObjects = []
+    recorders = []
+    for i in range(numSpacecraft):
+        rN = [7000e3, 0., 0.] + rng.uniform(-1e5, 1e5, 3)
+        vN = [0., 7.5e3, 0.] + rng.uniform(-100., 100., 3)
+        sigma_BN = rng.uniform(-0.3, 0.3, 3)
+        omega_BN_B = rng.uniform(-0.2, 0.2, 3)
+        inertia = [900., 800., 600.] + rng.uniform(-100., 100., 3)
+
+        scObject = spacecraft.Spacecraft()
+        scObject.ModelTag = "spacecraft" + str(i)
+        scObject.gravField.gravBodies = spacecraft.GravBodyVector(gravBodies)
+        scObject.hub.mHub = 100.
+        scObject.hub.r_CN_NInit = rN
+        scObject.hub.v_CN_NInit = vN
+        if rigid:
+            ensemble.addRigidSpacecraft(rN, vN, sigma_BN, omega_BN_B, inertia)
+            scObject.hub.IHubPntBc_B = np.diag(inertia)
+            scObject.hub.sigma_BNInit = sigma_BN
+            scObject.hub.omega_BN_BInit = omega_BN_B
+        else:
+            ensemble.addSpacecraft(rN, vN)
+        scSim.AddModelToTask("dynamicsTask", scObject)
+        scObjects.append(scObject)
+
+        recorders.append((ensemble.scStateOutMsgs[i].recorder(), scObject.scStateOutMsg.recorder()))
+        scSim.AddModelToTask("dynamicsTask", recorders[-1][0])
+        scSim.AddModelToTask("dynamicsTask", recorders[-1][1])
+
+    assert ensemble.getNumberOfSpacecraft() == numSpacecraft
+
+    scSim.InitializeSimulation()
+    scSim.ConfigureStopTime(macros.sec2nano(600.))
+    scSim.ExecuteSimulation()
+
+    for ensembleRec, scRec in recorders:
+        np.testing.assert_allclose(ensembleRec.r_BN_N, scRec.r_BN_N, rtol=0., atol=1e-6)
+        np.testing.assert_allclose(ensembleRec.v_BN_N, scRec.v_BN_N, rtol=0., atol=1e-9)
+        np.testing.assert_allclose(ensembleRec.sigma_BN, scRec.sigma_BN, rtol=0., atol=1e-10)
+        np.testing.assert_allclose(ensembleRec.omega_BN_B, scRec.omega_BN_B, rtol=0., atol=1e-10)
+        np.testing.assert_array_equal(ensembleRec.MRPSwitchCount, scRec.MRPSwitchCount)
+
+
+if __name__ == "__main__":
+    test_spacecraftEnsemble(True)
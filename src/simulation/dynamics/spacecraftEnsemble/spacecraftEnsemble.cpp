@@ -0,0 +1,296 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+
+#include "spacecraftEnsemble.h"
+#include "../_GeneralModuleFiles/svIntegratorRK4.h"
+#include "architecture/utilities/macroDefinitions.h"
+#include "architecture/utilities/avsEigenSupport.h"
+
+
+/*! This is the constructor, setting variables to default values */
+SpacecraftEnsemble::SpacecraftEnsemble()
+{
+    // - Set default names
+    this->nameOfPositionState = "ensemblePosition";
+    this->nameOfVelocityState = "ensembleVelocity";
+    this->nameOfSigmaState = "ensembleSigma";
+    this->nameOfOmegaState = "ensembleOmega";
+    this->sysTimePropertyName = "systemTime";
+
+    // - Set values to either zero or default values
+    this->attitudeEnabled = false;
+    this->timePrevious = 0.0;
+    this->simTimePrevious = 0;
+    this->posState = nullptr;
+    this->velState = nullptr;
+    this->sigmaState = nullptr;
+    this->omegaState = nullptr;
+    this->sysTime = nullptr;
+
+    // - Set integrator as RK4 by default
+    this->integrator = new svIntegratorRK4(this);
+}
+
+/*! This is the destructor, deleting the spacecraft state output messages */
+SpacecraftEnsemble::~SpacecraftEnsemble()
+{
+    for (auto msg : this->scStateOutMsgs) {
+        delete msg;
+    }
+}
+
+/*! This method adds a point mass spacecraft to the ensemble
+ @param r_CN_NInit [m] initial position wrt the central body
+ @param v_CN_NInit [m/s] initial velocity wrt the central body
+ */
+void SpacecraftEnsemble::addSpacecraft(Eigen::Vector3d r_CN_NInit, Eigen::Vector3d v_CN_NInit)
+{
+    this->appendSpacecraft(r_CN_NInit, v_CN_NInit, Eigen::Vector3d::Zero(), Eigen::Vector3d::Zero(),
+                           Eigen::Vector3d::Ones());
+}
+
+/*! This method adds a rigid spacecraft to the ensemble.  Adding a rigid spacecraft enables the attitude integration
+ for the whole ensemble, where the point mass spacecraft keep a zero attitude.
+ @param r_CN_NInit [m] initial position wrt the central body
+ @param v_CN_NInit [m/s] initial velocity wrt the central body
+ @param sigma_BNInit initial attitude MRP
+ @param omega_BN_BInit [r/s] initial attitude rate in body frame components
+ @param IPntC_B [kg m^2] principal inertias about the center of mass
+ */
+void SpacecraftEnsemble::addRigidSpacecraft(Eigen::Vector3d r_CN_NInit, Eigen::Vector3d v_CN_NInit,
+                                            Eigen::Vector3d sigma_BNInit, Eigen::Vector3d omega_BN_BInit,
+                                            Eigen::Vector3d IPntC_B)
+{
+    if ((IPntC_B.array() <= 0.0).any()) {
+        bskLogger.bskLog(BSK_ERROR, "SpacecraftEnsemble: the principal inertias must be positive.");
+        return;
+    }
+    this->appendSpacecraft(r_CN_NInit, v_CN_NInit, sigma_BNInit, omega_BN_BInit, IPntC_B);
+    this->attitudeEnabled = true;
+}
+
+/*! This method appends the initial conditions of a spacecraft to the ensemble and creates its output message */
+void SpacecraftEnsemble::appendSpacecraft(const Eigen::Vector3d& r_CN_NInit, const Eigen::Vector3d& v_CN_NInit,
+                                          const Eigen::Vector3d& sigma_BNInit, const Eigen::Vector3d& omega_BN_BInit,
+                                          const Eigen::Vector3d& IPntC_B)
+{
+    Eigen::Index n = this->r_CN_NInit.rows();
+    this->r_CN_NInit.conservativeResize(n + 1, 3);
+    this->v_CN_NInit.conservativeResize(n + 1, 3);
+    this->sigma_BNInit.conservativeResize(n + 1, 3);
+    this->omega_BN_BInit.conservativeResize(n + 1, 3);
+    this->IPntC_B.conservativeResize(n + 1, 3);
+    this->r_CN_NInit.row(n) = r_CN_NInit.transpose();
+    this->v_CN_NInit.row(n) = v_CN_NInit.transpose();
+    this->sigma_BNInit.row(n) = sigma_BNInit.transpose();
+    this->omega_BN_BInit.row(n) = omega_BN_BInit.transpose();
+    this->IPntC_B.row(n) = IPntC_B.transpose();
+
+    this->scStateOutMsgs.push_back(new Message<SCStatesMsgPayload>);
+}
+
+/*! This method returns the number of spacecraft in the ensemble */
+size_t SpacecraftEnsemble::getNumberOfSpacecraft() const
+{
+    return (size_t) this->r_CN_NInit.rows();
+}
+
+/*! This method is used to reset the module.
+ @return void
+ */
+void SpacecraftEnsemble::Reset(uint64_t CurrentSimNanos)
+{
+    this->gravField.Reset(CurrentSimNanos);
+    // - Call method for initializing the dynamics of the ensemble
+    this->initializeDynamics();
+
+    this->simTimePrevious = CurrentSimNanos;
+    this->timePrevious = CurrentSimNanos*NANO2SEC;
+    this->writeOutputStateMessages(CurrentSimNanos);
+}
+
+/*! This method registers the ensemble states, initializes gravity, and sets the initial conditions specified in
+ python for the simulation */
+void SpacecraftEnsemble::initializeDynamics()
+{
+    Eigen::Index n = this->r_CN_NInit.rows();
+    if (n == 0) {
+        bskLogger.bskLog(BSK_ERROR, "SpacecraftEnsemble: no spacecraft were added to the ensemble.");
+    }
+    // - The optional inputs must either be empty or have one row per spacecraft
+    if (this->nonGravAccel_N.rows() != 0 && this->nonGravAccel_N.rows() != n) {
+        bskLogger.bskLog(BSK_ERROR, "SpacecraftEnsemble: nonGravAccel_N must have one row per spacecraft.");
+        this->nonGravAccel_N.resize(0, 3);
+    }
+    if (this->extTorquePntC_B.rows() != 0 && this->extTorquePntC_B.rows() != n) {
+        bskLogger.bskLog(BSK_ERROR, "SpacecraftEnsemble: extTorquePntC_B must have one row per spacecraft.");
+        this->extTorquePntC_B.resize(0, 3);
+    }
+    // - External torques require the attitude to be integrated
+    if (this->extTorquePntC_B.rows() != 0) {
+        this->attitudeEnabled = true;
+    }
+
+    Eigen::MatrixXd systemTime(2,1);
+    systemTime.setZero();
+    this->sysTime = this->dynManager.createProperty(this->sysTimePropertyName, systemTime);
+
+    // - Register the gravity properties with the dynManager
+    this->gravField.registerProperties(this->dynManager);
+
+    // - Register the ensemble states, one row per spacecraft
+    this->posState = this->dynManager.registerState((uint32_t) n, 3, this->nameOfPositionState);
+    this->velState = this->dynManager.registerState((uint32_t) n, 3, this->nameOfVelocityState);
+    this->posState->setState(this->r_CN_NInit);
+    this->velState->setState(this->v_CN_NInit);
+    if (this->attitudeEnabled) {
+        this->sigmaState = this->dynManager.registerState((uint32_t) n, 3, this->nameOfSigmaState);
+        this->omegaState = this->dynManager.registerState((uint32_t) n, 3, this->nameOfOmegaState);
+        this->sigmaState->setState(this->sigma_BNInit);
+        this->omegaState->setState(this->omega_BN_BInit);
+    }
+    this->MRPSwitchCounts.assign((size_t) n, 0);
+
+    // - Link in the gravity states
+    this->gravField.linkInStates(this->dynManager);
+}
+
+/*! This method is a part of sysModel and is used to integrate the state and update the state in the messaging system */
+void SpacecraftEnsemble::UpdateState(uint64_t CurrentSimNanos)
+{
+    // - Convert current time to seconds
+    double newTime = CurrentSimNanos*NANO2SEC;
+
+    // - Get access to the spice bodies
+    this->gravField.UpdateState(CurrentSimNanos);
+
+    // - Integrate the state forward in time
+    this->integrateState(newTime);
+
+    // - Write the state of the vehicles into messages
+    this->writeOutputStateMessages(CurrentSimNanos);
+    this->simTimePrevious = CurrentSimNanos;
+}
+
+/*! This is the method where the messages of the state of the vehicles are written */
+void SpacecraftEnsemble::writeOutputStateMessages(uint64_t clockTime)
+{
+    // - Compute the inertial states of all the spacecraft, which might be defined relative to a planet
+    this->gravField.computeInertialPosAndVelBatch(this->posState->state, this->velState->state,
+                                                  this->inertialPositions, this->inertialVelocities);
+
+    for (size_t i = 0; i < this->scStateOutMsgs.size(); i++) {
+        SCStatesMsgPayload stateOut;
+        stateOut = this->scStateOutMsgs[i]->zeroMsgPayload;
+        for (int j = 0; j < 3; j++) {
+            stateOut.r_BN_N[j] = stateOut.r_CN_N[j] = this->inertialPositions(i, j);
+            stateOut.v_BN_N[j] = stateOut.v_CN_N[j] = this->inertialVelocities(i, j);
+            if (this->attitudeEnabled) {
+                stateOut.sigma_BN[j] = this->sigmaState->state(i, j);
+                stateOut.omega_BN_B[j] = this->omegaState->state(i, j);
+            }
+        }
+        stateOut.MRPSwitchCount = this->MRPSwitchCounts[i];
+        this->scStateOutMsgs[i]->write(&stateOut, this->moduleID, clockTime);
+    }
+}
+
+/*! This method computes the state derivatives of the whole ensemble.  The gravity is evaluated for all the
+ spacecraft in one call, and the kinematics and Euler equations operate on whole state columns at once.
+ @param integTimeSeconds [s] Time the method is called
+ @param timeStep [s] integration time step
+ */
+void SpacecraftEnsemble::equationsOfMotion(double integTimeSeconds, double timeStep)
+{
+    // - Update time to the current time
+    uint64_t integTimeNanos = this->simTimePrevious + (uint64_t) ((integTimeSeconds-this->timePrevious)/NANO2SEC);
+    (*this->sysTime) << (double) integTimeNanos, integTimeSeconds;
+
+    // - Translational motion
+    this->positions = this->posState->state;
+    this->gravField.computeGravityFieldBatch(this->positions, this->gravAccel_N);
+    this->posState->stateDeriv = this->velState->state;
+    this->velState->stateDeriv = this->gravAccel_N;
+    if (this->nonGravAccel_N.rows() != 0) {
+        this->velState->stateDeriv += this->nonGravAccel_N;
+    }
+
+    if (!this->attitudeEnabled) {
+        return;
+    }
+
+    // - MRP kinematics, sigmaDot = 1/4 ((1 - s^2) w + 2 s x w + 2 (s.w) s)
+    const Eigen::MatrixXd& sigma = this->sigmaState->state;
+    const Eigen::MatrixXd& omega = this->omegaState->state;
+    Eigen::ArrayXd s2 = sigma.array().square().rowwise().sum();
+    Eigen::ArrayXd sw = (sigma.array()*omega.array()).rowwise().sum();
+    Eigen::MatrixXd& sigmaDot = this->sigmaState->stateDeriv;
+    sigmaDot.resize(sigma.rows(), 3);
+    for (int j = 0; j < 3; j++) {
+        int k = (j + 1) % 3;
+        int l = (j + 2) % 3;
+        sigmaDot.col(j) = 0.25*((1.0 - s2)*omega.col(j).array()
+            + 2.0*(sigma.col(k).array()*omega.col(l).array() - sigma.col(l).array()*omega.col(k).array())
+            + 2.0*sw*sigma.col(j).array()).matrix();
+    }
+
+    // - Euler equations about the principal axes, IwDot = -w x Iw + L
+    Eigen::MatrixXd& omegaDot = this->omegaState->stateDeriv;
+    omegaDot.resize(omega.rows(), 3);
+    for (int j = 0; j < 3; j++) {
+        int k = (j + 1) % 3;
+        int l = (j + 2) % 3;
+        omegaDot.col(j) = ((this->IPntC_B.col(k).array() - this->IPntC_B.col(l).array())
+            *omega.col(k).array()*omega.col(l).array()).matrix();
+        if (this->extTorquePntC_B.rows() != 0) {
+            omegaDot.col(j) += this->extTorquePntC_B.col(j);
+        }
+        omegaDot.col(j).array() /= this->IPntC_B.col(j).array();
+    }
+}
+
+/*! Prepare for integration process
+ @param integrateToThisTime Time to integrate to
+ */
+void SpacecraftEnsemble::preIntegration(double integrateToThisTime) {
+    this->timeStep = integrateToThisTime - this->timePrevious;
+    this->timeBefore = integrateToThisTime - this->timeStep;
+}
+
+/*! Perform post-integration steps
+ @param integrateToThisTime Time to integrate to
+ */
+void SpacecraftEnsemble::postIntegration(double integrateToThisTime) {
+    this->timePrevious = integrateToThisTime;     // - copy the current time into previous time for next integrate state call
+
+    if (!this->attitudeEnabled) {
+        return;
+    }
+
+    // - Switch the MRPs of every spacecraft that left the unit sphere
+    Eigen::MatrixXd& sigma = this->sigmaState->state;
+    for (Eigen::Index i = 0; i < sigma.rows(); i++) {
+        double s2 = sigma.row(i).squaredNorm();
+        if (s2 > 1) {
+            sigma.row(i) /= -s2;
+            this->MRPSwitchCounts[i]++;
+        }
+    }
+}
@@ -0,0 +1,96 @@
+/*
+ ISC License
+
+ Copyright (c) 2026, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+
+ Permission to use, copy, modify, and/or distribute this software for any
+ purpose with or without fee is hereby granted, provided that the above
+ copyright notice and this permission notice appear in all copies.
+
+ THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+ WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+ MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+ WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+ OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+ */
+
+
+#ifndef SPACECRAFT_ENSEMBLE_H
+#define SPACECRAFT_ENSEMBLE_H
+
+#include <vector>
+#include <Eigen/Dense>
+#include "simulation/dynamics/_GeneralModuleFiles/dynamicObject.h"
+#include "simulation/dynamics/_GeneralModuleFiles/gravityEffector.h"
+#include "simulation/dynamics/_GeneralModuleFiles/stateData.h"
+#include "architecture/_GeneralModuleFiles/sys_model.h"
+#include "architecture/msgPayloadDefC/SCStatesMsgPayload.h"
+#include "architecture/utilities/bskLogging.h"
+#include "architecture/messaging/messaging.h"
+
+
+/*! @brief ensemble of spacecraft that are integrated together as a single dynamic object
+
+ The states of all the spacecraft are stored as structure-of-arrays matrices with one row per spacecraft, such that
+ the gravity and the equations of motion are evaluated for the whole ensemble at once.
+ */
+class SpacecraftEnsemble : public DynamicObject {
+public:
+    SpacecraftEnsemble();
+    ~SpacecraftEnsemble();
+    void Reset(uint64_t CurrentSimNanos);
+    void UpdateState(uint64_t CurrentSimNanos);
+    void initializeDynamics();
+    void equationsOfMotion(double integTimeSeconds, double timeStep);
+    void preIntegration(double callTime) final;
+    void postIntegration(double callTime) final;
+    void addSpacecraft(Eigen::Vector3d r_CN_NInit, Eigen::Vector3d v_CN_NInit);
+    void addRigidSpacecraft(Eigen::Vector3d r_CN_NInit, Eigen::Vector3d v_CN_NInit, Eigen::Vector3d sigma_BNInit,
+                            Eigen::Vector3d omega_BN_BInit, Eigen::Vector3d IPntC_B);
+    size_t getNumberOfSpacecraft() const;
+
+public:
+    std::vector<Message<SCStatesMsgPayload>*> scStateOutMsgs;  //!< spacecraft state output messages, one per spacecraft
+    GravityEffector gravField;           //!< -- Gravity effector for the gravitational field experienced by the ensemble
+    Eigen::MatrixX3d nonGravAccel_N;     //!< [m/s^2] (optional) non-gravitational acceleration of every spacecraft, one row per spacecraft
+    Eigen::MatrixX3d extTorquePntC_B;    //!< [N-m] (optional) external torque on every rigid spacecraft, one row per spacecraft
+    std::string nameOfPositionState;     //!< -- Identifier for the position state data container
+    std::string nameOfVelocityState;     //!< -- Identifier for the velocity state data container
+    std::string nameOfSigmaState;        //!< -- Identifier for the attitude state data container
+    std::string nameOfOmegaState;        //!< -- Identifier for the attitude rate state data container
+    std::string sysTimePropertyName;     //!< -- Name of the system time property
+
+private:
+    Eigen::MatrixX3d r_CN_NInit;         //!< [m] Initial positions wrt the central body, one row per spacecraft
+    Eigen::MatrixX3d v_CN_NInit;         //!< [m/s] Initial velocities wrt the central body, one row per spacecraft
+    Eigen::MatrixX3d sigma_BNInit;       //!< -- Initial attitudes, one row per spacecraft
+    Eigen::MatrixX3d omega_BN_BInit;     //!< [r/s] Initial attitude rates, one row per spacecraft
+    Eigen::MatrixX3d IPntC_B;            //!< [kg m^2] Principal inertias, one row per spacecraft
+    bool attitudeEnabled;                //!< -- Flag indicating that the attitude of the spacecraft is integrated
+    std::vector<int> MRPSwitchCounts;    //!< -- Number of MRP switches of every spacecraft
+
+    StateData *posState;                 //!< -- State data access to the positions
+    StateData *velState;                 //!< -- State data access to the velocities
+    StateData *sigmaState;               //!< -- State data access to the attitudes
+    StateData *omegaState;               //!< -- State data access to the attitude rates
+    Eigen::MatrixXd *sysTime;            //!< [s] System time
+    uint64_t simTimePrevious;            //!< [ns] Previous simulation time
+    double timePrevious;                 //!< [s] Time before the last integration
+
+    Eigen::MatrixX3d positions;          //!< [m] Position buffer for the gravity evaluation
+    Eigen::MatrixX3d gravAccel_N;        //!< [m/s^2] Gravitational acceleration of every spacecraft
+    Eigen::MatrixX3d inertialPositions;  //!< [m] Inertial positions for the output messages
+    Eigen::MatrixX3d inertialVelocities; //!< [m/s] Inertial velocities for the output messages
+
+private:
+    void writeOutputStateMessages(uint64_t clockTime);  //!< -- Write the state output message of every spacecraft
+    void appendSpacecraft(const Eigen::Vector3d& r_CN_NInit, const Eigen::Vector3d& v_CN_NInit,
+                          const Eigen::Vector3d& sigma_BNInit, const Eigen::Vector3d& omega_BN_BInit,
+                          const Eigen::Vector3d& IPntC_B);  //!< -- Append the initial conditions of a spacecraft
+};
+
+
+#endif /* SPACECRAFT_ENSEMBLE_H */
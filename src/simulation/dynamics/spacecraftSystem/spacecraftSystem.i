@@ -34,6 +34,7 @@ from Basilisk.simulation.gravityEffector import GravBodyVector
 %include "sys_model.i"
 %include "../_GeneralModuleFiles/stateData.h"
 %include "../_GeneralModuleFiles/dynParamManager.h"
+%include "../_GeneralModuleFiles/profilingCounter.h"
 %include "../_GeneralModuleFiles/dynamicObject.h"
 %import  "simulation/dynamics/gravityEffector/gravityEffector.i"
 %include "../_GeneralModuleFiles/stateEffector.h"
@@ -175,6 +175,11 @@ def stateProperties(show_plots):
         testFailCount += 1
         testMessages.append("1x1 Eigen property creation failed.")
 
+    massHandle = newManager.getPropertyHandle(massName)
+    if not massHandle.isValid() or newManager.getProperty(massHandle) != massList:
+        testFailCount += 1
+        testMessages.append("Property handle lookup failed.")
+
 
     if testFailCount == 0:
         print("PASSED: " + " State properties")
@@ -224,6 +229,15 @@ def stateArchitectureTest(show_plots):
     if(positionStateLookup.getName() != flexName):
         testFailCount += 1
         testMessages.append("State lookup for solar array flex failed")
+
+    flexHandle = newManager.getStateHandle(flexName)
+    if not flexHandle.isValid() or newManager.getState(flexHandle).getName() != flexName:
+        testFailCount += 1
+        testMessages.append("State handle lookup for solar array flex failed")
+
+    if newManager.getStateHandle("Array2_flex").isValid():
+        testFailCount += 1
+        testMessages.append("State handle lookup of a non-existent state returned a valid handle")
     
     vectorFactor = 4.0
     vecStart = [[1.0], [2.0], [3.5]]
@@ -0,0 +1,117 @@
+#
+#  ISC License
+#
+#  Copyright (c) 2024, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+#
+# Purpose:  Test the list and the preallocated buffer storage of the PythonVariableLogger
+#
+
+import numpy as np
+import pytest
+from Basilisk.architecture import bskLogging
+from Basilisk.utilities import SimulationBaseClass
+from Basilisk.utilities import macros
+from Basilisk.utilities.pythonVariableLogger import PythonVariableLogger
+
+
+@pytest.mark.parametrize("capacity", [None, 1, 100])
+def test_pythonVariableLogger(capacity):
+    """
+    testing that scalar, vector and batched logging functions are stored for every capacity setting
+    """
+
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_WARNING)
+
+    scSim = SimulationBaseClass.SimBaseClass()
+    dynProcess = scSim.CreateNewProcess("dynamicsProcess")
+    dynProcess.addTask(scSim.CreateNewTask("dynamicsTask", macros.sec2nano(1.)))
+
+    logger = PythonVariableLogger({
+        "seconds": lambda CurrentSimNanos: CurrentSimNanos * macros.NANO2SEC,
+        "vector": lambda CurrentSimNanos: [[CurrentSimNanos], [1], [2]],
+        ("square", "cube"): lambda CurrentSimNanos: (CurrentSimNanos // 10**9)**np.arange(2, 4),
+    }, capacity=capacity)
+    scSim.AddModelToTask("dynamicsTask", logger)
+
+    scSim.InitializeSimulation()
+    scSim.ConfigureStopTime(macros.sec2nano(10.0))
+    scSim.ExecuteSimulation()
+
+    times = np.array([macros.sec2nano(k) for k in range(11)])
+    np.testing.assert_array_equal(logger.times(), times)
+    np.testing.assert_array_equal(logger.seconds, np.arange(11.))
+    np.testing.assert_array_equal(logger.vector, np.array([[t, 1, 2] for t in times]))
+    np.testing.assert_array_equal(logger.square, np.arange(11)**2)
+    np.testing.assert_array_equal(logger.cube, np.arange(11)**3)
+
+    logger.clear()
+    assert len(logger.times()) == 0
+
+
+def test_pythonVariableLoggerFailures():
+    """
+    testing that the values which can't be logged are stored as NaN in the typed buffers, and that the buffers
+    are promoted to hold later values of another type
+    """
+
+    bskLogging.setDefaultLogLevel(bskLogging.BSK_SILENT)
+
+    scSim = SimulationBaseClass.SimBaseClass()
+    dynProcess = scSim.CreateNewProcess("dynamicsProcess")
+    dynProcess.addTask(scSim.CreateNewTask("dynamicsTask", macros.sec2nano(1.)))
+
+    def seconds(CurrentSimNanos):
+        seconds = CurrentSimNanos // 10**9
+        if seconds == 2:
+            raise ValueError("no value at 2 s")
+        return seconds if seconds < 5 else seconds + 0.5
+
+    def powers(CurrentSimNanos):
+        seconds = CurrentSimNanos // 10**9
+        return (seconds**2,) if seconds == 3 else (seconds**2, seconds**3)
+
+    logger = PythonVariableLogger({
+        "seconds": seconds,
+        ("square", "cube"): powers,
+        "vector": lambda CurrentSimNanos: [1., 2.] if CurrentSimNanos != macros.sec2nano(4.) else 3.,
+    }, capacity=4)
+    scSim.AddModelToTask("dynamicsTask", logger)
+
+    scSim.InitializeSimulation()
+    scSim.ConfigureStopTime(macros.sec2nano(10.0))
+    scSim.ExecuteSimulation()
+
+    # the integer buffer is promoted to hold NaN and the later float values
+    truthSeconds = np.array([0., 1., np.nan, 3., 4.] + [k + 0.5 for k in range(5, 11)])
+    np.testing.assert_array_equal(logger.seconds, truthSeconds)
+
+    # a function returning fewer values than names logs NaN for all of them
+    truthSquare = np.arange(11.)**2
+    truthSquare[3] = np.nan
+    truthCube = np.arange(11.)**3
+    truthCube[3] = np.nan
+    np.testing.assert_array_equal(logger.square, truthSquare)
+    np.testing.assert_array_equal(logger.cube, truthCube)
+
+    # a value of another shape is stored as NaN
+    truthVector = np.array([[1., 2.]] * 11)
+    truthVector[4] = np.nan
+    np.testing.assert_array_equal(logger.vector, truthVector)
+
+
+if __name__ == "__main__":
+    test_pythonVariableLogger(1)
@@ -30,7 +30,7 @@ from collections import OrderedDict
 import matplotlib.pyplot as plt
 import numpy as np
 from Basilisk.architecture import alg_contain, bskLogging, sim_model
-from Basilisk.utilities import deprecated, simulationArchTypes
+from Basilisk.utilities import deprecated, eventCondition, simulationArchTypes
 from Basilisk.utilities.pythonVariableLogger import PythonVariableLogger
 from Basilisk.utilities.simulationProgessBar import SimulationProgressBar
 
@@ -46,31 +46,59 @@ endColor = '\u001b[0m'
 class EventHandlerClass:
     """Event Handler Class"""
     def __init__(self, eventName, eventRate=int(1E9), eventActive=False,
-                 conditionList=[], actionList=[], terminal=False):
+                 conditionList=[], actionList=[], terminal=False,
+                 conditionExpression=None, conditionMessages=None,
+                 guardExpression=None, guardDirection=0):
+        self.simModel = None
+        self.eventIndex = -1
         self.eventName = eventName
         self.eventActive = eventActive
         self.eventRate = eventRate
         self.conditionList = conditionList
         self.actionList = actionList
+        self.conditionExpression = conditionExpression
+        self.conditionMessages = conditionMessages if conditionMessages is not None else {}
+        self.guardExpression = guardExpression
+        self.guardDirection = guardDirection
         self.occurCounter = 0
         self.prevTime = -1
         self.checkCall = None
         self.operateCall = None
         self.terminal = terminal
 
+    @property
+    def eventActive(self):
+        if self.simModel is not None:
+            return self.simModel.getEventActivity(self.eventIndex)
+        return self._eventActive
+
+    @eventActive.setter
+    def eventActive(self, value):
+        self._eventActive = value
+        if self.simModel is not None:
+            self.simModel.setEventActivity(self.eventIndex, value)
+
+    @property
+    def eventTime(self):
+        """Time in nanoseconds at which a native event fired last, for guard events the interpolated zero crossing"""
+        if self.simModel is not None:
+            return self.simModel.getEventTime(self.eventIndex)
+        return None
+
     def methodizeEvent(self):
-        if self.checkCall != None:
+        if self.operateCall != None:
             return
-        funcString = 'def EVENT_check_' + self.eventName + '(self):\n'
-        funcString += '    if('
-        for condValue in self.conditionList:
-            funcString += ' ' + condValue + ' and'
-        funcString = funcString[:-3] + '):\n'
-        funcString += '        return 1\n'
-        funcString += '    return 0'
-
-        exec (funcString)
-        self.checkCall = eval('EVENT_check_' + self.eventName)
+        if self.conditionExpression is None and self.guardExpression is None:
+            funcString = 'def EVENT_check_' + self.eventName + '(self):\n'
+            funcString += '    if('
+            for condValue in self.conditionList:
+                funcString += ' ' + condValue + ' and'
+            funcString = funcString[:-3] + '):\n'
+            funcString += '        return 1\n'
+            funcString += '    return 0'
+
+            exec (funcString)
+            self.checkCall = eval('EVENT_check_' + self.eventName)
         funcString = 'def EVENT_operate_' + self.eventName + '(self):\n'
         for actionValue in self.actionList:
             funcString += '    '
@@ -79,9 +107,25 @@ class EventHandlerClass:
         exec (funcString)
         self.operateCall = eval('EVENT_operate_' + self.eventName)
 
+    def registerNativeEvent(self, simModel):
+        """Compile the condition expression and add the event to the simulation, which then
+        checks the condition itself at the task boundaries without calling into python."""
+        if self.simModel is not None:
+            return
+        if self.guardExpression is not None:
+            program = eventCondition.compileCondition(self.guardExpression, self.conditionMessages)
+            self.eventIndex = simModel.addGuardEvent(self.eventName, self.eventRate, program,
+                                                     self.guardDirection, self._eventActive)
+        elif self.conditionExpression is not None:
+            program = eventCondition.compileCondition(self.conditionExpression, self.conditionMessages)
+            self.eventIndex = simModel.addEvent(self.eventName, self.eventRate, program, self._eventActive)
+        else:
+            return
+        self.simModel = simModel
+
     def checkEvent(self, parentSim):
         nextTime = int(-1)
-        if self.eventActive == False:
+        if self.simModel is not None or self.eventActive == False:
             return(nextTime)
         nextTime = self.prevTime + self.eventRate - (self.prevTime%self.eventRate)
         if self.prevTime < 0 or (parentSim.TotalSim.CurrentNanos%self.eventRate == 0):
@@ -89,13 +133,17 @@ class EventHandlerClass:
             eventCount = self.checkCall(parentSim)
             self.prevTime = parentSim.TotalSim.CurrentNanos
             if eventCount > 0:
-                self.eventActive = False
-                self.operateCall(parentSim)
-                self.occurCounter += 1
-                if self.terminal:
-                    parentSim.terminate = True
+                self.operateEvent(parentSim)
         return(nextTime)
 
+    def operateEvent(self, parentSim):
+        """Deactivate the event and execute its actions"""
+        self.eventActive = False
+        self.operateCall(parentSim)
+        self.occurCounter += 1
+        if self.terminal:
+            parentSim.terminate = True
+
 
 class StructDocData:
     """Structure data documentation class"""
@@ -494,7 +542,10 @@ class SimBaseClass:
         while self.TotalSim.NextTaskTime <= self.StopTime and not self.terminate:
             if self.TotalSim.CurrentNanos >= self.nextEventTime >= 0:
                 self.nextEventTime = self.checkEvents()
-                self.nextEventTime = self.nextEventTime if self.nextEventTime >= self.TotalSim.NextTaskTime else self.TotalSim.NextTaskTime
+                # without any active event there is nothing to check until the stop time, so all frames up to the
+                # next python process call are stepped within a single StepUntilStop() call
+                if 0 <= self.nextEventTime < self.TotalSim.NextTaskTime:
+                    self.nextEventTime = self.TotalSim.NextTaskTime
             if 0 <= self.nextEventTime < nextStopTime:
                 nextStopTime = self.nextEventTime
                 nextPriority = -1
@@ -502,6 +553,11 @@ class SimBaseClass:
                 break
             self.TotalSim.StepUntilStop(nextStopTime, nextPriority)
             progressBar.update(self.TotalSim.NextTaskTime)
+            # native events are checked by the simulation, which stops early to run the actions of those that fired
+            for eventIndex in self.TotalSim.getFiredEvents():
+                self.nativeEventMap[eventIndex].operateEvent(self)
+                if self.nextEventTime < 0:
+                    self.nextEventTime = self.TotalSim.CurrentNanos
             nextPriority = -1
             nextStopTime = self.StopTime
             procStopTimes = []
@@ -509,6 +565,9 @@ class SimBaseClass:
                 nextCallTime = pyProc.nextCallTime()
                 if nextCallTime <= self.TotalSim.CurrentNanos:
                     pyProc.executeTaskList(self.TotalSim.CurrentNanos)
+                    # python tasks can activate events, which are then checked again
+                    if self.nextEventTime < 0:
+                        self.nextEventTime = self.TotalSim.CurrentNanos
                 nextCallTime = pyProc.nextCallTime()
                 procStopTimes.append(nextCallTime)
 
@@ -551,6 +610,53 @@ class SimBaseClass:
             if Task.Name == TaskName:
                 Task.enable()
 
+    def getProfilingReport(self):
+        """
+        Return the profiling counters of the dynamic objects (such as spacecraft) added to the tasks.
+
+        The report is keyed by the ``ModelTag`` of every dynamic object and lists the number and wall clock
+        time of its ``equationsOfMotion`` calls, the calls, wall clock time and accepted and rejected steps
+        of its integrator, and the evaluations and wall clock time of each of its effectors.  Objects whose
+        integration is synced to another dynamic object don't report an integrator, their steps are taken by
+        the integrator of the primary object.  The evaluations are always counted, but their wall clock
+        times are only measured if ``profileEvaluationTimes`` of the dynamic object is set.
+
+        :return: dict of the profiling counters of every dynamic object
+        """
+        def counterDict(counter):
+            return {"calls": counter.calls, "nanoseconds": counter.nanoseconds}
+
+        report = {}
+        for model in self.profiledModels():
+            entry = {"equationsOfMotion": counterDict(model.equationsOfMotionProfile)}
+            if not model.isDynamicsSynced:
+                integratorProfile = model.getIntegratorProfile()
+                entry["integrator"] = dict(counterDict(integratorProfile.integrate),
+                                           acceptedSteps=integratorProfile.acceptedSteps,
+                                           rejectedSteps=integratorProfile.rejectedSteps)
+            entry["effectors"] = {name: counterDict(model.getEffectorProfile(index))
+                                  for index, name in enumerate(model.getEffectorProfileNames())}
+            report[model.ModelTag] = entry
+        return report
+
+    def resetProfilingCounters(self):
+        """
+        Set the profiling counters of all dynamic objects, their integrators and their effectors back to zero.
+        """
+        for model in self.profiledModels():
+            model.resetProfiling()
+
+    def profiledModels(self):
+        """
+        Return the dynamic objects added to the tasks, which keep profiling counters, each only once.
+        """
+        models = []
+        for Task in self.TaskList:
+            for model in Task.TaskModels:
+                if hasattr(model, "equationsOfMotionProfile") and not any(model is m for m in models):
+                    models.append(model)
+        return models
+
     def parseDataIndex(self):
         self.dataStructureDictionary = {}
         try:
@@ -566,20 +672,45 @@ class SimBaseClass:
         self.indexParsed = True
 
     def createNewEvent(self, eventName, eventRate=int(1E9), eventActive=False,
-                       conditionList=[], actionList=[], terminal=False):
+                       conditionList=[], actionList=[], terminal=False,
+                       conditionExpression=None, conditionMessages=None,
+                       guardExpression=None, guardDirection=0):
         """
         Create an event sequence that contains a series of tasks to be executed.
+
+        The event condition is either a ``conditionList`` of python strings that are evaluated on the
+        simulation, or a ``conditionExpression`` over the payload fields of the ``conditionMessages``
+        dictionary, see :ref:`eventCondition`.  The latter is compiled and checked by the simulation
+        itself at the task boundaries, such that python is only called to execute the ``actionList``.
+
+        Alternatively, a ``guardExpression`` is a continuous function of the message payload fields, and the
+        event fires when it crosses zero, rising if ``guardDirection`` is 1, falling if it is -1, or in both
+        directions if it is 0.  The guard is checked at least every ``eventRate``, and again close to its
+        predicted zero crossing, such that the simulation stops close after the crossing of a smooth guard even
+        with a coarse ``eventRate``.  A crossing that is not predicted, e.g. of a guard that jumps, is only found
+        at the next regular check.  The crossing time interpolated between the last two checks is available to
+        the actions as ``self.eventMap[eventName].eventTime``.
         """
         if (eventName in list(self.eventMap.keys())):
             return
+        if (conditionList and (conditionExpression is not None or guardExpression is not None)) or \
+                (conditionExpression is not None and guardExpression is not None):
+            raise ValueError(f"Event '{eventName}' can only have one of conditionList, conditionExpression"
+                             f" and guardExpression.")
         newEvent = EventHandlerClass(eventName, eventRate, eventActive,
-                                     conditionList, actionList, terminal)
+                                     conditionList, actionList, terminal,
+                                     conditionExpression, conditionMessages,
+                                     guardExpression, guardDirection)
         self.eventMap.update({eventName: newEvent})
 
     def initializeEventChecks(self):
         self.eventList = []
+        self.nativeEventMap = {}
         for key, value in self.eventMap.items():
             value.methodizeEvent()
+            value.registerNativeEvent(self.TotalSim)
+            if value.simModel is not None:
+                self.nativeEventMap[value.eventIndex] = value
             self.eventList.append(value)
         self.nextEventTime = 0
 
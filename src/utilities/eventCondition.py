@@ -0,0 +1,239 @@
+
+# ISC License
+#
+# Copyright (c) 2024, Autonomous Vehicle Systems Lab, University of Colorado at Boulder
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+"""
+Compiler of the event condition expressions that are checked by the simulation itself.
+
+A condition is a python expression over the payload fields of messages, e.g.::
+
+    "norm(scMsg.r_BN_N) < 7000e3 and time > 600"
+    "crossesBelow(attErrMsg.sigma_BR[0], 0.01)"
+
+The names of the expression are the keys of a dictionary of messages, or ``time`` for the
+simulation time in seconds.  Payload fields, nested payload structures and array elements are
+accessed as in python.  The expression may use numbers, ``+ - * /``, comparisons, ``and``,
+``or``, ``not`` and the functions
+
+- ``abs(x)`` and ``sqrt(x)``
+- ``norm(v)``, the Euclidean norm of an array field
+- ``crossesAbove(x, level)`` and ``crossesBelow(x, level)``, true if ``x`` went above or below
+  ``level`` since the previous check of the event
+
+The same expressions define the continuous guard functions of events that fire
+when the guard crosses zero, e.g. ``"norm(scMsg.r_BN_N) - 6578e3"``.
+
+The expression is compiled into a ``sim_model.EventProgram`` that reads the payload
+memory directly.  Only messages with a known payload memory layout, i.e. C message payloads,
+can be used.
+"""
+
+import ast
+
+import numpy as np
+from Basilisk.architecture import sim_model
+
+_DATA_TYPES = {
+    ("f", 8): sim_model.EventDouble, ("f", 4): sim_model.EventFloat,
+    ("i", 1): sim_model.EventInt8, ("i", 2): sim_model.EventInt16,
+    ("i", 4): sim_model.EventInt32, ("i", 8): sim_model.EventInt64,
+    ("u", 1): sim_model.EventUInt8, ("u", 2): sim_model.EventUInt16,
+    ("u", 4): sim_model.EventUInt32, ("u", 8): sim_model.EventUInt64,
+    ("b", 1): sim_model.EventUInt8,
+}
+
+_BINARY_OPS = {
+    ast.Add: sim_model.EventAdd, ast.Sub: sim_model.EventSub,
+    ast.Mult: sim_model.EventMul, ast.Div: sim_model.EventDiv,
+}
+
+_COMPARE_OPS = {
+    ast.Lt: sim_model.EventLess, ast.LtE: sim_model.EventLessEqual,
+    ast.Gt: sim_model.EventGreater, ast.GtE: sim_model.EventGreaterEqual,
+    ast.Eq: sim_model.EventEqual, ast.NotEq: sim_model.EventNotEqual,
+}
+
+
+def _instruction(opCode, value=0.0, address=0, dataType=0):
+    instruction = sim_model.EventInstruction()
+    instruction.opCode = opCode
+    instruction.value = value
+    instruction.address = address
+    instruction.dataType = dataType
+    return instruction
+
+
+class _Field:
+    """Payload memory at ``address`` with the numpy ``dtype`` of a message payload, or of one of its fields"""
+    def __init__(self, address, dtype, name):
+        self.address = address
+        self.dtype = dtype
+        self.name = name
+
+    def member(self, name):
+        if self.dtype.fields is None or name not in self.dtype.fields:
+            raise ValueError(f"'{self.name}' has no field '{name}'")
+        fieldDtype, offset = self.dtype.fields[name][:2]
+        return _Field(self.address + offset, fieldDtype, self.name + "." + name)
+
+    def element(self, index):
+        if self.dtype.subdtype is None:
+            raise ValueError(f"'{self.name}' is not an array")
+        base, shape = self.dtype.subdtype
+        if not -shape[0] <= index < shape[0]:
+            raise ValueError(f"index {index} is out of range for '{self.name}' of shape {shape}")
+        elementDtype = np.dtype((base, shape[1:])) if len(shape) > 1 else base
+        return _Field(self.address + (index % shape[0]) * elementDtype.itemsize, elementDtype,
+                      f"{self.name}[{index}]")
+
+    def elements(self):
+        """return the scalar fields of an array, in memory order"""
+        if self.dtype.subdtype is None:
+            return [self]
+        return [field for k in range(self.dtype.subdtype[1][0]) for field in self.element(k).elements()]
+
+    def load(self):
+        dataType = _DATA_TYPES.get((self.dtype.kind, self.dtype.itemsize))
+        if self.dtype.subdtype is not None or self.dtype.fields is not None or dataType is None:
+            raise ValueError(f"'{self.name}' is not a numeric scalar field")
+        return [_instruction(sim_model.EventLoad, address=self.address, dataType=dataType)]
+
+
+class _Compiler(ast.NodeVisitor):
+    """Translate the python expression tree into instructions in reverse polish notation"""
+    def __init__(self, expression, messages):
+        self.expression = expression
+        self.messages = messages
+
+    def scalar(self, node):
+        """return the instructions pushing the value of ``node``"""
+        value = self.visit(node)
+        return value.load() if isinstance(value, _Field) else value
+
+    def generic_visit(self, node):
+        segment = ast.get_source_segment(self.expression, node) or type(node).__name__
+        raise ValueError(f"'{segment}' is not supported in event conditions")
+
+    def visit_Expression(self, node):
+        return self.scalar(node.body)
+
+    def visit_Constant(self, node):
+        if not isinstance(node.value, (bool, int, float)):
+            return self.generic_visit(node)
+        return [_instruction(sim_model.EventConst, value=float(node.value))]
+
+    def visit_Name(self, node):
+        if node.id in self.messages:
+            msg = self.messages[node.id]
+            dtype = msg.payloadDtype()
+            if dtype is None:
+                raise ValueError(f"the payload memory layout of message '{node.id}' is not known, "
+                                 "only C message payloads can be used in event conditions")
+            return _Field(msg.getPayloadAddress(), dtype, node.id)
+        if node.id == "time":
+            return [_instruction(sim_model.EventTime)]
+        raise ValueError(f"'{node.id}' is neither a condition message nor 'time'")
+
+    def visit_Attribute(self, node):
+        value = self.visit(node.value)
+        if not isinstance(value, _Field):
+            return self.generic_visit(node)
+        return value.member(node.attr)
+
+    def visit_Subscript(self, node):
+        value = self.visit(node.value)
+        index = node.slice.value if isinstance(node.slice, getattr(ast, "Index", ())) else node.slice
+        try:
+            index = ast.literal_eval(index)
+        except ValueError:
+            index = None
+        if not isinstance(value, _Field) or not isinstance(index, int):
+            return self.generic_visit(node)
+        return value.element(index)
+
+    def visit_BinOp(self, node):
+        if type(node.op) not in _BINARY_OPS:
+            return self.generic_visit(node)
+        return self.scalar(node.left) + self.scalar(node.right) + [_instruction(_BINARY_OPS[type(node.op)])]
+
+    def visit_UnaryOp(self, node):
+        if isinstance(node.op, ast.USub):
+            return self.scalar(node.operand) + [_instruction(sim_model.EventNeg)]
+        if isinstance(node.op, ast.UAdd):
+            return self.scalar(node.operand)
+        if isinstance(node.op, ast.Not):
+            return self.scalar(node.operand) + [_instruction(sim_model.EventNot)]
+        return self.generic_visit(node)
+
+    def visit_BoolOp(self, node):
+        opCode = sim_model.EventAnd if isinstance(node.op, ast.And) else sim_model.EventOr
+        instructions = self.scalar(node.values[0])
+        for value in node.values[1:]:
+            instructions += self.scalar(value) + [_instruction(opCode)]
+        return instructions
+
+    def visit_Compare(self, node):
+        instructions = []
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            if type(op) not in _COMPARE_OPS:
+                return self.generic_visit(node)
+            instructions += self.scalar(left) + self.scalar(right) + [_instruction(_COMPARE_OPS[type(op)])]
+            if left is not node.left:
+                instructions.append(_instruction(sim_model.EventAnd))
+            left = right
+        return instructions
+
+    def visit_Call(self, node):
+        name = node.func.id if isinstance(node.func, ast.Name) else None
+        args = node.args
+        if name in ("abs", "sqrt") and len(args) == 1 and not node.keywords:
+            opCode = sim_model.EventAbs if name == "abs" else sim_model.EventSqrt
+            return self.scalar(args[0]) + [_instruction(opCode)]
+        if name == "norm" and len(args) == 1 and not node.keywords:
+            value = self.visit(args[0])
+            if not isinstance(value, _Field):
+                return self.generic_visit(node)
+            instructions = []
+            for k, element in enumerate(value.elements()):
+                instructions += element.load() * 2 + [_instruction(sim_model.EventMul)]
+                if k > 0:
+                    instructions.append(_instruction(sim_model.EventAdd))
+            return instructions + [_instruction(sim_model.EventSqrt)]
+        if name in ("crossesAbove", "crossesBelow") and len(args) == 2 and not node.keywords:
+            opCode = sim_model.EventCrossAbove if name == "crossesAbove" else sim_model.EventCrossBelow
+            return (self.scalar(args[0]) + self.scalar(args[1])
+                    + [_instruction(sim_model.EventSub), _instruction(opCode)])
+        return self.generic_visit(node)
+
+
+def compileCondition(expression, messages):
+    """
+    Compile an event condition expression into a program that is checked by the simulation.
+
+    :param expression: condition expression, see the module documentation
+    :param messages: dictionary of the messages, C message objects or C++ message objects and read
+        functors with C message payloads, referenced by name in the expression
+    :return: ``sim_model.EventProgram`` with the instructions in reverse polish notation
+    """
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as ex:
+        raise ValueError(f"the event condition '{expression}' is not a valid expression: {ex}") from ex
+    program = sim_model.EventProgram()
+    for instruction in _Compiler(expression, messages).visit(tree):
+        program.push_back(instruction)
+    return program
@@ -1,10 +1,11 @@
-from typing import Callable, Any, Sequence, Union, Dict
+from typing import Callable, Any, Sequence, Union, Dict, Tuple, Optional
 
 import numpy as np
 
 from Basilisk.architecture import sysModel
 
 LoggingFunction = Callable[[int], Any]
+LoggingNames = Union[str, Tuple[str, ...]]
 
 class PythonVariableLogger(sysModel.SysModel):
     """This a Python Module that will call one or multiple functions
@@ -25,64 +26,144 @@ class PythonVariableLogger(sysModel.SysModel):
         times        = log.times()
         timesSquared = log.a
         timesCubed   = log.b
+
+    A single function can log several variables at once if its key
+    is a tuple of names and it returns one value per name::
+
+        log = VariableLogger({
+            ("a", "b"): lambda CurrentSimNanos: (CurrentSimNanos**2, CurrentSimNanos**3),
+        })
+
+    If a ``capacity`` is given, the values are written into typed numpy
+    buffers instead of python lists. These buffers take the shape and
+    dtype of the first logged value, are preallocated for ``capacity``
+    samples and double in size whenever they are full. Their dtype is
+    promoted when a later value doesn't fit, and a value that can't be
+    logged, or that has another shape, is stored as NaN.
     """
 
     def __init__(
-        self, 
-        logging_functions: Dict[str, LoggingFunction], 
-        min_log_period: int = 0
+        self,
+        logging_functions: Dict[LoggingNames, LoggingFunction],
+        min_log_period: int = 0,
+        capacity: Optional[int] = None
     ) -> None:
         """Initializer.
 
         Args:
-            logging_functions (Dict[str, LoggingFunction]): A dictionary where the
+            logging_functions (Dict[LoggingNames, LoggingFunction]): A dictionary where the
                 keys are the names of variables to store, and the values are functions
                 called to retrieve these variables. These functions must accept a single
-                input, an integer with the time in nanoseconds when the function is 
-                called.
+                input, an integer with the time in nanoseconds when the function is
+                called. If the key is a tuple of names, the function must return a
+                sequence with one value for each of these names.
             min_log_period (int, optional): The minimum interval between data recordings
                 Defaults to 0.
+            capacity (int, optional): The number of samples for which typed numpy
+                buffers are preallocated. Defaults to None, which stores the samples
+                in python lists.
         """
         super().__init__()
 
         self.logging_functions = logging_functions
+        self._variable_names = []
+        for names in logging_functions:
+            self._variable_names.extend([names] if isinstance(names, str) else names)
 
         self.min_log_period = min_log_period
+        self.capacity = capacity
         self._next_update_time = 0
         self.clear()
 
     def clear(self):
         """Called to clear the internal data storages"""
         self._times = []
-        self._variables = {name: [] for name in self.logging_functions}
+        self._variables = {name: [] for name in self._variable_names}
+        self._num_samples = 0
+        self._finalized = {}
 
     def times(self):
         """Retrieve the times when the data was logged"""
-        return np.array(self._times)
-    
+        return self._finalize(None, self._times)
+
     def Reset(self, CurrentSimNanos):
         self.clear()
         return super().Reset(CurrentSimNanos)
-    
+
     def UpdateState(self, CurrentSimNanos):
         if CurrentSimNanos >= self._next_update_time:
-            self._times.append(CurrentSimNanos)
-            for variable_name, logging_function in self.logging_functions.items():
+            self._finalized = {}
+            if self.capacity is None:
+                self._times.append(CurrentSimNanos)
+            else:
+                self._times = self._store(self._times, CurrentSimNanos, "times")
+
+            for names, logging_function in self.logging_functions.items():
+                variable_names = [names] if isinstance(names, str) else names
                 try:
                     val = logging_function(CurrentSimNanos)
+                    vals = [val] if isinstance(names, str) else list(val)
+                    if len(vals) != len(variable_names):
+                        raise ValueError(f"{len(vals)} values were returned for {len(variable_names)} names")
                 except Exception as ex:
-                    self.bskLogger.bskLog(sysModel.BSK_ERROR, 
-                                        f"Error while logging '{variable_name}'"
+                    self.bskLogger.bskLog(sysModel.BSK_ERROR,
+                                        f"Error while logging '{names}'"
                                         f" in logger '{self.ModelTag}': {ex}")
-                    val = None
-                val = np.array(val).squeeze()
-                self._variables[variable_name].append(val)
+                    vals = [None] * len(variable_names)
+
+                for variable_name, val in zip(variable_names, vals):
+                    if self.capacity is None:
+                        val = np.array(val).squeeze()
+                        self._variables[variable_name].append(val)
+                    else:
+                        self._variables[variable_name] = self._store(self._variables[variable_name],
+                                                                     val, variable_name)
 
+            self._num_samples += 1
             self._next_update_time += self.min_log_period
         return super().UpdateState(CurrentSimNanos)
-    
+
+    def _store(self, buffer, val, variable_name):
+        """Write a value into the next row of a typed buffer, or NaN if the value could
+        not be logged (None). The buffer is created from the first value, and doubled in
+        size once it is full. Its dtype is promoted when a value, or NaN, doesn't fit."""
+        if len(buffer) == 0:
+            if val is None:
+                return buffer
+            # the samples that could not be logged before the first value are NaN
+            first = np.array(val).squeeze()
+            buffer = np.zeros((max(self.capacity, self._num_samples + 1),) + first.shape, dtype=first.dtype)
+            if self._num_samples > 0:
+                buffer = buffer.astype(np.result_type(first.dtype, np.float64))
+                buffer[:self._num_samples] = np.nan
+        elif self._num_samples == len(buffer):
+            grown = np.zeros((2 * len(buffer),) + buffer.shape[1:], dtype=buffer.dtype)
+            grown[:self._num_samples] = buffer
+            buffer = grown
+
+        row = np.array(np.nan) if val is None else np.array(val).squeeze()
+        if val is not None and row.shape != buffer.shape[1:]:
+            self.bskLogger.bskLog(sysModel.BSK_ERROR,
+                                f"Error while logging '{variable_name}' in logger '{self.ModelTag}':"
+                                f" a value of shape {row.shape} can't be stored with shape {buffer.shape[1:]}")
+            row = np.array(np.nan)
+        dtype = np.result_type(buffer.dtype, row.dtype)
+        if dtype != buffer.dtype:
+            buffer = buffer.astype(dtype)
+        buffer[self._num_samples] = row
+        return buffer
+
+    def _finalize(self, variable_name, samples):
+        """Return the logged samples as an array, cached until the next sample is logged"""
+        if variable_name not in self._finalized:
+            if len(samples) == 0 and self.capacity is not None:
+                # no value could be logged yet
+                samples = np.full(self._num_samples, np.nan)
+            self._finalized[variable_name] = np.array(samples[:self._num_samples])
+        return self._finalized[variable_name]
+
     def __getattr__(self, __name: str) -> Any:
         if __name in self._variables:
-            return np.array(self._variables[__name])
+            return self._finalize(__name, self._variables[__name])
         raise AttributeError(f"Logger is not logging '{__name}'. "
                              f"Must be one of: {', '.join(self._variables)}")